@@ -17,10 +17,10 @@ from pathlib import Path
 
 # Note: IntegrityError handling is done via exception message inspection
 # to support both SQLite and PostgreSQL backends
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import sqlalchemy as sa
-from fastapi import FastAPI, File, Form, HTTPException, Query, Request, Response, UploadFile
+from fastapi import FastAPI, File, Form, Header, HTTPException, Query, Request, Response, UploadFile
 from fastapi import Path as FastAPIPath
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
@@ -31,12 +31,31 @@ from slugify import slugify
 from sse_starlette.sse import EventSourceResponse
 
 from api.analytics_cache import create_analytics_cache
+from api.analytics_rollups import (
+    fetch_daily_buckets,
+    get_read_watermark,
+    merge_buckets,
+    start_analytics_rollups,
+    stop_analytics_rollups,
+    video_totals_query,
+)
 from api.audit import AuditAction, log_audit
 from api.chapter_detection import (
     extract_chapters_from_metadata,
     filter_chapters_by_length,
     generate_chapters_from_transcription,
 )
+from api.chunked_upload import (
+    ChunkError,
+    UploadSession,
+    complete_session,
+    create_session,
+    delete_session,
+    load_session,
+    missing_chunks,
+    sweep_expired_sessions,
+    write_chunk,
+)
 from api.common import (
     HTTPMetricsMiddleware,
     RequestIDMiddleware,
@@ -63,6 +82,7 @@ from api.database import (
     sprite_queue,
     tags,
     transcoding_jobs,
+    transcoding_tasks,
     transcriptions,
     video_custom_fields,
     video_qualities,
@@ -83,19 +103,22 @@ from api.db_retry import (
 )
 from api.enums import TranscriptionStatus, VideoStatus
 from api.errors import is_unique_violation, sanitize_error_message, sanitize_progress_error
-from api.job_queue import JobDispatch, get_job_queue
+from api.job_queue import JobDispatch, get_job_queue, notify_job_available
+from api.media_files import invalidate_video_manifests
 from api.metrics import (
-    STORAGE_VIDEOS_BYTES,
     get_metrics,
     init_app_info,
     start_metrics_background_tasks,
     stop_metrics_background_tasks,
 )
+from api.object_storage import STORAGE_SYNC_RESET, delete_video_objects, publish_path
 from api.pagination import encode_cursor, validate_cursor
 from api.partition_manager import ensure_partitions_exist, is_table_partitioned
 from api.public import get_video_url_prefix, get_watermark_settings
 from api.pubsub import subscribe_to_progress, subscribe_to_workers
 from api.redis_client import is_redis_available
+from api.related_videos import start_related_videos_refresh, stop_related_videos_refresh
+from api.response_cache import invalidate_response_cache
 from api.schemas import (
     MAX_CHAPTERS_PER_VIDEO,
     ActiveJobsResponse,
@@ -122,6 +145,8 @@ from api.schemas import (
     ChapterListResponse,
     ChapterResponse,
     ChapterUpdate,
+    ChunkedUploadCreateRequest,
+    ChunkedUploadResponse,
     CustomFieldCreate,
     CustomFieldListResponse,
     CustomFieldResponse,
@@ -152,6 +177,7 @@ from api.schemas import (
     SpriteQueueJobsResponse,
     SpriteQueueStatusResponse,
     SpriteStatusResponse,
+    StorageUsageResponse,
     TagCreate,
     TagResponse,
     TagUpdate,
@@ -204,7 +230,19 @@ from api.settings_service import (
 from api.settings_service import (
     get_setting as get_db_setting,
 )
-from api.worker_auth import authenticate_api_key
+from api.storage_ledger import (
+    clear_video_storage,
+    get_storage_totals,
+    get_video_storage,
+    record_video_storage,
+)
+from api.video_stats import start_video_stats_reconciler, stop_video_stats_reconciler
+from api.worker_auth import (
+    authenticate_api_key,
+    invalidate_worker_key_cache,
+    start_key_revocation_listener,
+    stop_key_revocation_listener,
+)
 from config import (
     ADMIN_API_SECRET,
     ADMIN_CORS_ALLOWED_ORIGINS,
@@ -215,6 +253,9 @@ from config import (
     ANALYTICS_CACHE_TTL,
     ANALYTICS_CLIENT_CACHE_MAX_AGE,
     ARCHIVE_DIR,
+    CHUNKED_UPLOAD_CHUNK_SIZE_MB,
+    CHUNKED_UPLOAD_EXPIRY_HOURS,
+    CHUNKED_UPLOAD_MAX_CHUNKS,
     JOB_QUEUE_MODE,
     MAX_THUMBNAIL_UPLOAD_SIZE,
     MAX_UPLOAD_SIZE,
@@ -568,14 +609,15 @@ async def delete_video_and_job(video_id: int) -> None:
     because foreign_keys pragma is per-connection and connections are pooled.
 
     This explicitly deletes related records to prevent orphaned data.
-    Deletes: quality_progress, transcoding_jobs, playback_sessions,
+    Deletes: quality_progress, transcoding_tasks, transcoding_jobs, playback_sessions,
     transcriptions, video_qualities, video_tags, and the video itself.
     """
     # Get job_id first (if exists) for quality_progress cleanup
     job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
     if job:
-        # Delete quality_progress entries first (FK to transcoding_jobs)
+        # Delete quality_progress entries and rendition tasks first (FK to transcoding_jobs)
         await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+        await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
         # Delete transcoding job
         await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.id == job["id"]))
     # Delete all related records
@@ -680,6 +722,7 @@ async def cleanup_orphaned_jobs() -> int:
     for job in orphaned:
         # Delete quality_progress first
         await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+        await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
         # Delete the orphaned job
         await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.id == job["id"]))
 
@@ -805,6 +848,15 @@ async def create_or_reset_transcoding_job(
                 # Re-raise other errors (retryable errors are handled by db_execute_with_retry)
                 raise
 
+    # The reset job is whole again - drop rendition tasks left from an earlier split
+    await db_execute_with_retry(
+        transcoding_tasks.delete().where(
+            transcoding_tasks.c.job_id.in_(
+                sa.select(transcoding_jobs.c.id).where(transcoding_jobs.c.video_id == video_id)
+            )
+        )
+    )
+
     # Publish job to Redis Streams for instant dispatch (if configured)
     if JOB_QUEUE_MODE in ("redis", "hybrid"):
         try:
@@ -831,13 +883,23 @@ async def create_or_reset_transcoding_job(
             # Redis publish failure is not critical - workers will poll database
             logger.warning(f"Failed to publish job to Redis: {e}")
 
+    # Wake a worker long-polling /api/worker/claim (no-op without Redis)
+    try:
+        job = await database.fetch_one(
+            sa.select(transcoding_jobs.c.id).where(transcoding_jobs.c.video_id == video_id)
+        )
+        if job:
+            await notify_job_available(job["id"], video_id, priority)
+    except Exception as e:
+        logger.warning(f"Failed to notify workers of new job: {e}")
+
 
 # Background task for periodic session cleanup
 _session_cleanup_task: Optional[asyncio.Task] = None
 
 
 async def _periodic_session_cleanup():
-    """Background task to periodically clean up expired sessions."""
+    """Background task to periodically clean up expired sessions and chunked uploads."""
     while True:
         try:
             # Run cleanup every hour
@@ -845,6 +907,12 @@ async def _periodic_session_cleanup():
             deleted = await cleanup_expired_sessions()
             if deleted:
                 logger.info(f"Cleaned up {deleted} expired admin sessions")
+            loop = asyncio.get_running_loop()
+            expired_uploads = await loop.run_in_executor(
+                None, sweep_expired_sessions, CHUNKED_UPLOAD_EXPIRY_HOURS * 3600
+            )
+            if expired_uploads:
+                logger.info(f"Removed {expired_uploads} expired chunked uploads")
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -909,6 +977,18 @@ async def lifespan(app: FastAPI):
     # Start background task for periodic session cleanup
     _session_cleanup_task = asyncio.create_task(_periodic_session_cleanup())
 
+    # Periodically recompute per-video counters from playback_sessions to correct drift
+    start_video_stats_reconciler()
+
+    # Roll playback sessions up into hourly/daily tables for the analytics dashboard
+    start_analytics_rollups()
+
+    # Precompute related video lists for the public related videos endpoint
+    start_related_videos_refresh()
+
+    # Evict cached worker API keys (used by re-encode endpoints) revoked on other instances
+    start_key_revocation_listener()
+
     # Issue #207: Start background tasks for dynamic metrics (heartbeat ages, storage reconciliation)
     await start_metrics_background_tasks(database, storage_path=VIDEOS_DIR)
 
@@ -928,6 +1008,11 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    await stop_video_stats_reconciler()
+    await stop_analytics_rollups()
+    await stop_related_videos_refresh()
+    await stop_key_revocation_listener()
+
     # Issue #203: Stop webhook delivery worker gracefully
     await stop_webhook_delivery_worker(timeout=10.0)
     logger.info("Webhook delivery worker stopped")
@@ -1325,6 +1410,8 @@ async def delete_category(request: Request, category_id: int):
         details={"name": existing["name"]},
     )
 
+    await invalidate_response_cache()
+
     return {"status": "ok"}
 
 
@@ -1433,6 +1520,9 @@ async def update_tag(request: Request, tag_id: int, data: TagUpdate) -> TagRespo
         details={"old_name": existing["name"], "new_name": data.name},
     )
 
+    # Public video lists embed tag names
+    await invalidate_response_cache()
+
     return TagResponse(
         id=tag_id,
         name=data.name,
@@ -1469,6 +1559,8 @@ async def delete_tag(request: Request, tag_id: int):
         details={"name": existing["name"]},
     )
 
+    await invalidate_response_cache()
+
     return {"status": "ok"}
 
 
@@ -1522,6 +1614,10 @@ async def list_all_videos(
             videos.c.streaming_format,
             videos.c.primary_codec,
             categories.c.name.label("category_name"),
+            sa.exists()
+            .where(transcoding_jobs.c.video_id == videos.c.id)
+            .where(transcoding_jobs.c.completed_at.is_(None))
+            .label("transcoding"),
         )
         .select_from(videos.outerjoin(categories, videos.c.category_id == categories.c.id))
         .where(videos.c.deleted_at.is_(None))  # Exclude soft-deleted videos
@@ -1571,6 +1667,7 @@ async def list_all_videos(
             thumbnail_timestamp=row["thumbnail_timestamp"],
             streaming_format=row["streaming_format"],
             primary_codec=row["primary_codec"],
+            transcoding=bool(row["transcoding"]),
         )
         for row in rows
     ]
@@ -1703,29 +1800,14 @@ async def get_video(request: Request, video_id: int) -> VideoResponse:
     )
 
 
-@app.post("/api/videos")
-@limiter.limit(RATE_LIMIT_ADMIN_UPLOAD)
-async def upload_video(
-    request: Request,
-    file: UploadFile = File(...),
-    title: str = Form(...),
-    description: str = Form(""),
-    category_id: Optional[int] = Form(None),
-):
-    """Upload a new video for processing."""
-    # Early rejection based on Content-Length header (if provided)
-    validate_content_length(request)
-
-    # Check storage availability before accepting upload
-    if not await check_storage_available():
-        raise HTTPException(
-            status_code=503,
-            detail="Video storage temporarily unavailable. Please try again later.",
-            headers={"Retry-After": "30"},
-        )
+def _validate_upload_fields(filename: Optional[str], title: str, description: str) -> str:
+    """
+    Validate the file extension, title and description of an upload.
 
-    # Validate file extension
-    file_ext = Path(file.filename).suffix.lower() if file.filename else ""
+    Returns:
+        The file extension (".mp4" if the filename has none)
+    """
+    file_ext = Path(filename).suffix.lower() if filename else ""
     if not file_ext:
         file_ext = ".mp4"  # Default extension
     if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
@@ -1741,7 +1823,26 @@ async def upload_video(
         raise HTTPException(status_code=400, detail=f"Title must be {MAX_TITLE_LENGTH} characters or less")
     if len(description) > MAX_DESCRIPTION_LENGTH:
         raise HTTPException(status_code=400, detail=f"Description must be {MAX_DESCRIPTION_LENGTH} characters or less")
+    return file_ext
+
+
+async def _raise_if_storage_unavailable() -> None:
+    """Reject uploads while the storage is unavailable (503)."""
+    if not await check_storage_available():
+        raise HTTPException(
+            status_code=503,
+            detail="Video storage temporarily unavailable. Please try again later.",
+            headers={"Retry-After": "30"},
+        )
 
+
+async def _insert_uploaded_video(title: str, description: str, category_id: Optional[int]) -> Tuple[int, str]:
+    """
+    Create the record of an uploaded video with a unique slug.
+
+    Returns:
+        (video_id, slug)
+    """
     # Generate slug with race condition handling
     base_slug = slugify(title.strip())
     slug = base_slug
@@ -1782,29 +1883,19 @@ async def upload_video(
 
     if video_id is None:
         raise HTTPException(status_code=500, detail="Failed to generate unique slug")
+    return video_id, slug
 
-    # Save uploaded file with size validation (file_ext already validated above)
-    # If file save fails, clean up the database record to avoid orphans
-    try:
-        upload_path = UPLOADS_DIR / f"{video_id}{file_ext}"
-        await save_upload_with_size_limit(file, upload_path)
-
-        # Create output directory
-        (VIDEOS_DIR / slug).mkdir(parents=True, exist_ok=True)
-    except HTTPException:
-        # Clean up orphan database record on upload failure
-        await delete_video_and_job(video_id)
-        raise
-    except (OSError, IOError, PermissionError) as e:
-        # Storage-related errors - clean up and return 503
-        await delete_video_and_job(video_id)
-        logger.warning(f"Storage error during video upload (video_id={video_id}): {e}")
-        raise HTTPException(
-            status_code=503,
-            detail="Video storage temporarily unavailable. Please try again later.",
-            headers={"Retry-After": "30"},
-        )
 
+async def _queue_uploaded_video(
+    request: Request,
+    video_id: int,
+    slug: str,
+    upload_path: Path,
+    title: str,
+    category_id: Optional[int],
+    filename: Optional[str],
+) -> dict:
+    """Probe a saved upload, create its transcoding job, and log/announce the upload."""
     # Probe video file to get actual duration and dimensions
     try:
         video_info = await get_video_info(upload_path)
@@ -1862,7 +1953,7 @@ async def upload_video(
         details={
             "title": title,
             "category_id": category_id,
-            "filename": file.filename,
+            "filename": filename,
         },
     )
 
@@ -1876,7 +1967,7 @@ async def upload_video(
                 "video_id": video_id,
                 "slug": slug,
                 "title": title,
-                "filename": file.filename,
+                "filename": filename,
             },
         )
     except Exception as e:
@@ -1890,6 +1981,186 @@ async def upload_video(
     }
 
 
+@app.post("/api/videos")
+@limiter.limit(RATE_LIMIT_ADMIN_UPLOAD)
+async def upload_video(
+    request: Request,
+    file: UploadFile = File(...),
+    title: str = Form(...),
+    description: str = Form(""),
+    category_id: Optional[int] = Form(None),
+):
+    """Upload a new video for processing."""
+    # Early rejection based on Content-Length header (if provided)
+    validate_content_length(request)
+
+    # Check storage availability before accepting upload
+    await _raise_if_storage_unavailable()
+
+    file_ext = _validate_upload_fields(file.filename, title, description)
+    video_id, slug = await _insert_uploaded_video(title, description, category_id)
+
+    # Save uploaded file with size validation (file_ext already validated above)
+    # If file save fails, clean up the database record to avoid orphans
+    try:
+        upload_path = UPLOADS_DIR / f"{video_id}{file_ext}"
+        await save_upload_with_size_limit(file, upload_path)
+
+        # Create output directory
+        (VIDEOS_DIR / slug).mkdir(parents=True, exist_ok=True)
+    except HTTPException:
+        # Clean up orphan database record on upload failure
+        await delete_video_and_job(video_id)
+        raise
+    except (OSError, IOError, PermissionError) as e:
+        # Storage-related errors - clean up and return 503
+        await delete_video_and_job(video_id)
+        logger.warning(f"Storage error during video upload (video_id={video_id}): {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Video storage temporarily unavailable. Please try again later.",
+            headers={"Retry-After": "30"},
+        )
+
+    return await _queue_uploaded_video(request, video_id, slug, upload_path, title, category_id, file.filename)
+
+
+# =============================================================================
+# Chunked Uploads (resumable, parallel - see api/chunked_upload.py)
+# =============================================================================
+
+
+def _chunked_upload_status(session: UploadSession) -> ChunkedUploadResponse:
+    return ChunkedUploadResponse(
+        upload_id=session.upload_id,
+        size=session.size,
+        chunk_size=session.chunk_size,
+        chunk_count=session.chunk_count,
+        missing_chunks=missing_chunks(session),
+        expires_at=datetime.fromtimestamp(session.created_at + CHUNKED_UPLOAD_EXPIRY_HOURS * 3600, timezone.utc),
+    )
+
+
+def _get_chunked_upload(upload_id: str) -> UploadSession:
+    session = load_session(upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload not found or expired")
+    return session
+
+
+@app.post("/api/uploads", response_model=ChunkedUploadResponse)
+@limiter.limit(RATE_LIMIT_ADMIN_UPLOAD)
+async def create_chunked_upload(request: Request, data: ChunkedUploadCreateRequest) -> ChunkedUploadResponse:
+    """
+    Start a resumable upload of a video.
+
+    The file is then sent as chunks (PUT /api/uploads/{upload_id}/chunks/{index},
+    in parallel and any order) and turned into a video by the complete endpoint.
+    """
+    if data.size > MAX_UPLOAD_SIZE:
+        max_size_gb = MAX_UPLOAD_SIZE / (1024 * 1024 * 1024)
+        raise HTTPException(status_code=413, detail=f"File too large. Maximum upload size is {max_size_gb:.0f} GB")
+    await _raise_if_storage_unavailable()
+    _validate_upload_fields(data.filename, data.title, data.description)
+
+    # Very large files get larger chunks to keep the session small
+    chunk_size = max(CHUNKED_UPLOAD_CHUNK_SIZE_MB * 1024 * 1024, -(-data.size // CHUNKED_UPLOAD_MAX_CHUNKS))
+    metadata = {"title": data.title, "description": data.description, "category_id": data.category_id}
+    try:
+        loop = asyncio.get_running_loop()
+        session = await loop.run_in_executor(None, create_session, data.size, chunk_size, data.filename, metadata)
+    except OSError as e:
+        logger.warning(f"Storage error creating chunked upload: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Video storage temporarily unavailable. Please try again later.",
+            headers={"Retry-After": "30"},
+        )
+    return _chunked_upload_status(session)
+
+
+@app.get("/api/uploads/{upload_id}", response_model=ChunkedUploadResponse)
+async def get_chunked_upload(upload_id: str) -> ChunkedUploadResponse:
+    """Status of a resumable upload, including the chunks still to be sent."""
+    session = _get_chunked_upload(upload_id)
+    return _chunked_upload_status(session)
+
+
+@app.put("/api/uploads/{upload_id}/chunks/{index}")
+async def upload_chunk(
+    request: Request,
+    upload_id: str,
+    index: int,
+    x_chunk_sha256: str = Header(..., alias="X-Chunk-SHA256"),
+) -> dict:
+    """
+    Store one chunk of a resumable upload (raw request body).
+
+    Not rate limited per request: chunks are only accepted for sessions created
+    through the (rate limited) create endpoint.
+    """
+    session = _get_chunked_upload(upload_id)
+    try:
+        await write_chunk(session, index, request.stream(), x_chunk_sha256)
+    except ChunkError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        # Completed, aborted or expired while the chunk was being received
+        raise HTTPException(status_code=404, detail="Upload not found or expired")
+    except OSError as e:
+        logger.warning(f"Storage error writing chunk {index} of upload {upload_id}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Video storage temporarily unavailable. Please try again later.",
+            headers={"Retry-After": "30"},
+        )
+    return {"status": "ok", "index": index}
+
+
+@app.post("/api/uploads/{upload_id}/complete")
+@limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
+async def complete_chunked_upload(request: Request, upload_id: str):
+    """Turn a fully received upload into a video and queue it for processing."""
+    session = _get_chunked_upload(upload_id)
+    missing = missing_chunks(session)
+    if missing:
+        raise HTTPException(status_code=409, detail=f"{len(missing)} chunks are missing (first: {missing[0]})")
+
+    title = str(session.metadata["title"])
+    description = str(session.metadata.get("description") or "")
+    category_id = session.metadata.get("category_id")
+    file_ext = _validate_upload_fields(session.filename, title, description)
+    video_id, slug = await _insert_uploaded_video(title, description, category_id)
+
+    upload_path = UPLOADS_DIR / f"{video_id}{file_ext}"
+    try:
+        # Chunks were written in place, so this is a rename
+        await asyncio.get_running_loop().run_in_executor(None, complete_session, session, upload_path)
+        (VIDEOS_DIR / slug).mkdir(parents=True, exist_ok=True)
+    except ChunkError as e:
+        await delete_video_and_job(video_id)
+        raise HTTPException(status_code=409, detail=str(e))
+    except OSError as e:
+        await delete_video_and_job(video_id)
+        logger.warning(f"Storage error completing upload {upload_id} (video_id={video_id}): {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Video storage temporarily unavailable. Please try again later.",
+            headers={"Retry-After": "30"},
+        )
+
+    return await _queue_uploaded_video(request, video_id, slug, upload_path, title, category_id, session.filename)
+
+
+@app.delete("/api/uploads/{upload_id}")
+@limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
+async def abort_chunked_upload(request: Request, upload_id: str) -> dict:
+    """Abort a resumable upload and discard its chunks."""
+    _get_chunked_upload(upload_id)
+    await asyncio.get_running_loop().run_in_executor(None, delete_session, upload_id)
+    return {"status": "ok"}
+
+
 @app.put("/api/videos/{video_id}")
 @limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
 async def update_video(
@@ -1960,6 +2231,8 @@ async def update_video(
             details={"updated_fields": list(update_data.keys())},
         )
 
+        await invalidate_response_cache()
+
     return {"status": "ok"}
 
 
@@ -1991,6 +2264,8 @@ async def publish_video(request: Request, video_id: int):
         details={"action": "publish"},
     )
 
+    await invalidate_response_cache()
+
     return {"status": "ok", "published": True}
 
 
@@ -2020,9 +2295,28 @@ async def unpublish_video(request: Request, video_id: int):
         details={"action": "unpublish"},
     )
 
+    await invalidate_response_cache()
+
     return {"status": "ok", "published": False}
 
 
+@app.post("/api/videos/{video_id}/manifests/invalidate")
+@limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
+async def invalidate_manifests(request: Request, video_id: int):
+    """
+    Drop cached manifests of a video on every public API instance.
+
+    Called by `vlog manifests regenerate` after rewriting a video's manifests.
+    """
+    video = await fetch_one_with_retry(videos.select().where(videos.c.id == video_id))
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    await invalidate_video_manifests(video["slug"])
+
+    return {"status": "ok"}
+
+
 @app.get("/api/videos/{video_id}/tags")
 @limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
 async def get_video_tags(request: Request, video_id: int) -> List[VideoTagInfo]:
@@ -2082,6 +2376,8 @@ async def set_video_tags(request: Request, video_id: int, data: VideoTagsUpdate)
         details={"tag_ids": data.tag_ids},
     )
 
+    await invalidate_response_cache()
+
     # Return updated tags
     query = (
         sa.select(tags.c.id, tags.c.name, tags.c.slug)
@@ -2337,6 +2633,7 @@ async def upload_custom_thumbnail(
 
         # Clean up frames directory if it exists
         _cleanup_frames_directory(video["slug"])
+        await publish_path(video["slug"], "thumbnail.jpg")
 
         # Audit log
         log_audit(
@@ -2413,6 +2710,7 @@ async def select_thumbnail_frame(
 
     # Clean up frames directory
     _cleanup_frames_directory(video["slug"])
+    await publish_path(video["slug"], "thumbnail.jpg")
 
     # Audit log
     log_audit(
@@ -2477,6 +2775,7 @@ async def revert_thumbnail(request: Request, video_id: int) -> ThumbnailResponse
 
     # Clean up frames directory
     _cleanup_frames_directory(video["slug"])
+    await publish_path(video["slug"], "thumbnail.jpg")
 
     # Audit log
     log_audit(
@@ -2528,12 +2827,16 @@ async def delete_video(
 
     if permanent:
         # PERMANENT DELETE - remove everything
+        # Issue #207: Remove the video from the storage ledger (before its rows cascade away)
+        await clear_video_storage(video_id)
+
         # First, delete all database records atomically
         async with database.transaction():
             # Get job ID for quality_progress cleanup
             job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
             if job:
                 await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+                await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
             await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
             await database.execute(playback_sessions.delete().where(playback_sessions.c.video_id == video_id))
             await database.execute(transcriptions.delete().where(transcriptions.c.video_id == video_id))
@@ -2544,18 +2847,13 @@ async def delete_video(
         # Delete files AFTER successful transaction (file ops can't be rolled back)
         video_dir = VIDEOS_DIR / row["slug"]
         if video_dir.exists():
-            # Issue #207: Track storage bytes for deleted video files
-            try:
-                video_size = sum(f.stat().st_size for f in video_dir.rglob("*") if f.is_file())
-                STORAGE_VIDEOS_BYTES.dec(video_size)
-            except OSError:
-                pass  # Size calculation failed, reconciliation will correct
             shutil.rmtree(video_dir)
 
         # Delete archived files if any
         archive_dir = ARCHIVE_DIR / row["slug"]
         if archive_dir.exists():
             shutil.rmtree(archive_dir)
+        await delete_video_objects(row["slug"])
 
         # Delete source file from uploads if still there
         for ext in SUPPORTED_VIDEO_EXTENSIONS:
@@ -2574,6 +2872,8 @@ async def delete_video(
             details={"permanent": True, "title": row["title"]},
         )
 
+        await invalidate_response_cache()
+
         return {"status": "ok", "message": "Video permanently deleted"}
 
     else:
@@ -2624,6 +2924,9 @@ async def delete_video(
             logger.exception(f"Failed to archive files for video {video_id}: {e}")
             raise HTTPException(status_code=500, detail="Failed to archive files")
 
+        # Archived files no longer count as video storage
+        await clear_video_storage(video_id)
+
         # Audit log
         log_audit(
             AuditAction.VIDEO_DELETE,
@@ -2651,6 +2954,8 @@ async def delete_video(
         except Exception as e:
             logger.warning(f"Failed to trigger webhook for video.deleted: {e}")
 
+        await invalidate_response_cache()
+
         return {"status": "ok", "message": "Video moved to archive"}
 
 
@@ -2684,12 +2989,16 @@ async def bulk_delete_videos(request: Request, data: BulkDeleteRequest) -> BulkD
 
             if data.permanent:
                 # PERMANENT DELETE
+                await clear_video_storage(video_id)
                 async with database.transaction():
                     job = await database.fetch_one(
                         transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id)
                     )
                     if job:
                         await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+                        await database.execute(
+                            transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"])
+                        )
                     await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
                     await database.execute(playback_sessions.delete().where(playback_sessions.c.video_id == video_id))
                     await database.execute(transcriptions.delete().where(transcriptions.c.video_id == video_id))
@@ -2703,6 +3012,7 @@ async def bulk_delete_videos(request: Request, data: BulkDeleteRequest) -> BulkD
                 archive_dir = ARCHIVE_DIR / row["slug"]
                 if archive_dir.exists():
                     shutil.rmtree(archive_dir)
+                await delete_video_objects(row["slug"])
                 for ext in SUPPORTED_VIDEO_EXTENSIONS:
                     upload_file = UPLOADS_DIR / f"{video_id}{ext}"
                     if upload_file.exists():
@@ -2745,6 +3055,7 @@ async def bulk_delete_videos(request: Request, data: BulkDeleteRequest) -> BulkD
                     )
                     failed_count += 1
                     continue
+                await clear_video_storage(video_id)
 
             # Emit individual audit event for successful delete
             log_audit(
@@ -2783,6 +3094,8 @@ async def bulk_delete_videos(request: Request, data: BulkDeleteRequest) -> BulkD
         },
     )
 
+    await invalidate_response_cache()
+
     return BulkDeleteResponse(
         status="ok" if failed_count == 0 else "partial",
         deleted=deleted_count,
@@ -2872,6 +3185,8 @@ async def bulk_update_videos(request: Request, data: BulkUpdateRequest) -> BulkU
         },
     )
 
+    await invalidate_response_cache()
+
     return BulkUpdateResponse(
         status="ok" if failed_count == 0 else "partial",
         updated=updated_count,
@@ -2944,6 +3259,9 @@ async def bulk_retranscode_videos(request: Request, data: BulkRetranscodeRequest
                     await database.execute(
                         quality_progress.delete().where(quality_progress.c.job_id == existing_job["id"])
                     )
+                    await database.execute(
+                        transcoding_tasks.delete().where(transcoding_tasks.c.job_id == existing_job["id"])
+                    )
                     await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
 
                 # NOTE: File deletion, video_qualities deletion, transcription deletion,
@@ -3060,6 +3378,7 @@ async def bulk_restore_videos(request: Request, data: BulkRestoreRequest) -> Bul
                 results.append(BulkOperationResult(video_id=video_id, success=False, error=f"Failed to restore: {e}"))
                 failed_count += 1
                 continue
+            await record_video_storage(video_id, video_dir)
 
             # Emit individual audit event for successful restore
             log_audit(
@@ -3096,6 +3415,8 @@ async def bulk_restore_videos(request: Request, data: BulkRestoreRequest) -> Bul
         },
     )
 
+    await invalidate_response_cache()
+
     return BulkRestoreResponse(
         status="ok" if failed_count == 0 else "partial",
         restored=restored_count,
@@ -3159,6 +3480,7 @@ async def restore_video(request: Request, video_id: int):
         await database.execute(videos.update().where(videos.c.id == video_id).values(deleted_at=original_deleted_at))
         logger.exception(f"Failed to restore files for video {video_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to restore files")
+    await record_video_storage(video_id, video_dir)
 
     # Audit log
     log_audit(
@@ -3186,6 +3508,8 @@ async def restore_video(request: Request, video_id: int):
     except Exception as e:
         logger.warning(f"Failed to trigger webhook for video.restored: {e}")
 
+    await invalidate_response_cache()
+
     return {"status": "ok", "message": "Video restored from archive"}
 
 
@@ -3289,6 +3613,7 @@ async def re_upload_video(
     else:
         # Create the directory if it doesn't exist
         video_dir.mkdir(parents=True, exist_ok=True)
+    await clear_video_storage(video_id)
 
     # 2. Delete old source file from uploads
     for ext in SUPPORTED_VIDEO_EXTENSIONS:
@@ -3302,6 +3627,7 @@ async def re_upload_video(
         job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
         if job:
             await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+            await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
         await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
 
         # Delete transcriptions
@@ -3320,6 +3646,7 @@ async def re_upload_video(
                 source_width=0,
                 source_height=0,
                 error_message=None,
+                **STORAGE_SYNC_RESET,
             )
         )
 
@@ -3376,8 +3703,13 @@ async def get_video_progress(request: Request, video_id: int) -> TranscodingProg
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # If video is ready or failed, return simple status
-    if video["status"] in [VideoStatus.READY, VideoStatus.FAILED]:
+    # Get job info for processing videos
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
+
+    # If video is ready or failed, return simple status (unless a progressively
+    # published video is still transcoding its remaining qualities)
+    partially_ready = video["status"] == VideoStatus.READY and job is not None and job["completed_at"] is None
+    if video["status"] in [VideoStatus.READY, VideoStatus.FAILED] and not partially_ready:
         return TranscodingProgressResponse(
             status=video["status"],
             progress_percent=100 if video["status"] == VideoStatus.READY else 0,
@@ -3393,9 +3725,6 @@ async def get_video_progress(request: Request, video_id: int) -> TranscodingProg
             progress_percent=0,
         )
 
-    # Get job info for processing videos
-    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
-
     if not job:
         return TranscodingProgressResponse(
             status=video["status"],
@@ -3465,6 +3794,27 @@ async def get_video_qualities(request: Request, video_id: int) -> VideoQualities
     )
 
 
+@app.get("/api/videos/{video_id}/storage")
+@limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
+async def get_video_storage_usage(request: Request, video_id: int) -> StorageUsageResponse:
+    """Get the storage used by a video, per rendition."""
+    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
+
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    qualities = await get_video_storage(video_id)
+    return StorageUsageResponse(video_id=video_id, total_bytes=sum(qualities.values()), qualities=qualities)
+
+
+@app.get("/api/storage")
+@limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
+async def get_storage_usage(request: Request) -> StorageUsageResponse:
+    """Get the storage used by all videos, per rendition."""
+    qualities = await get_storage_totals()
+    return StorageUsageResponse(total_bytes=sum(qualities.values()), qualities=qualities)
+
+
 @app.post("/api/videos/{video_id}/retranscode")
 @limiter.limit(RATE_LIMIT_ADMIN_DEFAULT)
 async def retranscode_video(
@@ -3530,6 +3880,7 @@ async def retranscode_video(
         if job:
             # Delete quality_progress records (these are job-related, not video-related)
             await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+            await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
             # Delete the job itself
             await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
 
@@ -3764,80 +4115,27 @@ async def analytics_overview(request: Request, response: Response) -> AnalyticsO
         response.headers["Cache-Control"] = f"private, max-age={cache_max_age}"
         return AnalyticsOverview(**cached_data)
 
-    # Cache miss - compute fresh data
+    # Cache miss - compute fresh data from daily rollups plus unrolled sessions
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=7)
     month_start = today_start - timedelta(days=30)
 
-    # Total views
-    total_views = await fetch_val_with_retry(sa.select(sa.func.count()).select_from(playback_sessions)) or 0
+    daily = await fetch_daily_buckets()
+    totals = merge_buckets(daily.values())
 
-    # Unique viewers
-    unique_viewers = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.count(sa.distinct(playback_sessions.c.viewer_id)))
-            .select_from(playback_sessions)
-            .where(playback_sessions.c.viewer_id.isnot(None))
-        )
-        or 0
-    )
+    total_views = totals.views
+    unique_viewers = totals.unique_viewers
+    total_watch_time_hours = totals.watch_seconds / 3600
+    completion_rate = totals.completions / total_views if total_views > 0 else 0
+    avg_watch = totals.watch_seconds / total_views if total_views > 0 else 0
 
-    # Total watch time
-    total_watch_seconds = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.sum(playback_sessions.c.duration_watched)).select_from(playback_sessions)
-        )
-        or 0
-    )
-    total_watch_time_hours = total_watch_seconds / 3600
+    def views_since(since: datetime) -> int:
+        return sum(bucket.views for (_video_id, day), bucket in daily.items() if day >= since.date())
 
-    # Completion rate
-    completed_count = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.count()).select_from(playback_sessions).where(playback_sessions.c.completed.is_(True))
-        )
-        or 0
-    )
-    completion_rate = completed_count / total_views if total_views > 0 else 0
-
-    # Average watch duration
-    avg_watch = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.avg(playback_sessions.c.duration_watched)).select_from(playback_sessions)
-        )
-        or 0
-    )
-
-    # Views today
-    views_today = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.count())
-            .select_from(playback_sessions)
-            .where(playback_sessions.c.started_at >= today_start)
-        )
-        or 0
-    )
-
-    # Views this week
-    views_week = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.count())
-            .select_from(playback_sessions)
-            .where(playback_sessions.c.started_at >= week_start)
-        )
-        or 0
-    )
-
-    # Views this month
-    views_month = (
-        await fetch_val_with_retry(
-            sa.select(sa.func.count())
-            .select_from(playback_sessions)
-            .where(playback_sessions.c.started_at >= month_start)
-        )
-        or 0
-    )
+    views_today = views_since(today_start)
+    views_week = views_since(week_start)
+    views_month = views_since(month_start)
 
     result_data = {
         "total_views": total_views,
@@ -3896,8 +4194,8 @@ async def analytics_videos(
     elif period == "month":
         period_filter = today_start - timedelta(days=30)
 
-    # Build query with aggregations - use parameterized queries
-    period_clause = "AND ps.started_at >= :period_filter" if period_filter else ""
+    # Per-video totals come from rollups plus unrolled sessions
+    totals_query, params = video_totals_query(period_filter, await get_read_watermark())
 
     # Validate sort_by to prevent SQL injection (whitelist approach)
     valid_sort_columns = {
@@ -3912,29 +4210,33 @@ async def analytics_videos(
             v.id as video_id,
             v.title,
             v.slug,
-            COUNT(ps.id) as total_views,
-            COUNT(DISTINCT ps.viewer_id) as unique_viewers,
-            COALESCE(SUM(ps.duration_watched), 0) as total_watch_time_seconds,
-            COALESCE(AVG(ps.duration_watched), 0) as avg_watch_duration_seconds,
-            COALESCE(
-                SUM(CASE WHEN ps.completed THEN 1 ELSE 0 END) * 1.0 / NULLIF(COUNT(ps.id), 0), 0
-            ) as completion_rate,
-            (SELECT quality_used FROM playback_sessions WHERE video_id = v.id
-                GROUP BY quality_used ORDER BY COUNT(*) DESC LIMIT 1) as peak_quality
+            COALESCE(t.views, 0) as total_views,
+            COALESCE(t.watch_seconds, 0) as total_watch_time_seconds,
+            COALESCE(t.watch_seconds * 1.0 / NULLIF(t.views, 0), 0) as avg_watch_duration_seconds,
+            COALESCE(t.completions * 1.0 / NULLIF(t.views, 0), 0) as completion_rate
         FROM videos v
-        LEFT JOIN playback_sessions ps ON v.id = ps.video_id {period_clause}
+        LEFT JOIN ({totals_query}) t ON v.id = t.video_id
         WHERE v.status = 'ready'
-        GROUP BY v.id
-        ORDER BY {order_clause}
+        ORDER BY {order_clause}, v.id
         LIMIT :limit OFFSET :offset
     """
 
-    params = {"limit": limit, "offset": offset}
-    if period_filter:
-        params["period_filter"] = period_filter.isoformat()
+    params.update(limit=limit, offset=offset)
 
     rows = await database.fetch_all(sa.text(base_query).bindparams(**params))
 
+    # Unique viewers (merged sketches over the period) and all-time peak quality for this page
+    page_buckets = await fetch_daily_buckets(video_ids=[row["video_id"] for row in rows])
+    unique_by_video = {}
+    peak_by_video = {}
+    for row in rows:
+        video_days = {day: bucket for (vid, day), bucket in page_buckets.items() if vid == row["video_id"]}
+        peak_by_video[row["video_id"]] = merge_buckets(video_days.values()).peak_quality
+        period_days = [
+            bucket for day, bucket in video_days.items() if period_filter is None or day >= period_filter.date()
+        ]
+        unique_by_video[row["video_id"]] = merge_buckets(period_days).unique_viewers
+
     # Get total count
     count_result = await fetch_val_with_retry(
         sa.select(sa.func.count()).select_from(videos).where(videos.c.status == VideoStatus.READY)
@@ -3949,11 +4251,11 @@ async def analytics_videos(
                 slug=row["slug"],
                 thumbnail_url=f"/videos/{row['slug']}/thumbnail.jpg",
                 total_views=row["total_views"] or 0,
-                unique_viewers=row["unique_viewers"] or 0,
+                unique_viewers=unique_by_video[row["video_id"]],
                 total_watch_time_seconds=row["total_watch_time_seconds"] or 0,
                 avg_watch_duration_seconds=round(row["avg_watch_duration_seconds"] or 0, 1),
                 completion_rate=round(row["completion_rate"] or 0, 2),
-                peak_quality=row["peak_quality"],
+                peak_quality=peak_by_video[row["video_id"]],
             )
         )
 
@@ -4111,36 +4413,22 @@ async def analytics_trends(
     valid_periods = {"7d": 7, "30d": 30, "90d": 90}
     days = valid_periods.get(period, 30)
 
-    # Build query with parameterized values
-    video_clause = "AND video_id = :video_id" if video_id else ""
-
-    base_query = f"""
-        SELECT
-            CAST(started_at AS DATE) as date,
-            COUNT(*) as views,
-            COUNT(DISTINCT viewer_id) as unique_viewers,
-            COALESCE(SUM(duration_watched), 0) / 3600.0 as watch_time_hours
-        FROM playback_sessions
-        WHERE started_at >= CURRENT_DATE - :days_offset * INTERVAL '1 day'
-        {video_clause}
-        GROUP BY CAST(started_at AS DATE)
-        ORDER BY date
-    """
-
-    params = {"days_offset": days}
-    if video_id:
-        params["video_id"] = video_id
-
-    rows = await database.fetch_all(sa.text(base_query).bindparams(**params))
+    # Daily points from rollups plus unrolled sessions
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    daily = await fetch_daily_buckets(
+        since=today_start - timedelta(days=days),
+        video_ids=[video_id] if video_id else None,
+    )
 
     data = [
         TrendDataPoint(
-            date=str(r["date"]),
-            views=r["views"],
-            unique_viewers=r["unique_viewers"] or 0,
-            watch_time_hours=round(r["watch_time_hours"], 2),
+            date=str(day),
+            views=bucket.views,
+            unique_viewers=bucket.unique_viewers,
+            watch_time_hours=round(bucket.watch_seconds / 3600.0, 2),
         )
-        for r in rows
+        for (_video_id, day), bucket in sorted(daily.items(), key=lambda item: item[0][1])
+        if bucket.views
     ]
 
     result_data = {
@@ -4491,7 +4779,11 @@ async def list_active_jobs(request: Request) -> ActiveJobsResponse:
         FROM transcoding_jobs tj
         JOIN videos v ON tj.video_id = v.id
         LEFT JOIN workers w ON tj.worker_id = w.worker_id
-        WHERE v.status IN ('pending', 'processing')
+        WHERE (
+            v.status IN ('pending', 'processing')
+            -- Progressively published, still transcoding
+            OR (v.status = 'ready' AND tj.claimed_at IS NOT NULL AND tj.completed_at IS NULL)
+          )
           AND v.deleted_at IS NULL
         ORDER BY tj.claimed_at DESC NULLS LAST, v.created_at ASC
     """)
@@ -4515,8 +4807,8 @@ async def list_active_jobs(request: Request) -> ActiveJobsResponse:
     for row in rows:
         caps = parse_worker_capabilities(row["capabilities"])
 
-        # Count by status
-        if row["video_status"] == "processing":
+        # Count by status (ready: progressively published, still transcoding)
+        if row["video_status"] in ("processing", "ready"):
             processing_count += 1
         else:
             pending_count += 1
@@ -4724,7 +5016,8 @@ async def disable_worker(request: Request, worker_id: str):
             job = await database.fetch_one(
                 transcoding_jobs.select().where(transcoding_jobs.c.id == worker["current_job_id"])
             )
-            if job and not job["completed_at"]:
+            # A split job is held by no worker and stays split
+            if job and not job["completed_at"] and job["worker_id"] == worker["worker_id"]:
                 # Release the job claim
                 await database.execute(
                     transcoding_jobs.update()
@@ -4736,8 +5029,20 @@ async def disable_worker(request: Request, worker_id: str):
                         current_step=None,
                     )
                 )
-                # Reset video status
-                await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(status="pending"))
+                # Reset video status (a progressively published video stays ready)
+                await database.execute(
+                    videos.update()
+                    .where(videos.c.id == job["video_id"])
+                    .values(status=sa.case((videos.c.status == "ready", "ready"), else_="pending"))
+                )
+
+        # Release any claimed rendition tasks of split jobs
+        await database.execute(
+            transcoding_tasks.update()
+            .where(transcoding_tasks.c.worker_id == worker["worker_id"])
+            .where(transcoding_tasks.c.status == "in_progress")
+            .values(status="pending", worker_id=None, claimed_at=None, claim_expires_at=None)
+        )
 
     # Audit log
     log_audit(
@@ -4814,7 +5119,8 @@ async def delete_worker(
             job = await database.fetch_one(
                 transcoding_jobs.select().where(transcoding_jobs.c.id == worker["current_job_id"])
             )
-            if job and not job["completed_at"]:
+            # A split job is held by no worker and stays split
+            if job and not job["completed_at"] and job["worker_id"] == worker["worker_id"]:
                 await database.execute(
                     transcoding_jobs.update()
                     .where(transcoding_jobs.c.id == job["id"])
@@ -4825,7 +5131,20 @@ async def delete_worker(
                         current_step=None,
                     )
                 )
-                await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(status="pending"))
+                # A progressively published video stays ready
+                await database.execute(
+                    videos.update()
+                    .where(videos.c.id == job["video_id"])
+                    .values(status=sa.case((videos.c.status == "ready", "ready"), else_="pending"))
+                )
+
+        # Release any claimed rendition tasks of split jobs
+        await database.execute(
+            transcoding_tasks.update()
+            .where(transcoding_tasks.c.worker_id == worker["worker_id"])
+            .where(transcoding_tasks.c.status == "in_progress")
+            .values(status="pending", worker_id=None, claimed_at=None, claim_expires_at=None)
+        )
 
         # Revoke API keys if requested
         if revoke_keys:
@@ -4844,6 +5163,9 @@ async def delete_worker(
         # Delete the worker record
         await database.execute(workers.delete().where(workers.c.id == worker["id"]))
 
+    if revoke_keys:
+        await invalidate_worker_key_cache(worker["id"])
+
     # Audit log
     log_audit(
         AuditAction.WORKER_DELETE,
@@ -9093,6 +9415,7 @@ async def reprocess_dead_letter_job(
                     attempt=job["attempt"] + 1 if job["attempt"] else 1,
                 )
             )
+            await db_execute_with_retry(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job_id))
         else:
             # Create a new job if old one doesn't exist
             # db_execute_with_retry returns the inserted row ID
@@ -0,0 +1,304 @@
+"""
+Write-behind buffer for playback heartbeats.
+
+Every viewer sends a heartbeat about every 30 seconds. Writing each one
+immediately costs a SELECT of the session plus an UPDATE plus a video_stats
+upsert, which dominates database writes with a few thousand concurrent viewers.
+
+Instead, heartbeats are coalesced per session token in memory (watch time is
+summed, the furthest position and latest quality kept) and written every
+ANALYTICS_WRITE_BUFFER_FLUSH_INTERVAL seconds as one batched UPDATE of
+playback_sessions plus one batched video_stats increment. Updates are relative
+(duration_watched + delta, GREATEST(max_position, ...)), so several public API
+instances buffering heartbeats for the same session never overwrite each other.
+
+Session tokens already seen by this process are remembered with their video, so
+steady-state heartbeats need no database round trip at all.
+
+The buffer is flushed on shutdown; a crash loses at most one flush interval of
+playback progress. Ending a session (pop_session) removes its buffered progress
+so the end endpoint can write it together with the final update.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import sqlalchemy as sa
+
+from api.db_retry import db_execute_with_retry
+from api.metrics import (
+    ANALYTICS_BUFFER_FLUSH_DURATION_SECONDS,
+    ANALYTICS_BUFFER_FLUSH_ERRORS_TOTAL,
+    ANALYTICS_BUFFER_FLUSHED_SESSIONS_TOTAL,
+    ANALYTICS_BUFFER_PENDING_SESSIONS,
+)
+from api.video_stats import increment_watch_seconds_batch
+from config import (
+    ANALYTICS_WRITE_BUFFER_ENABLED,
+    ANALYTICS_WRITE_BUFFER_FLUSH_INTERVAL,
+    ANALYTICS_WRITE_BUFFER_MAX_PENDING,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session tokens remembered (with their video ID) to skip the heartbeat lookup
+KNOWN_SESSIONS_MAX = 50000
+
+# Apply a batch of session deltas in one statement (PostgreSQL)
+_UPDATE_SESSIONS_BATCH_SQL = sa.text("""
+    UPDATE playback_sessions AS ps SET
+        duration_watched = COALESCE(ps.duration_watched, 0) + batch.watch_seconds,
+        max_position = GREATEST(COALESCE(ps.max_position, 0), batch.max_position),
+        quality_used = COALESCE(batch.quality, ps.quality_used)
+    FROM (
+        SELECT unnest(CAST(:session_tokens AS text[])) AS session_token,
+               unnest(CAST(:watch_seconds AS double precision[])) AS watch_seconds,
+               unnest(CAST(:max_positions AS double precision[])) AS max_position,
+               unnest(CAST(:qualities AS text[])) AS quality
+    ) AS batch
+    WHERE ps.session_token = batch.session_token
+""")
+
+# Per-session fallback for other databases (SQLite's scalar MAX is GREATEST)
+_UPDATE_SESSION_SQL = sa.text("""
+    UPDATE playback_sessions SET
+        duration_watched = COALESCE(duration_watched, 0) + :watch_seconds,
+        max_position = MAX(COALESCE(max_position, 0), :max_position),
+        quality_used = COALESCE(:quality, quality_used)
+    WHERE session_token = :session_token
+""")
+
+# Background flush task
+_flush_task: Optional[asyncio.Task] = None
+
+
+@dataclass
+class SessionDelta:
+    """Playback progress buffered for one session since the last flush."""
+
+    video_id: int
+    watch_seconds: float = 0.0
+    max_position: float = 0.0
+    quality: Optional[str] = None
+
+    def merge(self, other: "SessionDelta") -> None:
+        """Fold an older delta for the same session into this one."""
+        self.watch_seconds += other.watch_seconds
+        self.max_position = max(self.max_position, other.max_position)
+        if self.quality is None:
+            self.quality = other.quality
+
+
+class AnalyticsWriteBuffer:
+    """
+    Coalesces playback heartbeats per session and writes them in batches.
+
+    Usage:
+        video_id = analytics_buffer.get_session_video(token)  # None: look it up
+        analytics_buffer.add_heartbeat(token, video_id, 30.0, position, quality)
+        if analytics_buffer.should_flush():
+            await analytics_buffer.flush()
+    """
+
+    def __init__(self, enabled: bool = True, max_pending: int = 5000):
+        """
+        Initialize the buffer.
+
+        Args:
+            enabled: Whether to buffer (False: should_flush() is always True)
+            max_pending: Number of buffered sessions that triggers an early flush
+        """
+        self._enabled = enabled
+        self._max_pending = max_pending
+        self._pending: Dict[str, SessionDelta] = {}
+        self._known_sessions: "OrderedDict[str, int]" = OrderedDict()
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def remember_session(self, session_token: str, video_id: int) -> None:
+        """Remember that a session exists and which video it belongs to."""
+        self._known_sessions[session_token] = video_id
+        self._known_sessions.move_to_end(session_token)
+        while len(self._known_sessions) > KNOWN_SESSIONS_MAX:
+            self._known_sessions.popitem(last=False)
+
+    def get_session_video(self, session_token: str) -> Optional[int]:
+        """Get the video of a session seen by this process, or None if unknown."""
+        return self._known_sessions.get(session_token)
+
+    def add_heartbeat(
+        self,
+        session_token: str,
+        video_id: int,
+        watch_seconds: float,
+        position: float,
+        quality: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer one heartbeat.
+
+        Args:
+            session_token: Playback session token
+            video_id: Video the session belongs to
+            watch_seconds: Seconds of playback since the previous heartbeat
+            position: Current playback position
+            quality: Quality currently playing, if reported
+        """
+        delta = self._pending.get(session_token)
+        if delta is None:
+            delta = self._pending[session_token] = SessionDelta(video_id=video_id)
+        delta.watch_seconds += watch_seconds
+        delta.max_position = max(delta.max_position, position)
+        if quality:
+            delta.quality = quality
+        ANALYTICS_BUFFER_PENDING_SESSIONS.set(len(self._pending))
+
+    def pop_session(self, session_token: str) -> Optional[SessionDelta]:
+        """
+        Remove and return a session's buffered progress (e.g. when it ends).
+
+        The session is also forgotten, so later heartbeats are looked up again.
+        """
+        self._known_sessions.pop(session_token, None)
+        delta = self._pending.pop(session_token, None)
+        ANALYTICS_BUFFER_PENDING_SESSIONS.set(len(self._pending))
+        return delta
+
+    def should_flush(self) -> bool:
+        """Whether the caller should flush now (buffering disabled or buffer full)."""
+        return bool(self._pending) and (not self._enabled or len(self._pending) >= self._max_pending)
+
+    async def flush(self) -> int:
+        """
+        Write all buffered progress.
+
+        If the session update fails, the batch is kept and retried on the next
+        flush. Counter increment failures are only logged; video stats
+        reconciliation corrects them.
+
+        Returns:
+            Number of sessions written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            ANALYTICS_BUFFER_PENDING_SESSIONS.set(0)
+
+            started = time.monotonic()
+            try:
+                await _write_session_deltas(batch)
+            except Exception as e:
+                ANALYTICS_BUFFER_FLUSH_ERRORS_TOTAL.inc()
+                logger.warning(f"Failed to flush {len(batch)} buffered playback sessions: {e}")
+                self._requeue(batch)
+                return 0
+
+            watch_seconds_by_video: Dict[int, float] = {}
+            for delta in batch.values():
+                watch_seconds_by_video[delta.video_id] = (
+                    watch_seconds_by_video.get(delta.video_id, 0.0) + delta.watch_seconds
+                )
+            try:
+                await increment_watch_seconds_batch(watch_seconds_by_video)
+            except Exception as e:
+                logger.warning(f"Failed to update watch time counters: {e}")
+
+            ANALYTICS_BUFFER_FLUSH_DURATION_SECONDS.observe(time.monotonic() - started)
+            ANALYTICS_BUFFER_FLUSHED_SESSIONS_TOTAL.inc(len(batch))
+            return len(batch)
+
+    def _requeue(self, batch: Dict[str, SessionDelta]) -> None:
+        """Put a failed batch back, merging with heartbeats buffered meanwhile."""
+        for session_token, delta in batch.items():
+            newer = self._pending.get(session_token)
+            if newer is None:
+                self._pending[session_token] = delta
+            else:
+                newer.merge(delta)
+        ANALYTICS_BUFFER_PENDING_SESSIONS.set(len(self._pending))
+
+
+async def _write_session_deltas(batch: Dict[str, SessionDelta]) -> None:
+    """Apply buffered deltas to playback_sessions."""
+    from api.database import database
+
+    if not str(database.url).startswith("postgresql"):
+        for session_token, delta in batch.items():
+            await db_execute_with_retry(
+                _UPDATE_SESSION_SQL.bindparams(
+                    session_token=session_token,
+                    watch_seconds=delta.watch_seconds,
+                    max_position=delta.max_position,
+                    quality=delta.quality,
+                )
+            )
+        return
+
+    await db_execute_with_retry(
+        _UPDATE_SESSIONS_BATCH_SQL.bindparams(
+            session_tokens=list(batch),
+            watch_seconds=[delta.watch_seconds for delta in batch.values()],
+            max_positions=[delta.max_position for delta in batch.values()],
+            qualities=[delta.quality for delta in batch.values()],
+        )
+    )
+
+
+# Global buffer for the public API process
+analytics_buffer = AnalyticsWriteBuffer(
+    enabled=ANALYTICS_WRITE_BUFFER_ENABLED,
+    max_pending=ANALYTICS_WRITE_BUFFER_MAX_PENDING,
+)
+
+
+async def _periodic_flush() -> None:
+    """Background task flushing the analytics buffer."""
+    while True:
+        try:
+            await asyncio.sleep(ANALYTICS_WRITE_BUFFER_FLUSH_INTERVAL)
+            await analytics_buffer.flush()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Error flushing analytics buffer: {e}")
+
+
+def start_analytics_flusher() -> Optional[asyncio.Task]:
+    """
+    Start the periodic flush task.
+
+    Returns:
+        The asyncio Task, or None if buffering is disabled.
+    """
+    global _flush_task
+
+    if not ANALYTICS_WRITE_BUFFER_ENABLED:
+        return None
+
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_periodic_flush())
+    return _flush_task
+
+
+async def stop_analytics_flusher() -> None:
+    """Stop the periodic flush task and write whatever is still buffered."""
+    global _flush_task
+
+    if _flush_task and not _flush_task.done():
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+    _flush_task = None
+
+    flushed = await analytics_buffer.flush()
+    if flushed:
+        logger.info(f"Flushed {flushed} buffered playback sessions on shutdown")
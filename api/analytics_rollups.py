@@ -0,0 +1,583 @@
+"""
+Hourly and daily playback rollups for the admin analytics dashboard.
+
+The dashboard used to aggregate the whole playback_sessions table on every cache
+miss, so its cost grew with every month of retained sessions. Instead, a
+background job in the admin API rolls sessions up per video into hourly
+buckets (playback_rollups_hourly) and, once a day is complete, into daily
+buckets (playback_rollups_daily). Each bucket holds:
+- views, watch seconds and completions
+- a HyperLogLog sketch of viewer IDs, mergeable across buckets for unique viewers
+- session counts per quality
+
+video_id 0 holds the totals across all videos. It is written for every rolled-up
+hour, even without views, so the latest one marks the watermark: everything
+before it is rolled up, everything after it is read from playback_sessions
+(at most a few hours, pruned by the started_at index and monthly partitions).
+With rollups disabled or not built yet, sessions are aggregated per video and
+day by the database instead; unique viewers are then per-day distinct counts,
+which add up across days (a viewer active on several days counts once per day).
+
+Sessions are attributed to the hour they started in. Since heartbeats keep
+adding watch time after that hour closes, every run recomputes the last
+ANALYTICS_ROLLUP_LOOKBACK_HOURS rolled-up hours (replacing their rows), then
+advances the watermark by up to ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN hours. On a
+fresh install the same loop backfills from the oldest session.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import zlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import sqlalchemy as sa
+
+from api.database import playback_rollups_daily, playback_rollups_hourly, playback_sessions
+from api.db_retry import fetch_all_with_retry, fetch_val_with_retry
+from config import (
+    ANALYTICS_ROLLUP_INTERVAL,
+    ANALYTICS_ROLLUP_LOOKBACK_HOURS,
+    ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rollup rows holding the totals across all videos
+ALL_VIDEOS = 0
+
+# Hourly rows older than this are deleted once their day is rolled up
+HOURLY_RETENTION = timedelta(days=7)
+
+# Background rollup task
+_rollup_task: Optional[asyncio.Task] = None
+
+
+class ViewerSketch:
+    """
+    HyperLogLog sketch estimating the number of distinct viewers.
+
+    2^10 one-byte registers give a standard error of about 3%. Small sets are
+    counted almost exactly (linear counting). Sketches merge losslessly, so unique
+    viewers over any range of buckets is the estimate of their merged sketch.
+    """
+
+    PRECISION = 10
+    REGISTERS = 1 << PRECISION
+
+    def __init__(self, registers: Optional[bytes] = None):
+        self._registers = bytearray(registers) if registers else bytearray(self.REGISTERS)
+
+    def add(self, viewer_id: int) -> None:
+        """Add a viewer to the sketch."""
+        hashed = int.from_bytes(hashlib.blake2b(str(viewer_id).encode(), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self.PRECISION)
+        remaining = hashed & ((1 << (64 - self.PRECISION)) - 1)
+        rank = (64 - self.PRECISION) - remaining.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: "ViewerSketch") -> None:
+        """Merge another sketch into this one (set union)."""
+        self._registers = bytearray(max(a, b) for a, b in zip(self._registers, other._registers))
+
+    def estimate(self) -> int:
+        """Estimate the number of distinct viewers added."""
+        m = self.REGISTERS
+        zeros = self._registers.count(0)
+        if zeros == m:
+            return 0
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-register for register in self._registers)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def to_bytes(self) -> bytes:
+        """Serialize for storage (mostly-empty sketches compress to a few bytes)."""
+        return zlib.compress(bytes(self._registers))
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes]) -> "ViewerSketch":
+        """Deserialize a stored sketch (None gives an empty sketch)."""
+        return cls(zlib.decompress(data) if data else None)
+
+
+@dataclass
+class RollupBucket:
+    """Playback aggregates for one video (or all videos) over one bucket."""
+
+    views: int = 0
+    watch_seconds: float = 0.0
+    completions: int = 0
+    viewers: ViewerSketch = field(default_factory=ViewerSketch)
+    quality_counts: Dict[str, int] = field(default_factory=dict)
+    viewer_count: Optional[int] = None  # distinct viewers counted in SQL instead of sketched
+
+    def add_session(
+        self,
+        viewer_id: Optional[int],
+        duration_watched: Optional[float],
+        completed: Optional[bool],
+        quality: Optional[str],
+    ) -> None:
+        """Add one playback session."""
+        self.views += 1
+        self.watch_seconds += duration_watched or 0.0
+        if completed:
+            self.completions += 1
+        if viewer_id is not None:
+            self.viewers.add(viewer_id)
+        if quality:
+            self.quality_counts[quality] = self.quality_counts.get(quality, 0) + 1
+
+    def merge(self, other: "RollupBucket") -> None:
+        """Merge another bucket into this one."""
+        self.views += other.views
+        self.watch_seconds += other.watch_seconds
+        self.completions += other.completions
+        self.viewers.merge(other.viewers)
+        if other.viewer_count is not None:
+            self.viewer_count = (self.viewer_count or 0) + other.viewer_count
+        for quality, count in other.quality_counts.items():
+            self.quality_counts[quality] = self.quality_counts.get(quality, 0) + count
+
+    @property
+    def unique_viewers(self) -> int:
+        """Estimated distinct viewers (summed per-day counts for SQL-aggregated buckets)."""
+        if self.viewer_count is not None:
+            return self.viewer_count
+        return self.viewers.estimate()
+
+    @property
+    def peak_quality(self) -> Optional[str]:
+        """Quality used by the most sessions."""
+        if not self.quality_counts:
+            return None
+        return max(self.quality_counts.items(), key=lambda item: item[1])[0]
+
+    def to_values(self) -> dict:
+        """Column values for a rollup row."""
+        return {
+            "views": self.views,
+            "watch_seconds": self.watch_seconds,
+            "completions": self.completions,
+            "viewer_sketch": self.viewers.to_bytes(),
+            "quality_counts": json.dumps(self.quality_counts) if self.quality_counts else None,
+        }
+
+    @classmethod
+    def from_row(cls, row) -> "RollupBucket":
+        """Load a bucket from a rollup row."""
+        return cls(
+            views=row["views"] or 0,
+            watch_seconds=row["watch_seconds"] or 0.0,
+            completions=row["completions"] or 0,
+            viewers=ViewerSketch.from_bytes(row["viewer_sketch"]),
+            quality_counts=json.loads(row["quality_counts"]) if row["quality_counts"] else {},
+        )
+
+
+def _floor_hour(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _session_day(started_at: datetime) -> date:
+    return _floor_hour(started_at).date()
+
+
+async def get_rollup_watermark() -> Optional[datetime]:
+    """
+    Get the end of the last rolled-up hour.
+
+    Returns:
+        Sessions started before this are rolled up; None if nothing is rolled up yet
+    """
+    last_hour = await fetch_val_with_retry(
+        sa.select(sa.func.max(playback_rollups_hourly.c.hour)).where(playback_rollups_hourly.c.video_id == ALL_VIDEOS)
+    )
+    if last_hour is None:
+        return None
+    return _floor_hour(last_hour) + timedelta(hours=1)
+
+
+async def get_read_watermark() -> Optional[datetime]:
+    """
+    Get the watermark to read rollups up to.
+
+    Returns:
+        The rollup watermark, or None if rollups are disabled (their rows stop at the
+        last run, leaving an ever-growing range of unrolled sessions)
+    """
+    if ANALYTICS_ROLLUP_INTERVAL <= 0:
+        return None
+    return await get_rollup_watermark()
+
+
+async def roll_up_analytics(now: Optional[datetime] = None) -> int:
+    """
+    Recompute recent hourly rollups and advance the watermark.
+
+    Args:
+        now: Current time (closed hours before it are rolled up)
+
+    Returns:
+        Number of hours the watermark advanced (recomputed lookback hours not counted)
+    """
+    from api.database import database
+
+    current_hour = _floor_hour(now or datetime.now(timezone.utc))
+    watermark = await get_rollup_watermark()
+    if watermark is None:
+        # Nothing rolled up yet: backfill from the oldest session
+        earliest = await fetch_val_with_retry(sa.select(sa.func.min(playback_sessions.c.started_at)))
+        if earliest is None:
+            return 0
+        start = _floor_hour(earliest)
+        end = min(current_hour, start + timedelta(hours=ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN))
+    else:
+        start = watermark - timedelta(hours=ANALYTICS_ROLLUP_LOOKBACK_HOURS)
+        end = min(current_hour, watermark + timedelta(hours=ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN))
+    if end <= start:
+        return 0
+
+    sessions = await fetch_all_with_retry(
+        sa.select(
+            playback_sessions.c.video_id,
+            playback_sessions.c.viewer_id,
+            playback_sessions.c.duration_watched,
+            playback_sessions.c.completed,
+            playback_sessions.c.quality_used,
+            playback_sessions.c.started_at,
+        ).where(playback_sessions.c.started_at >= start, playback_sessions.c.started_at < end)
+    )
+
+    hours = int((end - start) / timedelta(hours=1))
+    buckets: Dict[Tuple[int, datetime], RollupBucket] = {
+        (ALL_VIDEOS, start + timedelta(hours=i)): RollupBucket() for i in range(hours)
+    }
+    for session in sessions:
+        hour = _floor_hour(session["started_at"])
+        for video_id in (session["video_id"], ALL_VIDEOS):
+            bucket = buckets.setdefault((video_id, hour), RollupBucket())
+            bucket.add_session(
+                session["viewer_id"], session["duration_watched"], session["completed"], session["quality_used"]
+            )
+
+    # Days completed within [start, end) are rolled up into daily rows
+    completed_days = [
+        day
+        for day in sorted({(start + timedelta(hours=i)).date() for i in range(hours)})
+        if _day_start(day) + timedelta(days=1) <= end
+    ]
+
+    async with database.transaction():
+        await database.execute(
+            playback_rollups_hourly.delete().where(
+                playback_rollups_hourly.c.hour >= start, playback_rollups_hourly.c.hour < end
+            )
+        )
+        await database.execute_many(
+            playback_rollups_hourly.insert(),
+            [
+                {"video_id": video_id, "hour": hour, **bucket.to_values()}
+                for (video_id, hour), bucket in buckets.items()
+            ],
+        )
+
+        for day in completed_days:
+            await _roll_up_day(database, day)
+
+        await database.execute(
+            playback_rollups_hourly.delete().where(playback_rollups_hourly.c.hour < end - HOURLY_RETENTION)
+        )
+
+    return int((end - (watermark or start)) / timedelta(hours=1))
+
+
+async def _roll_up_day(database, day: date) -> None:
+    """Replace a day's daily rows with the merge of its hourly rows."""
+    day_start = _day_start(day)
+    rows = await database.fetch_all(
+        playback_rollups_hourly.select().where(
+            playback_rollups_hourly.c.hour >= day_start,
+            playback_rollups_hourly.c.hour < day_start + timedelta(days=1),
+        )
+    )
+    daily: Dict[int, RollupBucket] = {}
+    for row in rows:
+        daily.setdefault(row["video_id"], RollupBucket()).merge(RollupBucket.from_row(row))
+
+    await database.execute(playback_rollups_daily.delete().where(playback_rollups_daily.c.day == day))
+    if daily:
+        await database.execute_many(
+            playback_rollups_daily.insert(),
+            [{"video_id": video_id, "day": day, **bucket.to_values()} for video_id, bucket in daily.items()],
+        )
+
+
+@dataclass
+class RollupRanges:
+    """Where each part of a time range is read from."""
+
+    daily: Optional[Tuple[Optional[date], date]]  # [from, to) days, None = no daily rows
+    hourly: Optional[Tuple[datetime, datetime]]  # [from, to) hours, None = no hourly rows
+    raw_from: Optional[datetime]  # sessions started at or after this (None = all)
+
+
+def get_rollup_ranges(since: Optional[datetime], watermark: Optional[datetime]) -> RollupRanges:
+    """
+    Split [since, now) into complete days, remaining rolled-up hours and raw sessions.
+
+    Args:
+        since: Start of the range (None = all time)
+        watermark: End of the last rolled-up hour (None = nothing rolled up)
+    """
+    if watermark is None:
+        return RollupRanges(daily=None, hourly=None, raw_from=since)
+
+    full_days_end = _day_start(watermark.date())
+    daily_from = since.date() if since else None
+    daily = (daily_from, full_days_end.date()) if daily_from is None or daily_from < full_days_end.date() else None
+    hourly_from = max(since, full_days_end) if since else full_days_end
+    hourly = (hourly_from, watermark) if hourly_from < watermark else None
+    raw_from = max(since, watermark) if since else watermark
+    return RollupRanges(daily=daily, hourly=hourly, raw_from=raw_from)
+
+
+async def fetch_daily_buckets(
+    since: Optional[datetime] = None,
+    video_ids: Optional[Sequence[int]] = None,
+) -> Dict[Tuple[int, date], RollupBucket]:
+    """
+    Get playback aggregates per video and day from rollups plus unrolled sessions.
+
+    With rollups disabled or not built yet, sessions in the range are aggregated
+    by the database instead.
+
+    Args:
+        since: Start of the range, day-aligned (None = all time)
+        video_ids: Videos to include, or None for the all-videos totals (keyed ALL_VIDEOS)
+
+    Returns:
+        Buckets keyed by (video_id, day)
+    """
+    watermark = await get_read_watermark()
+    if watermark is None:
+        return await _aggregate_daily_sessions(since, video_ids)
+
+    ranges = get_rollup_ranges(since, watermark)
+    rollup_video_ids = [ALL_VIDEOS] if video_ids is None else list(video_ids)
+    buckets: Dict[Tuple[int, date], RollupBucket] = {}
+
+    if ranges.daily:
+        query = playback_rollups_daily.select().where(
+            playback_rollups_daily.c.video_id.in_(rollup_video_ids),
+            playback_rollups_daily.c.day < ranges.daily[1],
+        )
+        if ranges.daily[0] is not None:
+            query = query.where(playback_rollups_daily.c.day >= ranges.daily[0])
+        for row in await fetch_all_with_retry(query):
+            buckets[(row["video_id"], row["day"])] = RollupBucket.from_row(row)
+
+    if ranges.hourly:
+        query = playback_rollups_hourly.select().where(
+            playback_rollups_hourly.c.video_id.in_(rollup_video_ids),
+            playback_rollups_hourly.c.hour >= ranges.hourly[0],
+            playback_rollups_hourly.c.hour < ranges.hourly[1],
+        )
+        for row in await fetch_all_with_retry(query):
+            key = (row["video_id"], _session_day(row["hour"]))
+            buckets.setdefault(key, RollupBucket()).merge(RollupBucket.from_row(row))
+
+    # Sessions since the watermark (at most a few hours)
+    query = sa.select(
+        playback_sessions.c.video_id,
+        playback_sessions.c.viewer_id,
+        playback_sessions.c.duration_watched,
+        playback_sessions.c.completed,
+        playback_sessions.c.quality_used,
+        playback_sessions.c.started_at,
+    ).where(playback_sessions.c.started_at >= ranges.raw_from)
+    if video_ids is not None:
+        query = query.where(playback_sessions.c.video_id.in_(rollup_video_ids))
+    for session in await fetch_all_with_retry(query):
+        video_id = ALL_VIDEOS if video_ids is None else session["video_id"]
+        bucket = buckets.setdefault((video_id, _session_day(session["started_at"])), RollupBucket())
+        bucket.add_session(
+            session["viewer_id"], session["duration_watched"], session["completed"], session["quality_used"]
+        )
+
+    return buckets
+
+
+async def _aggregate_daily_sessions(
+    since: Optional[datetime],
+    video_ids: Optional[Sequence[int]],
+) -> Dict[Tuple[int, date], RollupBucket]:
+    """
+    Aggregate sessions per video and day in the database (no rollups to read).
+
+    Unique viewers are per-day distinct counts (viewer_count); sketches can't be
+    built without fetching every session.
+    """
+    day = sa.cast(playback_sessions.c.started_at, sa.Date).label("day")
+    group_by = [day] if video_ids is None else [playback_sessions.c.video_id, day]
+    conditions = []
+    if since is not None:
+        conditions.append(playback_sessions.c.started_at >= since)
+    if video_ids is not None:
+        conditions.append(playback_sessions.c.video_id.in_(list(video_ids)))
+
+    def key(row) -> Tuple[int, date]:
+        return (ALL_VIDEOS if video_ids is None else row["video_id"], row["day"])
+
+    totals_query = (
+        sa.select(
+            *group_by,
+            sa.func.count().label("views"),
+            sa.func.coalesce(sa.func.sum(playback_sessions.c.duration_watched), 0).label("watch_seconds"),
+            sa.func.sum(sa.case((playback_sessions.c.completed.is_(True), 1), else_=0)).label("completions"),
+            sa.func.count(sa.distinct(playback_sessions.c.viewer_id)).label("viewers"),
+        )
+        .where(*conditions)
+        .group_by(*group_by)
+    )
+    buckets: Dict[Tuple[int, date], RollupBucket] = {}
+    for row in await fetch_all_with_retry(totals_query):
+        buckets[key(row)] = RollupBucket(
+            views=row["views"],
+            watch_seconds=float(row["watch_seconds"]),
+            completions=row["completions"] or 0,
+            viewer_count=row["viewers"],
+        )
+
+    quality_query = (
+        sa.select(*group_by, playback_sessions.c.quality_used, sa.func.count().label("sessions"))
+        .where(*conditions, playback_sessions.c.quality_used.isnot(None))
+        .group_by(*group_by, playback_sessions.c.quality_used)
+    )
+    for row in await fetch_all_with_retry(quality_query):
+        bucket = buckets.get(key(row))
+        if bucket is not None:
+            bucket.quality_counts[row["quality_used"]] = row["sessions"]
+
+    return buckets
+
+
+def merge_buckets(buckets: Iterable[RollupBucket]) -> RollupBucket:
+    """Merge buckets into one total."""
+    total = RollupBucket()
+    for bucket in buckets:
+        total.merge(bucket)
+    return total
+
+
+def video_totals_query(since: Optional[datetime], watermark: Optional[datetime]) -> Tuple[str, dict]:
+    """
+    Build a subquery of per-video (video_id, views, watch_seconds, completions) totals.
+
+    Returns:
+        SQL text for use as a derived table, and its bind parameters
+    """
+    ranges = get_rollup_ranges(since, watermark)
+    parts: List[str] = []
+    params: dict = {}
+
+    if ranges.daily:
+        daily_clause = "AND day >= :rollup_daily_from" if ranges.daily[0] is not None else ""
+        parts.append(f"""
+            SELECT video_id, views, watch_seconds, completions FROM playback_rollups_daily
+            WHERE video_id <> {ALL_VIDEOS} AND day < :rollup_daily_to {daily_clause}
+        """)
+        params["rollup_daily_to"] = ranges.daily[1]
+        if ranges.daily[0] is not None:
+            params["rollup_daily_from"] = ranges.daily[0]
+    if ranges.hourly:
+        parts.append(f"""
+            SELECT video_id, views, watch_seconds, completions FROM playback_rollups_hourly
+            WHERE video_id <> {ALL_VIDEOS} AND hour >= :rollup_hourly_from AND hour < :rollup_hourly_to
+        """)
+        params["rollup_hourly_from"] = ranges.hourly[0]
+        params["rollup_hourly_to"] = ranges.hourly[1]
+
+    raw_clause = "WHERE started_at >= :rollup_raw_from" if ranges.raw_from is not None else ""
+    parts.append(f"""
+        SELECT video_id, 1 AS views, COALESCE(duration_watched, 0) AS watch_seconds,
+               CASE WHEN completed THEN 1 ELSE 0 END AS completions
+        FROM playback_sessions {raw_clause}
+    """)
+    if ranges.raw_from is not None:
+        params["rollup_raw_from"] = ranges.raw_from
+
+    union = " UNION ALL ".join(parts)
+    query = f"""
+        SELECT video_id, SUM(views) AS views, SUM(watch_seconds) AS watch_seconds,
+               SUM(completions) AS completions
+        FROM ({union}) AS rollup_sources
+        GROUP BY video_id
+    """
+    return query, params
+
+
+async def _periodic_rollup() -> None:
+    """Background task rolling up playback sessions."""
+    while True:
+        try:
+            await asyncio.sleep(ANALYTICS_ROLLUP_INTERVAL)
+            started = asyncio.get_running_loop().time()
+            # Keep going while a full step was rolled up (backfill, or catching up after downtime)
+            hours = 0
+            while True:
+                rolled = await roll_up_analytics()
+                hours += rolled
+                if rolled < ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN:
+                    break
+            if hours:
+                elapsed = asyncio.get_running_loop().time() - started
+                logger.info(f"Rolled up {hours} hours of playback analytics in {elapsed:.2f}s")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Error during analytics rollup: {e}")
+
+
+def start_analytics_rollups() -> Optional[asyncio.Task]:
+    """
+    Start the periodic rollup task.
+
+    Returns:
+        The asyncio Task, or None if rollups are disabled (interval 0).
+    """
+    global _rollup_task
+
+    if ANALYTICS_ROLLUP_INTERVAL <= 0:
+        logger.info("Analytics rollups disabled")
+        return None
+
+    if _rollup_task is None or _rollup_task.done():
+        _rollup_task = asyncio.create_task(_periodic_rollup())
+    return _rollup_task
+
+
+async def stop_analytics_rollups() -> None:
+    """Stop the periodic rollup task."""
+    global _rollup_task
+
+    if _rollup_task and not _rollup_task.done():
+        _rollup_task.cancel()
+        try:
+            await _rollup_task
+        except asyncio.CancelledError:
+            pass
+    _rollup_task = None
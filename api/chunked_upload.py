@@ -0,0 +1,236 @@
+"""
+Resumable, parallel chunked uploads of large source files.
+
+A single multipart upload of a 50 GB file runs over one TCP connection and
+starts over if it drops. With chunked uploads (tus-style, see the
+/api/uploads endpoints in api/admin.py):
+
+1. The client creates an upload session with the file size; the server picks
+   the chunk size and preallocates the file.
+2. The client PUTs chunks by index, in parallel and in any order, each with
+   its SHA-256 (X-Chunk-SHA256). Chunks are written at their offset with
+   positional writes, so no assembly pass is needed; a chunk only counts as
+   received once its checksum matched and its data was flushed to disk.
+3. After a dropped connection, the client asks which chunks are missing and
+   sends only those.
+4. Completing the session renames the file into UPLOADS_DIR (no re-read).
+
+Sessions live under UPLOADS_DIR/.chunked/{upload_id}/ (session.json, the
+preallocated data file, and one marker file per received chunk, so concurrent
+chunk requests never rewrite shared state). Sessions not completed within
+CHUNKED_UPLOAD_EXPIRY_HOURS are removed by sweep_expired_sessions().
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+import shutil
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+from config import UPLOADS_DIR
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_SUBDIR = ".chunked"
+
+# Bytes buffered before each positional write
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+_UPLOAD_ID_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+class ChunkError(ValueError):
+    """A chunk was rejected (wrong index, size or checksum)."""
+
+
+@dataclass
+class UploadSession:
+    """State of a chunked upload, stored as session.json."""
+
+    upload_id: str
+    size: int
+    chunk_size: int
+    filename: str
+    created_at: float
+    metadata: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
+
+    def chunk_length(self, index: int) -> int:
+        """Expected length of a chunk (the last one may be shorter)."""
+        if index < 0 or index >= self.chunk_count:
+            raise ChunkError(f"Chunk index must be between 0 and {self.chunk_count - 1}")
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+
+def sessions_dir() -> Path:
+    return UPLOADS_DIR / SESSIONS_SUBDIR
+
+
+def _session_dir(upload_id: str) -> Path:
+    if not _UPLOAD_ID_RE.match(upload_id):
+        raise KeyError(upload_id)
+    return sessions_dir() / upload_id
+
+
+def _data_path(upload_id: str) -> Path:
+    return _session_dir(upload_id) / "data.part"
+
+
+def _chunks_dir(upload_id: str) -> Path:
+    return _session_dir(upload_id) / "chunks"
+
+
+def create_session(size: int, chunk_size: int, filename: str, metadata: Dict[str, object]) -> UploadSession:
+    """
+    Create a session and preallocate its file (sparse where supported).
+
+    Raises:
+        OSError: If the storage is unavailable or full
+    """
+    session = UploadSession(
+        upload_id=secrets.token_urlsafe(24),
+        size=size,
+        chunk_size=chunk_size,
+        filename=filename,
+        created_at=time.time(),
+        metadata=metadata,
+    )
+    session_dir = _session_dir(session.upload_id)
+    (session_dir / "chunks").mkdir(parents=True)
+    try:
+        with open(_data_path(session.upload_id), "wb") as f:
+            f.truncate(size)
+        temp_path = session_dir / "session.json.tmp"
+        temp_path.write_text(json.dumps(asdict(session)))
+        os.replace(temp_path, session_dir / "session.json")
+    except Exception:
+        shutil.rmtree(session_dir, ignore_errors=True)
+        raise
+    return session
+
+
+def load_session(upload_id: str) -> Optional[UploadSession]:
+    """The session with this ID (None if it does not exist or has expired and was removed)."""
+    try:
+        data = json.loads((_session_dir(upload_id) / "session.json").read_text())
+    except (KeyError, FileNotFoundError):
+        return None
+    return UploadSession(**data)
+
+
+def received_chunks(session: UploadSession) -> List[int]:
+    """Indexes of the chunks received so far, in order."""
+    try:
+        names = os.listdir(_chunks_dir(session.upload_id))
+    except FileNotFoundError:
+        return []
+    return sorted(int(name) for name in names if name.isdigit())
+
+
+def missing_chunks(session: UploadSession) -> List[int]:
+    """Indexes of the chunks still to be sent."""
+    received = set(received_chunks(session))
+    return [index for index in range(session.chunk_count) if index not in received]
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+async def write_chunk(session: UploadSession, index: int, body: AsyncIterator[bytes], checksum: str) -> None:
+    """
+    Write a chunk at its offset and record it once verified.
+
+    Raises:
+        ChunkError: If the index, length or checksum is wrong (the chunk is not recorded)
+    """
+    expected_length = session.chunk_length(index)
+    checksum = checksum.lower()
+    loop = asyncio.get_running_loop()
+    digest = hashlib.sha256()
+    offset = index * session.chunk_size
+    length = 0
+    buffer = bytearray()
+
+    fd = os.open(_data_path(session.upload_id), os.O_WRONLY)
+    try:
+        async for data in body:
+            length += len(data)
+            if length > expected_length:
+                raise ChunkError(f"Chunk {index} is larger than {expected_length} bytes")
+            digest.update(data)
+            buffer += data
+            if len(buffer) >= WRITE_BUFFER_SIZE:
+                await loop.run_in_executor(None, _pwrite_all, fd, bytes(buffer), offset)
+                offset += len(buffer)
+                buffer.clear()
+        if length != expected_length:
+            raise ChunkError(f"Chunk {index} has {length} bytes, expected {expected_length}")
+        if digest.hexdigest() != checksum:
+            raise ChunkError(f"Chunk {index} checksum mismatch")
+        if buffer:
+            await loop.run_in_executor(None, _pwrite_all, fd, bytes(buffer), offset)
+        # A chunk must survive a crash once it is reported as received
+        await loop.run_in_executor(None, os.fdatasync, fd)
+    finally:
+        os.close(fd)
+
+    (_chunks_dir(session.upload_id) / str(index)).write_text(checksum)
+
+
+def complete_session(session: UploadSession, dest_path: Path) -> None:
+    """
+    Move the assembled file to dest_path and remove the session.
+
+    Raises:
+        ChunkError: If chunks are missing
+    """
+    missing = missing_chunks(session)
+    if missing:
+        raise ChunkError(f"{len(missing)} chunks are missing (first: {missing[0]})")
+    os.replace(_data_path(session.upload_id), dest_path)
+    delete_session(session.upload_id)
+
+
+def delete_session(upload_id: str) -> None:
+    """Remove a session and its data (no-op if it does not exist)."""
+    try:
+        shutil.rmtree(_session_dir(upload_id), ignore_errors=True)
+    except KeyError:
+        pass
+
+
+def sweep_expired_sessions(max_age_seconds: float, now: Optional[float] = None) -> int:
+    """
+    Remove sessions created more than max_age_seconds ago.
+
+    Returns:
+        Number of sessions removed
+    """
+    directory = sessions_dir()
+    if not directory.is_dir():
+        return 0
+    now = time.time() if now is None else now
+    removed = 0
+    for session_dir in directory.iterdir():
+        session = load_session(session_dir.name)
+        created_at = session.created_at if session is not None else session_dir.stat().st_mtime
+        if now - created_at < max_age_seconds:
+            continue
+        shutil.rmtree(session_dir, ignore_errors=True)
+        removed += 1
+    return removed
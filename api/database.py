@@ -94,6 +94,9 @@ videos = sa.Table(
     sa.Column("sprite_sheet_tile_size", sa.Integer, nullable=True),  # Grid size (e.g., 10 for 10x10)
     sa.Column("sprite_sheet_frame_width", sa.Integer, nullable=True),  # Width of each frame
     sa.Column("sprite_sheet_frame_height", sa.Integer, nullable=True),  # Height of each frame
+    # Object storage publishing (see api/object_storage.py)
+    sa.Column("storage_sync_started_at", sa.DateTime(timezone=True), nullable=True),  # Last upload began
+    sa.Column("storage_synced_at", sa.DateTime(timezone=True), nullable=True),  # Bucket has the current files
     sa.Index("ix_videos_status", "status"),
     sa.Index("ix_videos_category_id", "category_id"),
     sa.Index("ix_videos_created_at", "created_at"),
@@ -123,6 +126,20 @@ video_qualities = sa.Table(
     sa.Index("ix_video_qualities_video_id", "video_id"),
 )
 
+# Storage ledger: bytes used per video and rendition ("other" holds thumbnails, master
+# manifests, sprites, ...). Maintained as files are written and deleted; reconciled_at
+# is set when the row was last measured from the video directory (see api/storage_ledger.py).
+video_storage = sa.Table(
+    "video_storage",
+    metadata,
+    sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+    sa.Column("quality", sa.String(20), nullable=False),
+    sa.Column("bytes", sa.BigInteger, nullable=False, default=0),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint("video_id", "quality"),
+)
+
 # Analytics: unique viewers (cookie-based)
 viewers = sa.Table(
     "viewers",
@@ -160,6 +177,69 @@ playback_sessions = sa.Table(
     sa.Index("ix_playback_sessions_started_at", "started_at"),
 )
 
+# Per-video playback counters, maintained incrementally by the analytics endpoints
+# and periodically reconciled against playback_sessions (see api/video_stats.py).
+# Listing queries read view counts from here instead of aggregating playback_sessions.
+video_stats = sa.Table(
+    "video_stats",
+    metadata,
+    sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("view_count", sa.Integer, nullable=False, default=0, server_default="0"),  # playback sessions
+    sa.Column("unique_viewers", sa.Integer, nullable=False, default=0, server_default="0"),
+    sa.Column("watch_seconds", sa.Float, nullable=False, default=0, server_default="0"),
+    sa.Column("completions", sa.Integer, nullable=False, default=0, server_default="0"),  # sessions >= 90% watched
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Index("ix_video_stats_view_count", "view_count"),
+)
+
+# Hourly and daily playback rollups for the admin analytics dashboard, maintained by
+# a background job (see api/analytics_rollups.py) so dashboard queries never aggregate
+# the full playback_sessions history. video_id 0 holds the totals across all videos and
+# is written for every rolled-up hour (even without views) so it marks progress.
+# No foreign key: rollups outlive the sessions they summarize (partition retention).
+playback_rollups_hourly = sa.Table(
+    "playback_rollups_hourly",
+    metadata,
+    sa.Column("video_id", sa.Integer, primary_key=True),
+    sa.Column("hour", sa.DateTime(timezone=True), primary_key=True),
+    sa.Column("views", sa.Integer, nullable=False, default=0, server_default="0"),
+    sa.Column("watch_seconds", sa.Float, nullable=False, default=0, server_default="0"),
+    sa.Column("completions", sa.Integer, nullable=False, default=0, server_default="0"),
+    sa.Column("viewer_sketch", sa.LargeBinary, nullable=True),  # HyperLogLog registers (zlib)
+    sa.Column("quality_counts", sa.Text, nullable=True),  # JSON {quality: sessions}
+    sa.Index("ix_playback_rollups_hourly_hour", "hour"),
+)
+
+playback_rollups_daily = sa.Table(
+    "playback_rollups_daily",
+    metadata,
+    sa.Column("video_id", sa.Integer, primary_key=True),
+    sa.Column("day", sa.Date, primary_key=True),
+    sa.Column("views", sa.Integer, nullable=False, default=0, server_default="0"),
+    sa.Column("watch_seconds", sa.Float, nullable=False, default=0, server_default="0"),
+    sa.Column("completions", sa.Integer, nullable=False, default=0, server_default="0"),
+    sa.Column("viewer_sketch", sa.LargeBinary, nullable=True),
+    sa.Column("quality_counts", sa.Text, nullable=True),
+    sa.Index("ix_playback_rollups_daily_day", "day"),
+)
+
+# Denormalized full-text search document per video (title, description, tag names and
+# transcript). Rows are maintained by database triggers on videos, tags, video_tags and
+# transcriptions, so every write path stays in sync without application changes.
+# PostgreSQL adds a weighted tsvector column with a GIN index; SQLite mirrors the rows
+# into an FTS5 table (video_search_fts). See VIDEO_SEARCH_DDL below.
+video_search = sa.Table(
+    "video_search",
+    metadata,
+    sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("title", sa.Text, nullable=False, server_default=""),
+    sa.Column("description", sa.Text, nullable=False, server_default=""),
+    sa.Column("tags", sa.Text, nullable=False, server_default=""),  # space-separated tag names
+    sa.Column("transcript", sa.Text, nullable=False, server_default=""),
+    sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+)
+
 # Transcoding jobs with checkpoint support
 #
 # Job state is derived from nullable field combinations. For explicit state
@@ -247,6 +327,52 @@ quality_progress = sa.Table(
     sa.UniqueConstraint("job_id", "quality", name="uq_job_quality"),
 )
 
+# Rendition sub-tasks of split transcoding jobs (VLOG_JOB_SPLITTING_ENABLED).
+# Each rendition of a probed job is claimed, expired and retried on its own; the
+# parent job keeps claimed_at set (and no worker or expiry) until the Worker API
+# assembles the manifests after the last task finished. streaming_format and codec
+# are fixed at split time so every rendition is encoded the same way.
+transcoding_tasks = sa.Table(
+    "transcoding_tasks",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("job_id", sa.Integer, sa.ForeignKey("transcoding_jobs.id", ondelete="CASCADE"), nullable=False),
+    sa.Column(
+        "quality",
+        sa.String(10),
+        sa.CheckConstraint(
+            "quality IN ('2160p', '1440p', '1080p', '720p', '480p', '360p', 'original')",
+            name="ck_transcoding_tasks_quality",
+        ),
+        nullable=False,
+    ),
+    sa.Column(
+        "status",
+        sa.String(20),
+        sa.CheckConstraint(
+            "status IN ('pending', 'in_progress', 'completed', 'failed')",
+            name="ck_transcoding_tasks_status",
+        ),
+        nullable=False,
+        default="pending",
+    ),
+    sa.Column("streaming_format", sa.String(10), nullable=False),
+    sa.Column("codec", sa.String(10), nullable=False),
+    sa.Column("worker_id", sa.String(36), nullable=True),
+    sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("claim_expires_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Column("attempt_number", sa.Integer, nullable=False, default=1),
+    sa.Column("max_attempts", sa.Integer, nullable=False, default=3),
+    sa.Column("last_error", sa.Text, nullable=True),
+    # Rendition produced (set on completion)
+    sa.Column("width", sa.Integer, nullable=True),
+    sa.Column("height", sa.Integer, nullable=True),
+    sa.Column("bitrate", sa.Integer, nullable=True),  # kbps
+    sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    sa.UniqueConstraint("job_id", "quality", name="uq_transcoding_tasks_job_quality"),
+    sa.Index("ix_transcoding_tasks_status", "status"),
+)
+
 # Transcription tracking
 transcriptions = sa.Table(
     "transcriptions",
@@ -479,6 +605,32 @@ video_tags = sa.Table(
     sa.Index("ix_video_tags_tag_id", "tag_id"),
 )
 
+# Precomputed related-video lists (see api/related_videos.py). Each video's top
+# neighbors are scored by shared category, tag Jaccard similarity and co-watching,
+# so the related videos endpoint is a single indexed lookup.
+video_neighbors = sa.Table(
+    "video_neighbors",
+    metadata,
+    sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+    sa.Column("neighbor_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+    sa.Column("score", sa.Float, nullable=False),
+    sa.PrimaryKeyConstraint("video_id", "neighbor_id"),
+    sa.Index("ix_video_neighbors_video_score", "video_id", "score"),
+    sa.Index("ix_video_neighbors_neighbor_id", "neighbor_id"),
+)
+
+# Refresh state of each video's neighbor list. signature hashes the inputs the
+# list depends on (category, tags, visibility), so edits are detected without
+# hooks in every write path; refreshed_at NULL marks a list for recomputation.
+related_video_state = sa.Table(
+    "related_video_state",
+    metadata,
+    sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("signature", sa.String(64), nullable=False),
+    sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+    sa.Index("ix_related_video_state_refreshed_at", "refreshed_at"),
+)
+
 # Custom field definitions for flexible video metadata
 # Fields can be defined globally (category_id=NULL) or per-category
 #
@@ -927,6 +1079,178 @@ webhook_deliveries = sa.Table(
 )
 
 
+# =============================================================================
+# Full-text search index (video_search)
+# =============================================================================
+#
+# The statements below are registered on metadata "after_create" and run on every
+# create_tables() call, so they must be idempotent. Migration 029 applies the same
+# DDL to existing deployments.
+
+# Transcripts beyond this many characters are not indexed (PostgreSQL caps a
+# tsvector at 1MB, and ranking cost grows with document length).
+VIDEO_SEARCH_TRANSCRIPT_MAX_CHARS = 100000
+
+
+def _video_search_upsert_sql(where: str, string_agg: str) -> str:
+    """Build the statement that (re)builds video_search rows for the videos matching `where`."""
+    return f"""
+        INSERT INTO video_search (video_id, title, description, tags, transcript, updated_at)
+        SELECT
+            v.id,
+            v.title,
+            COALESCE(v.description, ''),
+            COALESCE((
+                SELECT {string_agg}
+                FROM video_tags vt JOIN tags t ON t.id = vt.tag_id
+                WHERE vt.video_id = v.id
+            ), ''),
+            COALESCE((
+                SELECT substr(tr.transcript_text, 1, {VIDEO_SEARCH_TRANSCRIPT_MAX_CHARS})
+                FROM transcriptions tr
+                WHERE tr.video_id = v.id
+            ), ''),
+            CURRENT_TIMESTAMP
+        FROM videos v
+        WHERE {where}
+        ON CONFLICT (video_id) DO UPDATE SET
+            title = excluded.title,
+            description = excluded.description,
+            tags = excluded.tags,
+            transcript = excluded.transcript,
+            updated_at = excluded.updated_at"""
+
+
+def _pg_video_search_trigger(name: str, table: str, events: str, function: str) -> str:
+    """Create a row trigger unless it already exists (CREATE OR REPLACE TRIGGER needs PostgreSQL 14)."""
+    return f"""
+        DO $$ BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_trigger WHERE tgname = '{name}' AND tgrelid = '{table}'::regclass
+            ) THEN
+                CREATE TRIGGER {name} AFTER {events} ON {table}
+                    FOR EACH ROW EXECUTE FUNCTION {function}();
+            END IF;
+        END $$"""
+
+
+POSTGRESQL_VIDEO_SEARCH_DDL = [
+    # Weighted document: title > tags > description > transcript
+    """
+    ALTER TABLE video_search ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A')
+            || setweight(to_tsvector('english', tags), 'B')
+            || setweight(to_tsvector('english', description), 'C')
+            || setweight(to_tsvector('english', transcript), 'D')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_video_search_vector ON video_search USING GIN (search_vector)",
+    f"""
+    CREATE OR REPLACE FUNCTION video_search_refresh(p_video_id integer) RETURNS void AS $$
+    BEGIN
+        {_video_search_upsert_sql("v.id = p_video_id", "string_agg(t.name, ' ' ORDER BY t.name)")};
+    END;
+    $$ LANGUAGE plpgsql""",
+    """
+    CREATE OR REPLACE FUNCTION video_search_videos_sync() RETURNS trigger AS $$
+    BEGIN
+        PERFORM video_search_refresh(NEW.id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql""",
+    """
+    CREATE OR REPLACE FUNCTION video_search_video_ref_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            PERFORM video_search_refresh(OLD.video_id);
+        ELSE
+            PERFORM video_search_refresh(NEW.video_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql""",
+    """
+    CREATE OR REPLACE FUNCTION video_search_tags_sync() RETURNS trigger AS $$
+    BEGIN
+        PERFORM video_search_refresh(vt.video_id) FROM video_tags vt WHERE vt.tag_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql""",
+    _pg_video_search_trigger(
+        "trg_video_search_videos", "videos", "INSERT OR UPDATE OF title, description", "video_search_videos_sync"
+    ),
+    _pg_video_search_trigger(
+        "trg_video_search_video_tags", "video_tags", "INSERT OR DELETE", "video_search_video_ref_sync"
+    ),
+    _pg_video_search_trigger("trg_video_search_tags", "tags", "UPDATE OF name", "video_search_tags_sync"),
+    _pg_video_search_trigger(
+        "trg_video_search_transcriptions",
+        "transcriptions",
+        "INSERT OR UPDATE OF transcript_text OR DELETE",
+        "video_search_video_ref_sync",
+    ),
+    # Index videos that predate the triggers
+    """
+    SELECT video_search_refresh(v.id) FROM videos v
+    WHERE NOT EXISTS (SELECT 1 FROM video_search s WHERE s.video_id = v.id)""",
+]
+
+SQLITE_VIDEO_SEARCH_DDL = [
+    # External-content FTS5 table over video_search, kept in sync by the triggers below
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS video_search_fts USING fts5(
+        title, tags, description, transcript,
+        content='video_search', content_rowid='video_id', tokenize='porter unicode61'
+    )""",
+    """
+    CREATE TRIGGER IF NOT EXISTS video_search_fts_ai AFTER INSERT ON video_search BEGIN
+        INSERT INTO video_search_fts (rowid, title, tags, description, transcript)
+        VALUES (new.video_id, new.title, new.tags, new.description, new.transcript);
+    END""",
+    """
+    CREATE TRIGGER IF NOT EXISTS video_search_fts_ad AFTER DELETE ON video_search BEGIN
+        INSERT INTO video_search_fts (video_search_fts, rowid, title, tags, description, transcript)
+        VALUES ('delete', old.video_id, old.title, old.tags, old.description, old.transcript);
+    END""",
+    """
+    CREATE TRIGGER IF NOT EXISTS video_search_fts_au AFTER UPDATE ON video_search BEGIN
+        INSERT INTO video_search_fts (video_search_fts, rowid, title, tags, description, transcript)
+        VALUES ('delete', old.video_id, old.title, old.tags, old.description, old.transcript);
+        INSERT INTO video_search_fts (rowid, title, tags, description, transcript)
+        VALUES (new.video_id, new.title, new.tags, new.description, new.transcript);
+    END""",
+]
+_SQLITE_TAG_AGG = "group_concat(t.name, ' ')"
+_SQLITE_VIDEO_SEARCH_TRIGGERS = [
+    # (trigger name, event, videos to rebuild)
+    ("video_search_videos_ai", "INSERT ON videos", "v.id = new.id"),
+    ("video_search_videos_au", "UPDATE OF title, description ON videos", "v.id = new.id"),
+    ("video_search_video_tags_ai", "INSERT ON video_tags", "v.id = new.video_id"),
+    ("video_search_video_tags_ad", "DELETE ON video_tags", "v.id = old.video_id"),
+    (
+        "video_search_tags_au",
+        "UPDATE OF name ON tags",
+        "v.id IN (SELECT video_id FROM video_tags WHERE tag_id = new.id)",
+    ),
+    ("video_search_transcriptions_ai", "INSERT ON transcriptions", "v.id = new.video_id"),
+    ("video_search_transcriptions_au", "UPDATE OF transcript_text ON transcriptions", "v.id = new.video_id"),
+    ("video_search_transcriptions_ad", "DELETE ON transcriptions", "v.id = old.video_id"),
+]
+SQLITE_VIDEO_SEARCH_DDL += [
+    f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} BEGIN{_video_search_upsert_sql(where, _SQLITE_TAG_AGG)};\nEND"
+    for name, event, where in _SQLITE_VIDEO_SEARCH_TRIGGERS
+]
+# Index videos that predate the triggers
+SQLITE_VIDEO_SEARCH_DDL.append(
+    _video_search_upsert_sql("NOT EXISTS (SELECT 1 FROM video_search s WHERE s.video_id = v.id)", _SQLITE_TAG_AGG)
+)
+
+for _statement in POSTGRESQL_VIDEO_SEARCH_DDL:
+    sa.event.listen(metadata, "after_create", sa.DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_VIDEO_SEARCH_DDL:
+    sa.event.listen(metadata, "after_create", sa.DDL(_statement).execute_if(dialect="sqlite"))
+
+
 def create_tables():
     """
     Create database tables directly using SQLAlchemy metadata.
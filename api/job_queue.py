@@ -14,10 +14,12 @@ Priority queue support with three levels:
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Deque, List, Optional
 
+from api.pubsub import Publisher, Subscriber, channel_name
 from api.redis_client import get_redis
 from config import (
     JOB_QUEUE_MODE,
@@ -26,6 +28,7 @@ from config import (
     REDIS_PENDING_TIMEOUT_MS,
     REDIS_PUBSUB_PREFIX,
     REDIS_STREAM_MAX_LEN,
+    REDIS_URL,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,7 @@ PRIORITY_STREAMS = {
     "low": f"{REDIS_PUBSUB_PREFIX}:jobs:low",
 }
 STREAM_PRIORITIES = ["high", "normal", "low"]  # Check order
+STREAM_RANK = {PRIORITY_STREAMS[priority]: rank for rank, priority in enumerate(STREAM_PRIORITIES)}
 
 DEAD_LETTER_STREAM = f"{REDIS_PUBSUB_PREFIX}:jobs:dead-letter"
 
@@ -99,6 +103,9 @@ class JobDispatch:
         return job
 
 
+# Seconds to wait before resubscribing after the job notification listener disconnects
+JOB_NOTIFICATION_RESUBSCRIBE_DELAY = 5.0
+
 # Rate limit for abandoned message checking (Issue #429)
 # Only check for abandoned messages every 30 seconds instead of every claim
 ABANDONED_CHECK_INTERVAL_SECONDS = 30
@@ -192,7 +199,8 @@ class JobQueue:
         """
         Claim a job from the Redis queue.
 
-        Checks priority streams in order (high -> normal -> low).
+        Takes the highest-priority new message (high -> normal -> low), waiting
+        on all priority streams with a single blocking read when they are empty.
         Also recovers abandoned messages from crashed workers.
 
         Returns:
@@ -216,14 +224,7 @@ class JobQueue:
                 if recovered:
                     return recovered
 
-            # Check each priority stream in order
-            for priority in STREAM_PRIORITIES:
-                stream_name = PRIORITY_STREAMS[priority]
-                job = await self._read_from_stream(redis, stream_name)
-                if job:
-                    return job
-
-            return None
+            return await self._read_from_streams(redis)
 
         except Exception as e:
             # Log warning but don't disable Redis; RedisClient handles recovery
@@ -266,27 +267,66 @@ class JobQueue:
 
         return None
 
-    async def _read_from_stream(self, redis, stream_name: str) -> Optional[JobDispatch]:
-        """Read a new message from a specific stream."""
+    async def _read_from_streams(self, redis) -> Optional[JobDispatch]:
+        """
+        Read a new message from the priority streams.
+
+        The streams are first read without blocking, one at a time in priority
+        order, stopping at the first message. Only when all are empty does one
+        blocking XREADGROUP wait on all of them. That read can deliver messages
+        from several streams at once; the highest-priority one is returned and
+        the others are released right away, so other workers can claim them
+        instead of them waiting in this consumer's pending list.
+        """
+        for priority in STREAM_PRIORITIES:
+            jobs = await self._read_group(redis, [PRIORITY_STREAMS[priority]], block=None)
+            if jobs:
+                return jobs[0]
+
+        jobs = await self._read_group(redis, [PRIORITY_STREAMS[p] for p in STREAM_PRIORITIES], REDIS_CONSUMER_BLOCK_MS)
+        if not jobs:
+            return None
+        jobs.sort(key=lambda job: STREAM_RANK.get(job._stream_name, len(STREAM_RANK)))
+        for extra in jobs[1:]:
+            await self._release_job(redis, extra)
+        return jobs[0]
+
+    async def _read_group(self, redis, streams: List[str], block: Optional[int]) -> List[JobDispatch]:
+        """XREADGROUP up to one new message per stream."""
         try:
             messages = await redis.xreadgroup(
                 REDIS_CONSUMER_GROUP,
                 self._consumer_name,
-                {stream_name: ">"},
+                {stream_name: ">" for stream_name in streams},
                 count=1,
-                block=REDIS_CONSUMER_BLOCK_MS,
+                block=block,
             )
-
-            if messages:
-                # messages format: [[stream_name, [(message_id, data), ...]]]
-                stream, msg_list = messages[0]
-                if msg_list:
-                    message_id, data = msg_list[0]
-                    return JobDispatch.from_stream_dict(data, message_id=message_id, stream_name=stream_name)
         except Exception as e:
-            logger.debug(f"Error reading from {stream_name}: {e}")
+            logger.debug(f"Error reading from job streams: {e}")
+            return []
+
+        # messages format: [[stream_name, [(message_id, data), ...]], ...]
+        jobs = []
+        for stream, msg_list in messages or []:
+            stream_name = stream.decode() if isinstance(stream, bytes) else stream
+            for message_id, data in msg_list:
+                jobs.append(JobDispatch.from_stream_dict(data, message_id=message_id, stream_name=stream_name))
+        return jobs
+
+    async def _release_job(self, redis, job: JobDispatch) -> None:
+        """
+        Hand a delivered message back to the other consumers.
 
-        return None
+        Messages cannot be un-delivered, so the job is re-added to its stream and
+        the delivered copy acknowledged. If re-adding fails, the message stays
+        pending and is recovered as abandoned.
+        """
+        try:
+            await redis.xadd(job._stream_name, job.to_stream_dict(), maxlen=REDIS_STREAM_MAX_LEN)
+            await redis.xack(job._stream_name, REDIS_CONSUMER_GROUP, job._message_id)
+            logger.debug(f"Released job {job.job_id} back to {job._stream_name}")
+        except Exception as e:
+            logger.warning(f"Failed to release job {job.job_id}: {e}")
 
     async def acknowledge_job(self, job: JobDispatch) -> bool:
         """
@@ -387,6 +427,133 @@ class JobQueue:
         return stats
 
 
+class ClaimWaiters:
+    """
+    Idle workers parked on a long-poll claim (see /api/worker/claim?wait=).
+
+    Each published job wakes exactly one waiter (oldest first), which then
+    retries its database claim. A notification that arrives while no worker is
+    parked is held briefly, so a worker that checked the database just before
+    the job was created doesn't sleep through it.
+    """
+
+    # Seconds an unconsumed notification stays valid
+    NOTIFICATION_GRACE_SECONDS = 2.0
+
+    def __init__(self) -> None:
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._unclaimed: Deque[float] = deque()
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until a job is published or the timeout expires.
+
+        Returns:
+            True if woken by a published job, False on timeout
+        """
+        now = time.monotonic()
+        while self._unclaimed:
+            notified_at = self._unclaimed.popleft()
+            if now - notified_at <= self.NOTIFICATION_GRACE_SECONDS:
+                return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def notify_one(self) -> bool:
+        """
+        Wake the longest-waiting worker.
+
+        Returns:
+            True if a parked worker was woken
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return True
+        now = time.monotonic()
+        while self._unclaimed and now - self._unclaimed[0] > self.NOTIFICATION_GRACE_SECONDS:
+            self._unclaimed.popleft()
+        self._unclaimed.append(now)
+        return False
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+
+# Workers parked on long-poll claims in this API process
+claim_waiters = ClaimWaiters()
+_job_notification_listener_task: Optional[asyncio.Task] = None
+
+
+async def notify_job_available(job_id: int, video_id: int, priority: str = "normal") -> None:
+    """
+    Wake one worker parked on a long-poll claim, on every Worker API instance.
+
+    No-op without Redis (parked workers fall back to periodic database checks).
+    """
+    await Publisher.publish_job_available(job_id, video_id, priority)
+
+
+async def _listen_for_job_notifications() -> None:
+    """Background task waking one parked worker per published job."""
+    while True:
+        subscriber = Subscriber()
+        try:
+            if await subscriber.subscribe(channel_name("jobs", "available")):
+                async for _message in subscriber.listen():
+                    claim_waiters.notify_one()
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Job notification listener error: {e}")
+        finally:
+            await subscriber.close()
+
+        await asyncio.sleep(JOB_NOTIFICATION_RESUBSCRIBE_DELAY)
+
+
+def start_job_notification_listener() -> Optional[asyncio.Task]:
+    """
+    Start waking long-poll claims when jobs are published.
+
+    Returns:
+        The asyncio Task, or None if Redis is not configured.
+    """
+    global _job_notification_listener_task
+
+    if not REDIS_URL:
+        return None
+
+    if _job_notification_listener_task is None or _job_notification_listener_task.done():
+        _job_notification_listener_task = asyncio.create_task(_listen_for_job_notifications())
+    return _job_notification_listener_task
+
+
+async def stop_job_notification_listener() -> None:
+    """Stop the job notification listener task."""
+    global _job_notification_listener_task
+
+    if _job_notification_listener_task and not _job_notification_listener_task.done():
+        _job_notification_listener_task.cancel()
+        try:
+            await _job_notification_listener_task
+        except asyncio.CancelledError:
+            pass
+    _job_notification_listener_task = None
+
+
 # Global job queue instance for API use
 _job_queue: Optional[JobQueue] = None
 _job_queue_initialized: bool = False
@@ -0,0 +1,878 @@
+"""
+Media file serving for streaming content and downloads.
+
+HLS/DASH segments are served straight from storage when no CDN is configured,
+so the per-request cost matters:
+- File lookups (path resolution and stat, a NAS round trip) are cached in a
+  short-lived stat index, so hot segments are served without touching the
+  filesystem metadata again.
+- Bodies are handed to the ASGI server as a path (http.response.pathsend) or
+  file descriptor (http.response.zerocopysend) when the server supports those
+  extensions, letting it use sendfile(2). Otherwise files are read with
+  positional reads in large chunks, off the event loop.
+- Single and multiple byte ranges (multipart/byteranges), If-Range, and
+  If-None-Match / If-Modified-Since 304s are answered from the cached stat.
+
+MediaFileResponse also takes an on_complete callback that runs exactly once
+when the response ends, whether the body finished, the client disconnected or
+sending failed (used to release per-IP download slots).
+
+HLS/DASH manifests are small and requested on every player start, so their
+contents are kept in memory (ManifestCache), keyed by path and validated
+against the file version (mtime, inode, size) from the stat index, with ETags
+hashed from the content. Whether a manifest is complete VOD content (and so
+may be cached by browsers and CDNs) is worked out from the manifests
+themselves; interim manifests of progressively published videos carry a
+marker (mark_partial_manifest()) and are never treated as complete. When a
+video's manifests are rewritten (worker finalize uploads,
+`vlog manifests regenerate`), invalidate_video_manifests() drops its cached
+files on every public API instance through Redis pub/sub.
+
+With an S3 storage backend, segments of published videos are answered with a
+redirect to a presigned bucket URL instead (see api/object_storage.py). Whether
+a video is published comes from the database (PublishedVideos), so redirected
+requests never touch the storage mount.
+"""
+
+import asyncio
+import errno
+import hashlib
+import logging
+import mimetypes
+import os
+import posixpath
+import re
+import secrets
+import stat
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import RedirectResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from api.object_storage import REDIRECT_SUFFIXES, StorageBackend, video_published
+from api.pubsub import Publisher, Subscriber, channel_name
+from config import (
+    MANIFEST_CACHE_MAX_ENTRIES,
+    MEDIA_STAT_CACHE_MAX_ENTRIES,
+    MEDIA_STAT_CACHE_TTL,
+    REDIS_URL,
+    VIDEOS_DIR,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bytes per read when the server cannot send files itself
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Requests with more ranges than this get the whole file (range abuse protection)
+MAX_RANGES = 16
+
+# Headers kept on 304 responses (RFC 9110 section 15.4.5)
+_NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "vary", "last-modified")
+
+# Files served from the manifest cache
+MANIFEST_SUFFIXES = (".m3u8", ".mpd")
+
+# Seconds to wait before resubscribing after the manifest invalidation listener disconnects
+MANIFEST_INVALIDATION_RESUBSCRIBE_DELAY = 5.0
+
+# Marks interim manifests written while further renditions are still being encoded
+# (progressive publishing): a comment line in HLS playlists, an XML comment in MPDs
+PARTIAL_MANIFEST_MARKER = "VLOG-PARTIAL"
+
+_MPD_DYNAMIC_RE = re.compile(rb"<MPD\b[^>]*\btype\s*=\s*[\"']dynamic[\"']")
+_URI_ATTRIBUTE_RE = re.compile(r'URI="([^"]*)"')
+
+_manifest_invalidation_task: Optional[asyncio.Task] = None
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """Cached metadata of a file to serve."""
+
+    path: str
+    size: int
+    mtime: float
+    etag: str
+    last_modified: str
+    mtime_ns: int = 0
+    inode: int = 0
+    ctime_ns: int = 0
+
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """Changes whenever the file is rewritten or replaced."""
+        return (self.mtime_ns, self.inode, self.size)
+
+    @classmethod
+    def from_stat(cls, path: str, stat_result: os.stat_result) -> "FileInfo":
+        """Build file info (ETag and Last-Modified) from a stat result."""
+        return cls(
+            path=path,
+            size=stat_result.st_size,
+            mtime=stat_result.st_mtime,
+            etag=f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+            last_modified=formatdate(stat_result.st_mtime, usegmt=True),
+            mtime_ns=stat_result.st_mtime_ns,
+            inode=stat_result.st_ino,
+            ctime_ns=stat_result.st_ctime_ns,
+        )
+
+
+class StatIndex:
+    """
+    LRU cache of file lookups with a short TTL.
+
+    Only existing regular files are cached, so files written after a miss (e.g.
+    segments of a video still transcoding) are found on the next request. A
+    file replaced in place is picked up after at most ttl seconds.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_entries: int = 20000):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, FileInfo]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, load: Callable[[], Optional[FileInfo]]) -> Optional[FileInfo]:
+        """
+        Get file info from the cache, or load it in a worker thread.
+
+        Args:
+            key: Cache key (e.g. the request path)
+            load: Blocking function returning FileInfo, or None if there is no file
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        info = await anyio.to_thread.run_sync(load)
+        if info is None:
+            self._entries.pop(key, None)
+            return None
+        if self._ttl > 0:
+            self._entries[key] = (time.monotonic() + self._ttl, info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return info
+
+    def invalidate(self, predicate: Optional[Callable[[FileInfo], bool]] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            predicate: Only drop entries whose file info matches (default: all)
+
+        Returns:
+            Number of entries dropped
+        """
+        if predicate is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        stale = [key for key, (_expires, info) in self._entries.items() if predicate(info)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """An HLS playlist or DASH MPD held in memory."""
+
+    # File info of the cached version, with an ETag hashed from the content
+    info: FileInfo
+    body: bytes
+    # Media playlist with #EXT-X-ENDLIST, or a static MPD
+    ended: bool
+    # Playlists referenced by a master playlist (URIs relative to it)
+    variants: Tuple[str, ...]
+    # Interim manifest of a progressively published video
+    partial: bool = False
+
+
+def parse_manifest(path: str, body: bytes) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Find whether a manifest has ended and which playlists it references.
+
+    Returns:
+        (ended, variants) - see Manifest
+    """
+    if path.endswith(".mpd"):
+        # MPD@type defaults to "static"
+        return _MPD_DYNAMIC_RE.search(body) is None, ()
+
+    ended = False
+    variants: List[str] = []
+    stream_uri_next = False
+    for line in body.decode("utf-8", "replace").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#EXT-X-ENDLIST"):
+            ended = True
+        elif line.startswith("#EXT-X-STREAM-INF"):
+            stream_uri_next = True
+        elif line.startswith(("#EXT-X-MEDIA:", "#EXT-X-I-FRAME-STREAM-INF")):
+            variants.extend(_URI_ATTRIBUTE_RE.findall(line))
+        elif stream_uri_next and not line.startswith("#"):
+            variants.append(line)
+            stream_uri_next = False
+    return ended, tuple(dict.fromkeys(variants))
+
+
+def _read_manifest(path: str) -> Manifest:
+    with open(path, "rb") as file:
+        stat_result = os.fstat(file.fileno())
+        body = file.read()
+    ended, variants = parse_manifest(path, body)
+    info = FileInfo.from_stat(path, stat_result)
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return Manifest(
+        info=replace(info, etag=etag),
+        body=body,
+        ended=ended,
+        variants=variants,
+        partial=PARTIAL_MANIFEST_MARKER.encode() in body,
+    )
+
+
+def mark_partial_manifest(path: Path) -> None:
+    """
+    Mark a manifest as interim, so it is served with no-cache until rewritten.
+
+    The file is replaced atomically, so it is never served without the marker.
+    """
+    if path.suffix == ".mpd":
+        comment = f"<!-- {PARTIAL_MANIFEST_MARKER} -->\n"
+    else:
+        # Lines starting with "#" but not "#EXT" are comments (RFC 8216 section 4.1)
+        comment = f"#{PARTIAL_MANIFEST_MARKER}\n"
+    body = path.read_text()
+    if not body.endswith("\n"):
+        body += "\n"
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(body + comment)
+    os.replace(temp_path, path)
+
+
+class ManifestCache:
+    """
+    LRU cache of manifest contents.
+
+    Entries are keyed by path and only used while the file version from the
+    stat index matches, so a rewritten or replaced manifest is read again as
+    soon as its lookup is refreshed (or dropped by invalidate_directory()).
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Manifest]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, info: FileInfo) -> Manifest:
+        """
+        Get a manifest from the cache, or read it in a worker thread.
+
+        Args:
+            info: Current file info of the manifest (from the stat index)
+        """
+        entry = self._entries.get(info.path)
+        if entry is not None and entry.info.version == info.version:
+            self._entries.move_to_end(info.path)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        manifest = await anyio.to_thread.run_sync(_read_manifest, info.path)
+        if self._max_entries > 0:
+            self._entries[info.path] = manifest
+            self._entries.move_to_end(info.path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return manifest
+
+    def invalidate(self, predicate: Optional[Callable[[FileInfo], bool]] = None) -> int:
+        """
+        Drop cached manifests.
+
+        Args:
+            predicate: Only drop manifests whose file info matches (default: all)
+
+        Returns:
+            Number of manifests dropped
+        """
+        if predicate is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        stale = [path for path, manifest in self._entries.items() if predicate(manifest.info)]
+        for path in stale:
+            del self._entries[path]
+        return len(stale)
+
+
+class PublishedVideos:
+    """
+    Which videos object storage has the current files of, cached with a short TTL.
+
+    A video stops being published as soon as its files start changing, but
+    other processes only see that once their entry expires or is invalidated.
+    """
+
+    def __init__(self, load: Callable[[str], Awaitable[bool]], ttl: float = 10.0, max_entries: int = 20000):
+        self._load = load
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+    async def get(self, slug: str) -> bool:
+        """Whether a video is published (looked up with load on a miss)."""
+        entry = self._entries.get(slug)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(slug)
+            return entry[1]
+
+        published = await self._load(slug)
+        if self._ttl > 0:
+            self._entries[slug] = (time.monotonic() + self._ttl, published)
+            self._entries.move_to_end(slug)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return published
+
+    def invalidate(self, slug: Optional[str] = None) -> None:
+        """Drop the cached state of a video (default: of all videos)."""
+        if slug is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(slug, None)
+
+
+# Shared by all media file mounts of the process
+media_stat_index = StatIndex(ttl=MEDIA_STAT_CACHE_TTL, max_entries=MEDIA_STAT_CACHE_MAX_ENTRIES)
+media_manifest_cache = ManifestCache(max_entries=MANIFEST_CACHE_MAX_ENTRIES)
+media_published_videos = PublishedVideos(video_published, ttl=MEDIA_STAT_CACHE_TTL)
+
+
+def invalidate_directory(directory: str) -> int:
+    """
+    Drop this process's cached file lookups and manifests under a directory.
+
+    Returns:
+        Number of entries dropped
+    """
+    prefixes = tuple({os.path.join(os.path.abspath(directory), ""), os.path.join(os.path.realpath(directory), "")})
+
+    def under(info: FileInfo) -> bool:
+        return info.path.startswith(prefixes)
+
+    return media_stat_index.invalidate(under) + media_manifest_cache.invalidate(under)
+
+
+async def invalidate_video_manifests(slug: str) -> None:
+    """
+    Drop cached manifests and file lookups of a video on every public API instance.
+
+    Call after a video's manifests were rewritten or it was published to object
+    storage. Without Redis only this process is invalidated; other processes
+    pick up the new files once their cached lookups expire
+    (VLOG_MEDIA_STAT_CACHE_TTL).
+
+    Args:
+        slug: Video slug (its directory under VIDEOS_DIR)
+    """
+    invalidate_directory(str(VIDEOS_DIR / slug))
+    media_published_videos.invalidate(slug)
+    await Publisher.publish_manifests_invalidated(slug)
+
+
+async def _listen_for_manifest_invalidations() -> None:
+    """Background task dropping manifests invalidated by other processes."""
+    while True:
+        subscriber = Subscriber()
+        try:
+            if await subscriber.subscribe(channel_name("cache", "manifests")):
+                # Invalidations published while unsubscribed were missed
+                media_stat_index.invalidate()
+                media_manifest_cache.invalidate()
+                media_published_videos.invalidate()
+                async for message in subscriber.listen():
+                    slug = message.get("slug")
+                    if isinstance(slug, str) and slug:
+                        invalidate_directory(str(VIDEOS_DIR / slug))
+                        media_published_videos.invalidate(slug)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Manifest invalidation listener error: {e}")
+        finally:
+            await subscriber.close()
+
+        await asyncio.sleep(MANIFEST_INVALIDATION_RESUBSCRIBE_DELAY)
+
+
+def start_manifest_invalidation_listener() -> Optional[asyncio.Task]:
+    """
+    Start listening for manifest invalidations from other processes.
+
+    Returns:
+        The asyncio Task, or None if Redis is not configured.
+    """
+    global _manifest_invalidation_task
+
+    if not REDIS_URL:
+        return None
+
+    if _manifest_invalidation_task is None or _manifest_invalidation_task.done():
+        _manifest_invalidation_task = asyncio.create_task(_listen_for_manifest_invalidations())
+    return _manifest_invalidation_task
+
+
+async def stop_manifest_invalidation_listener() -> None:
+    """Stop the manifest invalidation listener task."""
+    global _manifest_invalidation_task
+
+    if _manifest_invalidation_task and not _manifest_invalidation_task.done():
+        _manifest_invalidation_task.cancel()
+        try:
+            await _manifest_invalidation_task
+        except asyncio.CancelledError:
+            pass
+    _manifest_invalidation_task = None
+
+
+class RangeNotSatisfiable(Exception):
+    """No requested range overlaps the file."""
+
+
+def parse_range_header(value: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse a Range header into sorted, merged [start, end) byte ranges.
+
+    Args:
+        value: Range header value (e.g. "bytes=0-499,1000-")
+        size: File size
+
+    Returns:
+        Ranges to send, or None to ignore the header and send the whole file
+        (malformed, not bytes, or more than MAX_RANGES ranges)
+
+    Raises:
+        RangeNotSatisfiable: If no range overlaps the file
+    """
+    unit, _, specs = value.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
+        return None
+
+    parts = specs.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for part in parts:
+        first, dash, last = part.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if first == "":
+                # Suffix range: the last N bytes
+                suffix = int(last)
+                if suffix < 0:
+                    return None
+                if suffix == 0:
+                    continue
+                start, end = max(size - suffix, 0), size
+            else:
+                start = int(first)
+                end = int(last) + 1 if last else max(size, start + 1)
+                if start < 0 or end <= start:
+                    return None
+                end = min(end, size)
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _parse_http_date(value: str) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if header.strip() == "*":
+        return True
+    weak = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == weak for tag in header.split(","))
+
+
+def is_not_modified(request_headers: Headers, info: FileInfo) -> bool:
+    """Whether a conditional GET can be answered with 304."""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, info.etag)
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since:
+        since = _parse_http_date(if_modified_since)
+        return since is not None and int(info.mtime) <= since
+    return False
+
+
+async def _send_not_modified(send: Send, raw_headers: List[Tuple[bytes, bytes]]) -> None:
+    headers = [(k, v) for k, v in raw_headers if k.decode("latin-1") in _NOT_MODIFIED_HEADERS]
+    await send({"type": "http.response.start", "status": 304, "headers": headers})
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _if_range_matches(value: str, info: FileInfo) -> bool:
+    """Whether a range request's If-Range validator still matches (strong comparison)."""
+    value = value.strip()
+    if value.startswith(('"', "W/")):
+        return value == info.etag
+    since = _parse_http_date(value)
+    return since is not None and int(info.mtime) == since
+
+
+class MediaFileResponse(Response):
+    """
+    File response with byte ranges, conditional requests and zero-copy sending.
+
+    Validators come from the given FileInfo, so no stat happens per request.
+    """
+
+    def __init__(
+        self,
+        info: FileInfo,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        on_complete: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self.info = info
+        self.status_code = status_code
+        self.media_type = media_type or mimetypes.guess_type(info.path)[0] or "application/octet-stream"
+        self.background = None
+        self.on_complete = on_complete
+        self.init_headers(headers)
+        self.headers.setdefault("accept-ranges", "bytes")
+        self.headers.setdefault("etag", info.etag)
+        self.headers.setdefault("last-modified", info.last_modified)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self._respond(scope, receive, send)
+        finally:
+            if self.on_complete is not None:
+                with anyio.CancelScope(shield=True):
+                    await self.on_complete()
+
+    async def _respond(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = Headers(scope=scope)
+        head_only = scope.get("method", "GET").upper() == "HEAD"
+        size = self.info.size
+
+        if self.status_code == 200 and is_not_modified(request_headers, self.info):
+            await _send_not_modified(send, self.raw_headers)
+            return
+
+        ranges = None
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if self.status_code == 200 and range_header and (if_range is None or _if_range_matches(if_range, self.info)):
+            try:
+                ranges = parse_range_header(range_header, size)
+            except RangeNotSatisfiable:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 416,
+                        "headers": [(b"content-range", f"bytes */{size}".encode()), (b"content-length", b"0")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+        if not ranges:
+            self.headers["content-length"] = str(size)
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            parts: List[Tuple[bytes, int, int]] = [(b"", 0, size)]
+            trailer = b""
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            self.headers["content-length"] = str(end - start)
+            await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+            parts = [(b"", start, end)]
+            trailer = b""
+        else:
+            boundary = secrets.token_hex(13)
+            parts = []
+            for index, (start, end) in enumerate(ranges):
+                header = (
+                    f"--{boundary}\r\nContent-Type: {self.media_type}\r\n"
+                    f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+                ).encode("latin-1")
+                # Every part after the first starts on a new line
+                parts.append((b"\r\n" + header if index else header, start, end))
+            trailer = f"\r\n--{boundary}--\r\n".encode("latin-1")
+            content_length = sum(len(header) + end - start for header, start, end in parts) + len(trailer)
+            self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+            self.headers["content-length"] = str(content_length)
+            await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+
+        if head_only or size == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if ranges is None and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": self.info.path})
+            return
+
+        async with anyio.create_task_group() as task_group:
+
+            async def stream() -> None:
+                await self._send_parts(send, parts, trailer, "http.response.zerocopysend" in extensions)
+                task_group.cancel_scope.cancel()
+
+            task_group.start_soon(stream)
+            # Stop reading the file as soon as the client goes away
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    task_group.cancel_scope.cancel()
+                    break
+
+    async def _send_parts(
+        self, send: Send, parts: List[Tuple[bytes, int, int]], trailer: bytes, zerocopy: bool
+    ) -> None:
+        """Send file byte ranges, each preceded by its (possibly empty) part header."""
+        file = await anyio.to_thread.run_sync(lambda: open(self.info.path, "rb", buffering=0))
+        try:
+            for index, (header, start, end) in enumerate(parts):
+                last_part = index == len(parts) - 1
+                if header:
+                    await send({"type": "http.response.body", "body": header, "more_body": True})
+                if zerocopy:
+                    await send(
+                        {
+                            "type": "http.response.zerocopysend",
+                            "file": file,
+                            "offset": start,
+                            "count": end - start,
+                            "more_body": not (last_part and not trailer),
+                        }
+                    )
+                    continue
+                offset = start
+                while offset < end:
+                    chunk = await anyio.to_thread.run_sync(
+                        os.pread, file.fileno(), min(READ_CHUNK_SIZE, end - offset), offset
+                    )
+                    if not chunk:
+                        raise OSError(errno.EIO, f"File shrank while sending: {self.info.path}")
+                    offset += len(chunk)
+                    more_body = offset < end or not last_part or bool(trailer)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            if trailer:
+                await send({"type": "http.response.body", "body": trailer, "more_body": False})
+        finally:
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(file.close)
+
+
+class ManifestResponse(Response):
+    """Response for a cached manifest, answering conditional requests with 304."""
+
+    def __init__(
+        self, manifest: Manifest, headers: Optional[Mapping[str, str]] = None, media_type: Optional[str] = None
+    ):
+        self.manifest = manifest
+        super().__init__(
+            manifest.body,
+            headers=headers,
+            media_type=media_type or mimetypes.guess_type(manifest.info.path)[0] or "application/octet-stream",
+        )
+        self.headers.setdefault("etag", manifest.info.etag)
+        self.headers.setdefault("last-modified", manifest.info.last_modified)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if is_not_modified(Headers(scope=scope), self.manifest.info):
+            await _send_not_modified(send, self.raw_headers)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class MediaStaticFiles(StaticFiles):
+    """
+    StaticFiles serving through the stat index and MediaFileResponse.
+
+    Manifests (MANIFEST_SUFFIXES) are served from the manifest cache instead.
+    Subclasses choose per-file headers by overriding file_headers().
+
+    With a storage_backend that supports presigned URLs, segments of published
+    videos are redirected to the backend (see _presigned_url()).
+    """
+
+    def __init__(
+        self,
+        *args,
+        stat_index: Optional[StatIndex] = None,
+        manifest_cache: Optional[ManifestCache] = None,
+        storage_backend: Optional[StorageBackend] = None,
+        published_videos: Optional[PublishedVideos] = None,
+        presigned_url_expiry: int = 3600,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.stat_index = stat_index if stat_index is not None else media_stat_index
+        self.manifest_cache = manifest_cache if manifest_cache is not None else media_manifest_cache
+        self.storage_backend = storage_backend
+        self.published_videos = published_videos if published_videos is not None else media_published_videos
+        self.presigned_url_expiry = presigned_url_expiry
+
+    def file_headers(self, path: str, complete: bool = False) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Media type (None = guess from the extension) and extra headers for a file.
+
+        Args:
+            path: Requested path
+            complete: For manifests, whether it is complete VOD content that will
+                not change (see _manifest_complete())
+        """
+        return None, {}
+
+    def _load_file_info(self, path: str) -> Optional[FileInfo]:
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return FileInfo.from_stat(full_path, stat_result)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+
+        if self.storage_backend is not None and path.endswith(REDIRECT_SUFFIXES):
+            url = await self._presigned_url(path)
+            if url is not None:
+                media_type, headers = self.file_headers(path)
+                # Browsers may reuse the redirect while the URL is still valid
+                headers["Cache-Control"] = f"private, max-age={self.presigned_url_expiry // 2}"
+                return RedirectResponse(url, status_code=307, headers=headers)
+
+        info = await self._lookup(path)
+        if info is None:
+            raise HTTPException(status_code=404)
+
+        if path.endswith(MANIFEST_SUFFIXES):
+            manifest = await self.manifest_cache.get(info)
+            media_type, headers = self.file_headers(path, complete=await self._manifest_complete(path, manifest))
+            return ManifestResponse(manifest, headers=headers, media_type=media_type)
+
+        media_type, headers = self.file_headers(path)
+        return MediaFileResponse(info, headers=headers, media_type=media_type)
+
+    async def _presigned_url(self, path: str) -> Optional[str]:
+        """
+        Presigned URL of a file if the backend has its current version.
+
+        That is the case when the file's video is published (PublishedVideos).
+        Decided without looking at the file, so a slow storage mount does not
+        hold up redirected requests.
+        """
+        slug = path.split("/", 1)[0]
+        if slug == path or ".." in path.split("/"):
+            return None
+        try:
+            if not await self.published_videos.get(slug):
+                return None
+            return self.storage_backend.presigned_url(path, self.presigned_url_expiry)
+        except Exception as e:
+            logger.warning(f"Failed to presign {path}, serving it directly: {e}")
+            return None
+
+    async def _lookup(self, path: str) -> Optional[FileInfo]:
+        """File info through the stat index (None if there is no such file)."""
+        try:
+            return await self.stat_index.get((id(self), path), lambda: self._load_file_info(path))
+        except PermissionError:
+            raise HTTPException(status_code=401)
+        except OSError as exc:
+            # Filename is too long, so it can't be a valid file
+            if exc.errno == errno.ENAMETOOLONG:
+                raise HTTPException(status_code=404)
+            raise
+        except ValueError:
+            # Null bytes or other invalid characters in the path
+            raise HTTPException(status_code=404)
+
+    async def _manifest_complete(self, path: str, manifest: Manifest) -> bool:
+        """
+        Whether a manifest is complete VOD content.
+
+        Media playlists and MPDs are complete once ended. A master playlist is
+        complete when every playlist it references exists next to it and has ended.
+        Interim manifests of progressively published videos are never complete.
+        """
+        if manifest.partial:
+            return False
+        if not manifest.variants:
+            return manifest.ended
+
+        directory = posixpath.dirname(path)
+        for uri in manifest.variants:
+            variant_path = posixpath.normpath(posixpath.join(directory, uri.split("?", 1)[0]))
+            if (
+                "://" in uri
+                or uri.startswith("/")
+                or variant_path.startswith("..")
+                or not variant_path.endswith(".m3u8")
+            ):
+                return False
+            try:
+                info = await self._lookup(variant_path)
+            except HTTPException:
+                return False
+            if info is None:
+                return False
+            variant = await self.manifest_cache.get(info)
+            if variant.variants or not variant.ended:
+                return False
+        return True
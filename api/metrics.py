@@ -29,12 +29,13 @@ STORAGE_RECONCILIATION_INTERVAL_SECONDS = int(
     os.environ.get("VLOG_STORAGE_RECONCILIATION_INTERVAL", 6 * 60 * 60)
 )
 
-# Maximum files to scan during reconciliation (prevents runaway scans)
-STORAGE_SCAN_MAX_FILES = int(os.environ.get("VLOG_STORAGE_SCAN_MAX_FILES", 5_000_000))
-
-# Timeout for storage scan in seconds (default 30 minutes)
+# Timeout for a storage ledger reconciliation pass in seconds (default 30 minutes);
+# an interrupted pass is resumed by the next one
 STORAGE_SCAN_TIMEOUT_SECONDS = int(os.environ.get("VLOG_STORAGE_SCAN_TIMEOUT", 1800))
 
+# How often storage gauges are refreshed from the storage ledger
+STORAGE_METRICS_REFRESH_SECONDS = 60
+
 # Application info
 APP_INFO = Info("vlog", "VLog application information")
 
@@ -200,12 +201,18 @@ STORAGE_BYTES_WRITTEN = Counter(
     "Total bytes written to storage",
 )
 
-# Issue #207: Total video storage used (tracked incrementally with periodic reconciliation)
+# Issue #207: Total video storage used (from the storage ledger, see api/storage_ledger.py)
 STORAGE_VIDEOS_BYTES = Gauge(
     "vlog_storage_videos_bytes",
     "Total video storage used in bytes",
 )
 
+STORAGE_QUALITY_BYTES = Gauge(
+    "vlog_storage_quality_bytes",
+    "Video storage used in bytes per rendition",
+    ["quality"],  # 1080p, original, audio, ... "other" for thumbnails, manifests, sprites
+)
+
 # =============================================================================
 # Playback Metrics
 # =============================================================================
@@ -226,6 +233,28 @@ VIDEOS_WATCH_TIME_SECONDS_TOTAL = Counter(
     "Total video watch time in seconds",
 )
 
+# Analytics write-behind buffer (api/analytics_buffer.py)
+ANALYTICS_BUFFER_PENDING_SESSIONS = Gauge(
+    "vlog_analytics_buffer_pending_sessions",
+    "Playback sessions with heartbeats buffered but not yet written",
+)
+
+ANALYTICS_BUFFER_FLUSH_DURATION_SECONDS = Histogram(
+    "vlog_analytics_buffer_flush_duration_seconds",
+    "Time to write one batch of buffered heartbeats",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+ANALYTICS_BUFFER_FLUSHED_SESSIONS_TOTAL = Counter(
+    "vlog_analytics_buffer_flushed_sessions_total",
+    "Total playback session updates written by buffer flushes",
+)
+
+ANALYTICS_BUFFER_FLUSH_ERRORS_TOTAL = Counter(
+    "vlog_analytics_buffer_flush_errors_total",
+    "Total failed analytics buffer flushes (batch kept for the next flush)",
+)
+
 # =============================================================================
 # Background Task Health Metrics (Issue #207 review feedback)
 # =============================================================================
@@ -350,6 +379,7 @@ def normalize_endpoint(path: str) -> str:
 # =============================================================================
 
 _metrics_update_task: Optional[asyncio.Task] = None
+_storage_metrics_task: Optional[asyncio.Task] = None
 _storage_reconcile_task: Optional[asyncio.Task] = None
 
 # Storage path for video files (configurable via environment)
@@ -373,7 +403,8 @@ async def start_metrics_background_tasks(database: "Database", storage_path: Opt
         database: Database connection for querying worker heartbeats
         storage_path: Path to video storage directory (for reconciliation)
     """
-    global _metrics_update_task, _storage_reconcile_task, _STORAGE_VIDEO_PATH
+    global _metrics_update_task, _storage_metrics_task, _storage_reconcile_task, _STORAGE_VIDEO_PATH
+    from config import STORAGE_LEDGER_RECONCILE_ENABLED
 
     if storage_path:
         _STORAGE_VIDEO_PATH = storage_path
@@ -384,8 +415,14 @@ async def start_metrics_background_tasks(database: "Database", storage_path: Opt
         name="metrics_heartbeat_update",
     )
 
+    # Storage gauges come from the storage ledger (runs every minute)
+    _storage_metrics_task = asyncio.create_task(
+        _storage_metrics_loop(),
+        name="metrics_storage_ledger",
+    )
+
     # Start storage reconciliation task (configurable interval, default 6 hours)
-    if _STORAGE_VIDEO_PATH and _STORAGE_VIDEO_PATH.exists():
+    if STORAGE_LEDGER_RECONCILE_ENABLED and _STORAGE_VIDEO_PATH and _STORAGE_VIDEO_PATH.exists():
         _storage_reconcile_task = asyncio.create_task(
             _storage_reconciliation_loop(),
             name="metrics_storage_reconcile",
@@ -398,7 +435,7 @@ async def start_metrics_background_tasks(database: "Database", storage_path: Opt
 
 async def stop_metrics_background_tasks() -> None:
     """Stop all metrics background tasks."""
-    global _metrics_update_task, _storage_reconcile_task
+    global _metrics_update_task, _storage_metrics_task, _storage_reconcile_task
 
     if _metrics_update_task and not _metrics_update_task.done():
         _metrics_update_task.cancel()
@@ -408,6 +445,14 @@ async def stop_metrics_background_tasks() -> None:
             pass
         _metrics_update_task = None
 
+    if _storage_metrics_task and not _storage_metrics_task.done():
+        _storage_metrics_task.cancel()
+        try:
+            await _storage_metrics_task
+        except asyncio.CancelledError:
+            pass
+        _storage_metrics_task = None
+
     if _storage_reconcile_task and not _storage_reconcile_task.done():
         _storage_reconcile_task.cancel()
         try:
@@ -494,8 +539,29 @@ async def _update_worker_heartbeat_metrics(database: "Database", sa, workers) ->
     _known_worker_labels = current_labels
 
 
+async def _storage_metrics_loop() -> None:
+    """Background loop to refresh storage gauges from the storage ledger every minute."""
+    from api.storage_ledger import refresh_storage_metrics
+
+    while True:
+        start_time = time.perf_counter()
+        try:
+            await refresh_storage_metrics()
+            BACKGROUND_TASK_LAST_SUCCESS.labels(task_name="storage_metrics").set(time.time())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            BACKGROUND_TASK_ERRORS_TOTAL.labels(task_name="storage_metrics").inc()
+            logger.warning(f"Failed to refresh storage metrics: {e}")
+        finally:
+            duration = time.perf_counter() - start_time
+            BACKGROUND_TASK_DURATION_SECONDS.labels(task_name="storage_metrics").observe(duration)
+
+        await asyncio.sleep(STORAGE_METRICS_REFRESH_SECONDS)
+
+
 async def _storage_reconciliation_loop() -> None:
-    """Background loop to reconcile storage bytes at configurable interval."""
+    """Background loop to reconcile the storage ledger at configurable interval."""
     # Run initial reconciliation after a short delay
     await asyncio.sleep(60)  # Wait 1 minute after startup
     await reconcile_storage_bytes()
@@ -520,124 +586,66 @@ async def _storage_reconciliation_loop() -> None:
 
 async def reconcile_storage_bytes() -> None:
     """
-    Scan filesystem and reset storage gauge to accurate value.
+    Reconcile the storage ledger with the video directories.
 
-    This corrects any drift from incremental tracking and provides
-    an accurate baseline for the storage metric.
+    Re-measures one video directory at a time (see
+    api.storage_ledger.reconcile_storage_ledger), correcting drift from
+    incremental tracking, then refreshes the storage gauges.
 
     Features:
-    - Timeout protection (configurable, default 30 minutes)
-    - Symlink escape protection
-    - Partial failure detection (doesn't update metric on incomplete scan)
-    - File count limit to prevent runaway scans
+    - Timeout protection (configurable, default 30 minutes); the next pass
+      resumes with the videos this one did not reach
+    - Symlinks are never followed
+    - Sharding across admin instances (VLOG_STORAGE_LEDGER_SHARD_COUNT/INDEX)
     """
+    from api.storage_ledger import reconcile_storage_ledger, refresh_storage_metrics
+    from config import (
+        STORAGE_LEDGER_RECONCILE_CONCURRENCY,
+        STORAGE_LEDGER_SHARD_COUNT,
+        STORAGE_LEDGER_SHARD_INDEX,
+    )
+
     if not _STORAGE_VIDEO_PATH or not _STORAGE_VIDEO_PATH.exists():
         logger.debug("Storage path not configured or doesn't exist, skipping reconciliation")
         STORAGE_RECONCILIATION_STATUS.set(0)  # Failed
         return
 
     try:
-        # Run scan with timeout (use wait_for for Python 3.9 compatibility)
+        # Run pass with timeout (use wait_for for Python 3.9 compatibility)
         result = await asyncio.wait_for(
-            asyncio.to_thread(_scan_storage_size_safe, _STORAGE_VIDEO_PATH),
+            reconcile_storage_ledger(
+                _STORAGE_VIDEO_PATH,
+                STORAGE_RECONCILIATION_INTERVAL_SECONDS,
+                concurrency=STORAGE_LEDGER_RECONCILE_CONCURRENCY,
+                shard_count=STORAGE_LEDGER_SHARD_COUNT,
+                shard_index=STORAGE_LEDGER_SHARD_INDEX % STORAGE_LEDGER_SHARD_COUNT,
+            ),
             timeout=STORAGE_SCAN_TIMEOUT_SECONDS,
         )
+        total_bytes = await refresh_storage_metrics()
 
-        if result["success"]:
-            STORAGE_VIDEOS_BYTES.set(result["total_bytes"])
-            STORAGE_RECONCILIATION_STATUS.set(1)  # Success
-            logger.info(
-                f"Storage reconciliation complete: {result['total_bytes']:,} bytes "
-                f"({result['total_bytes'] / (1024**3):.2f} GB), "
-                f"{result['files_scanned']:,} files scanned"
-            )
-        elif result["partial"]:
-            # Partial scan - don't update metric with incomplete data
+        if result.errors:
             STORAGE_RECONCILIATION_STATUS.set(-1)  # Partial
             logger.warning(
-                f"Storage reconciliation incomplete: {result['error']}. "
-                f"Scanned {result['files_scanned']:,} files, {result['total_bytes']:,} bytes partial. "
-                "Metric NOT updated to avoid incorrect values."
+                f"Storage reconciliation incomplete: {result.errors} videos could not be measured "
+                "(retried in the next pass)"
             )
         else:
-            STORAGE_RECONCILIATION_STATUS.set(0)  # Failed
-            logger.error(f"Storage reconciliation failed: {result['error']}")
+            STORAGE_RECONCILIATION_STATUS.set(1)  # Success
+        logger.info(
+            f"Storage reconciliation complete: {result.videos_checked:,} videos checked, "
+            f"{result.drift_bytes:,} bytes of drift corrected, "
+            f"{total_bytes:,} bytes ({total_bytes / (1024**3):.2f} GB) in total"
+        )
 
     except asyncio.TimeoutError:
-        STORAGE_RECONCILIATION_STATUS.set(0)  # Failed
+        STORAGE_RECONCILIATION_STATUS.set(-1)  # Partial
         BACKGROUND_TASK_ERRORS_TOTAL.labels(task_name="storage_reconcile").inc()
-        logger.error(
-            f"Storage reconciliation timed out after {STORAGE_SCAN_TIMEOUT_SECONDS} seconds. "
-            "Consider increasing VLOG_STORAGE_SCAN_TIMEOUT or reducing storage size."
+        logger.warning(
+            f"Storage reconciliation timed out after {STORAGE_SCAN_TIMEOUT_SECONDS} seconds; "
+            "the next pass resumes where it stopped. Consider increasing VLOG_STORAGE_SCAN_TIMEOUT "
+            "or VLOG_STORAGE_LEDGER_RECONCILE_CONCURRENCY."
         )
     except Exception as e:
         STORAGE_RECONCILIATION_STATUS.set(0)  # Failed
-        logger.warning(f"Failed to scan storage for reconciliation: {e}")
-
-
-def _scan_storage_size_safe(storage_path: Path) -> dict:
-    """
-    Safe blocking filesystem scan with symlink protection and limits.
-
-    Returns a dict with:
-    - success: True if scan completed successfully
-    - partial: True if scan was interrupted but has partial data
-    - total_bytes: Total bytes scanned
-    - files_scanned: Number of files scanned
-    - error: Error message if any
-
-    Security:
-    - Prevents symlink escape attacks by verifying paths stay within storage_path
-    - Limits file count to prevent runaway scans on unexpected directory structures
-    """
-    total = 0
-    files_scanned = 0
-    storage_path_resolved = storage_path.resolve()
-
-    try:
-        for f in storage_path.rglob("*"):
-            # Check file count limit
-            if files_scanned >= STORAGE_SCAN_MAX_FILES:
-                return {
-                    "success": False,
-                    "partial": True,
-                    "total_bytes": total,
-                    "files_scanned": files_scanned,
-                    "error": f"File count limit ({STORAGE_SCAN_MAX_FILES:,}) exceeded",
-                }
-
-            # Skip symlinks entirely to prevent escape attacks
-            if f.is_symlink():
-                continue
-
-            if f.is_file():
-                try:
-                    # Verify file is within storage path (symlink escape protection)
-                    file_resolved = f.resolve()
-                    if not str(file_resolved).startswith(str(storage_path_resolved)):
-                        logger.warning(f"Symlink escape detected, skipping: {f}")
-                        continue
-
-                    total += f.stat().st_size
-                    files_scanned += 1
-                except OSError:
-                    # File may have been deleted during scan
-                    pass
-
-        return {
-            "success": True,
-            "partial": False,
-            "total_bytes": total,
-            "files_scanned": files_scanned,
-            "error": None,
-        }
-
-    except OSError as e:
-        # Directory-level error means partial data - don't use it
-        return {
-            "success": False,
-            "partial": True,
-            "total_bytes": total,
-            "files_scanned": files_scanned,
-            "error": str(e),
-        }
+        logger.warning(f"Failed to reconcile storage ledger: {e}")
@@ -0,0 +1,525 @@
+"""
+Pluggable object storage for published video files.
+
+VIDEOS_DIR remains the working copy: the worker API writes uploads there,
+thumbnails, sprites and manifests are generated there, and the public API
+serves from it. A storage backend is where finished video files are published:
+
+- FilesystemBackend (VLOG_STORAGE_BACKEND=filesystem, the default) is VIDEOS_DIR
+  itself, so publishing does nothing.
+- S3Backend (VLOG_STORAGE_BACKEND=s3) uploads to an S3-compatible bucket (AWS S3,
+  MinIO, Ceph RGW, ...). Large files are sent as multipart uploads with parallel
+  parts. Once a video is published, the public API redirects segment requests to
+  presigned bucket URLs, so segment bytes no longer pass through Python.
+
+Videos are published when their job completes (and after re-encodes);
+thumbnails and sprite sheets are published when they are regenerated, and
+permanently deleted videos are removed from the bucket. The backend is only a
+publish mirror: worker uploads, manifest/thumbnail/sprite generation and
+cleanup keep working on VIDEOS_DIR, which stays the source of truth.
+
+Whether a video is published is recorded in the database: publishing sets
+videos.storage_sync_started_at before uploading and storage_synced_at once the
+upload finished, unless the video's files started changing meanwhile. Anything
+that starts rewriting a video's files (job claims, re-encodes, re-uploads)
+clears both columns (STORAGE_SYNC_RESET), so the public API can decide to
+redirect a segment from the database alone, without touching VIDEOS_DIR.
+"""
+
+import asyncio
+import logging
+import math
+import mimetypes
+import os
+import shutil
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import sqlalchemy as sa
+
+from api.database import database, videos
+from api.pubsub import Publisher
+from config import (
+    S3_ACCESS_KEY_ID,
+    S3_BUCKET,
+    S3_ENDPOINT_URL,
+    S3_KEY_PREFIX,
+    S3_MAX_CONCURRENCY,
+    S3_MULTIPART_PART_SIZE_MB,
+    S3_MULTIPART_THRESHOLD_MB,
+    S3_REGION,
+    S3_SECRET_ACCESS_KEY,
+    STORAGE_BACKEND,
+    VIDEOS_DIR,
+)
+
+logger = logging.getLogger(__name__)
+
+# Values clearing a video's published state, set with any update after which its files change
+STORAGE_SYNC_RESET = {"storage_sync_started_at": None, "storage_synced_at": None}
+
+# Files the public API redirects to presigned URLs
+REDIRECT_SUFFIXES = (".ts", ".m4s", ".mp4")
+
+# S3 limits for multipart uploads
+S3_MAX_PARTS = 10000
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Content types and cache headers stored with objects, matching what the public API
+# sends for the same files (redirected requests get their headers from the bucket)
+_OBJECT_HEADERS = {
+    ".ts": ("video/mp2t", "public, max-age=31536000"),
+    ".m4s": ("video/iso.segment", "public, max-age=31536000"),
+    ".mp4": ("video/mp4", "public, max-age=31536000"),
+    ".m3u8": ("application/vnd.apple.mpegurl", "no-cache"),
+    ".mpd": ("application/dash+xml", "no-cache"),
+    ".jpg": ("image/jpeg", "public, max-age=60, must-revalidate"),
+    ".vtt": ("text/vtt", "public, max-age=60, must-revalidate"),
+}
+
+
+class ObjectInfo(NamedTuple):
+    """Size and modification time of a stored object."""
+
+    size: int
+    mtime: float
+
+
+def object_headers(key: str) -> Tuple[str, Optional[str]]:
+    """Content type and Cache-Control value to store with an object."""
+    content_type, cache_control = _OBJECT_HEADERS.get(os.path.splitext(key)[1], (None, None))
+    if content_type is None:
+        content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+    return content_type, cache_control
+
+
+class StorageBackend(ABC):
+    """
+    Interface of storage backends.
+
+    Keys are relative POSIX paths ("{slug}/{path}"). Methods are blocking;
+    async callers run them in an executor.
+    """
+
+    name = "base"
+    # Whether objects live somewhere other than VIDEOS_DIR (publishing does work)
+    remote = False
+
+    @abstractmethod
+    def put_file(self, key: str, path: Path) -> None:
+        """Store a local file under key, replacing any existing object."""
+
+    @abstractmethod
+    def get_file(self, key: str, dest_path: Path) -> None:
+        """Download an object to a local file."""
+
+    @abstractmethod
+    def list_objects(self, prefix: str) -> Dict[str, ObjectInfo]:
+        """All objects whose key starts with prefix."""
+
+    @abstractmethod
+    def delete_objects(self, keys: Iterable[str]) -> int:
+        """Delete objects (missing keys are ignored). Returns how many were given."""
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every object whose key starts with prefix."""
+        return self.delete_objects(list(self.list_objects(prefix)))
+
+    def presigned_url(self, key: str, expires_in: int) -> Optional[str]:
+        """Time-limited URL to download an object (None if not supported)."""
+        return None
+
+
+class FilesystemBackend(StorageBackend):
+    """Objects are files under a root directory (VIDEOS_DIR by default)."""
+
+    name = "filesystem"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.remote = self.root.resolve() != VIDEOS_DIR.resolve()
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        # Keys come from relative paths, but never write outside the root
+        path.relative_to(self.root.resolve())
+        return path
+
+    def put_file(self, key: str, path: Path) -> None:
+        dest_path = self._path(key)
+        try:
+            if os.path.samefile(path, dest_path):
+                return
+        except FileNotFoundError:
+            pass
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = dest_path.with_name(f".{dest_path.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(path, temp_path)
+            os.replace(temp_path, dest_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def get_file(self, key: str, dest_path: Path) -> None:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._path(key), dest_path)
+
+    def list_objects(self, prefix: str) -> Dict[str, ObjectInfo]:
+        directory = prefix.rpartition("/")[0]
+        base = self._path(directory) if directory else self.root.resolve()
+        if not base.is_dir():
+            return {}
+        objects = {}
+        root = self.root.resolve()
+        for path in base.rglob("*"):
+            key = path.relative_to(root).as_posix()
+            if not key.startswith(prefix) or path.suffix == ".tmp":
+                continue
+            try:
+                path_stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                objects[key] = ObjectInfo(path_stat.st_size, path_stat.st_mtime)
+        return objects
+
+    def delete_objects(self, keys: Iterable[str]) -> int:
+        count = 0
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+            count += 1
+        return count
+
+
+class S3Backend(StorageBackend):
+    """
+    Objects in an S3-compatible bucket.
+
+    Uses boto3 (optional dependency, pip install 'vlog[s3]'). Clients are
+    thread-safe, so parts and files are uploaded from a thread pool.
+    """
+
+    name = "s3"
+    remote = True
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str = "",
+        region: str = "us-east-1",
+        access_key_id: str = "",
+        secret_access_key: str = "",
+        key_prefix: str = "",
+        multipart_threshold: int = 64 * 1024 * 1024,
+        part_size: int = 16 * 1024 * 1024,
+        max_concurrency: int = 8,
+        client=None,
+    ):
+        if not bucket:
+            raise ValueError("VLOG_S3_BUCKET is required for the s3 storage backend")
+        self.bucket = bucket
+        self.key_prefix = key_prefix
+        self.multipart_threshold = multipart_threshold
+        self.part_size = max(part_size, S3_MIN_PART_SIZE)
+        self.max_concurrency = max_concurrency
+        if client is None:
+            try:
+                import boto3
+                from botocore.config import Config
+            except ImportError:
+                raise RuntimeError("The s3 storage backend requires boto3 (pip install 'vlog[s3]')")
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url or None,
+                region_name=region,
+                aws_access_key_id=access_key_id or None,
+                aws_secret_access_key=secret_access_key or None,
+                config=Config(max_pool_connections=max_concurrency * 2, retries={"mode": "standard"}),
+            )
+        self._client = client
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def put_file(self, key: str, path: Path) -> None:
+        content_type, cache_control = object_headers(key)
+        extra = {"ContentType": content_type}
+        if cache_control:
+            extra["CacheControl"] = cache_control
+
+        size = path.stat().st_size
+        if size < self.multipart_threshold:
+            with open(path, "rb") as f:
+                self._client.put_object(Bucket=self.bucket, Key=self._key(key), Body=f, **extra)
+            return
+        self._put_multipart(self._key(key), path, size, extra)
+
+    def _put_multipart(self, object_key: str, path: Path, size: int, extra: dict) -> None:
+        """Upload a file as a multipart upload, sending parts in parallel."""
+        # Large files need larger parts to stay within the part limit
+        part_size = max(self.part_size, math.ceil(size / S3_MAX_PARTS))
+        part_count = math.ceil(size / part_size)
+        upload_id = self._client.create_multipart_upload(Bucket=self.bucket, Key=object_key, **extra)["UploadId"]
+
+        def upload_part(number: int) -> dict:
+            with open(path, "rb") as f:
+                f.seek((number - 1) * part_size)
+                data = f.read(part_size)
+            response = self._client.upload_part(
+                Bucket=self.bucket, Key=object_key, UploadId=upload_id, PartNumber=number, Body=data
+            )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, part_count)) as pool:
+                parts = list(pool.map(upload_part, range(1, part_count + 1)))
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket, Key=object_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except Exception:
+            # Uploaded parts are billed storage until the upload is aborted
+            try:
+                self._client.abort_multipart_upload(Bucket=self.bucket, Key=object_key, UploadId=upload_id)
+            except Exception as e:
+                logger.warning(f"Failed to abort multipart upload of {object_key}: {e}")
+            raise
+
+    def get_file(self, key: str, dest_path: Path) -> None:
+        response = self._client.get_object(Bucket=self.bucket, Key=self._key(key))
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest_path, "wb") as f:
+            for chunk in iter(lambda: response["Body"].read(1024 * 1024), b""):
+                f.write(chunk)
+
+    def list_objects(self, prefix: str) -> Dict[str, ObjectInfo]:
+        objects = {}
+        kwargs = {"Bucket": self.bucket, "Prefix": self._key(prefix)}
+        while True:
+            response = self._client.list_objects_v2(**kwargs)
+            for item in response.get("Contents", []):
+                key = item["Key"][len(self.key_prefix) :]
+                objects[key] = ObjectInfo(item["Size"], item["LastModified"].timestamp())
+            if not response.get("IsTruncated"):
+                return objects
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    def delete_objects(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        # DeleteObjects accepts up to 1000 keys per request
+        for start in range(0, len(keys), 1000):
+            batch = keys[start : start + 1000]
+            self._client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": self._key(key)} for key in batch], "Quiet": True},
+            )
+        return len(keys)
+
+    def presigned_url(self, key: str, expires_in: int) -> Optional[str]:
+        return self._client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": self._key(key)}, ExpiresIn=expires_in
+        )
+
+
+_backend: Optional[StorageBackend] = None
+
+
+def get_storage_backend() -> StorageBackend:
+    """
+    The configured storage backend (created on first use).
+
+    Raises:
+        RuntimeError: If the s3 backend is configured but boto3 is not installed
+        ValueError: If the backend name is unknown or its settings are incomplete
+    """
+    global _backend
+    if _backend is None:
+        if STORAGE_BACKEND == "s3":
+            _backend = S3Backend(
+                bucket=S3_BUCKET,
+                endpoint_url=S3_ENDPOINT_URL,
+                region=S3_REGION,
+                access_key_id=S3_ACCESS_KEY_ID,
+                secret_access_key=S3_SECRET_ACCESS_KEY,
+                key_prefix=S3_KEY_PREFIX,
+                multipart_threshold=S3_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+                part_size=S3_MULTIPART_PART_SIZE_MB * 1024 * 1024,
+                max_concurrency=S3_MAX_CONCURRENCY,
+            )
+        elif STORAGE_BACKEND == "filesystem":
+            _backend = FilesystemBackend(VIDEOS_DIR)
+        else:
+            raise ValueError(f"Unknown storage backend: {STORAGE_BACKEND} (expected 'filesystem' or 's3')")
+    return _backend
+
+
+def sync_directory(backend: StorageBackend, local_dir: Path, prefix: str, max_concurrency: int = 8) -> Tuple[int, int]:
+    """
+    Make the objects under prefix match a local directory.
+
+    Files whose object has the same size and is at least as new are skipped;
+    objects without a local file are deleted. A file is as new as its last
+    data or inode change (ctime): files linked in from the segment store keep
+    the blob's old mtime.
+
+    Returns:
+        (files uploaded, objects deleted)
+    """
+    remote = backend.list_objects(prefix)
+    local: Dict[str, Path] = {}
+    uploads: List[Tuple[str, Path]] = []
+    for path in local_dir.rglob("*"):
+        if path.suffix == ".tmp" or not path.is_file():
+            continue
+        key = prefix + path.relative_to(local_dir).as_posix()
+        local[key] = path
+        existing = remote.get(key)
+        path_stat = path.stat()
+        changed = max(path_stat.st_mtime, path_stat.st_ctime)
+        if existing is None or existing.size != path_stat.st_size or existing.mtime < changed:
+            uploads.append((key, path))
+
+    if uploads:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(uploads))) as pool:
+            # list() re-raises the first failed upload
+            list(pool.map(lambda item: backend.put_file(*item), uploads))
+
+    stale = [key for key in remote if key not in local]
+    if stale:
+        backend.delete_objects(stale)
+    return len(uploads), len(stale)
+
+
+def publish_video_sync(slug: str, backend: Optional[StorageBackend] = None) -> Tuple[int, int]:
+    """
+    Upload a video directory (publish_video() records it as published).
+
+    Returns:
+        (files uploaded, objects deleted)
+    """
+    backend = backend if backend is not None else get_storage_backend()
+    return sync_directory(backend, VIDEOS_DIR / slug, f"{slug}/", S3_MAX_CONCURRENCY)
+
+
+def publish_path_sync(slug: str, relative_path: str, backend: Optional[StorageBackend] = None) -> int:
+    """
+    Publish one file or subdirectory of a video (thumbnail, sprite sheets).
+
+    Returns:
+        Number of files uploaded
+    """
+    backend = backend if backend is not None else get_storage_backend()
+    path = VIDEOS_DIR / slug / relative_path
+    key = f"{slug}/{relative_path}"
+    if path.is_dir():
+        return sync_directory(backend, path, f"{key}/", S3_MAX_CONCURRENCY)[0]
+    if path.is_file():
+        backend.put_file(key, path)
+        return 1
+    backend.delete_objects([key])
+    return 0
+
+
+def _run_in_executor(func, *args):
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def publish_path(slug: str, relative_path: str) -> None:
+    """Publish one file or subdirectory of a video (best effort, logged on failure)."""
+    if not get_storage_backend().remote:
+        return
+    try:
+        await _run_in_executor(publish_path_sync, slug, relative_path)
+    except Exception as e:
+        logger.warning(f"Failed to publish {slug}/{relative_path} to object storage: {e}")
+
+
+async def delete_video_objects(slug: str, relative_path: str = "") -> None:
+    """Remove a video (or one of its subdirectories) from object storage (best effort)."""
+    if not get_storage_backend().remote:
+        return
+    prefix = f"{slug}/{relative_path}/" if relative_path else f"{slug}/"
+    try:
+        deleted = await _run_in_executor(get_storage_backend().delete_prefix, prefix)
+    except Exception as e:
+        logger.warning(f"Failed to delete {prefix} from object storage: {e}")
+        return
+    if deleted:
+        logger.info(f"Deleted {deleted} objects under {prefix} from object storage")
+
+
+async def video_published(slug: str) -> bool:
+    """Whether object storage has the current files of a video."""
+    video_id = await database.fetch_val(
+        sa.select(videos.c.id).where(videos.c.slug == slug).where(videos.c.storage_synced_at.isnot(None))
+    )
+    return video_id is not None
+
+
+async def publish_video(slug: str) -> None:
+    """
+    Publish a video directory (best effort, logged on failure).
+
+    Only ready videos are published. The video is recorded as published if
+    nothing cleared its sync state (STORAGE_SYNC_RESET) while uploading.
+    """
+    if not get_storage_backend().remote:
+        return
+    started = datetime.now(timezone.utc)
+    try:
+        video_id = await database.fetch_val(
+            videos.update()
+            .where(videos.c.slug == slug)
+            .where(videos.c.status == "ready")
+            .values(storage_sync_started_at=started)
+            .returning(videos.c.id)
+        )
+        if video_id is None:
+            return
+        uploaded, deleted = await _run_in_executor(publish_video_sync, slug)
+        await database.execute(
+            videos.update()
+            .where(videos.c.id == video_id)
+            .where(videos.c.storage_sync_started_at == started)
+            .values(storage_synced_at=datetime.now(timezone.utc))
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish {slug} to object storage: {e}")
+        return
+    # Public API instances re-check the video's published state
+    await Publisher.publish_manifests_invalidated(slug)
+    logger.info(f"Published {slug} to object storage ({uploaded} files uploaded, {deleted} removed)")
+
+
+# Videos being published, and those changed again while being published
+_publish_tasks: Dict[str, "asyncio.Task[None]"] = {}
+_republish: Set[str] = set()
+
+
+async def _publish_video_task(slug: str) -> None:
+    try:
+        while True:
+            _republish.discard(slug)
+            await publish_video(slug)
+            if slug not in _republish:
+                break
+    finally:
+        _publish_tasks.pop(slug, None)
+
+
+def schedule_video_publish(slug: str) -> None:
+    """
+    Publish a video in the background.
+
+    Until it completes, the video keeps being served from VIDEOS_DIR. If the
+    video is already being published, it is published again afterwards.
+    """
+    if not get_storage_backend().remote:
+        return
+    if slug in _publish_tasks:
+        _republish.add(slug)
+        return
+    _publish_tasks[slug] = asyncio.create_task(_publish_video_task(slug))
@@ -8,12 +8,14 @@ import hashlib
 import json
 import logging
 import os
+import re
 import time
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 import sqlalchemy as sa
@@ -24,7 +26,7 @@ from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 
-from api.analytics_cache import AnalyticsCache
+from api.analytics_buffer import analytics_buffer, start_analytics_flusher, stop_analytics_flusher
 from api.common import (
     HTTPMetricsMiddleware,
     RequestIDMiddleware,
@@ -38,18 +40,21 @@ from api.common import (
 )
 from api.database import (
     categories,
-    chapters,
     configure_database,
     custom_field_definitions,
     database,
     playback_sessions,
     playlists,
     quality_progress,
+    related_video_state,
     tags,
     transcoding_jobs,
     transcriptions,
     video_custom_fields,
+    video_neighbors,
     video_qualities,
+    video_search,
+    video_stats,
     video_tags,
     videos,
     viewers,
@@ -63,11 +68,24 @@ from api.db_retry import (
 )
 from api.enums import DurationFilter, SortBy, SortOrder, TranscriptionStatus, VideoStatus
 from api.errors import sanitize_error_message, sanitize_progress_error
+from api.media_files import (
+    FileInfo,
+    MediaFileResponse,
+    MediaStaticFiles,
+    start_manifest_invalidation_listener,
+    stop_manifest_invalidation_listener,
+)
 from api.metrics import VIDEOS_WATCH_TIME_SECONDS_TOTAL
+from api.object_storage import get_storage_backend
 from api.pagination import encode_cursor, validate_cursor
+from api.response_cache import (
+    create_response_cache,
+    load_tag_versions,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
 from api.schemas import (
     CategoryResponse,
-    ChapterInfo,
     PaginatedVideoListResponse,
     PlaybackEnd,
     PlaybackHeartbeat,
@@ -83,10 +101,11 @@ from api.schemas import (
     TranscodingProgressResponse,
     TranscriptionResponse,
     VideoListResponse,
-    VideoQualityResponse,
     VideoResponse,
     VideoTagInfo,
 )
+from api.video_details import CHAPTERS, QUALITIES, TAGS, TRANSCRIPTIONS, get_detail_loader
+from api.video_stats import increment_video_stats, is_new_viewer_for_video
 from config import (
     CORS_ALLOWED_ORIGINS,
     DOWNLOADS_ALLOW_ORIGINAL,
@@ -94,6 +113,7 @@ from config import (
     DOWNLOADS_ENABLED,
     DOWNLOADS_MAX_CONCURRENT,
     DOWNLOADS_RATE_LIMIT_PER_HOUR,
+    MANIFEST_CACHE_MAX_AGE,
     NAS_STORAGE,
     PUBLIC_PORT,
     QUALITY_NAMES,
@@ -102,6 +122,9 @@ from config import (
     RATE_LIMIT_PUBLIC_DEFAULT,
     RATE_LIMIT_PUBLIC_VIDEOS_LIST,
     RATE_LIMIT_STORAGE_URL,
+    RELATED_VIDEOS_REFRESH_INTERVAL,
+    S3_PRESIGNED_REDIRECTS,
+    S3_PRESIGNED_URL_EXPIRY,
     SECURE_COOKIES,
     SUPPORTED_VIDEO_EXTENSIONS,
     UPLOADS_DIR,
@@ -126,8 +149,9 @@ _cached_watermark_settings_time: float = 0
 _WATERMARK_SETTINGS_CACHE_TTL = 60  # Refresh every 60 seconds
 
 # Video list cache for performance (Issue #429)
-# Caches video list query results for 30 seconds to reduce database load
-_video_list_cache = AnalyticsCache(ttl_seconds=30, enabled=True, max_size=500)
+# Caches video list query results in-process and, with Redis, across all public API
+# instances; admin changes and completed transcodes invalidate it (see api/response_cache.py)
+_video_list_cache = create_response_cache()
 
 
 async def get_watermark_settings() -> Dict[str, Any]:
@@ -300,7 +324,16 @@ async def lifespan(app: FastAPI):
         )
     await database.connect()
     await configure_database()
+    # Adopt the shared cache tag versions before serving, then follow invalidations
+    await load_tag_versions()
+    start_invalidation_listener()
+    start_manifest_invalidation_listener()
+    start_analytics_flusher()
     yield
+    # Write buffered playback progress before the database goes away
+    await stop_analytics_flusher()
+    await stop_manifest_invalidation_listener()
+    await stop_invalidation_listener()
     await database.disconnect()
 
 
@@ -343,7 +376,14 @@ app.add_middleware(HTTPMetricsMiddleware, api_name="public")
 
 
 # Custom static files handler with proper headers for HLS/DASH/CMAF streaming
-class StreamingStaticFiles(StaticFiles):
+def _manifest_cache_control(complete: bool) -> str:
+    """Cache-Control for a manifest: completed VOD manifests are cacheable, others must revalidate."""
+    if complete and MANIFEST_CACHE_MAX_AGE > 0:
+        return f"public, max-age={MANIFEST_CACHE_MAX_AGE}"
+    return "no-cache"
+
+
+class StreamingStaticFiles(MediaStaticFiles):
     """
     Static files handler for video streaming content.
 
@@ -353,48 +393,54 @@ class StreamingStaticFiles(StaticFiles):
     - HLS playlists (.m3u8)
     - DASH manifests (.mpd)
 
-    Provides appropriate MIME types and cache headers for each file type.
+    Provides appropriate MIME types and cache headers for each file type. Files are
+    served from the cached stat index with byte-range support, and manifests from
+    the in-memory manifest cache (see api/media_files.py).
     """
 
-    async def get_response(self, path: str, scope) -> Response:
-        try:
-            response = await super().get_response(path, scope)
+    def file_headers(self, path: str, complete: bool = False) -> Tuple[Optional[str], Dict[str, str]]:
+        # CORS headers for cross-origin playback (needed for some players)
+        headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Expose-Headers": "Content-Length,Content-Range",
+        }
+        media_type = None
 
-            # CORS headers for cross-origin playback (needed for some players)
-            response.headers["Access-Control-Allow-Origin"] = "*"
-            response.headers["Access-Control-Expose-Headers"] = "Content-Length,Content-Range"
+        # MIME types and cache headers based on file type
+        if path.endswith(".ts"):
+            # Legacy MPEG-TS segments - cache aggressively (immutable)
+            media_type = "video/mp2t"
+            headers["Cache-Control"] = "public, max-age=31536000"
 
-            # MIME types and cache headers based on file type
-            if path.endswith(".ts"):
-                # Legacy MPEG-TS segments - cache aggressively (immutable)
-                response.headers["Content-Type"] = "video/mp2t"
-                response.headers["Cache-Control"] = "public, max-age=31536000"
+        elif path.endswith(".m4s"):
+            # CMAF media segments - cache aggressively (immutable)
+            media_type = "video/iso.segment"
+            headers["Cache-Control"] = "public, max-age=31536000"
 
-            elif path.endswith(".m4s"):
-                # CMAF media segments - cache aggressively (immutable)
-                response.headers["Content-Type"] = "video/iso.segment"
-                response.headers["Cache-Control"] = "public, max-age=31536000"
+        elif path.endswith("init.mp4"):
+            # CMAF initialization segments - cache aggressively
+            media_type = "video/mp4"
+            headers["Cache-Control"] = "public, max-age=31536000"
 
-            elif path.endswith("init.mp4"):
-                # CMAF initialization segments - cache aggressively
-                response.headers["Content-Type"] = "video/mp4"
-                response.headers["Cache-Control"] = "public, max-age=31536000"
+        elif path.endswith(".m3u8"):
+            # HLS playlists - cacheable once complete, otherwise no cache to allow live updates
+            media_type = "application/vnd.apple.mpegurl"
+            headers["Cache-Control"] = _manifest_cache_control(complete)
 
-            elif path.endswith(".m3u8"):
-                # HLS playlists - no cache to allow live updates
-                response.headers["Content-Type"] = "application/vnd.apple.mpegurl"
-                response.headers["Cache-Control"] = "no-cache"
+        elif path.endswith(".mpd"):
+            # DASH manifests - cacheable once complete, otherwise no cache to allow live updates
+            media_type = "application/dash+xml"
+            headers["Cache-Control"] = _manifest_cache_control(complete)
 
-            elif path.endswith(".mpd"):
-                # DASH manifests - no cache to allow live updates
-                response.headers["Content-Type"] = "application/dash+xml"
-                response.headers["Cache-Control"] = "no-cache"
+        elif path.endswith("thumbnail.jpg") or "/frames/" in path:
+            # Short cache for thumbnails and frame images
+            headers["Cache-Control"] = "public, max-age=60, must-revalidate"
 
-            elif path.endswith("thumbnail.jpg") or "/frames/" in path:
-                # Short cache for thumbnails and frame images
-                response.headers["Cache-Control"] = "public, max-age=60, must-revalidate"
+        return media_type, headers
 
-            return response
+    async def get_response(self, path: str, scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
 
         except (OSError, PermissionError) as e:
             # Storage unavailable - return 503 with helpful message
@@ -413,7 +459,17 @@ HLSStaticFiles = StreamingStaticFiles
 # Serve video files (HLS segments, playlists, thumbnails)
 # Skip in test mode since CI doesn't have the storage directory
 if not os.environ.get("VLOG_TEST_MODE"):
-    app.mount("/videos", HLSStaticFiles(directory=str(VIDEOS_DIR)), name="videos")
+    # With an S3 backend, segments of published videos are redirected to presigned URLs
+    storage_backend = get_storage_backend()
+    app.mount(
+        "/videos",
+        HLSStaticFiles(
+            directory=str(VIDEOS_DIR),
+            storage_backend=storage_backend if storage_backend.remote and S3_PRESIGNED_REDIRECTS else None,
+            presigned_url_expiry=S3_PRESIGNED_URL_EXPIRY,
+        ),
+        name="videos",
+    )
 
 # Serve static web files
 WEB_DIR = Path(__file__).parent.parent / "web" / "public"
@@ -469,85 +525,6 @@ async def tag_page(slug: str):
     return FileResponse(WEB_DIR / "tag.html")
 
 
-async def get_video_tags(video_ids: List[int]) -> dict:
-    """Get tags for a list of video IDs. Returns a dict of video_id -> list of tags."""
-    if not video_ids:
-        return {}
-
-    query = (
-        sa.select(
-            video_tags.c.video_id,
-            tags.c.id,
-            tags.c.name,
-            tags.c.slug,
-        )
-        .select_from(video_tags.join(tags, video_tags.c.tag_id == tags.c.id))
-        .where(video_tags.c.video_id.in_(video_ids))
-        .order_by(tags.c.name)
-    )
-
-    rows = await fetch_all_with_retry(query)
-
-    result = {}
-    for row in rows:
-        video_id = row["video_id"]
-        if video_id not in result:
-            result[video_id] = []
-        result[video_id].append(VideoTagInfo(id=row["id"], name=row["name"], slug=row["slug"]))
-
-    return result
-
-
-async def get_video_chapters(video_ids: List[int], has_chapters_flags: Dict[int, bool] = None) -> dict:
-    """
-    Get chapters for a list of video IDs. Returns a dict of video_id -> list of chapters.
-
-    Args:
-        video_ids: List of video IDs to get chapters for
-        has_chapters_flags: Optional dict mapping video_id -> has_chapters bool.
-                           If provided, only queries for videos with has_chapters=True.
-    """
-    if not video_ids:
-        return {}
-
-    # Filter to only videos that have chapters (if flag info provided)
-    if has_chapters_flags:
-        video_ids = [vid for vid in video_ids if has_chapters_flags.get(vid, False)]
-
-    if not video_ids:
-        return {}
-
-    query = (
-        sa.select(
-            chapters.c.video_id,
-            chapters.c.id,
-            chapters.c.title,
-            chapters.c.start_time,
-            chapters.c.end_time,
-        )
-        .where(chapters.c.video_id.in_(video_ids))
-        .order_by(chapters.c.video_id, chapters.c.position)
-    )
-
-    rows = await fetch_all_with_retry(query)
-
-    result = {}
-    for row in rows:
-        video_id = row["video_id"]
-        if video_id not in result:
-            result[video_id] = []
-        result[video_id].append(
-            ChapterInfo(
-                id=row["id"],
-                title=row["title"],
-                start_time=row["start_time"],
-                end_time=row["end_time"],
-            )
-        )
-
-    return result
-
-
 # =============================================================================
 # Video List Query Helpers (Issue #437)
 # =============================================================================
@@ -559,6 +536,9 @@ def build_base_videos_query() -> sa.Select:
 
     Returns a query that selects video fields, category name, and view count,
     filtered to only show published, non-deleted, ready videos.
+
+    View counts come from the maintained video_stats counters rather than an
+    aggregate over playback_sessions, so listing cost does not grow with analytics volume.
     """
     return (
         sa.select(
@@ -574,28 +554,16 @@ def build_base_videos_query() -> sa.Select:
             videos.c.thumbnail_source,
             videos.c.thumbnail_timestamp,
             categories.c.name.label("category_name"),
-            sa.func.count(sa.distinct(playback_sessions.c.id)).label("view_count"),
+            sa.func.coalesce(video_stats.c.view_count, 0).label("view_count"),
         )
         .select_from(
             videos.outerjoin(categories, videos.c.category_id == categories.c.id).outerjoin(
-                playback_sessions, videos.c.id == playback_sessions.c.video_id
+                video_stats, videos.c.id == video_stats.c.video_id
             )
         )
         .where(videos.c.status == VideoStatus.READY)
         .where(videos.c.deleted_at.is_(None))
         .where(videos.c.published_at.is_not(None))
-        .group_by(
-            videos.c.id,
-            videos.c.title,
-            videos.c.slug,
-            videos.c.description,
-            videos.c.category_id,
-            videos.c.duration,
-            videos.c.status,
-            videos.c.created_at,
-            videos.c.published_at,
-            categories.c.name,
-        )
     )
 
 
@@ -620,17 +588,75 @@ def apply_tag_filter(query: sa.Select, tag: Optional[str]) -> sa.Select:
     return query.where(tag_exists)
 
 
+# Full-text search index columns (see video_search in api/database.py). The tsvector
+# column only exists on PostgreSQL and the FTS5 table only on SQLite, so neither is
+# part of the SQLAlchemy metadata.
+_VIDEO_SEARCH_VECTOR = sa.literal_column("video_search.search_vector")
+_VIDEO_SEARCH_FTS = sa.literal_column("video_search_fts")
+
+
+def _search_tokens(search: str) -> List[str]:
+    """Split a search string into word tokens, dropping full-text query operators."""
+    return re.findall(r"\w+", search.lower())
+
+
+def _search_tsquery(tokens: List[str]) -> sa.ColumnElement:
+    """Build a PostgreSQL tsquery requiring every token as a word prefix."""
+    return sa.func.to_tsquery("english", " & ".join(f"{token}:*" for token in tokens))
+
+
+def _search_match(search: str) -> Optional[sa.ColumnElement]:
+    """
+    Build the full-text match condition for a search string.
+
+    Every word must match, as a prefix so partially typed words still find results.
+    PostgreSQL matches the weighted tsvector on video_search; SQLite matches the
+    video_search_fts FTS5 table.
+
+    Returns:
+        The match condition, or None if the search contains no words
+    """
+    tokens = _search_tokens(search)
+    if not tokens:
+        return None
+    if str(database.url).startswith("postgresql"):
+        return _VIDEO_SEARCH_VECTOR.op("@@")(_search_tsquery(tokens))
+    fts_query = " ".join(f'"{token}"*' for token in tokens)
+    return _VIDEO_SEARCH_FTS.op("MATCH")(fts_query)
+
+
+def _search_rank(search: str) -> Optional[sa.ColumnElement]:
+    """
+    Build a relevance score for a search string, higher is more relevant.
+
+    Matches are weighted title > tags > description > transcript.
+    """
+    match = _search_match(search)
+    if match is None:
+        return None
+    if str(database.url).startswith("postgresql"):
+        return sa.func.ts_rank_cd(_VIDEO_SEARCH_VECTOR, _search_tsquery(_search_tokens(search)))
+    # FTS5 bm25() is only available inside the full-text query, and lower is better
+    return -(
+        sa.select(sa.func.bm25(_VIDEO_SEARCH_FTS, 10.0, 5.0, 2.0, 1.0))
+        .select_from(sa.table("video_search_fts"))
+        .where(match)
+        .where(sa.literal_column("video_search_fts.rowid") == videos.c.id)
+        .scalar_subquery()
+    )
+
+
 def apply_search_filter(query: sa.Select, search: Optional[str]) -> sa.Select:
-    """Apply text search filter on title and description."""
+    """Apply full-text search over title, description, tags and transcript."""
     if not search:
         return query
-    search_term = f"%{search}%"
-    return query.where(
-        sa.or_(
-            videos.c.title.ilike(search_term),
-            videos.c.description.ilike(search_term),
-        )
-    )
+    match = _search_match(search)
+    if match is None:
+        return query.where(sa.false())
+    if str(database.url).startswith("postgresql"):
+        return query.where(video_search.c.video_id == videos.c.id).where(match)
+    matching_ids = sa.select(sa.literal_column("rowid")).select_from(sa.table("video_search_fts")).where(match)
+    return query.where(videos.c.id.in_(matching_ids))
 
 
 def apply_duration_filter(query: sa.Select, duration: Optional[str]) -> sa.Select:
@@ -836,7 +862,7 @@ def parse_sort_parameters(sort: Optional[str], order: Optional[str], has_search:
     return sort_by, sort_order
 
 
-def apply_sorting(query: sa.Select, sort_by: SortBy, sort_order: SortOrder) -> sa.Select:
+def apply_sorting(query: sa.Select, sort_by: SortBy, sort_order: SortOrder, search: Optional[str] = None) -> sa.Select:
     """
     Apply sorting to the query.
 
@@ -844,6 +870,7 @@ def apply_sorting(query: sa.Select, sort_by: SortBy, sort_order: SortOrder) -> s
         query: The current query
         sort_by: The field to sort by
         sort_order: The sort direction
+        search: The search string, used to rank results when sorting by relevance
 
     Returns:
         Query with sorting applied
@@ -866,7 +893,14 @@ def apply_sorting(query: sa.Select, sort_by: SortBy, sort_order: SortOrder) -> s
         order_col = title_lower.asc() if sort_order == SortOrder.ASC else title_lower.desc()
         return query.order_by(order_col)
 
-    # SortBy.RELEVANCE and default: use published date descending
+    if sort_by == SortBy.RELEVANCE and search:
+        rank = _search_rank(search)
+        if rank is not None:
+            order_col = rank.desc() if sort_order == SortOrder.DESC else rank.asc()
+            # Equally relevant results are ordered newest first
+            return query.order_by(order_col, videos.c.published_at.desc())
+
+    # SortBy.RELEVANCE without a search and default: use published date descending
     return query.order_by(videos.c.published_at.desc())
 
 
@@ -961,7 +995,7 @@ async def list_videos(
     Filters:
     - category: Filter by category slug
     - tag: Filter by tag slug
-    - search: Full-text search in title and description
+    - search: Full-text search in title, description, tags and transcript
     - duration: short (<5min), medium (5-20min), long (>20min)
     - quality: Filter by available quality variants (e.g., 1080p, 2160p)
     - date_from/date_to: Filter by publication date range
@@ -970,6 +1004,7 @@ async def list_videos(
     Sorting:
     - relevance (default for text searches), date, duration, views, title
     - order: asc (ascending) or desc (descending)
+    - Searches sorted by relevance are paged with offset (no next_cursor)
 
     Note: Cursor-based pagination is recommended for large datasets (Issue #463).
     """
@@ -992,10 +1027,10 @@ async def list_videos(
     custom_filters_key = "|".join(f"{k}={v}" for k, v in sorted(custom_filters.items()))
     pagination_key = f"cursor:{cursor}" if using_cursor else f"offset:{offset}"
     cache_key_raw = f"{category}|{tag}|{search}|{duration}|{quality}|{date_from}|{date_to}|{has_transcription}|{featured}|{sort}|{order}|{limit}|{pagination_key}|{include_total}|{custom_filters_key}"
-    cache_key = f"videos:{hashlib.sha256(cache_key_raw.encode()).hexdigest()[:16]}"
+    cache_key = _video_list_cache.versioned_key(f"videos:{hashlib.sha256(cache_key_raw.encode()).hexdigest()[:16]}")
 
     # Check cache first
-    cached_result = _video_list_cache.get(cache_key)
+    cached_result = await _video_list_cache.get(cache_key)
     if cached_result is not None:
         return PaginatedVideoListResponse(**cached_result)
 
@@ -1016,6 +1051,11 @@ async def list_videos(
     # Apply sorting - need to know sort direction for cursor pagination
     sort_by, sort_order = parse_sort_parameters(sort, order, has_search=bool(search))
 
+    # A (published_at, id) cursor does not follow a relevance ranking, so ranked
+    # searches are paged by offset
+    if sort_by == SortBy.RELEVANCE and search:
+        using_cursor = False
+
     # Apply cursor-based pagination if cursor is provided (Issue #463)
     # Cursor pagination uses (published_at, id) for stable ordering
     if using_cursor:
@@ -1038,7 +1078,7 @@ async def list_videos(
             )
 
     # Apply sorting with secondary sort by id for stable cursor pagination
-    query = apply_sorting(query, sort_by, sort_order)
+    query = apply_sorting(query, sort_by, sort_order, search)
     # Add secondary sort by id for deterministic ordering with same published_at
     if sort_order == SortOrder.DESC:
         query = query.order_by(videos.c.id.desc())
@@ -1058,13 +1098,13 @@ async def list_videos(
     if has_more:
         rows = rows[:limit]  # Remove the extra row
 
-    video_ids = [row["id"] for row in rows]
-    video_tags_map = await get_video_tags(video_ids)
-    video_list = build_video_list_response(rows, video_tags_map)
+    loader = get_detail_loader(request)
+    await loader.load([row["id"] for row in rows], TAGS)
+    video_list = build_video_list_response(rows, loader.tags_map())
 
     # Generate next cursor from the last item
     next_cursor = None
-    if has_more and rows:
+    if has_more and rows and not (sort_by == SortBy.RELEVANCE and search):
         last_row = rows[-1]
         if last_row["published_at"]:
             next_cursor = encode_cursor(last_row["published_at"], last_row["id"])
@@ -1093,7 +1133,7 @@ async def list_videos(
     )
 
     # Cache the result as dict for serialization (Issue #429)
-    _video_list_cache.set(cache_key, result.model_dump())
+    await _video_list_cache.set(cache_key, result.model_dump(mode="json"))
 
     return result
 
@@ -1163,45 +1203,29 @@ async def get_videos_bulk(
             videos.c.streaming_format,
             videos.c.primary_codec,
             categories.c.name.label("category_name"),
-            sa.func.count(sa.distinct(playback_sessions.c.id)).label("view_count"),
+            sa.func.coalesce(video_stats.c.view_count, 0).label("view_count"),
         )
         .select_from(
             videos.outerjoin(categories, videos.c.category_id == categories.c.id).outerjoin(
-                playback_sessions, videos.c.id == playback_sessions.c.video_id
+                video_stats, videos.c.id == video_stats.c.video_id
             )
         )
         .where(videos.c.id.in_(id_list))
         .where(videos.c.status == "ready")
         .where(videos.c.deleted_at.is_(None))
         .where(videos.c.published_at.is_not(None))
-        .group_by(
-            videos.c.id,
-            videos.c.title,
-            videos.c.slug,
-            videos.c.description,
-            videos.c.category_id,
-            videos.c.duration,
-            videos.c.status,
-            videos.c.created_at,
-            videos.c.published_at,
-            videos.c.thumbnail_source,
-            videos.c.thumbnail_timestamp,
-            videos.c.streaming_format,
-            videos.c.primary_codec,
-            categories.c.name,
-        )
     )
 
     rows = await fetch_all_with_retry(query)
 
     # Get tags for these videos
-    video_ids = [row["id"] for row in rows]
-    video_tags_map = await get_video_tags(video_ids)
+    loader = get_detail_loader(request)
+    await loader.load([row["id"] for row in rows], TAGS)
 
     # Build response preserving original request order
     row_map = {row["id"]: row for row in rows}
     ordered_rows = [row_map[vid] for vid in id_list if vid in row_map]
-    return build_video_list_response(ordered_rows, video_tags_map)
+    return build_video_list_response(ordered_rows, loader.tags_map())
 
 
 @app.get("/api/videos/{slug}")
@@ -1228,42 +1252,23 @@ async def get_video(request: Request, slug: str) -> VideoResponse:
     if not row:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Get quality variants
-    quality_query = video_qualities.select().where(video_qualities.c.video_id == row["id"])
-    quality_rows = await fetch_all_with_retry(quality_query)
-
-    qualities = [
-        VideoQualityResponse(
-            quality=q["quality"],
-            width=q["width"],
-            height=q["height"],
-            bitrate=q["bitrate"],
-        )
-        for q in quality_rows
-    ]
-
-    # Get transcription status
-    transcription_query = transcriptions.select().where(transcriptions.c.video_id == row["id"])
-    transcription_row = await fetch_one_with_retry(transcription_query)
+    # Load qualities, transcription, tags and chapters in one concurrent wave
+    # (chapters only if has_chapters is True - Issue #413 Phase 7A)
+    loader = get_detail_loader(request)
+    kinds = [QUALITIES, TRANSCRIPTIONS, TAGS]
+    if row._mapping.get("has_chapters", False):
+        kinds.append(CHAPTERS)
+    await loader.load([row["id"]], *kinds)
 
     captions_url = None
     transcription_status = None
 
+    transcription_row = loader.transcription(row["id"])
     if transcription_row:
         transcription_status = transcription_row["status"]
         if transcription_row["status"] == TranscriptionStatus.COMPLETED and transcription_row["vtt_path"]:
             captions_url = f"/videos/{row['slug']}/captions.vtt"
 
-    # Get tags for this video
-    video_tags_map = await get_video_tags([row["id"]])
-    video_tag_list = video_tags_map.get(row["id"], [])
-
-    # Get chapters for this video (only if has_chapters is True - Issue #413 Phase 7A)
-    chapter_list = []
-    if row._mapping.get("has_chapters", False):
-        video_chapters_map = await get_video_chapters([row["id"]])
-        chapter_list = video_chapters_map.get(row["id"], [])
-
     # Build sprite sheet info if available (Issue #413 Phase 7B)
     sprite_sheet_info = None
     if row._mapping.get("sprite_sheet_status") == "ready" and row._mapping.get("sprite_sheet_count", 0) > 0:
@@ -1322,9 +1327,9 @@ async def get_video(request: Request, slug: str) -> VideoResponse:
         primary_codec=row._mapping.get("primary_codec", "h264"),
         captions_url=captions_url,
         transcription_status=transcription_status,
-        qualities=qualities,
-        tags=video_tag_list,
-        chapters=chapter_list,
+        qualities=loader.qualities(row["id"]),
+        tags=loader.tags(row["id"]),
+        chapters=loader.chapters(row["id"]),
         sprite_sheet_info=sprite_sheet_info,
     )
 
@@ -1440,58 +1445,94 @@ async def get_transcript(request: Request, slug: str) -> TranscriptionResponse:
 # =============================================================================
 
 
-async def _fetch_related_videos_tier(
+async def _fetch_related_videos_live(
+    video_id: int,
     category_id: Optional[int],
-    tag_ids: Optional[List[int]],
     exclude_ids: set,
     limit: int,
 ) -> List[Dict[str, Any]]:
     """
-    Fetch videos matching category and/or tags, excluding specified IDs.
+    Compute related videos for a video in a single query.
 
-    Tiers:
-    - category_id + tag_ids: Videos with same category AND shared tags (highest relevance)
-    - category_id only: Videos in the same category
-    - tag_ids only: Videos with shared tags
-    - neither: Recent published videos (fallback)
+    Used for videos without a precomputed list (see api/related_videos.py) and to
+    fill short lists. Videos are ranked by tier, then most recent first:
+    - same category + shared tags (highest relevance)
+    - same category only
+    - shared tags only
+    - any other recent published video (fallback)
 
     Args:
-        category_id: Optional category ID to filter by
-        tag_ids: Optional list of tag IDs to match (uses EXISTS for any match)
+        video_id: Source video ID (its top 10 tags are matched)
+        category_id: Source video's category ID, if any
         exclude_ids: Set of video IDs to exclude from results
         limit: Maximum number of videos to return
 
     Returns:
-        List of video rows matching criteria
+        List of video rows in relevance order
     """
     if limit <= 0:
         return []
 
-    query = build_base_videos_query()
-
-    # Exclude already-found videos
+    # Each tier is a separate candidate list of at most `limit` ids, so the fallback
+    # reads the category and tag indexes (and the newest published videos) instead
+    # of ranking the whole catalog
+    public = [
+        videos.c.status == VideoStatus.READY,
+        videos.c.deleted_at.is_(None),
+        videos.c.published_at.is_not(None),
+    ]
     if exclude_ids:
-        query = query.where(videos.c.id.notin_(exclude_ids))
+        public.append(videos.c.id.notin_(exclude_ids))
+
+    source_tags = video_tags.alias("source_tags")
+    candidate_tags = video_tags.alias("candidate_tags")
+    shares_tag = videos.c.id.in_(
+        sa.select(candidate_tags.c.video_id).where(
+            candidate_tags.c.tag_id.in_(
+                sa.select(source_tags.c.tag_id).where(source_tags.c.video_id == video_id).limit(10)
+            )
+        )
+    )
 
-    # Apply category filter
+    def candidates(tier: int, *criteria: sa.ColumnElement) -> sa.Select:
+        subquery = (
+            sa.select(videos.c.id, sa.literal(tier, sa.Integer).label("tier"))
+            .where(*public, *criteria)
+            .order_by(videos.c.published_at.desc())
+            .limit(limit)
+            .subquery()
+        )
+        return sa.select(subquery.c.id, subquery.c.tier)
+
+    tiers = []
     if category_id is not None:
-        query = query.where(videos.c.category_id == category_id)
+        same_category = videos.c.category_id == category_id
+        tiers += [candidates(0, same_category, shares_tag), candidates(1, same_category)]
+    tiers += [candidates(2, shares_tag), candidates(3)]
 
-    # Apply tag filter using EXISTS (at least one matching tag)
-    if tag_ids:
-        tag_match_exists = (
-            sa.select(sa.literal_column("1"))
-            .select_from(video_tags)
-            .where(video_tags.c.video_id == videos.c.id)
-            .where(video_tags.c.tag_id.in_(tag_ids))
-            .exists()
-        )
-        query = query.where(tag_match_exists)
+    # A video found by several tiers ranks by its best one
+    pooled = sa.union_all(*tiers).subquery()
+    ranked = sa.select(pooled.c.id, sa.func.min(pooled.c.tier).label("tier")).group_by(pooled.c.id).subquery()
+
+    query = (
+        build_base_videos_query()
+        .join(ranked, ranked.c.id == videos.c.id)
+        .order_by(ranked.c.tier, videos.c.published_at.desc())
+        .limit(limit)
+    )
+
+    return await fetch_all_with_retry(query)
 
-    # Order by published date (most recent first)
-    query = query.order_by(videos.c.published_at.desc())
-    query = query.limit(limit)
 
+async def _fetch_related_videos_precomputed(video_id: int, limit: int) -> List[Dict[str, Any]]:
+    """Fetch a video's precomputed related videos, best first (still-public videos only)."""
+    query = (
+        build_base_videos_query()
+        .join(video_neighbors, video_neighbors.c.neighbor_id == videos.c.id)
+        .where(video_neighbors.c.video_id == video_id)
+        .order_by(video_neighbors.c.score.desc(), videos.c.published_at.desc())
+        .limit(limit)
+    )
     return await fetch_all_with_retry(query)
 
 
@@ -1505,7 +1546,9 @@ async def get_related_videos(
     """
     Get related videos for a given video.
 
-    Algorithm priority (with early termination when limit reached):
+    Related videos are precomputed per video, scored by shared category, tag
+    similarity and co-watching (see api/related_videos.py). Videos without a
+    precomputed list, or with fewer entries than requested, are filled live by tier:
     1. Same category + shared tags (highest relevance)
     2. Same category only
     3. Shared tags only
@@ -1518,7 +1561,7 @@ async def get_related_videos(
         limit: Maximum number of related videos (1-24, default 12)
 
     Returns:
-        List of related videos sorted by relevance tier then recency
+        List of related videos sorted by relevance
     """
     # Validate slug to prevent injection attacks
     if not validate_slug(slug):
@@ -1526,23 +1569,28 @@ async def get_related_videos(
 
     # Build cache key with SHA256 hash to prevent cache poisoning
     # High priority fix (Margo): Include schema version in cache key
-    RELATED_VIDEOS_CACHE_VERSION = "v1"  # Increment on schema changes
+    RELATED_VIDEOS_CACHE_VERSION = "v2"  # Increment on schema changes
     cache_key_raw = f"related:{RELATED_VIDEOS_CACHE_VERSION}:{slug}|{limit}"
-    cache_key = f"related:{hashlib.sha256(cache_key_raw.encode()).hexdigest()[:16]}"
+    cache_key = _video_list_cache.versioned_key(f"related:{hashlib.sha256(cache_key_raw.encode()).hexdigest()[:16]}")
 
     # Check cache first
-    cached = _video_list_cache.get(cache_key)
+    cached = await _video_list_cache.get(cache_key)
     if cached is not None:
         try:
             return [VideoListResponse(**v) for v in cached]
         except Exception as e:
             # Cache schema mismatch after deploy, invalidate and regenerate
             logger.warning(f"Cached related videos schema mismatch, invalidating: {e}")
-            _video_list_cache.delete(cache_key)
+            await _video_list_cache.delete(cache_key)
 
-    # Get the source video with its category
+    # Get the source video with its category and whether its list is precomputed
     video_query = (
-        sa.select(videos.c.id, videos.c.category_id)
+        sa.select(
+            videos.c.id,
+            videos.c.category_id,
+            related_video_state.c.video_id.label("precomputed_id"),
+        )
+        .select_from(videos.outerjoin(related_video_state, related_video_state.c.video_id == videos.c.id))
         .where(videos.c.slug == slug)
         .where(videos.c.status == VideoStatus.READY)
         .where(videos.c.deleted_at.is_(None))
@@ -1554,81 +1602,30 @@ async def get_related_videos(
         raise HTTPException(status_code=404, detail="Video not found")
 
     video_id = video["id"]
-    category_id = video["category_id"]
 
-    # Get source video's tag IDs (limit to top 10 to avoid overly complex queries)
-    tag_query = sa.select(video_tags.c.tag_id).where(video_tags.c.video_id == video_id).limit(10)
-    tag_rows = await fetch_all_with_retry(tag_query)
-    source_tag_ids = [r["tag_id"] for r in tag_rows] if tag_rows else []
-
-    # Collect related videos using tiered algorithm with early termination
+    # Precomputed neighbors (single indexed lookup), topped up live if the list is
+    # short; videos without a list yet are computed live in one query
     related_videos: List[Dict[str, Any]] = []
-    seen_ids: set = {video_id}  # Always exclude the source video
-
-    # Tier 1: Same category + shared tags (highest relevance)
-    if category_id is not None and source_tag_ids:
-        tier1 = await _fetch_related_videos_tier(
-            category_id=category_id,
-            tag_ids=source_tag_ids,
-            exclude_ids=seen_ids,
-            limit=limit,
-        )
-        for v in tier1:
-            if len(related_videos) < limit:
-                related_videos.append(v)
-                seen_ids.add(v["id"])
-
-    # Tier 2: Same category only (if we need more)
-    if len(related_videos) < limit and category_id is not None:
-        remaining = limit - len(related_videos)
-        tier2 = await _fetch_related_videos_tier(
-            category_id=category_id,
-            tag_ids=None,
-            exclude_ids=seen_ids,
-            limit=remaining,
-        )
-        for v in tier2:
-            if len(related_videos) < limit:
-                related_videos.append(v)
-                seen_ids.add(v["id"])
-
-    # Tier 3: Shared tags only (if we need more)
-    if len(related_videos) < limit and source_tag_ids:
-        remaining = limit - len(related_videos)
-        tier3 = await _fetch_related_videos_tier(
-            category_id=None,
-            tag_ids=source_tag_ids,
-            exclude_ids=seen_ids,
-            limit=remaining,
-        )
-        for v in tier3:
-            if len(related_videos) < limit:
-                related_videos.append(v)
-                seen_ids.add(v["id"])
-
-    # Tier 4: Recent videos fallback (if we still need more)
+    if RELATED_VIDEOS_REFRESH_INTERVAL > 0 and video["precomputed_id"] is not None:
+        related_videos = list(await _fetch_related_videos_precomputed(video_id, limit))
     if len(related_videos) < limit:
-        remaining = limit - len(related_videos)
-        tier4 = await _fetch_related_videos_tier(
-            category_id=None,
-            tag_ids=None,
+        seen_ids = {video_id} | {v["id"] for v in related_videos}
+        related_videos += await _fetch_related_videos_live(
+            video_id=video_id,
+            category_id=video["category_id"],
             exclude_ids=seen_ids,
-            limit=remaining,
+            limit=limit - len(related_videos),
         )
-        for v in tier4:
-            if len(related_videos) < limit:
-                related_videos.append(v)
-                seen_ids.add(v["id"])
 
     # Get tags for all related videos
-    video_ids = [v["id"] for v in related_videos]
-    video_tags_map = await get_video_tags(video_ids)
+    loader = get_detail_loader(request)
+    await loader.load([v["id"] for v in related_videos], TAGS)
 
     # Build response using existing helper
-    result = build_video_list_response(related_videos, video_tags_map)
+    result = build_video_list_response(related_videos, loader.tags_map())
 
     # Cache the result
-    _video_list_cache.set(cache_key, [v.model_dump() for v in result])
+    await _video_list_cache.set(cache_key, [v.model_dump(mode="json") for v in result])
 
     return result
 
@@ -2449,7 +2446,8 @@ async def download_original(
         try:
             if not original_file.exists():
                 raise HTTPException(status_code=404, detail="Original file no longer available")
-            file_size = original_file.stat().st_size
+            file_stat = original_file.stat()
+            file_size = file_stat.st_size
         except OSError as e:
             logger.error(f"Filesystem error accessing {original_file}: {e}")
             raise HTTPException(status_code=503, detail="Storage temporarily unavailable")
@@ -2484,16 +2482,10 @@ async def download_original(
             f"file={original_file.name}, size={file_size_mb:.1f}MB, client={client_ip}"
         )
 
-        # Note: We don't release the download slot here because FileResponse
-        # streams the file asynchronously. The slot will be released when the
-        # response completes or errors. For true slot tracking, we'd need to
-        # wrap the response in a custom streaming response with cleanup.
-        # For now, we accept this limitation - slots may leak on slow downloads.
-        # TODO: Implement proper cleanup with background task or custom response
-
-        return FileResponse(
-            path=original_file,
-            filename=download_filename,
+        # The slot is released when the response ends: body sent, client
+        # disconnected or sending failed
+        return MediaFileResponse(
+            FileInfo.from_stat(str(original_file), file_stat),
             media_type=media_type,
             headers={
                 # RFC 5987 encoded filename with ASCII fallback
@@ -2501,6 +2493,7 @@ async def download_original(
                 f"filename*=UTF-8''{encoded_filename}",
                 "Cache-Control": "private, max-age=3600",
             },
+            on_complete=partial(_release_download_slot, client_ip),
         )
 
     except HTTPException:
@@ -2548,14 +2541,13 @@ async def start_analytics_session(
 
     # Get or create viewer from cookie
     if vlog_viewer:
-        # Look up existing viewer
-        viewer = await fetch_one_with_retry(viewers.select().where(viewers.c.session_id == vlog_viewer))
-        if viewer:
-            viewer_id = viewer["id"]
-            # Update last_seen timestamp
-            await db_execute_with_retry(
-                viewers.update().where(viewers.c.id == viewer_id).values(last_seen=datetime.now(timezone.utc))
-            )
+        # Update last_seen of an existing viewer and get its ID in one round trip
+        viewer_id = await fetch_val_with_retry(
+            viewers.update()
+            .where(viewers.c.session_id == vlog_viewer)
+            .values(last_seen=datetime.now(timezone.utc))
+            .returning(viewers.c.id)
+        )
 
     # If no valid viewer cookie, create new viewer
     if viewer_id is None:
@@ -2577,6 +2569,9 @@ async def start_analytics_session(
             secure=SECURE_COOKIES,
         )
 
+    # Check before inserting the session so this viewer's earlier sessions are the only ones seen
+    new_viewer = await is_new_viewer_for_video(data.video_id, viewer_id)
+
     # Create playback session linked to viewer
     await db_execute_with_retry(
         playback_sessions.insert().values(
@@ -2588,6 +2583,9 @@ async def start_analytics_session(
         )
     )
 
+    await increment_video_stats(data.video_id, views=1, unique_viewers=1 if new_viewer else 0)
+    analytics_buffer.remember_session(session_token, data.video_id)
+
     return PlaybackSessionResponse(session_token=session_token)
 
 
@@ -2595,35 +2593,24 @@ async def start_analytics_session(
 @limiter.limit(RATE_LIMIT_PUBLIC_ANALYTICS)
 async def analytics_heartbeat(request: Request, data: PlaybackHeartbeat):
     """Update playback session with current progress."""
-    # Find the session
-    query = playback_sessions.select().where(playback_sessions.c.session_token == data.session_token)
-    session = await fetch_one_with_retry(query)
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+    # Sessions seen by this process need no lookup; progress is written in batches
+    video_id = analytics_buffer.get_session_video(data.session_token)
+    if video_id is None:
+        video_id = await fetch_val_with_retry(
+            sa.select(playback_sessions.c.video_id).where(playback_sessions.c.session_token == data.session_token)
+        )
+        if video_id is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        analytics_buffer.remember_session(data.session_token, video_id)
 
     # Calculate time since last update (heartbeats come every ~30s)
     duration_increment = 30.0 if data.playing else 0.0
 
-    # Update session (handle None values from fresh sessions)
-    current_duration = session["duration_watched"] or 0.0
-    current_max_position = session["max_position"] or 0.0
-    new_duration = current_duration + duration_increment
-    new_max_position = max(current_max_position, data.position)
-
-    update_values = {
-        "duration_watched": new_duration,
-        "max_position": new_max_position,
-    }
-
-    if data.quality:
-        update_values["quality_used"] = data.quality
-
-    await db_execute_with_retry(
-        playback_sessions.update()
-        .where(playback_sessions.c.session_token == data.session_token)
-        .values(**update_values)
+    analytics_buffer.add_heartbeat(
+        data.session_token, video_id, duration_increment, data.position, data.quality or None
     )
+    if analytics_buffer.should_flush():
+        await analytics_buffer.flush()
 
     return {"status": "ok"}
 
@@ -2650,21 +2637,39 @@ async def end_analytics_session(request: Request, data: PlaybackEnd):
         if percent_watched >= 0.9:
             completed = True
 
-    # Final update (handle None values from fresh sessions)
+    # Final update, including progress still buffered from heartbeats
+    # (handle None values from fresh sessions)
+    pending = analytics_buffer.pop_session(data.session_token)
     current_max_position = session["max_position"] or 0.0
+    duration_watched = session["duration_watched"] or 0.0
+    final_values = {
+        "ended_at": datetime.now(timezone.utc),
+        "max_position": max(current_max_position, data.position),
+        "completed": completed,
+    }
+    if pending:
+        duration_watched += pending.watch_seconds
+        final_values["duration_watched"] = (
+            sa.func.coalesce(playback_sessions.c.duration_watched, 0) + pending.watch_seconds
+        )
+        final_values["max_position"] = max(final_values["max_position"], pending.max_position)
+        if pending.quality:
+            final_values["quality_used"] = pending.quality
     await db_execute_with_retry(
         playback_sessions.update()
         .where(playback_sessions.c.session_token == data.session_token)
-        .values(
-            ended_at=datetime.now(timezone.utc),
-            max_position=max(current_max_position, data.position),
-            completed=completed,
-        )
+        .values(**final_values)
+    )
+
+    # Count each session's completion once, even if /end is called repeatedly
+    await increment_video_stats(
+        session["video_id"],
+        watch_seconds=pending.watch_seconds if pending else 0.0,
+        completions=1 if completed and not session["completed"] else 0,
     )
 
     # Issue #207: Record watch time metric
-    # duration_watched is accumulated in heartbeat endpoint - record the final value
-    duration_watched = session["duration_watched"] or 0.0
+    # duration_watched is accumulated from heartbeats - record the final value
     if 0 < duration_watched < 86400:  # Sanity check: 0 < watch time < 24 hours
         VIDEOS_WATCH_TIME_SECONDS_TOTAL.inc(duration_watched)
 
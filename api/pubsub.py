@@ -12,6 +12,9 @@ Channels:
 - vlog:workers:status - Worker status changes
 - vlog:jobs:completed - Job completion notifications
 - vlog:jobs:failed - Job failure notifications
+- vlog:workers:keys_revoked - Worker API key revocations (verified-key cache eviction)
+- vlog:jobs:available - New transcoding jobs (wakes workers parked on long-poll claims)
+- vlog:cache:invalidate - Public response cache tag invalidations
 """
 
 import asyncio
@@ -257,6 +260,134 @@ class Publisher:
             logger.warning(f"Failed to publish job failure: {e}")
             return False
 
+    @staticmethod
+    async def publish_job_available(job_id: int, video_id: int, priority: str = "normal") -> bool:
+        """
+        Publish that a transcoding job is ready to be claimed.
+
+        Each Worker API instance wakes one worker parked on a long-poll claim
+        (see api/job_queue.py).
+
+        Args:
+            job_id: Job ready to be claimed
+            video_id: Video to transcode
+            priority: Job priority
+
+        Returns:
+            True if published successfully
+        """
+        redis = await get_redis()
+        if not redis:
+            return False
+
+        message = {
+            "type": "job_available",
+            "job_id": job_id,
+            "video_id": video_id,
+            "priority": priority,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            await redis.publish(channel_name("jobs", "available"), json.dumps(message))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish job availability: {e}")
+            return False
+
+    @staticmethod
+    async def publish_worker_keys_revoked(worker_id: int) -> bool:
+        """
+        Publish that a worker's API keys were revoked.
+
+        API instances evict the worker's keys from their verified-key cache
+        (see api/worker_auth.py).
+
+        Args:
+            worker_id: Worker database ID (workers.id, not the UUID)
+
+        Returns:
+            True if published successfully
+        """
+        redis = await get_redis()
+        if not redis:
+            return False
+
+        message = {
+            "type": "keys_revoked",
+            "worker_id": worker_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            await redis.publish(channel_name("workers", "keys_revoked"), json.dumps(message))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish worker key revocation: {e}")
+            return False
+
+    @staticmethod
+    async def publish_cache_invalidated(tag_versions: Dict[str, int]) -> bool:
+        """
+        Publish that public response cache tags were invalidated.
+
+        Public API instances adopt the new tag versions, so entries cached under
+        the old versions are no longer read (see api/response_cache.py).
+
+        Args:
+            tag_versions: New version of each invalidated tag
+
+        Returns:
+            True if published successfully
+        """
+        redis = await get_redis()
+        if not redis:
+            return False
+
+        message = {
+            "type": "cache_invalidated",
+            "tags": tag_versions,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            await redis.publish(channel_name("cache", "invalidate"), json.dumps(message))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+            return False
+
+    @staticmethod
+    async def publish_manifests_invalidated(slug: str) -> bool:
+        """
+        Publish that a video's manifests were rewritten.
+
+        Public API instances drop their cached manifests and file lookups for the
+        video's directory (see api/media_files.py).
+
+        Args:
+            slug: Video slug (its directory under VIDEOS_DIR)
+
+        Returns:
+            True if published successfully
+        """
+        redis = await get_redis()
+        if not redis:
+            return False
+
+        message = {
+            "type": "manifests_invalidated",
+            "slug": slug,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            await redis.publish(channel_name("cache", "manifests"), json.dumps(message))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to publish manifest invalidation: {e}")
+            return False
+
 
 class Subscriber:
     """Subscribe to Redis Pub/Sub channels for SSE streaming."""
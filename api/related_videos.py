@@ -0,0 +1,351 @@
+"""
+Precomputed related-video lists.
+
+The related videos endpoint used to run up to four tier queries per view (same
+category and tags, same category, shared tags, recent), plus tag lookups. It is
+the most requested endpoint after the watch page, so each video's list is now
+computed ahead of time by a background job in the admin API and stored in
+video_neighbors, making the endpoint a single indexed lookup.
+
+Candidates are scored by:
+- shared category (CATEGORY_WEIGHT), which keeps same-category videos first
+  as the tiered algorithm did
+- tag Jaccard similarity (TAG_WEIGHT)
+- co-watching: distinct viewers who watched both videos within the last
+  RELATED_VIDEOS_COWATCH_DAYS, relative to the most co-watched candidate
+  (COWATCH_WEIGHT)
+
+Lists are refreshed incrementally. Each run loads the catalog (category, tags
+and visibility of every video) and compares a signature of those inputs with
+the one stored in related_video_state. A changed video gets its list
+recomputed, and every video that lists it or shares its category or a tag is
+marked for recomputation (refreshed_at NULL), since the change may move it in
+or out of their lists. Lists older than RELATED_VIDEOS_MAX_AGE_HOURS are also
+recomputed to pick up co-watching. Each run recomputes at most
+RELATED_VIDEOS_MAX_PER_RUN lists; the rest wait for the next run.
+
+Videos without a stored list (new, or the job is disabled) get related videos
+computed live by the endpoint.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import sqlalchemy as sa
+
+from api.database import playback_sessions, related_video_state, video_neighbors, video_tags, videos
+from api.db_retry import fetch_all_with_retry
+from api.enums import VideoStatus
+from config import (
+    RELATED_VIDEOS_COWATCH_DAYS,
+    RELATED_VIDEOS_MAX_AGE_HOURS,
+    RELATED_VIDEOS_MAX_PER_RUN,
+    RELATED_VIDEOS_REFRESH_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Neighbors stored per video (the endpoint's maximum limit)
+NEIGHBORS_PER_VIDEO = 24
+
+# Co-watched videos considered per video
+MAX_COWATCH_CANDIDATES = 500
+
+# Score weights
+CATEGORY_WEIGHT = 2.0
+TAG_WEIGHT = 1.0
+COWATCH_WEIGHT = 1.0
+
+# Background refresh task
+_refresh_task: Optional[asyncio.Task] = None
+
+
+@dataclass
+class CatalogVideo:
+    """Inputs of a video's related list."""
+
+    category_id: Optional[int]
+    eligible: bool  # ready, published and not deleted
+    published_at: Optional[datetime]
+    tag_ids: FrozenSet[int] = frozenset()
+
+    @property
+    def signature(self) -> str:
+        """Hash of everything other videos' lists depend on."""
+        raw = f"{self.category_id}|{int(self.eligible)}|{','.join(str(t) for t in sorted(self.tag_ids))}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass
+class Catalog:
+    """All videos with category and tag indexes of the eligible ones."""
+
+    videos: Dict[int, CatalogVideo] = field(default_factory=dict)
+    by_category: Dict[int, Set[int]] = field(default_factory=dict)
+    by_tag: Dict[int, Set[int]] = field(default_factory=dict)
+
+    def add(self, video_id: int, video: CatalogVideo) -> None:
+        """Add a video (tags included) to the catalog."""
+        self.videos[video_id] = video
+        if not video.eligible:
+            return
+        if video.category_id is not None:
+            self.by_category.setdefault(video.category_id, set()).add(video_id)
+        for tag_id in video.tag_ids:
+            self.by_tag.setdefault(tag_id, set()).add(video_id)
+
+    def sharing(self, video_id: int) -> Set[int]:
+        """Eligible videos sharing the category or a tag with a video."""
+        video = self.videos[video_id]
+        result: Set[int] = set()
+        if video.category_id is not None:
+            result |= self.by_category.get(video.category_id, set())
+        for tag_id in video.tag_ids:
+            result |= self.by_tag.get(tag_id, set())
+        result.discard(video_id)
+        return result
+
+
+def rank_neighbors(catalog: Catalog, video_id: int, cowatch: Dict[int, int]) -> List[Tuple[int, float]]:
+    """
+    Score and rank a video's related candidates.
+
+    Args:
+        catalog: Catalog containing the video
+        video_id: Video to rank neighbors for
+        cowatch: Candidate video ID -> distinct viewers who watched both
+
+    Returns:
+        Up to NEIGHBORS_PER_VIDEO (neighbor_id, score) pairs, best first
+        (ties broken by most recently published)
+    """
+    source = catalog.videos[video_id]
+    cowatch = {
+        candidate_id: viewers
+        for candidate_id, viewers in cowatch.items()
+        if candidate_id != video_id and candidate_id in catalog.videos and catalog.videos[candidate_id].eligible
+    }
+    candidates = catalog.sharing(video_id) | set(cowatch)
+    max_cowatch = max(cowatch.values(), default=0)
+
+    scored = []
+    for candidate_id in candidates:
+        candidate = catalog.videos[candidate_id]
+        score = 0.0
+        if source.category_id is not None and candidate.category_id == source.category_id:
+            score += CATEGORY_WEIGHT
+        shared = len(source.tag_ids & candidate.tag_ids)
+        if shared:
+            score += TAG_WEIGHT * shared / len(source.tag_ids | candidate.tag_ids)
+        if max_cowatch:
+            score += COWATCH_WEIGHT * cowatch.get(candidate_id, 0) / max_cowatch
+        if score > 0:
+            published = candidate.published_at.timestamp() if candidate.published_at else 0.0
+            scored.append((score, published, candidate_id))
+
+    scored.sort(reverse=True)
+    return [(candidate_id, round(score, 6)) for score, _published, candidate_id in scored[:NEIGHBORS_PER_VIDEO]]
+
+
+async def load_catalog() -> Catalog:
+    """Load category, visibility and tags of every video."""
+    eligible = sa.and_(
+        videos.c.status == VideoStatus.READY,
+        videos.c.deleted_at.is_(None),
+        videos.c.published_at.is_not(None),
+    )
+    video_rows, tag_rows = await asyncio.gather(
+        fetch_all_with_retry(
+            sa.select(
+                videos.c.id,
+                videos.c.category_id,
+                videos.c.published_at,
+                sa.case((eligible, True), else_=False).label("eligible"),
+            )
+        ),
+        fetch_all_with_retry(sa.select(video_tags.c.video_id, video_tags.c.tag_id)),
+    )
+
+    tags_by_video: Dict[int, Set[int]] = {}
+    for row in tag_rows:
+        tags_by_video.setdefault(row["video_id"], set()).add(row["tag_id"])
+
+    catalog = Catalog()
+    for row in video_rows:
+        catalog.add(
+            row["id"],
+            CatalogVideo(
+                category_id=row["category_id"],
+                eligible=bool(row["eligible"]),
+                published_at=row["published_at"],
+                tag_ids=frozenset(tags_by_video.get(row["id"], ())),
+            ),
+        )
+    return catalog
+
+
+async def _fetch_cowatch(video_id: int, since: datetime) -> Dict[int, int]:
+    """Count distinct viewers per other video among viewers of a video."""
+    source = playback_sessions.alias("source_sessions")
+    other = playback_sessions.alias("other_sessions")
+    query = (
+        sa.select(other.c.video_id, sa.func.count(sa.distinct(other.c.viewer_id)).label("viewers"))
+        .select_from(source.join(other, other.c.viewer_id == source.c.viewer_id))
+        .where(source.c.video_id == video_id)
+        .where(source.c.viewer_id.is_not(None))
+        .where(source.c.started_at >= since)
+        .where(other.c.started_at >= since)
+        .where(other.c.video_id != video_id)
+        .group_by(other.c.video_id)
+        .order_by(sa.desc("viewers"))
+        .limit(MAX_COWATCH_CANDIDATES)
+    )
+    return {row["video_id"]: row["viewers"] for row in await fetch_all_with_retry(query)}
+
+
+async def _store_neighbors(database, video_id: int, signature: str, neighbors: List[Tuple[int, float]], now) -> None:
+    """Replace a video's stored list and mark it fresh."""
+    async with database.transaction():
+        await database.execute(video_neighbors.delete().where(video_neighbors.c.video_id == video_id))
+        if neighbors:
+            await database.execute_many(
+                video_neighbors.insert(),
+                [{"video_id": video_id, "neighbor_id": n, "score": score} for n, score in neighbors],
+            )
+        await database.execute(related_video_state.delete().where(related_video_state.c.video_id == video_id))
+        await database.execute(
+            related_video_state.insert().values(video_id=video_id, signature=signature, refreshed_at=now)
+        )
+
+
+async def refresh_related_videos(now: Optional[datetime] = None) -> int:
+    """
+    Recompute related lists of changed, invalidated and stale videos.
+
+    Args:
+        now: Current time (for tests)
+
+    Returns:
+        Number of lists recomputed
+    """
+    from api.database import database
+
+    now = now or datetime.now(timezone.utc)
+    catalog = await load_catalog()
+    state: Dict[int, dict] = {}
+    for row in await fetch_all_with_retry(related_video_state.select()):
+        refreshed_at = row["refreshed_at"]
+        if refreshed_at is not None and refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+        state[row["video_id"]] = {"signature": row["signature"], "refreshed_at": refreshed_at}
+
+    changed = [
+        video_id
+        for video_id, video in catalog.videos.items()
+        if (video.eligible or video_id in state)
+        and (video_id not in state or state[video_id]["signature"] != video.signature)
+    ]
+
+    if changed:
+        # Lists that may gain, lose or reorder a changed video
+        affected: Set[int] = set()
+        for video_id in changed:
+            affected |= catalog.sharing(video_id)
+        listing_rows = await fetch_all_with_retry(
+            sa.select(video_neighbors.c.video_id).distinct().where(video_neighbors.c.neighbor_id.in_(changed))
+        )
+        affected |= {row["video_id"] for row in listing_rows}
+        affected = {video_id for video_id in affected if video_id in state} - set(changed)
+        if affected:
+            await database.execute(
+                related_video_state.update()
+                .where(related_video_state.c.video_id.in_(affected))
+                .values(refreshed_at=None)
+            )
+            for video_id in affected:
+                state[video_id]["refreshed_at"] = None
+
+        # Videos no longer listed publicly drop their own list
+        removed = [video_id for video_id in changed if not catalog.videos[video_id].eligible]
+        if removed:
+            async with database.transaction():
+                await database.execute(video_neighbors.delete().where(video_neighbors.c.video_id.in_(removed)))
+                await database.execute(related_video_state.delete().where(related_video_state.c.video_id.in_(removed)))
+
+    # Changed videos first, then invalidated lists, then the stalest lists
+    stale_before = now - timedelta(hours=RELATED_VIDEOS_MAX_AGE_HOURS)
+    queue = [video_id for video_id in changed if catalog.videos[video_id].eligible]
+    queue += [video_id for video_id, row in state.items() if row["refreshed_at"] is None]
+    queue += sorted(
+        (
+            video_id
+            for video_id, row in state.items()
+            if row["refreshed_at"] is not None and row["refreshed_at"] < stale_before
+        ),
+        key=lambda video_id: state[video_id]["refreshed_at"],
+    )
+
+    since = now - timedelta(days=RELATED_VIDEOS_COWATCH_DAYS)
+    refreshed = 0
+    for video_id in dict.fromkeys(queue):
+        if refreshed >= RELATED_VIDEOS_MAX_PER_RUN:
+            break
+        video = catalog.videos.get(video_id)
+        if video is None or not video.eligible:
+            continue
+        neighbors = rank_neighbors(catalog, video_id, await _fetch_cowatch(video_id, since))
+        await _store_neighbors(database, video_id, video.signature, neighbors, now)
+        refreshed += 1
+
+    return refreshed
+
+
+async def _periodic_refresh() -> None:
+    """Background task refreshing related video lists."""
+    while True:
+        try:
+            await asyncio.sleep(RELATED_VIDEOS_REFRESH_INTERVAL)
+            started = asyncio.get_running_loop().time()
+            refreshed = await refresh_related_videos()
+            if refreshed:
+                elapsed = asyncio.get_running_loop().time() - started
+                logger.info(f"Refreshed {refreshed} related video lists in {elapsed:.2f}s")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Error refreshing related videos: {e}")
+
+
+def start_related_videos_refresh() -> Optional[asyncio.Task]:
+    """
+    Start the periodic refresh task.
+
+    Returns:
+        The asyncio Task, or None if precomputation is disabled (interval 0).
+    """
+    global _refresh_task
+
+    if RELATED_VIDEOS_REFRESH_INTERVAL <= 0:
+        logger.info("Related videos precomputation disabled")
+        return None
+
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_periodic_refresh())
+    return _refresh_task
+
+
+async def stop_related_videos_refresh() -> None:
+    """Stop the periodic refresh task."""
+    global _refresh_task
+
+    if _refresh_task and not _refresh_task.done():
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+    _refresh_task = None
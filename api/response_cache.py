@@ -0,0 +1,319 @@
+"""
+Tiered response cache for the public API.
+
+Responses are cached in-process (L1, an AnalyticsCache) and, when Redis is
+configured, in Redis (L2) so every public API instance shares them.
+
+Invalidation is tag-based. Every cached key embeds the current version of its
+tags; invalidating a tag increments its version in Redis and broadcasts the new
+version over pub/sub, so all instances immediately stop reading entries cached
+under the old version (which then expire on their own). Because a request
+computes its versioned key before querying the database, a response computed
+concurrently with an invalidation is stored under the old version and is never
+served afterwards.
+
+Without Redis, versions are per-process and entries expire after the short
+in-process TTL.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from api.analytics_cache import AnalyticsCache
+from api.pubsub import Publisher, Subscriber, channel_name
+from api.redis_client import get_redis
+from config import (
+    PUBLIC_RESPONSE_CACHE_ENABLED,
+    PUBLIC_RESPONSE_CACHE_MAX_SIZE,
+    PUBLIC_RESPONSE_CACHE_SHARED_TTL,
+    PUBLIC_RESPONSE_CACHE_TTL,
+    REDIS_PUBSUB_PREFIX,
+    REDIS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tag for every response derived from the set of published videos
+# (video lists, related videos)
+VIDEO_LISTS_TAG = "videos"
+
+RESPONSE_CACHE_TAGS: Tuple[str, ...] = (VIDEO_LISTS_TAG,)
+
+CACHE_KEY_PREFIX = f"{REDIS_PUBSUB_PREFIX}:response_cache:"
+TAG_VERSION_KEY_PREFIX = f"{CACHE_KEY_PREFIX}tag:"
+
+# Seconds to wait before resubscribing after the invalidation listener disconnects
+INVALIDATION_RESUBSCRIBE_DELAY = 5.0
+
+# Current version of each tag in this process
+_tag_versions: Dict[str, int] = {}
+_invalidation_listener_task: Optional[asyncio.Task] = None
+
+
+def _apply_tag_versions(versions: Dict[str, Any]) -> None:
+    """Adopt newer tag versions (versions never go backwards)."""
+    for tag, version in versions.items():
+        try:
+            version = int(version)
+        except (TypeError, ValueError):
+            continue
+        if version > _tag_versions.get(tag, 0):
+            _tag_versions[tag] = version
+
+
+def get_tag_version(tag: str) -> int:
+    """Get the current version of a cache tag in this process."""
+    return _tag_versions.get(tag, 0)
+
+
+class ResponseCache:
+    """
+    Two-level (in-process + Redis) cache for JSON-serializable responses.
+
+    Usage:
+        key = cache.versioned_key("videos:abc123")
+        cached = await cache.get(key)
+        if cached is None:
+            cached = ...  # query the database
+            await cache.set(key, cached)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 30,
+        enabled: bool = True,
+        max_size: int = 500,
+        shared: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Time to live in seconds for entries (both levels)
+            enabled: Whether caching is enabled
+            max_size: Maximum number of in-process entries
+            shared: Whether to also store entries in Redis
+        """
+        self._ttl = ttl_seconds
+        self._enabled = enabled
+        self._shared = shared
+        self._local = AnalyticsCache(ttl_seconds=ttl_seconds, enabled=enabled, max_size=max_size)
+        self._local_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+
+    def versioned_key(self, key: str, tags: Iterable[str] = RESPONSE_CACHE_TAGS) -> str:
+        """
+        Build the cache key for key under the current versions of tags.
+
+        Compute this once per request, before querying the database, and use it
+        for both get() and set().
+        """
+        versions = ".".join(f"{tag}{get_tag_version(tag)}" for tag in tags)
+        return f"{key}@{versions}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Versioned cache key
+
+        Returns:
+            Cached value if present in either level, None otherwise
+        """
+        if not self._enabled:
+            return None
+
+        value = self._local.get(key)
+        if value is not None:
+            self._local_hits += 1
+            return value
+
+        if self._shared:
+            redis = await get_redis()
+            if redis:
+                try:
+                    data = await redis.get(f"{CACHE_KEY_PREFIX}{key}")
+                    if data is not None:
+                        value = json.loads(data)
+                        self._local.set(key, value)
+                        self._shared_hits += 1
+                        return value
+                except Exception as e:
+                    logger.debug(f"Shared response cache get failed: {e}")
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Set a value in both cache levels.
+
+        Args:
+            key: Versioned cache key
+            value: JSON-serializable value
+        """
+        if not self._enabled:
+            return
+
+        self._local.set(key, value)
+
+        if self._shared:
+            redis = await get_redis()
+            if redis:
+                try:
+                    await redis.setex(f"{CACHE_KEY_PREFIX}{key}", self._ttl, json.dumps(value))
+                except Exception as e:
+                    logger.debug(f"Shared response cache set failed: {e}")
+
+    async def delete(self, key: str) -> None:
+        """
+        Delete a value from both cache levels.
+
+        Args:
+            key: Versioned cache key
+        """
+        self._local.invalidate(key)
+
+        if self._shared:
+            redis = await get_redis()
+            if redis:
+                try:
+                    await redis.delete(f"{CACHE_KEY_PREFIX}{key}")
+                except Exception as e:
+                    logger.debug(f"Shared response cache delete failed: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-process cache level."""
+        self._local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counts, TTL, enabled status and backend
+        """
+        return {
+            "enabled": self._enabled,
+            "ttl_seconds": self._ttl,
+            "entry_count": self._local.get_stats()["entry_count"],
+            "local_hits": self._local_hits,
+            "shared_hits": self._shared_hits,
+            "misses": self._misses,
+            "backend": "memory+redis" if self._shared else "memory",
+        }
+
+
+def create_response_cache() -> ResponseCache:
+    """Create a response cache from configuration (shared when Redis is configured)."""
+    shared = bool(REDIS_URL)
+    return ResponseCache(
+        ttl_seconds=PUBLIC_RESPONSE_CACHE_SHARED_TTL if shared else PUBLIC_RESPONSE_CACHE_TTL,
+        enabled=PUBLIC_RESPONSE_CACHE_ENABLED,
+        max_size=PUBLIC_RESPONSE_CACHE_MAX_SIZE,
+        shared=shared,
+    )
+
+
+async def load_tag_versions(tags: Iterable[str] = RESPONSE_CACHE_TAGS) -> bool:
+    """
+    Load the current tag versions from Redis.
+
+    Returns:
+        True if versions were loaded, False if Redis is unavailable
+    """
+    tags = list(tags)
+    redis = await get_redis()
+    if not redis or not tags:
+        return False
+    try:
+        values = await redis.mget([f"{TAG_VERSION_KEY_PREFIX}{tag}" for tag in tags])
+    except Exception as e:
+        logger.warning(f"Failed to load response cache tag versions: {e}")
+        return False
+    _apply_tag_versions({tag: value for tag, value in zip(tags, values) if value is not None})
+    return True
+
+
+async def invalidate_response_cache(*tags: str) -> None:
+    """
+    Invalidate cached public API responses.
+
+    Increments each tag's version in Redis and broadcasts it so every public API
+    instance stops serving entries cached under the old version. Without Redis,
+    only this process's cache is invalidated.
+
+    Args:
+        *tags: Tags to invalidate (default: VIDEO_LISTS_TAG)
+    """
+    tags = tags or RESPONSE_CACHE_TAGS
+    redis = await get_redis()
+    if redis:
+        try:
+            pipe = redis.pipeline()
+            for tag in tags:
+                pipe.incr(f"{TAG_VERSION_KEY_PREFIX}{tag}")
+            new_versions = dict(zip(tags, await pipe.execute()))
+            _apply_tag_versions(new_versions)
+            await Publisher.publish_cache_invalidated(new_versions)
+            return
+        except Exception as e:
+            logger.warning(f"Failed to invalidate shared response cache: {e}")
+
+    _apply_tag_versions({tag: get_tag_version(tag) + 1 for tag in tags})
+
+
+async def _listen_for_invalidations() -> None:
+    """Background task adopting tag versions invalidated on other instances."""
+    while True:
+        subscriber = Subscriber()
+        try:
+            if await subscriber.subscribe(channel_name("cache", "invalidate")):
+                # Invalidations published while unsubscribed were missed; catch up from Redis
+                await load_tag_versions()
+                async for message in subscriber.listen():
+                    tags = message.get("tags")
+                    if isinstance(tags, dict):
+                        _apply_tag_versions(tags)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Response cache invalidation listener error: {e}")
+        finally:
+            await subscriber.close()
+
+        await asyncio.sleep(INVALIDATION_RESUBSCRIBE_DELAY)
+
+
+def start_invalidation_listener() -> Optional[asyncio.Task]:
+    """
+    Start listening for response cache invalidations from other instances.
+
+    Returns:
+        The asyncio Task, or None if Redis is not configured or caching is disabled.
+    """
+    global _invalidation_listener_task
+
+    if not REDIS_URL or not PUBLIC_RESPONSE_CACHE_ENABLED:
+        return None
+
+    if _invalidation_listener_task is None or _invalidation_listener_task.done():
+        _invalidation_listener_task = asyncio.create_task(_listen_for_invalidations())
+    return _invalidation_listener_task
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener task."""
+    global _invalidation_listener_task
+
+    if _invalidation_listener_task and not _invalidation_listener_task.done():
+        _invalidation_listener_task.cancel()
+        try:
+            await _invalidation_listener_task
+        except asyncio.CancelledError:
+            pass
+    _invalidation_listener_task = None
@@ -3,7 +3,7 @@ import math
 import socket
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
@@ -222,6 +222,7 @@ class VideoListResponse(BaseModel):
     primary_codec: str = "h264"  # h264, hevc, or av1
     tags: List[VideoTagInfo] = []
     view_count: int = 0  # Total playback sessions (Issue #413 Phase 3)
+    transcoding: bool = False  # Job still running (admin; a ready video may lack some qualities)
 
     @field_validator("description", mode="before")
     @classmethod
@@ -466,6 +467,14 @@ class VideoQualitiesResponse(BaseModel):
     existing_qualities: List[VideoQualityInfo]  # Current transcoded qualities
 
 
+class StorageUsageResponse(BaseModel):
+    """Storage used, from the storage ledger (bytes per rendition, "other" for thumbnails, manifests, ...)."""
+
+    video_id: Optional[int] = None  # None for the totals over all videos
+    total_bytes: int
+    qualities: Dict[str, int]
+
+
 # ============ Bulk Operation Models ============
 
 
@@ -748,6 +757,27 @@ class ThumbnailFramesResponse(BaseModel):
     frames: List[ThumbnailFrame]
 
 
+class ChunkedUploadCreateRequest(BaseModel):
+    """Request to start a resumable chunked upload."""
+
+    filename: str = Field(..., min_length=1, max_length=255)
+    size: int = Field(..., gt=0, description="File size in bytes")
+    title: str
+    description: str = ""
+    category_id: Optional[int] = None
+
+
+class ChunkedUploadResponse(BaseModel):
+    """State of a resumable chunked upload."""
+
+    upload_id: str
+    size: int
+    chunk_size: int
+    chunk_count: int
+    missing_chunks: List[int]
+    expires_at: datetime
+
+
 class ThumbnailResponse(BaseModel):
     """Response after thumbnail update operations."""
 
@@ -0,0 +1,318 @@
+"""
+Content-addressed, deduplicating storage for uploaded segments.
+
+Re-transcodes, re-encodes and re-uploads write full sets of segments into
+VIDEOS_DIR/{slug} again, and many of those files (init.mp4, segments of
+unchanged renditions) are byte-identical to ones already stored. With the
+segment store enabled (VLOG_SEGMENT_STORE_ENABLED), every segment the worker
+API receives is stored once under SEGMENT_STORE_DIR by its SHA-256 and
+materialized into the per-video layout as a hard link (or a reflink where hard
+links are not possible), so the public serving layout is unchanged.
+
+Workers can ask for segments by hash before uploading them (link endpoint in
+api/worker_api.py); segments the store already has are linked into place
+without sending or writing their bytes again.
+
+Reference counting uses the filesystem link count: a blob is referenced by
+every hard link in a video directory (including archived videos, as long as
+the archive is on the same filesystem). Deleting or replacing a video file
+drops its reference. The periodic sweep removes blobs without references once
+they have been unreferenced for SEGMENT_STORE_UNREFERENCED_HOURS, which lets a
+re-transcode relink the segments of a quality directory it just deleted.
+Because a materialized file is a link to the blob's data, removing a blob never
+affects a video file, even if the sweep races with a new link. Reflinked or
+copied files are independent files and do not count as references.
+
+Blobs are read-only (BLOB_MODE): a hard-linked segment shares its data with
+every other video linking to it, so it must never be rewritten in place (files
+are always replaced by renaming a new file over them).
+
+The store must be on the same filesystem as VIDEOS_DIR; otherwise files are
+copied and only the segment upload savings remain.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import string
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+
+from config import SEGMENT_STORE_DIR, SEGMENT_STORE_UNREFERENCED_HOURS
+
+logger = logging.getLogger(__name__)
+
+# Permissions of stored segments (shared by every hard link)
+BLOB_MODE = 0o444
+
+# Linux FICLONE ioctl (reflink a whole file), from <linux/fs.h>
+_FICLONE = 0x40049409
+
+_HEX_DIGITS = frozenset(string.hexdigits.lower())
+
+
+def is_valid_checksum(checksum: str) -> bool:
+    """Whether a string is a lowercase hex SHA-256 digest."""
+    return len(checksum) == 64 and set(checksum) <= _HEX_DIGITS
+
+
+def blob_path(checksum: str, store_dir: Optional[Path] = None) -> Path:
+    """
+    Path of a blob in the store (sharded by the first two hex digits).
+
+    Raises:
+        ValueError: If checksum is not a hex SHA-256 digest
+    """
+    if not is_valid_checksum(checksum):
+        raise ValueError("Invalid checksum")
+    return (store_dir if store_dir is not None else SEGMENT_STORE_DIR) / checksum[:2] / checksum
+
+
+def _reflink(source: Path, dest: Path) -> None:
+    """Clone a file's data into a new file (copy-on-write filesystems only)."""
+    import fcntl
+
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+def materialize(blob: Path, dest_path: Path) -> str:
+    """
+    Place a blob at dest_path, replacing any existing file atomically.
+
+    Tries a hard link, then a reflink, then a plain copy.
+
+    Returns:
+        How the file was placed: "hardlink", "reflink" or "copy"
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if os.path.samefile(blob, dest_path):
+            # Already linked (and renaming a link over itself would do nothing)
+            return "hardlink"
+    except FileNotFoundError:
+        pass
+    temp_path = dest_path.with_suffix(dest_path.suffix + ".tmp")
+    temp_path.unlink(missing_ok=True)
+
+    method = "hardlink"
+    try:
+        try:
+            os.link(blob, temp_path)
+        except OSError as e:
+            # EXDEV: different filesystems, EMLINK: link count limit, EPERM: links not allowed
+            if e.errno not in (errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOTSUP):
+                raise
+            try:
+                method = "reflink"
+                _reflink(blob, temp_path)
+            except (OSError, ImportError):
+                method = "copy"
+                shutil.copyfile(blob, temp_path)
+            temp_path.chmod(0o644)
+        os.replace(temp_path, dest_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return method
+
+
+def _write_blob(data: bytes, blob: Path) -> None:
+    """Write a blob atomically with fsync (no-op if the store already has it)."""
+    if blob.exists():
+        return
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per writer: threads of one process may write the same blob at once
+    temp_path = blob.with_name(f".{blob.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.chmod(BLOB_MODE)
+        os.replace(temp_path, blob)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def store_segment(data: bytes, checksum: str, dest_path: Path, store_dir: Optional[Path] = None) -> bool:
+    """
+    Store a verified segment in the store and materialize it at dest_path.
+
+    Args:
+        data: Segment bytes (already verified against checksum)
+        checksum: SHA-256 hex digest of data
+        dest_path: Path in the per-video layout
+
+    Returns:
+        True if the store already had the blob (no segment data was written)
+    """
+    blob = blob_path(checksum, store_dir)
+    existed = blob.exists()
+    _write_blob(data, blob)
+    materialize(blob, dest_path)
+    return existed
+
+
+def adopt_file(temp_path: Path, checksum: str, dest_path: Path, store_dir: Optional[Path] = None) -> None:
+    """
+    Move a fully written (fsynced) file into the store and link it to dest_path.
+
+    If the store is on another filesystem, the file is moved to dest_path instead.
+    """
+    blob = blob_path(checksum, store_dir)
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(temp_path, blob)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        os.replace(temp_path, dest_path)
+        return
+    blob.chmod(BLOB_MODE)
+    materialize(blob, dest_path)
+
+
+def link_segment(checksum: str, size: int, dest_path: Path, store_dir: Optional[Path] = None) -> bool:
+    """
+    Materialize a segment from the store without receiving its data.
+
+    Args:
+        checksum: SHA-256 hex digest of the segment
+        size: Expected size in bytes (guards against truncated blobs)
+        dest_path: Path in the per-video layout
+
+    Returns:
+        True if the segment is in place, False if the store does not have it
+    """
+    blob = blob_path(checksum, store_dir)
+    try:
+        blob_stat = blob.stat()
+    except FileNotFoundError:
+        return False
+    if blob_stat.st_size != size:
+        logger.warning(f"Segment store blob {checksum[:16]}... has size {blob_stat.st_size}, expected {size}")
+        return False
+
+    try:
+        materialize(blob, dest_path)
+    except FileNotFoundError:
+        # Swept between the stat and the link
+        return False
+    return True
+
+
+def ingest_file(path: Path, store_dir: Optional[Path] = None) -> bool:
+    """
+    Deduplicate a file already written into the per-video layout.
+
+    Used after archive extraction: a file whose content the store already has is
+    replaced by a link to the blob; otherwise the file itself becomes the blob
+    (a hard link, no data is copied).
+
+    Returns:
+        True if the file was replaced by an existing blob
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    blob = blob_path(digest.hexdigest(), store_dir)
+
+    if blob.exists():
+        materialize(blob, path)
+        return True
+
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(path, blob)
+    except FileExistsError:
+        materialize(blob, path)
+        return True
+    except OSError as e:
+        # Not on the same filesystem (or links not allowed): keep the file as is
+        logger.debug(f"Could not add {path} to the segment store: {e}")
+        return False
+    blob.chmod(BLOB_MODE)
+    return False
+
+
+def ingest_directory(directory: Path, extensions: Tuple[str, ...], store_dir: Optional[Path] = None) -> int:
+    """
+    Deduplicate every file with one of the given extensions under a directory.
+
+    Files that already have other links are skipped, so running this again
+    after more files were extracted only hashes the new ones.
+
+    Returns:
+        Number of files replaced by existing blobs
+    """
+    replaced = 0
+    for path in directory.rglob("*"):
+        if path.suffix not in extensions or path.is_symlink():
+            continue
+        try:
+            path_stat = path.stat()
+            # Files with other links are already in the store (or shared on purpose)
+            if not stat.S_ISREG(path_stat.st_mode) or path_stat.st_nlink > 1:
+                continue
+            if ingest_file(path, store_dir):
+                replaced += 1
+        except OSError as e:
+            logger.warning(f"Failed to deduplicate {path}: {e}")
+    return replaced
+
+
+def sweep_segment_store(
+    store_dir: Optional[Path] = None,
+    max_unreferenced_seconds: float = SEGMENT_STORE_UNREFERENCED_HOURS * 3600,
+    now: Optional[float] = None,
+) -> Tuple[int, int]:
+    """
+    Remove blobs no video file links to anymore.
+
+    A blob is unreferenced when its link count is 1 (only the store entry). The
+    inode change time is updated whenever a link is added or removed, so it
+    tells how long the blob has been unreferenced. Leftover temp files are
+    removed after the same delay.
+
+    Returns:
+        (blobs removed, bytes freed)
+    """
+    store_dir = store_dir if store_dir is not None else SEGMENT_STORE_DIR
+    if not store_dir.is_dir():
+        return 0, 0
+    now = time.time() if now is None else now
+    removed = 0
+    freed = 0
+
+    for shard in store_dir.iterdir():
+        if not shard.is_dir():
+            continue
+        for entry in shard.iterdir():
+            try:
+                entry_stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            is_temp = entry.name.startswith(".")
+            if not is_temp and entry_stat.st_nlink > 1:
+                continue
+            if now - entry_stat.st_ctime < max_unreferenced_seconds:
+                continue
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Failed to remove segment store blob {entry}: {e}")
+                continue
+            removed += 1
+            freed += entry_stat.st_size
+
+    return removed, freed
@@ -0,0 +1,310 @@
+"""
+Per-video storage ledger.
+
+Storage metrics used to come from a walk of the whole videos directory (rglob
+plus resolve() and stat() per file) every few hours, which took tens of
+minutes on large trees and loaded the NAS. Instead, the bytes used by each
+video are recorded per rendition in video_storage as files are written and
+deleted:
+
+- segment uploads (single, batch and segment store links) add their bytes
+- quality archive extraction, finalize, re-encode swaps and restores re-measure
+  the video's directory (one directory, not the tree)
+- deletes and archive moves remove the video's rows
+
+Storage gauges are then a SUM over the ledger. reconcile_storage_ledger() is
+the safety net: it re-measures video directories one at a time with
+os.scandir (concurrently, optionally sharded across instances), corrects any
+drift, and fills the ledger for videos stored before it existed. A pass skips
+videos measured during the current interval, so an interrupted pass resumes
+where it stopped.
+
+Ledger updates are best effort: a failed update is logged and corrected by the
+next reconciliation, it never fails the write it accounts for.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+import sqlalchemy as sa
+
+from api.database import video_storage, videos
+from api.metrics import STORAGE_QUALITY_BYTES, STORAGE_VIDEOS_BYTES
+from config import QUALITY_PRESETS
+from worker.hwaccel import AUDIO_RENDITION_NAME
+
+logger = logging.getLogger(__name__)
+
+# Ledger entry for files outside the renditions (thumbnails, master manifests, sprites, ...)
+OTHER_BUCKET = "other"
+
+RENDITION_BUCKETS = frozenset([q["name"] for q in QUALITY_PRESETS] + ["original", AUDIO_RENDITION_NAME])
+
+# Videos measured per reconciliation query
+RECONCILE_BATCH_SIZE = 100
+
+
+def ledger_bucket(name: str, is_dir: bool = False) -> str:
+    """
+    Ledger entry for a top-level entry of a video directory.
+
+    Rendition directories (CMAF) map to their rendition; HLS/TS files are matched by
+    their prefix ("1080p.m3u8", "1080p_0001.ts", "original.m3u8").
+    """
+    if not is_dir:
+        name = name.split(".", 1)[0].split("_", 1)[0]
+    return name if name in RENDITION_BUCKETS else OTHER_BUCKET
+
+
+def _directory_bytes(path: str) -> int:
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                # Symlinks are not followed (nor counted): they could point outside the storage
+                if entry.is_dir(follow_symlinks=False):
+                    total += _directory_bytes(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                pass  # Deleted during the scan
+    return total
+
+
+def scan_video_directory(video_dir: Path) -> Dict[str, int]:
+    """
+    Measure a video directory (blocking).
+
+    Returns:
+        Bytes per ledger entry (OTHER_BUCKET is always present, empty if the
+        directory does not exist)
+    """
+    usage = {OTHER_BUCKET: 0}
+    try:
+        entries = list(os.scandir(video_dir))
+    except FileNotFoundError:
+        return usage
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                size = _directory_bytes(entry.path)
+                bucket = ledger_bucket(entry.name, is_dir=True)
+            elif entry.is_file(follow_symlinks=False):
+                size = entry.stat(follow_symlinks=False).st_size
+                bucket = ledger_bucket(entry.name)
+            else:
+                continue
+        except FileNotFoundError:
+            continue
+        usage[bucket] = usage.get(bucket, 0) + size
+    return usage
+
+
+def _adjust_gauges(changes: Dict[str, int]) -> None:
+    for quality, delta in changes.items():
+        if delta:
+            STORAGE_QUALITY_BYTES.labels(quality=quality).inc(delta)
+            STORAGE_VIDEOS_BYTES.inc(delta)
+
+
+async def set_video_storage(video_id: int, usage: Dict[str, int], now: Optional[datetime] = None) -> int:
+    """
+    Replace a video's ledger entries with measured usage.
+
+    Returns:
+        Change of the video's total in bytes
+    """
+    from api.database import database
+
+    now = now or datetime.now(timezone.utc)
+    async with database.transaction():
+        rows = await database.fetch_all(
+            sa.select(video_storage.c.quality, video_storage.c.bytes).where(video_storage.c.video_id == video_id)
+        )
+        await database.execute(video_storage.delete().where(video_storage.c.video_id == video_id))
+        await database.execute_many(
+            video_storage.insert(),
+            [
+                {"video_id": video_id, "quality": quality, "bytes": size, "updated_at": now, "reconciled_at": now}
+                for quality, size in usage.items()
+            ],
+        )
+
+    changes = dict(usage)
+    for row in rows:
+        changes[row["quality"]] = changes.get(row["quality"], 0) - row["bytes"]
+    _adjust_gauges(changes)
+    return sum(changes.values())
+
+
+async def record_video_storage(video_id: int, video_dir: Path) -> None:
+    """Re-measure a video directory after files were added, replaced or removed."""
+    try:
+        usage = await asyncio.to_thread(scan_video_directory, video_dir)
+        await set_video_storage(video_id, usage)
+    except Exception as e:
+        logger.warning(f"Failed to update storage ledger for video {video_id}: {e}")
+
+
+async def add_video_storage_bytes(video_id: int, quality: str, delta: int) -> None:
+    """Add (or with a negative delta, remove) bytes written to a rendition."""
+    from api.database import database
+
+    if not delta:
+        return
+    quality = ledger_bucket(quality, is_dir=True)
+    try:
+        await database.execute(
+            sa.text(
+                "INSERT INTO video_storage (video_id, quality, bytes, updated_at) "
+                "VALUES (:video_id, :quality, :delta, :now) "
+                "ON CONFLICT (video_id, quality) DO UPDATE "
+                "SET bytes = video_storage.bytes + excluded.bytes, updated_at = excluded.updated_at"
+            ).bindparams(video_id=video_id, quality=quality, delta=delta, now=datetime.now(timezone.utc))
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update storage ledger for video {video_id}: {e}")
+        return
+    _adjust_gauges({quality: delta})
+
+
+async def clear_video_storage(video_id: int) -> None:
+    """Remove a video's ledger entries (its files were deleted or archived)."""
+    from api.database import database
+
+    try:
+        async with database.transaction():
+            rows = await database.fetch_all(
+                sa.select(video_storage.c.quality, video_storage.c.bytes).where(video_storage.c.video_id == video_id)
+            )
+            await database.execute(video_storage.delete().where(video_storage.c.video_id == video_id))
+    except Exception as e:
+        logger.warning(f"Failed to clear storage ledger for video {video_id}: {e}")
+        return
+    _adjust_gauges({row["quality"]: -row["bytes"] for row in rows})
+
+
+async def get_video_storage(video_id: int) -> Dict[str, int]:
+    """Bytes per ledger entry of a video."""
+    from api.database import database
+
+    rows = await database.fetch_all(
+        sa.select(video_storage.c.quality, video_storage.c.bytes).where(video_storage.c.video_id == video_id)
+    )
+    return {row["quality"]: row["bytes"] for row in rows}
+
+
+async def get_storage_totals() -> Dict[str, int]:
+    """Bytes per ledger entry over all videos."""
+    from api.database import database
+
+    total = sa.func.sum(video_storage.c.bytes)
+    rows = await database.fetch_all(
+        sa.select(video_storage.c.quality, total.label("bytes")).group_by(video_storage.c.quality)
+    )
+    return {row["quality"]: int(row["bytes"] or 0) for row in rows}
+
+
+async def refresh_storage_metrics() -> int:
+    """
+    Set the storage gauges from the ledger.
+
+    Other processes (worker API, local workers) update the ledger too, so the
+    in-process increments are periodically replaced by the ledger totals.
+
+    Returns:
+        Total bytes
+    """
+    totals = await get_storage_totals()
+    for quality in RENDITION_BUCKETS | {OTHER_BUCKET}:
+        STORAGE_QUALITY_BYTES.labels(quality=quality).set(totals.get(quality, 0))
+    total = sum(totals.values())
+    STORAGE_VIDEOS_BYTES.set(total)
+    return total
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of a reconciliation pass."""
+
+    videos_checked: int = 0
+    # Sum of the absolute corrections
+    drift_bytes: int = 0
+    # Videos that could not be measured (retried in the next pass)
+    errors: int = 0
+
+
+async def reconcile_storage_ledger(
+    videos_dir: Path,
+    interval_seconds: int,
+    concurrency: int = 4,
+    shard_count: int = 1,
+    shard_index: int = 0,
+    now: Optional[datetime] = None,
+) -> ReconcileResult:
+    """
+    Re-measure the video directories of a shard and correct the ledger.
+
+    Videos measured within the last half interval are skipped, so a pass that was
+    interrupted (timeout, restart) continues with the videos it had not reached.
+
+    Args:
+        videos_dir: Directory holding the video directories
+        interval_seconds: Interval between passes
+        concurrency: Video directories measured concurrently
+        shard_count: Number of shards the videos are split into (by id)
+        shard_index: Shard checked by this pass
+        now: Current time (for tests)
+    """
+    from api.database import database
+
+    now = now or datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=interval_seconds / 2)
+    result = ReconcileResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    reconciled = (
+        sa.select(
+            video_storage.c.video_id,
+            sa.func.min(video_storage.c.reconciled_at).label("reconciled_at"),
+        )
+        .group_by(video_storage.c.video_id)
+        .subquery()
+    )
+
+    async def check(video_id: int, slug: str) -> None:
+        async with semaphore:
+            try:
+                usage = await asyncio.to_thread(scan_video_directory, videos_dir / slug)
+                change = await set_video_storage(video_id, usage, now=now)
+            except Exception as e:
+                result.errors += 1
+                logger.warning(f"Storage reconciliation failed for video {video_id}: {e}")
+                return
+        result.videos_checked += 1
+        if change:
+            result.drift_bytes += abs(change)
+            logger.info(f"Storage ledger of video {video_id} corrected by {change:+,} bytes")
+
+    last_id = 0
+    while True:
+        rows = await database.fetch_all(
+            sa.select(videos.c.id, videos.c.slug)
+            .select_from(videos.outerjoin(reconciled, reconciled.c.video_id == videos.c.id))
+            .where(videos.c.id > last_id)
+            .where(videos.c.id % shard_count == shard_index)
+            .where(sa.or_(reconciled.c.reconciled_at.is_(None), reconciled.c.reconciled_at < stale_before))
+            .order_by(videos.c.id)
+            .limit(RECONCILE_BATCH_SIZE)
+        )
+        if not rows:
+            break
+        await asyncio.gather(*(check(row["id"], row["slug"]) for row in rows))
+        last_id = rows[-1]["id"]
+
+    return result
@@ -0,0 +1,176 @@
+"""
+Batched loading of per-video details for public API responses.
+
+Video list and watch page responses embed entities from several tables (tags,
+chapters, quality variants, transcription status). Fetching them one kind at a
+time, or one video at a time, costs a serialized database round trip per kind.
+
+VideoDetailLoader fetches every requested kind for a whole set of video IDs
+with one query per kind, and runs those queries concurrently, so a response
+needs a single parallel wave regardless of page size. Results are memoized on
+the loader; get_detail_loader() keeps one loader per request so helpers called
+from the same handler never query the same (kind, video) twice.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+
+import sqlalchemy as sa
+from fastapi import Request
+
+from api.database import chapters, tags, transcriptions, video_qualities, video_tags
+from api.db_retry import fetch_all_with_retry
+from api.schemas import ChapterInfo, VideoQualityResponse, VideoTagInfo
+
+# Detail kinds a loader can fetch
+TAGS = "tags"
+CHAPTERS = "chapters"
+QUALITIES = "qualities"
+TRANSCRIPTIONS = "transcriptions"
+
+
+async def _fetch_tags(video_ids: List[int]) -> Dict[int, List[VideoTagInfo]]:
+    query = (
+        sa.select(video_tags.c.video_id, tags.c.id, tags.c.name, tags.c.slug)
+        .select_from(video_tags.join(tags, video_tags.c.tag_id == tags.c.id))
+        .where(video_tags.c.video_id.in_(video_ids))
+        .order_by(tags.c.name)
+    )
+    result: Dict[int, List[VideoTagInfo]] = {}
+    for row in await fetch_all_with_retry(query):
+        result.setdefault(row["video_id"], []).append(VideoTagInfo(id=row["id"], name=row["name"], slug=row["slug"]))
+    return result
+
+
+async def _fetch_chapters(video_ids: List[int]) -> Dict[int, List[ChapterInfo]]:
+    query = (
+        sa.select(
+            chapters.c.video_id,
+            chapters.c.id,
+            chapters.c.title,
+            chapters.c.start_time,
+            chapters.c.end_time,
+        )
+        .where(chapters.c.video_id.in_(video_ids))
+        .order_by(chapters.c.video_id, chapters.c.position)
+    )
+    result: Dict[int, List[ChapterInfo]] = {}
+    for row in await fetch_all_with_retry(query):
+        result.setdefault(row["video_id"], []).append(
+            ChapterInfo(
+                id=row["id"],
+                title=row["title"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+            )
+        )
+    return result
+
+
+async def _fetch_qualities(video_ids: List[int]) -> Dict[int, List[VideoQualityResponse]]:
+    query = sa.select(
+        video_qualities.c.video_id,
+        video_qualities.c.quality,
+        video_qualities.c.width,
+        video_qualities.c.height,
+        video_qualities.c.bitrate,
+    ).where(video_qualities.c.video_id.in_(video_ids))
+    result: Dict[int, List[VideoQualityResponse]] = {}
+    for row in await fetch_all_with_retry(query):
+        result.setdefault(row["video_id"], []).append(
+            VideoQualityResponse(
+                quality=row["quality"],
+                width=row["width"],
+                height=row["height"],
+                bitrate=row["bitrate"],
+            )
+        )
+    return result
+
+
+async def _fetch_transcriptions(video_ids: List[int]) -> Dict[int, dict]:
+    query = sa.select(
+        transcriptions.c.video_id,
+        transcriptions.c.status,
+        transcriptions.c.vtt_path,
+    ).where(transcriptions.c.video_id.in_(video_ids))
+    return {
+        row["video_id"]: {"status": row["status"], "vtt_path": row["vtt_path"]}
+        for row in await fetch_all_with_retry(query)
+    }
+
+
+_FETCHERS = {
+    TAGS: _fetch_tags,
+    CHAPTERS: _fetch_chapters,
+    QUALITIES: _fetch_qualities,
+    TRANSCRIPTIONS: _fetch_transcriptions,
+}
+
+
+class VideoDetailLoader:
+    """
+    Batched, memoized loader for per-video details.
+
+    Usage:
+        loader = get_detail_loader(request)
+        await loader.load(video_ids, TAGS, QUALITIES)  # one concurrent wave
+        loader.tags(video_id), loader.qualities(video_id)
+    """
+
+    def __init__(self):
+        self._loaded: Dict[str, Dict[int, object]] = {kind: {} for kind in _FETCHERS}
+
+    async def load(self, video_ids: Iterable[int], *kinds: str) -> None:
+        """
+        Fetch the given detail kinds for a set of videos.
+
+        Issues at most one query per kind, all concurrently. Videos already
+        loaded for a kind are not queried again.
+
+        Args:
+            video_ids: Videos to load details for
+            kinds: Detail kinds to load (TAGS, CHAPTERS, QUALITIES, TRANSCRIPTIONS)
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        pending = {}
+        for kind in kinds:
+            missing = [vid for vid in video_ids if vid not in self._loaded[kind]]
+            if missing:
+                pending[kind] = missing
+        if not pending:
+            return
+
+        results = await asyncio.gather(*(_FETCHERS[kind](ids) for kind, ids in pending.items()))
+        for (kind, ids), found in zip(pending.items(), results):
+            loaded = self._loaded[kind]
+            for vid in ids:
+                loaded[vid] = found.get(vid)
+
+    def tags(self, video_id: int) -> List[VideoTagInfo]:
+        """Tags of a loaded video, ordered by name."""
+        return self._loaded[TAGS].get(video_id) or []
+
+    def tags_map(self) -> Dict[int, List[VideoTagInfo]]:
+        """Tags of all loaded videos, keyed by video ID."""
+        return {vid: value for vid, value in self._loaded[TAGS].items() if value}
+
+    def chapters(self, video_id: int) -> List[ChapterInfo]:
+        """Chapters of a loaded video, in position order."""
+        return self._loaded[CHAPTERS].get(video_id) or []
+
+    def qualities(self, video_id: int) -> List[VideoQualityResponse]:
+        """Quality variants of a loaded video."""
+        return self._loaded[QUALITIES].get(video_id) or []
+
+    def transcription(self, video_id: int) -> Optional[dict]:
+        """Transcription status and VTT path of a loaded video, or None."""
+        return self._loaded[TRANSCRIPTIONS].get(video_id)
+
+
+def get_detail_loader(request: Request) -> VideoDetailLoader:
+    """Get the detail loader for a request, creating it on first use."""
+    loader = getattr(request.state, "video_detail_loader", None)
+    if loader is None:
+        loader = request.state.video_detail_loader = VideoDetailLoader()
+    return loader
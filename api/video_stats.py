@@ -0,0 +1,231 @@
+"""
+Per-video playback counters.
+
+Listing and sorting videos by views used to aggregate the whole playback_sessions
+table on every request, which gets slower as analytics data accumulates. Instead,
+the analytics endpoints bump counters in the video_stats table as sessions start,
+heartbeat and end, and a periodic reconciliation job recomputes the counters from
+playback_sessions to correct any drift (lost increments, deleted sessions, races).
+
+Counter semantics match the aggregates they replace:
+- view_count: number of playback sessions
+- unique_viewers: number of distinct viewers with a session
+- watch_seconds: sum of duration_watched across sessions
+- completions: number of sessions marked completed (>= 90% watched)
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import sqlalchemy as sa
+
+from api.database import playback_sessions
+from api.db_retry import db_execute_with_retry, fetch_val_with_retry
+from config import VIDEO_STATS_RECONCILE_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Background reconciliation task
+_reconcile_task: Optional[asyncio.Task] = None
+
+# INSERT ... ON CONFLICT is supported by both PostgreSQL and SQLite (3.24+)
+_INCREMENT_SQL = sa.text("""
+    INSERT INTO video_stats
+        (video_id, view_count, unique_viewers, watch_seconds, completions, updated_at)
+    VALUES (:video_id, :views, :unique_viewers, :watch_seconds, :completions, :now)
+    ON CONFLICT (video_id) DO UPDATE SET
+        view_count = video_stats.view_count + excluded.view_count,
+        unique_viewers = video_stats.unique_viewers + excluded.unique_viewers,
+        watch_seconds = video_stats.watch_seconds + excluded.watch_seconds,
+        completions = video_stats.completions + excluded.completions,
+        updated_at = excluded.updated_at
+""")
+
+# Batched watch-time increments for the analytics write buffer (PostgreSQL)
+_INCREMENT_WATCH_SECONDS_BATCH_SQL = sa.text("""
+    INSERT INTO video_stats
+        (video_id, view_count, unique_viewers, watch_seconds, completions, updated_at)
+    SELECT batch.video_id, 0, 0, batch.watch_seconds, 0, :now
+    FROM (
+        SELECT unnest(CAST(:video_ids AS integer[])) AS video_id,
+               unnest(CAST(:watch_seconds AS double precision[])) AS watch_seconds
+    ) AS batch
+    ON CONFLICT (video_id) DO UPDATE SET
+        watch_seconds = video_stats.watch_seconds + excluded.watch_seconds,
+        updated_at = excluded.updated_at
+""")
+
+# Recompute counters from playback_sessions.
+# The WHERE clause avoids SQLite's INSERT ... SELECT ... ON CONFLICT parsing ambiguity.
+_RECONCILE_SQL = sa.text("""
+    INSERT INTO video_stats
+        (video_id, view_count, unique_viewers, watch_seconds, completions, updated_at, reconciled_at)
+    SELECT
+        video_id,
+        COUNT(*),
+        COUNT(DISTINCT viewer_id),
+        COALESCE(SUM(duration_watched), 0),
+        SUM(CASE WHEN completed THEN 1 ELSE 0 END),
+        :now,
+        :now
+    FROM playback_sessions
+    WHERE video_id IS NOT NULL
+    GROUP BY video_id
+    ON CONFLICT (video_id) DO UPDATE SET
+        view_count = excluded.view_count,
+        unique_viewers = excluded.unique_viewers,
+        watch_seconds = excluded.watch_seconds,
+        completions = excluded.completions,
+        updated_at = excluded.updated_at,
+        reconciled_at = excluded.reconciled_at
+""")
+
+# Zero out counters for videos whose sessions have all been deleted
+_RESET_ORPHANED_SQL = sa.text("""
+    UPDATE video_stats SET
+        view_count = 0,
+        unique_viewers = 0,
+        watch_seconds = 0,
+        completions = 0,
+        updated_at = :now,
+        reconciled_at = :now
+    WHERE view_count <> 0
+      AND NOT EXISTS (SELECT 1 FROM playback_sessions ps WHERE ps.video_id = video_stats.video_id)
+""")
+
+
+async def increment_video_stats(
+    video_id: int,
+    views: int = 0,
+    unique_viewers: int = 0,
+    watch_seconds: float = 0.0,
+    completions: int = 0,
+) -> None:
+    """
+    Atomically add deltas to a video's counters, creating the row if needed.
+
+    Args:
+        video_id: Video the counters belong to
+        views: Number of new playback sessions
+        unique_viewers: Number of viewers watching this video for the first time
+        watch_seconds: Seconds of playback to add
+        completions: Number of newly completed sessions
+    """
+    if not (views or unique_viewers or watch_seconds or completions):
+        return
+    await db_execute_with_retry(
+        _INCREMENT_SQL.bindparams(
+            video_id=video_id,
+            views=views,
+            unique_viewers=unique_viewers,
+            watch_seconds=float(watch_seconds),
+            completions=completions,
+            now=datetime.now(timezone.utc),
+        )
+    )
+
+
+async def increment_watch_seconds_batch(watch_seconds_by_video: Dict[int, float]) -> None:
+    """
+    Add watch time to many videos' counters in one statement.
+
+    Args:
+        watch_seconds_by_video: Seconds of playback to add, keyed by video ID
+    """
+    from api.database import database
+
+    deltas = {video_id: seconds for video_id, seconds in watch_seconds_by_video.items() if seconds}
+    if not deltas:
+        return
+    if not str(database.url).startswith("postgresql"):
+        for video_id, seconds in deltas.items():
+            await increment_video_stats(video_id, watch_seconds=seconds)
+        return
+    await db_execute_with_retry(
+        _INCREMENT_WATCH_SECONDS_BATCH_SQL.bindparams(
+            video_ids=list(deltas),
+            watch_seconds=[float(seconds) for seconds in deltas.values()],
+            now=datetime.now(timezone.utc),
+        )
+    )
+
+
+async def is_new_viewer_for_video(video_id: int, viewer_id: Optional[int]) -> bool:
+    """
+    Check whether a viewer has no earlier playback session for a video.
+
+    Must be called before the new session is inserted. Sessions without a
+    viewer never count as a unique viewer, matching COUNT(DISTINCT viewer_id).
+    """
+    if viewer_id is None:
+        return False
+    existing = await fetch_val_with_retry(
+        sa.select(playback_sessions.c.id)
+        .where(playback_sessions.c.video_id == video_id)
+        .where(playback_sessions.c.viewer_id == viewer_id)
+        .limit(1)
+    )
+    return existing is None
+
+
+async def reconcile_video_stats() -> None:
+    """
+    Recompute every video's counters from playback_sessions.
+
+    Increments that land while this runs may be lost or double counted; the next
+    reconciliation corrects them.
+    """
+    from api.database import database
+
+    now = datetime.now(timezone.utc)
+    async with database.transaction():
+        await database.execute(_RECONCILE_SQL.bindparams(now=now))
+        await database.execute(_RESET_ORPHANED_SQL.bindparams(now=now))
+
+
+async def _periodic_reconcile() -> None:
+    """Background task to periodically reconcile video counters."""
+    while True:
+        try:
+            await asyncio.sleep(VIDEO_STATS_RECONCILE_INTERVAL)
+            started = asyncio.get_running_loop().time()
+            await reconcile_video_stats()
+            elapsed = asyncio.get_running_loop().time() - started
+            logger.info(f"Reconciled video stats in {elapsed:.2f}s")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Error during video stats reconciliation: {e}")
+
+
+def start_video_stats_reconciler() -> Optional[asyncio.Task]:
+    """
+    Start the periodic reconciliation task.
+
+    Returns:
+        The asyncio Task, or None if reconciliation is disabled (interval 0).
+    """
+    global _reconcile_task
+
+    if VIDEO_STATS_RECONCILE_INTERVAL <= 0:
+        logger.info("Video stats reconciliation disabled")
+        return None
+
+    if _reconcile_task is None or _reconcile_task.done():
+        _reconcile_task = asyncio.create_task(_periodic_reconcile())
+    return _reconcile_task
+
+
+async def stop_video_stats_reconciler() -> None:
+    """Stop the periodic reconciliation task."""
+    global _reconcile_task
+
+    if _reconcile_task and not _reconcile_task.done():
+        _reconcile_task.cancel()
+        try:
+            await _reconcile_task
+        except asyncio.CancelledError:
+            pass
+    _reconcile_task = None
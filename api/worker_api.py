@@ -54,9 +54,11 @@ see: docs/TRANSCODING_ARCHITECTURE.md
 """
 
 import asyncio
+import concurrent.futures
 import functools
 import hashlib
 import hmac
+import io
 import json
 import logging
 import os
@@ -64,17 +66,18 @@ import secrets
 import shutil
 import tarfile
 import tempfile
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import sqlalchemy as sa
-from fastapi import Depends, FastAPI, File, Header, HTTPException, Request, Response, UploadFile
+from fastapi import Depends, FastAPI, File, Header, HTTPException, Query, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from starlette.background import BackgroundTask
@@ -95,6 +98,7 @@ from api.database import (
     reencode_queue,
     sprite_queue,
     transcoding_jobs,
+    transcoding_tasks,
     transcriptions,
     video_qualities,
     videos,
@@ -102,52 +106,96 @@ from api.database import (
     workers,
 )
 from api.db_retry import DatabaseLockedError, execute_with_retry, fetch_all_with_retry, fetch_one_with_retry
+from api.job_queue import (
+    claim_waiters,
+    notify_job_available,
+    start_job_notification_listener,
+    stop_job_notification_listener,
+)
+from api.media_files import invalidate_video_manifests, mark_partial_manifest
 from api.metrics import (
-    STORAGE_VIDEOS_BYTES,
     TRANSCODING_JOBS_TOTAL,
     WORKER_JOBS_COMPLETED_TOTAL,
     get_metrics,
     sanitize_label,
 )
+from api.object_storage import STORAGE_SYNC_RESET, delete_video_objects, schedule_video_publish
 from api.pubsub import Publisher
 from api.redis_client import get_redis
+from api.response_cache import invalidate_response_cache
+from api.segment_store import (
+    adopt_file,
+    blob_path,
+    ingest_directory,
+    link_segment,
+    materialize,
+    store_segment,
+    sweep_segment_store,
+)
 from api.settings_service import get_setting as get_db_setting
+from api.storage_ledger import add_video_storage_bytes, record_video_storage
 from api.webhook_service import trigger_webhook_event
-from api.worker_auth import get_key_prefix, hash_api_key, verify_worker_key
+from api.worker_auth import (
+    get_key_prefix,
+    hash_api_key,
+    invalidate_worker_key_cache,
+    start_key_revocation_listener,
+    stop_key_revocation_listener,
+    verify_worker_key,
+)
 from api.worker_schemas import (
     ClaimJobResponse,
+    ClaimTaskResponse,
     CompleteJobRequest,
     CompleteJobResponse,
+    CompleteTaskRequest,
+    CompleteTaskResponse,
     FailJobRequest,
     FailJobResponse,
     HeartbeatRequest,
     HeartbeatResponse,
     ProgressUpdateRequest,
     ProgressUpdateResponse,
+    PublishRenditionsRequest,
+    PublishRenditionsResponse,
+    SegmentBatchItem,
+    SegmentBatchResult,
+    SegmentBatchUploadResponse,
     SegmentFinalizeRequest,
     SegmentFinalizeResponse,
+    SegmentLinkRequest,
+    SegmentLinkResponse,
     SegmentQuality,
     SegmentStatusResponse,
     SegmentUploadResponse,
+    SplitJobRequest,
+    SplitJobResponse,
     StatusResponse,
+    TaskProgressRequest,
     WorkerListResponse,
     WorkerRegisterRequest,
     WorkerRegisterResponse,
     WorkerStatusResponse,
 )
 from config import (
+    JOB_SPLIT_MIN_DURATION,
+    JOB_SPLITTING_ENABLED,
+    JOB_TASK_MAX_ATTEMPTS,
     MAX_HLS_ARCHIVE_FILES,
     MAX_HLS_ARCHIVE_SIZE,
     MAX_HLS_SINGLE_FILE_SIZE,
     ORPHAN_CLEANUP_ENABLED,
     ORPHAN_CLEANUP_INTERVAL,
     ORPHAN_CLEANUP_MIN_AGE,
+    PROGRESSIVE_PUBLISH_ENABLED,
     QUALITY_NAMES,
+    QUALITY_PRESETS,
     RATE_LIMIT_ENABLED,
     RATE_LIMIT_STORAGE_URL,
     RATE_LIMIT_WORKER_DEFAULT,
     RATE_LIMIT_WORKER_PROGRESS,
     RATE_LIMIT_WORKER_REGISTER,
+    SEGMENT_STORE_ENABLED,
     SPRITE_SHEET_AUTO_GENERATE,
     SPRITE_SHEET_ENABLED,
     STALE_JOB_CHECK_INTERVAL,
@@ -158,8 +206,10 @@ from config import (
     WORKER_ADMIN_SECRET,
     WORKER_API_PORT,
     WORKER_CLAIM_DURATION_MINUTES,
+    WORKER_CLAIM_LONG_POLL_MAX_SECONDS,
     WORKER_HEARTBEAT_INTERVAL,
     WORKER_OFFLINE_THRESHOLD_MINUTES,
+    WORKER_POLL_INTERVAL,
 )
 
 logger = logging.getLogger(__name__)
@@ -186,6 +236,16 @@ STYP_MAGIC = b"styp"  # Segment type box (common in CMAF)
 SIDX_MAGIC = b"sidx"  # Segment index box (code review fix)
 EMSG_MAGIC = b"emsg"  # Event message box (code review fix)
 
+# Maximum segments accepted by one batched segment upload
+MAX_SEGMENT_BATCH_FILES = 64
+# Maximum body of a batched segment upload with several segments. The body is
+# buffered in memory; a single segment may be up to MAX_HLS_SINGLE_FILE_SIZE, as
+# with upload_segment()
+MAX_SEGMENT_BATCH_BYTES = 256 * 1024 * 1024
+
+# Files kept in the segment store when it is enabled
+SEGMENT_STORE_EXTENSIONS = (".ts", ".m4s", ".mp4")
+
 
 def validate_segment_filename(filename: str) -> bool:
     """
@@ -295,7 +355,9 @@ def _write_segment_sync(
 
     This is the synchronous version that runs in a thread pool.
     Uses temp file + fsync + rename pattern for durability guarantee.
-    Only returns success if data is safely on disk.
+    Only returns success if data is safely on disk. With the segment store
+    enabled, the data is written to the store (once per content) and linked
+    into place instead.
 
     Args:
         data: The segment file data
@@ -315,6 +377,14 @@ def _write_segment_sync(
         )
         return False, 0, False
 
+    if SEGMENT_STORE_ENABLED:
+        try:
+            store_segment(data, checksum, dest_path)
+        except Exception as e:
+            logger.error(f"Failed to store segment {dest_path}: {e}")
+            raise
+        return True, len(data), True
+
     # Ensure parent directory exists
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -371,6 +441,176 @@ async def write_segment_atomic(
     )
 
 
+def _write_segment_batch_sync(
+    items: list[tuple[str, bytes, str]],
+    output_dir: Path,
+) -> list[tuple[str, Optional[str], bool, int, int]]:
+    """
+    Write a batch of segments with a single group commit.
+
+    Same guarantees as _write_segment_sync() for every segment, but the fsyncs are
+    issued back to back after all data has been written (so the storage can flush
+    them together), followed by the renames and one fsync of the directory.
+    Segments that already exist with the same checksum are left untouched. With
+    the segment store enabled, segments the store already has are linked without
+    writing, and new ones are renamed into the store and linked into place.
+
+    Args:
+        items: (filename, data, checksum) tuples; checksums are hex without prefix
+        output_dir: Quality directory to write into
+
+    Returns:
+        One (filename, error, written, bytes_written, old_size) tuple per item,
+        where error is None on success
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[str, tuple[str, Optional[str], bool, int, int]] = {}
+    pending = []  # (filename, checksum, temp_path, dest_path, file, size, old_size)
+
+    try:
+        for filename, data, checksum in items:
+            if hashlib.sha256(data).hexdigest() != checksum:
+                logger.warning(f"Checksum mismatch for {filename} in segment batch")
+                results[filename] = (filename, "Checksum verification failed", False, 0, 0)
+                continue
+
+            dest_path = output_dir / filename
+            old_size = 0
+            if dest_path.exists():
+                existing = dest_path.read_bytes()
+                if hashlib.sha256(existing).hexdigest() == checksum:
+                    results[filename] = (filename, None, False, len(data), 0)
+                    continue
+                old_size = len(existing)
+                logger.warning(f"Segment {filename} exists with different checksum, overwriting")
+
+            if SEGMENT_STORE_ENABLED and blob_path(checksum).exists():
+                materialize(blob_path(checksum), dest_path)
+                results[filename] = (filename, None, True, len(data), old_size)
+                continue
+
+            temp_path = dest_path.with_suffix(dest_path.suffix + ".tmp")
+            f = open(temp_path, "wb")
+            pending.append((filename, checksum, temp_path, dest_path, f, len(data), old_size))
+            f.write(data)
+
+        # Group commit: flush every file, then publish them all
+        for filename, checksum, temp_path, dest_path, f, size, old_size in pending:
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        for filename, checksum, temp_path, dest_path, f, size, old_size in pending:
+            temp_path.chmod(0o644)
+            if SEGMENT_STORE_ENABLED:
+                adopt_file(temp_path, checksum, dest_path)
+            else:
+                temp_path.rename(dest_path)
+            results[filename] = (filename, None, True, size, old_size)
+
+        if pending:
+            dir_fd = os.open(output_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    except Exception as e:
+        logger.error(f"Failed to write segment batch in {output_dir}: {e}")
+        for filename, checksum, temp_path, dest_path, f, size, old_size in pending:
+            f.close()
+            temp_path.unlink(missing_ok=True)
+        raise
+
+    return [results[filename] for filename, _, _ in items]
+
+
+async def _deduplicate_segments(video_dir: Path) -> None:
+    """Move extracted segments into the segment store, if enabled (best effort)."""
+    if not SEGMENT_STORE_ENABLED:
+        return
+    loop = asyncio.get_event_loop()
+    try:
+        replaced = await loop.run_in_executor(
+            _io_executor, functools.partial(ingest_directory, video_dir, SEGMENT_STORE_EXTENSIONS)
+        )
+    except Exception as e:
+        logger.warning(f"Failed to deduplicate segments in {video_dir}: {e}")
+        return
+    if replaced:
+        logger.info(f"Deduplicated {replaced} segments in {video_dir} against the segment store")
+
+
+def _extract_tar_members(
+    tar: tarfile.TarFile,
+    output_dir: Path,
+    allowed_extensions: tuple,
+    max_files: int,
+    max_size: int,
+    max_single_file: int,
+    strict_filenames: Optional[tuple] = None,
+) -> None:
+    """
+    Validate and extract every member of an open tar archive.
+
+    Members are processed in archive order, so this works for both seekable
+    archives and streams opened with mode "r|*".
+
+    Raises:
+        ValueError: If validation fails
+    """
+    output_dir_resolved = output_dir.resolve()
+    extracted_count = 0
+    extracted_size = 0
+
+    for member in tar:
+        extracted_count += 1
+        if extracted_count > max_files:
+            raise ValueError(f"Archive contains too many files (limit: {max_files})")
+
+        if member.isfile() and member.size > max_single_file:
+            raise ValueError(f"File too large: {member.name} ({member.size} bytes)")
+
+        extracted_size += member.size
+        if extracted_size > max_size:
+            raise ValueError(f"Archive too large (limit: {max_size} bytes)")
+
+        if member.issym() or member.islnk():
+            raise ValueError(f"Invalid archive: symlinks not allowed ({member.name})")
+
+        if not (member.isfile() or member.isdir()):
+            raise ValueError(f"Invalid archive: unsupported file type ({member.name})")
+
+        if member.isfile():
+            # Check strict filenames if specified
+            if strict_filenames and member.name not in strict_filenames:
+                raise ValueError(f"Unexpected file in archive: {member.name}")
+            # Check extensions
+            if not any(member.name.endswith(ext) for ext in allowed_extensions):
+                raise ValueError(f"Invalid file type: {member.name}")
+
+        # Validate path traversal
+        member_path = output_dir / member.name
+        try:
+            if member_path.exists():
+                dest_resolved = member_path.resolve()
+            else:
+                dest_resolved = member_path.parent.resolve() / member_path.name
+        except (ValueError, OSError) as e:
+            raise ValueError(f"Invalid path {member.name}: {e}")
+
+        try:
+            dest_resolved.relative_to(output_dir_resolved)
+        except ValueError:
+            raise ValueError(f"Path traversal detected ({member.name})")
+
+        # Extract and fix permissions
+        tar.extract(member, output_dir)
+        extracted_path = output_dir / member.name
+        if extracted_path.is_file():
+            extracted_path.chmod(0o644)
+        elif extracted_path.is_dir():
+            extracted_path.chmod(0o755)
+
+
 def _extract_tar_sync(
     tmp_path: Path,
     output_dir: Path,
@@ -395,59 +635,74 @@ def _extract_tar_sync(
     Raises:
         ValueError: If validation fails
     """
-    output_dir_resolved = output_dir.resolve()
-    extracted_count = 0
-    extracted_size = 0
-
     with tarfile.open(tmp_path, "r:gz") as tar:
-        for member in tar.getmembers():
-            extracted_count += 1
-            if extracted_count > max_files:
-                raise ValueError(f"Archive contains too many files (limit: {max_files})")
-
-            if member.isfile() and member.size > max_single_file:
-                raise ValueError(f"File too large: {member.name} ({member.size} bytes)")
-
-            extracted_size += member.size
-            if extracted_size > max_size:
-                raise ValueError(f"Archive too large (limit: {max_size} bytes)")
-
-            if member.issym() or member.islnk():
-                raise ValueError(f"Invalid archive: symlinks not allowed ({member.name})")
-
-            if not (member.isfile() or member.isdir()):
-                raise ValueError(f"Invalid archive: unsupported file type ({member.name})")
-
-            if member.isfile():
-                # Check strict filenames if specified
-                if strict_filenames and member.name not in strict_filenames:
-                    raise ValueError(f"Unexpected file in archive: {member.name}")
-                # Check extensions
-                if not any(member.name.endswith(ext) for ext in allowed_extensions):
-                    raise ValueError(f"Invalid file type: {member.name}")
-
-            # Validate path traversal
-            member_path = output_dir / member.name
-            try:
-                if member_path.exists():
-                    dest_resolved = member_path.resolve()
-                else:
-                    dest_resolved = member_path.parent.resolve() / member_path.name
-            except (ValueError, OSError) as e:
-                raise ValueError(f"Invalid path {member.name}: {e}")
+        _extract_tar_members(
+            tar, output_dir, allowed_extensions, max_files, max_size, max_single_file, strict_filenames
+        )
 
-            try:
-                dest_resolved.relative_to(output_dir_resolved)
-            except ValueError:
-                raise ValueError(f"Path traversal detected ({member.name})")
 
-            # Extract and fix permissions
-            tar.extract(member, output_dir)
-            extracted_path = output_dir / member.name
-            if extracted_path.is_file():
-                extracted_path.chmod(0o644)
-            elif extracted_path.is_dir():
-                extracted_path.chmod(0o755)
+class _RequestBodyReader(io.RawIOBase):
+    """
+    Blocking file-like view of an async request body, for use from a worker thread.
+
+    Each read pulls the next chunk from the event loop on demand, so a tar archive can
+    be extracted while it is still being received, without a temp file.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop):
+        self._chunks = chunks
+        self._loop = loop
+        self._buffer = b""
+        self._eof = False
+        self._pending: Optional[concurrent.futures.Future] = None
+        self._aborted = False
+
+    def readable(self) -> bool:
+        return True
+
+    async def _next_chunk(self) -> bytes:
+        # Starlette yields an empty chunk at the end of the body; skip empty chunks
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+    def readinto(self, b) -> int:
+        if not self._buffer and not self._eof:
+            if self._aborted:
+                raise ValueError("Upload aborted")
+            self._pending = asyncio.run_coroutine_threadsafe(self._next_chunk(), self._loop)
+            try:
+                self._buffer = self._pending.result()
+            except concurrent.futures.CancelledError:
+                raise ValueError("Upload aborted")
+            finally:
+                self._pending = None
+            self._eof = not self._buffer
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def abort(self) -> None:
+        """Make the reading thread fail fast (e.g. after an extraction timeout)."""
+        self._aborted = True
+        pending = self._pending
+        if pending is not None:
+            pending.cancel()
+
+
+def _extract_tar_stream_sync(
+    reader: _RequestBodyReader,
+    output_dir: Path,
+    allowed_extensions: tuple,
+    max_files: int,
+    max_size: int,
+    max_single_file: int,
+) -> None:
+    """Synchronous extraction of a tar stream (plain or gzip) - runs in thread pool."""
+    with tarfile.open(fileobj=io.BufferedReader(reader, SOURCE_RANGE_CHUNK_SIZE), mode="r|*") as tar:
+        _extract_tar_members(tar, output_dir, allowed_extensions, max_files, max_size, max_single_file)
 
 
 async def extract_tar_async(
@@ -513,6 +768,71 @@ async def extract_tar_async(
         raise ValueError(f"Tar extraction timed out after {timeout}s - storage may be unresponsive")
 
 
+TAR_STREAM_CONTENT_TYPE = "application/x-tar"
+
+
+def is_tar_stream_request(request: Request) -> bool:
+    """Check whether a request carries a raw tar stream as its body (vs multipart)."""
+    content_type = request.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower() == TAR_STREAM_CONTENT_TYPE
+
+
+async def extract_tar_stream_async(
+    chunks: AsyncIterator[bytes],
+    output_dir: Path,
+    allowed_extensions: tuple,
+    max_files: int,
+    max_size: int,
+    max_single_file: int,
+    timeout: Optional[float] = None,
+) -> None:
+    """
+    Extract a tar archive while it is being received - no temp file.
+
+    Streaming counterpart of extract_tar_async() for archives sent as the raw request
+    body (Content-Type: application/x-tar). Members are validated with the same rules
+    and written as they arrive, in a thread pool so slow storage can't block the
+    event loop. Uncompressed and gzip archives are both accepted.
+
+    Args:
+        chunks: Async iterator of body chunks (e.g. request.stream())
+        output_dir: Directory to extract to
+        allowed_extensions: Allowed file extensions
+        max_files: Max files allowed
+        max_size: Max total extracted size
+        max_single_file: Max size per file
+        timeout: Extraction timeout in seconds (default: TAR_EXTRACTION_TIMEOUT)
+
+    Raises:
+        ValueError: If validation fails, the archive is malformed, or extraction times out
+    """
+    if timeout is None:
+        timeout = TAR_EXTRACTION_TIMEOUT
+
+    loop = asyncio.get_running_loop()
+    reader = _RequestBodyReader(chunks, loop)
+    extraction = loop.run_in_executor(
+        _io_executor,
+        functools.partial(
+            _extract_tar_stream_sync,
+            reader,
+            output_dir,
+            allowed_extensions,
+            max_files,
+            max_size,
+            max_single_file,
+        ),
+    )
+    try:
+        await asyncio.wait_for(asyncio.shield(extraction), timeout=timeout)
+    except asyncio.TimeoutError:
+        reader.abort()
+        logger.error(f"Streamed tar extraction timed out after {timeout}s - possible stale NFS mount. Target: {output_dir}")
+        raise ValueError(f"Tar extraction timed out after {timeout}s - storage may be unresponsive")
+    except tarfile.TarError as e:
+        raise ValueError(f"Invalid archive: {e}")
+
+
 # Initialize rate limiter
 limiter = Limiter(
     key_func=get_real_ip,
@@ -766,11 +1086,20 @@ async def _detect_and_release_stale_jobs():
             )
 
             # Reset video status back to pending so it can be reclaimed
+            # (a progressively published video stays ready; its job is reclaimed as is)
             video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
             if video and video["status"] == "processing":
                 await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(status="pending"))
                 logger.info(f"Reset video {job['video_id']} status to pending")
 
+    # Rendition tasks of split jobs carry their own claims; release the expired ones
+    # here too, so tasks of offline workers don't wait for the next claim-task call
+    async def do_release_tasks_transaction():
+        async with database.transaction():
+            return await _release_expired_tasks(now)
+
+    await _finish_exhausted_split_jobs(await execute_with_retry(do_release_tasks_transaction))
+
     # Issue #456: Record successful check time in Redis for cross-instance coordination
     await _record_stale_check_time()
 
@@ -922,6 +1251,9 @@ async def _cleanup_orphaned_quality_directories() -> int:
                     cleaned_count += 1
                 except Exception as e:
                     logger.error(f"Failed to remove orphaned directory {subdir}: {e}")
+                    continue
+                await delete_video_objects(video_slug, subdir.name)
+                await record_video_storage(video_id, video_dir)
 
     except Exception as e:
         logger.exception(f"Error during orphan cleanup scan: {e}")
@@ -936,10 +1268,13 @@ async def cleanup_orphaned_files():
     Runs periodically to detect and remove quality directories that were
     uploaded during transcoding but never had their job completed.
     This prevents disk space leaks from abandoned partial uploads.
+
+    With the segment store enabled, also removes stored segments no video
+    links to anymore (see api/segment_store.py).
     """
     global _shutdown_event
 
-    if not ORPHAN_CLEANUP_ENABLED:
+    if not ORPHAN_CLEANUP_ENABLED and not SEGMENT_STORE_ENABLED:
         logger.info("Orphan cleanup is disabled (VLOG_ORPHAN_CLEANUP_ENABLED=false)")
         return
 
@@ -949,9 +1284,16 @@ async def cleanup_orphaned_files():
 
     while not _shutdown_event.is_set():
         try:
-            cleaned = await _cleanup_orphaned_quality_directories()
-            if cleaned > 0:
-                logger.info(f"Orphan cleanup removed {cleaned} orphaned quality directories")
+            if ORPHAN_CLEANUP_ENABLED:
+                cleaned = await _cleanup_orphaned_quality_directories()
+                if cleaned > 0:
+                    logger.info(f"Orphan cleanup removed {cleaned} orphaned quality directories")
+            if SEGMENT_STORE_ENABLED:
+                # Segments freed by the cleanup above (or by deletes) leave the store after a delay
+                loop = asyncio.get_event_loop()
+                removed, freed = await loop.run_in_executor(_io_executor, sweep_segment_store)
+                if removed > 0:
+                    logger.info(f"Segment store sweep removed {removed} unreferenced segments ({freed} bytes)")
         except Exception as e:
             logger.exception(f"Error in orphan cleanup: {e}")
 
@@ -992,9 +1334,16 @@ async def lifespan(app: FastAPI):
     # Start background tasks
     stale_job_task = asyncio.create_task(check_stale_jobs())
     orphan_cleanup_task = asyncio.create_task(cleanup_orphaned_files())
+    # Evict cached API keys revoked on other instances
+    start_key_revocation_listener()
+    # Wake long-polling claims when jobs are created on any instance
+    start_job_notification_listener()
 
     yield
 
+    await stop_job_notification_listener()
+    await stop_key_revocation_listener()
+
     # Signal background tasks to stop
     _shutdown_event.set()
 
@@ -1024,9 +1373,11 @@ async def lifespan(app: FastAPI):
     logger.info("Worker API shutting down - releasing claimed jobs...")
     try:
         # Find all jobs that are still claimed but not completed
+        # (split jobs are held by no worker; their tasks expire on their own)
         claimed_jobs = await database.fetch_all(
             transcoding_jobs.select()
             .where(transcoding_jobs.c.claimed_at.isnot(None))
+            .where(transcoding_jobs.c.worker_id.isnot(None))
             .where(transcoding_jobs.c.completed_at.is_(None))
         )
 
@@ -1124,7 +1475,7 @@ async def register_worker(
     """
     worker_id = str(uuid.uuid4())
     api_key = secrets.token_urlsafe(32)  # 256-bit key
-    key_hash, hash_version = hash_api_key(api_key)  # Returns (hash, version) tuple
+    key_hash, hash_version = await asyncio.to_thread(hash_api_key, api_key)  # Returns (hash, version) tuple
     key_prefix = get_key_prefix(api_key)
     now = datetime.now(timezone.utc)
 
@@ -1371,29 +1722,12 @@ def worker_has_gpu(worker: dict) -> bool:
     return False
 
 
-@app.post("/api/worker/claim", response_model=ClaimJobResponse)
-@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
-async def claim_job(
-    request: Request,
-    job_id: Optional[int] = None,
-    worker: dict = Depends(verify_worker_key),
-):
+async def _claim_refusal(worker: dict, now: datetime) -> Optional[str]:
     """
-    Atomically claim a transcoding job.
-
-    Uses database transaction for distributed safety.
-    Claims expire after WORKER_CLAIM_DURATION_MINUTES (extended on progress updates).
-
-    Args:
-        job_id: Optional specific job ID to claim (for Redis-dispatched jobs).
-                If provided, will only claim this specific job.
-                If not provided, claims any available job from the database.
-
-    GPU workers have priority over CPU workers. If a CPU worker requests a job
-    but idle GPU workers are available, the CPU worker will be told to wait.
+    Why a worker may not claim work right now (None if it may).
 
-    Also enforces code version matching if workers.require_version_match is enabled.
-    Workers with outdated code will be rejected from claiming jobs.
+    Enforces code version matching (workers.require_version_match) and GPU
+    priority: a CPU worker waits while recently active GPU workers are idle.
     """
     from api.settings_service import get_settings_service
     from code_version import CODE_VERSION
@@ -1421,7 +1755,7 @@ async def claim_job(
             f"Rejecting job claim from worker '{worker_name}' - "
             f"no code_version in metadata (workers.require_version_field is enabled)"
         )
-        return ClaimJobResponse(message="Version field required: worker must send code_version in heartbeat")
+        return "Version field required: worker must send code_version in heartbeat"
 
     # Check for version mismatch
     if require_version_match and worker_version and worker_version != CODE_VERSION:
@@ -1429,13 +1763,7 @@ async def claim_job(
             f"Rejecting job claim from worker '{worker_name}' "
             f"due to version mismatch: {worker_version} != {CODE_VERSION}"
         )
-        return ClaimJobResponse(
-            message=f"Version mismatch: worker has {worker_version}, server requires {CODE_VERSION}"
-        )
-
-    now = datetime.now(timezone.utc)
-    claim_duration = timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
-    expires_at = now + claim_duration
+        return f"Version mismatch: worker has {worker_version}, server requires {CODE_VERSION}"
 
     # Check worker priority - GPU workers get priority over CPU workers
     requesting_worker_has_gpu = worker_has_gpu(worker)
@@ -1458,7 +1786,71 @@ async def claim_job(
         for idle_worker in idle_gpu_workers:
             if worker_has_gpu(dict(idle_worker)):
                 # GPU worker is available and recently active, CPU worker should wait
-                return ClaimJobResponse(message="Waiting for GPU workers")
+                return "Waiting for GPU workers"
+
+    return None
+
+
+def _find_source_filename(video_id: int) -> Optional[str]:
+    """Name of a video's uploaded source file in UPLOADS_DIR (None if missing)."""
+    for ext in SUPPORTED_VIDEO_EXTENSIONS:
+        candidate = UPLOADS_DIR / f"{video_id}{ext}"
+        if candidate.exists():
+            return candidate.name
+    return None
+
+
+async def _audio_rendition_bandwidth(video_slug: str) -> Optional[int]:
+    """
+    Bandwidth of a video's shared audio rendition (None if its renditions carry their own audio).
+
+    Measuring it reads the audio playlist and stats every segment, so it runs in
+    the I/O thread pool.
+    """
+    from worker.transcoder import get_audio_rendition_bandwidth
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _io_executor, functools.partial(get_audio_rendition_bandwidth, VIDEOS_DIR / video_slug)
+    )
+
+
+@app.post("/api/worker/claim", response_model=ClaimJobResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def claim_job(
+    request: Request,
+    job_id: Optional[int] = None,
+    wait: int = Query(default=0, ge=0),
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Atomically claim a transcoding job.
+
+    Uses database transaction for distributed safety.
+    Claims expire after WORKER_CLAIM_DURATION_MINUTES (extended on progress updates).
+
+    Args:
+        job_id: Optional specific job ID to claim (for Redis-dispatched jobs).
+                If provided, will only claim this specific job.
+                If not provided, claims any available job from the database.
+        wait: Long-poll: if no job is available, wait up to this many seconds
+              (capped at WORKER_CLAIM_LONG_POLL_MAX_SECONDS) for one to be published.
+              The request is woken as soon as a job is created instead of the
+              worker polling again.
+
+    GPU workers have priority over CPU workers. If a CPU worker requests a job
+    but idle GPU workers are available, the CPU worker will be told to wait.
+
+    Also enforces code version matching if workers.require_version_match is enabled.
+    Workers with outdated code will be rejected from claiming jobs.
+    """
+    now = datetime.now(timezone.utc)
+    claim_duration = timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
+    expires_at = now + claim_duration
+
+    refusal = await _claim_refusal(worker, now)
+    if refusal:
+        return ClaimJobResponse(message=refusal)
 
     # Store job data in mutable container for the transaction
     claim_result = {"job": None}
@@ -1506,7 +1898,8 @@ async def claim_job(
 
             # Job is claimable if:
             # - video status is 'pending' (normal new upload), OR
-            # - video status is 'ready' AND job has retranscode_metadata (Issue #408)
+            # - video status is 'ready': a re-transcode with retranscode_metadata (Issue #408),
+            #   or a progressively published video whose job was released or retried
             if job_id is not None:
                 # Targeted claim for a specific job (Redis-dispatched)
                 if is_postgresql:
@@ -1517,7 +1910,7 @@ async def claim_job(
                             FROM transcoding_jobs tj
                             JOIN videos v ON tj.video_id = v.id
                             WHERE tj.id = :job_id
-                              AND (v.status = 'pending' OR (v.status = 'ready' AND tj.retranscode_metadata IS NOT NULL))
+                              AND v.status IN ('pending', 'ready')
                               AND v.deleted_at IS NULL
                               AND tj.claimed_at IS NULL
                               AND tj.completed_at IS NULL
@@ -1532,7 +1925,7 @@ async def claim_job(
                             FROM transcoding_jobs tj
                             JOIN videos v ON tj.video_id = v.id
                             WHERE tj.id = :job_id
-                              AND (v.status = 'pending' OR (v.status = 'ready' AND tj.retranscode_metadata IS NOT NULL))
+                              AND v.status IN ('pending', 'ready')
                               AND v.deleted_at IS NULL
                               AND tj.claimed_at IS NULL
                               AND tj.completed_at IS NULL
@@ -1546,7 +1939,7 @@ async def claim_job(
                                tj.retranscode_metadata
                         FROM transcoding_jobs tj
                         JOIN videos v ON tj.video_id = v.id
-                        WHERE (v.status = 'pending' OR (v.status = 'ready' AND tj.retranscode_metadata IS NOT NULL))
+                        WHERE v.status IN ('pending', 'ready')
                           AND v.deleted_at IS NULL
                           AND tj.claimed_at IS NULL
                           AND tj.completed_at IS NULL
@@ -1564,7 +1957,7 @@ async def claim_job(
                                tj.retranscode_metadata
                         FROM transcoding_jobs tj
                         JOIN videos v ON tj.video_id = v.id
-                        WHERE (v.status = 'pending' OR (v.status = 'ready' AND tj.retranscode_metadata IS NOT NULL))
+                        WHERE v.status IN ('pending', 'ready')
                           AND v.deleted_at IS NULL
                           AND tj.claimed_at IS NULL
                           AND tj.completed_at IS NULL
@@ -1598,23 +1991,64 @@ async def claim_job(
                 )
             )
 
-            # Update video status
-            await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(status="processing"))
+            # Drop rendition tasks left from an earlier split attempt; the job is whole again
+            await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
+
+            # The job rewrites the video's files: serve them from VIDEOS_DIR until republished
+            await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(**STORAGE_SYNC_RESET))
+
+            # Update video status (a progressively published video stays playable while its
+            # job resumes; a re-transcode takes it down until it is done)
+            video_update = videos.update().where(videos.c.id == job["video_id"])
+            if job["retranscode_metadata"] is None:
+                video_update = video_update.where(videos.c.status != "ready")
+            await database.execute(video_update.values(status="processing"))
 
             # Update worker's current job
             await database.execute(
                 workers.update().where(workers.c.id == worker["id"]).values(current_job_id=job["id"])
             )
 
-    try:
-        await execute_with_retry(do_claim_transaction)
-    except DatabaseLockedError as e:
-        raise HTTPException(
-            status_code=503,
-            detail="Database temporarily unavailable, please retry",
-        ) from e
+    async def try_claim() -> Optional[dict]:
+        try:
+            await execute_with_retry(do_claim_transaction)
+        except DatabaseLockedError as e:
+            raise HTTPException(
+                status_code=503,
+                detail="Database temporarily unavailable, please retry",
+            ) from e
+        return claim_result["job"]
+
+    job = await try_claim()
+
+    # Long-poll: park until a job is published (or re-check every poll interval
+    # in case a notification was missed), then retry the claim
+    wait_seconds = min(wait, WORKER_CLAIM_LONG_POLL_MAX_SECONDS) if job_id is None else 0
+    deadline = time.monotonic() + wait_seconds
+    while not job:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        woken = await claim_waiters.wait(min(remaining, WORKER_POLL_INTERVAL))
+        if await request.is_disconnected():
+            if woken:
+                # Hand the wake-up to the next parked worker
+                claim_waiters.notify_one()
+            return ClaimJobResponse(message="No jobs available")
+        now = datetime.now(timezone.utc)
+        expires_at = now + claim_duration
+        # GPU priority and version checks depend on the current state of the workers
+        refusal = await _claim_refusal(worker, now)
+        if refusal:
+            if woken:
+                # The wake-up is meant for a worker that may claim (e.g. an idle GPU worker)
+                claim_waiters.notify_one()
+            return ClaimJobResponse(message=refusal)
+        job = await try_claim()
+        if not job and JOB_SPLITTING_ENABLED and await _pending_tasks_exist():
+            # Hand the worker to a split job's renditions instead of parking it
+            return ClaimJobResponse(message="Rendition tasks available", tasks_available=True)
 
-    job = claim_result["job"]
     if not job:
         return ClaimJobResponse(message="No jobs available")
 
@@ -1649,8 +2083,11 @@ async def claim_job(
                     if quality_dir.exists() and quality_dir.is_dir():
                         shutil.rmtree(quality_dir, ignore_errors=True)
 
-                # If retranscoding all, also delete master playlist and thumbnail
+                # If retranscoding all, also delete master playlist, shared audio and thumbnail
                 if retranscode_all:
+                    from worker.hwaccel import AUDIO_RENDITION_NAME
+
+                    shutil.rmtree(video_dir / AUDIO_RENDITION_NAME, ignore_errors=True)
                     for master_file in ["master.m3u8", "manifest.mpd"]:
                         master = video_dir / master_file
                         if master.exists():
@@ -1664,6 +2101,7 @@ async def claim_job(
                     vtt_path = video_dir / "captions.vtt"
                     if vtt_path.exists():
                         vtt_path.unlink()
+                await record_video_storage(video_id, video_dir)
 
             # Database cleanup in a transaction for consistency
             async with database.transaction():
@@ -1712,12 +2150,7 @@ async def claim_job(
             )
 
     # Find source filename
-    source_filename = None
-    for ext in SUPPORTED_VIDEO_EXTENSIONS:
-        candidate = UPLOADS_DIR / f"{job['video_id']}{ext}"
-        if candidate.exists():
-            source_filename = candidate.name
-            break
+    source_filename = _find_source_filename(job["video_id"])
 
     # Query existing qualities to skip during transcoding (for selective re-transcode)
     existing_quality_rows = await database.fetch_all(
@@ -1735,6 +2168,8 @@ async def claim_job(
         source_filename=source_filename,
         claim_expires_at=expires_at,
         existing_qualities=existing_qualities,
+        progressive_publish=PROGRESSIVE_PUBLISH_ENABLED,
+        audio_bandwidth=await _audio_rendition_bandwidth(job["slug"]),
         message="Job claimed successfully",
     )
 
@@ -1744,6 +2179,12 @@ async def claim_job(
 # =============================================================================
 
 
+async def _running_job_video_status(video_id: int) -> str:
+    """Video status announced with a running job's progress (ready once progressively published)."""
+    status = await database.fetch_val(sa.select(videos.c.status).where(videos.c.id == video_id))
+    return "ready" if status == "ready" else "processing"
+
+
 @app.post("/api/worker/{job_id}/progress", response_model=ProgressUpdateResponse)
 @limiter.limit(RATE_LIMIT_WORKER_PROGRESS)
 async def update_progress(
@@ -1850,7 +2291,7 @@ async def update_progress(
         current_step=data.current_step,
         progress_percent=data.progress_percent,
         qualities=qualities_data,
-        status="processing",
+        status=await _running_job_video_status(job["video_id"]),
     )
 
     return ProgressUpdateResponse(status="ok", claim_expires_at=new_expiry)
@@ -1861,32 +2302,88 @@ async def update_progress(
 # =============================================================================
 
 
-@app.post("/api/worker/{job_id}/complete", response_model=CompleteJobResponse)
-@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
-async def complete_job(
-    request: Request,
-    job_id: int,
-    data: CompleteJobRequest,
-    worker: dict = Depends(verify_worker_key),
-):
-    """Mark job as complete after HLS files uploaded.
-
-    Idempotency (Issue #455):
-    - If completion_token is provided and was already processed, returns early
-    - If job is already completed, returns early
-    - Metadata fields only update if not already set (idempotent on retry)
-    """
-    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    if job["worker_id"] != worker["worker_id"]:
-        raise HTTPException(status_code=403, detail="Not your job")
+async def _after_job_completed(job_id: int, video_id: int, worker: dict, qualities: List[dict]) -> None:
+    """Record metrics, queue sprites and announce a job whose video just became ready."""
+    # Issue #207: Record job completion metrics (sanitize label to prevent injection)
+    worker_label = sanitize_label(worker["worker_name"] or worker["worker_id"])
+    WORKER_JOBS_COMPLETED_TOTAL.labels(worker_name=worker_label).inc()
+    TRANSCODING_JOBS_TOTAL.labels(status="completed").inc()
 
-    now = datetime.now(timezone.utc)
+    # Publish job completion to Redis pub/sub for real-time UI updates
+    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
+    worker_name = worker["worker_name"] or worker["worker_id"][:8]
 
-    # Issue #455: Idempotency check - if job already completed, return early
-    if job["completed_at"] is not None:
-        logger.info(f"Job {job_id} already completed, returning idempotent response")
+    # Queue sprite sheet generation if enabled (Issue #413 Phase 7B)
+    if SPRITE_SHEET_ENABLED and SPRITE_SHEET_AUTO_GENERATE:
+        try:
+            # Check if sprite job already exists for this video
+            existing_sprite = await database.fetch_one(
+                sa.text(
+                    "SELECT id FROM sprite_queue WHERE video_id = :video_id AND status IN ('pending', 'processing')"
+                ).bindparams(video_id=video_id)
+            )
+            if not existing_sprite:
+                await database.execute(
+                    sprite_queue.insert().values(
+                        video_id=video_id,
+                        priority="normal",
+                        status="pending",
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+                await database.execute(
+                    videos.update()
+                    .where(videos.c.id == video_id)
+                    .values(
+                        sprite_sheet_status="pending",
+                        sprite_sheet_error=None,
+                    )
+                )
+                logger.info(f"Queued sprite sheet generation for video {video_id}")
+        except Exception as sprite_err:
+            logger.warning(f"Failed to queue sprite generation: {sprite_err}")
+
+    await Publisher.publish_job_completed(
+        job_id=job_id,
+        video_id=video_id,
+        video_slug=video["slug"] if video else "unknown",
+        worker_id=worker["worker_id"],
+        worker_name=worker_name,
+        qualities=qualities,
+    )
+    # The video is now ready, so public video lists must include it
+    await invalidate_response_cache()
+    if video:
+        # Served from VIDEOS_DIR until published to object storage
+        schedule_video_publish(video["slug"])
+
+
+@app.post("/api/worker/{job_id}/complete", response_model=CompleteJobResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def complete_job(
+    request: Request,
+    job_id: int,
+    data: CompleteJobRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """Mark job as complete after HLS files uploaded.
+
+    Idempotency (Issue #455):
+    - If completion_token is provided and was already processed, returns early
+    - If job is already completed, returns early
+    - Metadata fields only update if not already set (idempotent on retry)
+    """
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["worker_id"] != worker["worker_id"]:
+        raise HTTPException(status_code=403, detail="Not your job")
+
+    now = datetime.now(timezone.utc)
+
+    # Issue #455: Idempotency check - if job already completed, return early
+    if job["completed_at"] is not None:
+        logger.info(f"Job {job_id} already completed, returning idempotent response")
         return CompleteJobResponse(status="ok", message="Job already completed")
 
     # Issue #455: Atomic token check-and-set using SETNX (set if not exists)
@@ -2013,57 +2510,166 @@ async def complete_job(
                 # Redis failure shouldn't block - token was already set, DB is source of truth
                 logger.warning(f"Failed to update completion token status in Redis: {e}")
 
-    # Issue #207: Record job completion metrics (sanitize label to prevent injection)
-    worker_label = sanitize_label(worker["worker_name"] or worker["worker_id"])
-    WORKER_JOBS_COMPLETED_TOTAL.labels(worker_name=worker_label).inc()
-    TRANSCODING_JOBS_TOTAL.labels(status="completed").inc()
+    await _after_job_completed(job_id, job["video_id"], worker, [q.model_dump() for q in data.qualities])
 
-    # Publish job completion to Redis pub/sub for real-time UI updates
-    video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
-    worker_name = worker["worker_name"] or worker["worker_id"][:8]
+    return CompleteJobResponse(status="ok", message="Job completed successfully")
 
-    # Queue sprite sheet generation if enabled (Issue #413 Phase 7B)
-    if SPRITE_SHEET_ENABLED and SPRITE_SHEET_AUTO_GENERATE:
-        try:
-            # Check if sprite job already exists for this video
-            existing_sprite = await database.fetch_one(
-                sa.text(
-                    "SELECT id FROM sprite_queue WHERE video_id = :video_id AND status IN ('pending', 'processing')"
-                ).bindparams(video_id=job["video_id"])
-            )
-            if not existing_sprite:
-                await database.execute(
-                    sprite_queue.insert().values(
-                        video_id=job["video_id"],
-                        priority="normal",
-                        status="pending",
-                        created_at=datetime.now(timezone.utc),
-                    )
+
+# =============================================================================
+# Progressive Publishing
+# =============================================================================
+#
+# With VLOG_PROGRESSIVE_PUBLISH_ENABLED, a video becomes playable as soon as its
+# first (cheapest) rendition is uploaded: the Worker API writes interim manifests
+# from the renditions so far and marks the video ready while the job keeps
+# running. Each further rendition rewrites the manifests, and finishing the job
+# replaces them with the final ones. Whole jobs are published by their worker
+# (POST /api/worker/{job_id}/publish), split jobs as their tasks complete.
+
+
+def _rendition_playlist_path(output_dir: Path, quality: str, streaming_format: str) -> Path:
+    """Playlist of an uploaded rendition."""
+    if streaming_format == "cmaf":
+        return output_dir / quality / "stream.m3u8"
+    return output_dir / f"{quality}.m3u8"
+
+
+async def _publish_renditions(job, qualities: List[dict], streaming_format: str, codec: str) -> List[str]:
+    """
+    Make uploaded renditions of a running job playable.
+
+    Records the renditions, writes interim manifests from all of the video's
+    renditions and marks the video ready if it was still processing. The
+    original remux is left out until the job finishes, so players start on an
+    encoded rendition.
+
+    Args:
+        job: The running transcoding job
+        qualities: Uploaded renditions (name, width, height, bitrate in kbps)
+
+    Returns:
+        Renditions in the video's manifests (empty if nothing was published)
+
+    Raises:
+        RuntimeError: If the manifests could not be written
+    """
+    video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
+    if not video or video["deleted_at"] is not None:
+        return []
+    output_dir = VIDEOS_DIR / video["slug"]
+    uploaded = [
+        q
+        for q in qualities
+        if q["name"] != "original" and _rendition_playlist_path(output_dir, q["name"], streaming_format).exists()
+    ]
+    if not uploaded:
+        return []
+
+    async def do_record_transaction():
+        """Record the renditions - wrapped with retry logic."""
+        async with database.transaction():
+            for q in uploaded:
+                existing = await database.fetch_one(
+                    video_qualities.select()
+                    .where(video_qualities.c.video_id == video["id"])
+                    .where(video_qualities.c.quality == q["name"])
                 )
-                await database.execute(
-                    videos.update()
-                    .where(videos.c.id == job["video_id"])
-                    .values(
-                        sprite_sheet_status="pending",
-                        sprite_sheet_error=None,
+                if not existing:
+                    await database.execute(
+                        video_qualities.insert().values(
+                            video_id=video["id"],
+                            quality=q["name"],
+                            width=q["width"],
+                            height=q["height"],
+                            bitrate=q["bitrate"],
+                        )
                     )
-                )
-                logger.info(f"Queued sprite sheet generation for video {job['video_id']}")
-        except Exception as sprite_err:
-            logger.warning(f"Failed to queue sprite generation: {sprite_err}")
 
-    await Publisher.publish_job_completed(
-        job_id=job_id,
-        video_id=job["video_id"],
-        video_slug=video["slug"] if video else "unknown",
-        worker_id=worker["worker_id"],
-        worker_name=worker_name,
-        qualities=[
-            {"name": q.name, "width": q.width, "height": q.height, "bitrate": q.bitrate} for q in data.qualities
-        ],
+    await execute_with_retry(do_record_transaction)
+    await _write_video_manifests(video, streaming_format, codec, partial=True)
+    rows = await database.fetch_all(
+        sa.select(video_qualities.c.quality).where(video_qualities.c.video_id == video["id"])
     )
+    published = sorted(row["quality"] for row in rows)
+
+    if video["status"] == "processing":
+        video_updates = {"status": "ready"}
+        if video["published_at"] is None:
+            video_updates["published_at"] = datetime.now(timezone.utc)
+        if video["streaming_format"] is None:
+            video_updates["streaming_format"] = streaming_format
+        if video["primary_codec"] is None:
+            video_updates["primary_codec"] = codec
+
+        async def do_ready_update():
+            await database.execute(
+                videos.update()
+                .where(videos.c.id == video["id"])
+                .where(videos.c.status == "processing")
+                .values(**video_updates)
+            )
 
-    return CompleteJobResponse(status="ok", message="Job completed successfully")
+        await execute_with_retry(do_ready_update)
+        logger.info(f"Video {video['slug']} is playable ({', '.join(published)}) while job {job['id']} continues")
+        # The video is now ready, so public video lists must include it
+        await invalidate_response_cache()
+        await Publisher.publish_progress(
+            video_id=video["id"],
+            job_id=job["id"],
+            current_step=job["current_step"] or "transcode",
+            progress_percent=job["progress_percent"] or 0,
+            status="ready",
+        )
+    return published
+
+
+@app.post("/api/worker/{job_id}/publish", response_model=PublishRenditionsResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def publish_renditions(
+    request: Request,
+    job_id: int,
+    data: PublishRenditionsRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Make the renditions uploaded so far playable before the job finishes.
+
+    Called after each rendition upload when the claim response asked for
+    progressive publishing, with every rendition uploaded so far (so a retried
+    call is harmless).
+    """
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["worker_id"] != worker["worker_id"]:
+        raise HTTPException(status_code=403, detail="Not your job")
+    if job["claim_expires_at"] and ensure_utc(job["claim_expires_at"]) < datetime.now(timezone.utc):
+        raise HTTPException(
+            status_code=409,
+            detail="Claim expired - job may have been reassigned",
+        )
+
+    if not PROGRESSIVE_PUBLISH_ENABLED:
+        return PublishRenditionsResponse(status="ok", message="Progressive publishing is disabled")
+    if job["completed_at"] is not None:
+        return PublishRenditionsResponse(status="ok", message="Job already completed")
+
+    try:
+        published = await _publish_renditions(
+            job, [q.model_dump() for q in data.qualities], data.streaming_format, data.streaming_codec
+        )
+    except DatabaseLockedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable, please retry",
+        ) from e
+    except RuntimeError as e:
+        logger.error(f"Failed to publish renditions of job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to write manifests")
+
+    if not published:
+        return PublishRenditionsResponse(status="ok", message="No uploaded renditions to publish")
+    return PublishRenditionsResponse(status="ok", published=published, message=f"Published {len(published)} renditions")
 
 
 # =============================================================================
@@ -2117,10 +2723,16 @@ async def fail_job(
                         attempt_number=job["attempt_number"] + 1,
                     )
                 )
-                # Clean up quality_progress records from previous attempt
+                # Clean up quality_progress records (and any rendition tasks) from previous attempt
                 # to prevent stale progress data affecting the retry
                 await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job_id))
-                await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(status="pending"))
+                await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job_id))
+                # A progressively published video stays playable until the retry resumes
+                await database.execute(
+                    videos.update()
+                    .where(videos.c.id == job["video_id"])
+                    .values(status=sa.case((videos.c.status == "ready", "ready"), else_="pending"))
+                )
             else:
                 # Final failure
                 await database.execute(
@@ -2133,10 +2745,14 @@ async def fail_job(
                         claim_expires_at=None,
                     )
                 )
+                # A progressively published video stays playable with the renditions it has
                 await database.execute(
                     videos.update()
                     .where(videos.c.id == job["video_id"])
-                    .values(status="failed", error_message=data.error_message[:500])
+                    .values(
+                        status=sa.case((videos.c.status == "ready", "ready"), else_="failed"),
+                        error_message=data.error_message[:500],
+                    )
                 )
 
             # Clear worker's current job
@@ -2186,140 +2802,951 @@ async def fail_job(
 
 
 # =============================================================================
-# File Transfer
+# Rendition Sub-Tasks
 # =============================================================================
+#
+# With VLOG_JOB_SPLITTING_ENABLED, the worker that claimed a long video splits
+# the job after probing it: every rendition (including the original remux)
+# becomes a transcoding_tasks row that any worker can claim, with its own claim
+# expiry and retries. The parent job keeps claimed_at (so it is never claimed
+# or expired again) but is held by no worker. When its last task is done, the
+# Worker API writes the master playlist (and DASH manifest) from the uploaded
+# renditions and marks the video ready, as complete_job does for whole jobs.
+
+
+async def _pending_tasks_exist() -> bool:
+    """Whether a rendition task of a live video is waiting to be claimed."""
+    row = await database.fetch_one(
+        sa.text(
+            """
+            SELECT 1 FROM transcoding_tasks ts
+            JOIN transcoding_jobs tj ON ts.job_id = tj.id
+            JOIN videos v ON tj.video_id = v.id
+            WHERE ts.status = 'pending' AND tj.completed_at IS NULL
+              AND tj.worker_id IS NULL AND tj.current_step = 'transcode'
+              AND v.deleted_at IS NULL
+            LIMIT 1
+            """
+        )
+    )
+    return row is not None
 
 
-@app.get("/api/worker/source/{video_id}")
-@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
-async def download_source(
-    request: Request,
-    video_id: int,
-    worker: dict = Depends(verify_worker_key),
-):
-    """Stream source file to worker."""
-    # Verify worker has claimed this video's job
-    job = await database.fetch_one(
-        transcoding_jobs.select()
-        .where(transcoding_jobs.c.video_id == video_id)
-        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
+async def _release_expired_tasks(now: datetime) -> Dict[int, str]:
+    """
+    Release rendition tasks whose claim expired, counting as a failed attempt.
+
+    Tasks that used their last attempt are failed instead. Call inside a
+    transaction; the jobs returned may now be finished (_finish_exhausted_split_jobs).
+
+    Returns:
+        The jobs of the failed tasks, mapped to the worker that held the task
+    """
+    exhausted = await database.fetch_all(
+        sa.text(
+            """
+            UPDATE transcoding_tasks
+            SET status = 'failed', claim_expires_at = NULL, completed_at = :now,
+                last_error = 'Claim expired'
+            WHERE status = 'in_progress' AND claim_expires_at < :now
+              AND attempt_number >= max_attempts
+            RETURNING job_id, worker_id
+            """
+        ).bindparams(now=now)
     )
-    if not job:
-        raise HTTPException(status_code=403, detail="Not your job or job not found")
+    await database.execute(
+        sa.text(
+            """
+            UPDATE transcoding_tasks
+            SET status = 'pending', worker_id = NULL, claimed_at = NULL, claim_expires_at = NULL,
+                attempt_number = attempt_number + 1, last_error = 'Claim expired'
+            WHERE status = 'in_progress' AND claim_expires_at < :now
+            """
+        ).bindparams(now=now)
+    )
+    return {row["job_id"]: row["worker_id"] for row in exhausted}
 
-    # Check if claim has expired
-    now = datetime.now(timezone.utc)
-    if job["claim_expires_at"]:
-        claim_expiry = job["claim_expires_at"]
-        if claim_expiry.tzinfo is None:
-            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
-        if claim_expiry < now:
-            raise HTTPException(
-                status_code=409,
-                detail="Claim expired - job may have been reassigned",
-            )
 
-    # Find source file
-    source_file: Optional[Path] = None
-    for ext in SUPPORTED_VIDEO_EXTENSIONS:
-        candidate = UPLOADS_DIR / f"{video_id}{ext}"
-        if candidate.exists():
-            source_file = candidate
-            break
+async def _finish_exhausted_split_jobs(exhausted: Dict[int, str]) -> None:
+    """Finish the jobs from _release_expired_tasks, charged to the worker whose task expired."""
+    for job_id, worker_id in exhausted.items():
+        holder = await database.fetch_one(workers.select().where(workers.c.worker_id == worker_id))
+        await _finish_split_job(job_id, dict(holder) if holder else {"worker_id": worker_id, "worker_name": None})
 
-    if not source_file:
-        raise HTTPException(status_code=404, detail="Source file not found")
 
-    return FileResponse(
-        source_file,
-        media_type="application/octet-stream",
-        filename=source_file.name,
-    )
+def _progressive_task_order(qualities: List[str]) -> List[str]:
+    """Move the cheapest encoded rendition to the front, so it is published first."""
+    heights = {preset["name"]: preset["height"] for preset in QUALITY_PRESETS}
+    encoded = [quality for quality in qualities if quality in heights]
+    if not encoded:
+        return list(qualities)
+    cheapest = min(encoded, key=heights.__getitem__)
+    return [cheapest] + [quality for quality in qualities if quality != cheapest]
 
 
-@app.post("/api/worker/upload/{video_id}/quality/{quality_name}", response_model=StatusResponse)
+@app.post("/api/worker/{job_id}/split", response_model=SplitJobResponse)
 @limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
-async def upload_quality(
+async def split_job(
     request: Request,
-    video_id: int,
-    quality_name: str,
-    file: UploadFile = File(...),
+    job_id: int,
+    data: SplitJobRequest,
     worker: dict = Depends(verify_worker_key),
 ):
     """
-    Upload a single quality's HLS files (tar.gz of playlist + segments).
-
-    Called after each quality finishes transcoding. This allows:
-    - Incremental upload as qualities complete
-    - Reduced disk space on worker (delete after upload)
-    - Partial progress saved if worker crashes
-    - Server can start serving partial content earlier
+    Split a probed job into rendition tasks.
 
-    Expected files in archive:
-    - {quality_name}.m3u8 (quality playlist)
-    - {quality_name}_XXXX.ts (segments)
+    The job is only split if splitting is enabled, the video is at least
+    JOB_SPLIT_MIN_DURATION seconds long and there are at least two renditions;
+    otherwise the worker transcodes it whole as before. After a split the
+    worker no longer holds the job and claims its tasks like any other worker.
     """
-    job = await database.fetch_one(
-        transcoding_jobs.select()
-        .where(transcoding_jobs.c.video_id == video_id)
-        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
-    )
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
     if not job:
-        raise HTTPException(status_code=403, detail="Not your job or job not found")
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["worker_id"] != worker["worker_id"]:
+        raise HTTPException(status_code=403, detail="Not your job")
 
-    # Check if claim has expired
     now = datetime.now(timezone.utc)
-    if job["claim_expires_at"]:
-        claim_expiry = job["claim_expires_at"]
-        if claim_expiry.tzinfo is None:
-            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
-        if claim_expiry < now:
-            raise HTTPException(
-                status_code=409,
-                detail="Claim expired - job may have been reassigned",
-            )
+    if job["claim_expires_at"] and ensure_utc(job["claim_expires_at"]) < now:
+        raise HTTPException(
+            status_code=409,
+            detail="Claim expired - job may have been reassigned",
+        )
 
-    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
-    if not video:
-        raise HTTPException(status_code=404, detail="Video not found")
+    if not JOB_SPLITTING_ENABLED:
+        return SplitJobResponse(split=False, message="Job splitting is disabled")
+    if len(data.qualities) < 2:
+        return SplitJobResponse(split=False, message="Nothing to split")
+    video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
+    if not video or (video["duration"] or 0) < JOB_SPLIT_MIN_DURATION:
+        return SplitJobResponse(split=False, message="Video too short to split")
+    # Tasks are claimed in insertion order
+    qualities = _progressive_task_order(data.qualities) if PROGRESSIVE_PUBLISH_ENABLED else data.qualities
 
-    output_dir = VIDEOS_DIR / video["slug"]
-    output_dir.mkdir(parents=True, exist_ok=True)
+    async def do_split_transaction():
+        """Replace the job's tasks - wrapped with retry logic."""
+        async with database.transaction():
+            await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job_id))
+            await database.execute(
+                quality_progress.delete()
+                .where(quality_progress.c.job_id == job_id)
+                .where(quality_progress.c.quality.in_(qualities))
+            )
+            for quality in qualities:
+                await database.execute(
+                    transcoding_tasks.insert().values(
+                        job_id=job_id,
+                        quality=quality,
+                        status="pending",
+                        streaming_format=data.streaming_format,
+                        codec=data.streaming_codec,
+                        attempt_number=1,
+                        max_attempts=JOB_TASK_MAX_ATTEMPTS,
+                    )
+                )
+                await database.execute(
+                    quality_progress.insert().values(
+                        job_id=job_id, quality=quality, status="pending", progress_percent=0
+                    )
+                )
+
+            # Tasks carry the claims from now on
+            await database.execute(
+                transcoding_jobs.update()
+                .where(transcoding_jobs.c.id == job_id)
+                .values(worker_id=None, claim_expires_at=None, current_step="transcode", last_checkpoint=now)
+            )
+            await database.execute(workers.update().where(workers.c.id == worker["id"]).values(current_job_id=None))
 
-    # Save uploaded tar.gz to temp file using streaming writes
-    tmp_path = None
     try:
-        with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+        await execute_with_retry(do_split_transaction)
+    except DatabaseLockedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable, please retry",
+        ) from e
 
-        with open(tmp_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):
-                f.write(chunk)
-    except HTTPException:
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
-        raise
+    # The splitting worker claims the first task itself; wake others for the rest
+    for _ in range(len(qualities) - 1):
+        await notify_job_available(job_id, job["video_id"])
+
+    logger.info(f"Job {job_id} split into {len(qualities)} rendition tasks: {', '.join(qualities)}")
+    return SplitJobResponse(split=True, task_count=len(qualities), message="Job split into rendition tasks")
+
+
+@app.post("/api/worker/claim-task", response_model=ClaimTaskResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def claim_task(
+    request: Request,
+    job_id: Optional[int] = Query(None, description="Only claim a task of this job"),
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Atomically claim a pending rendition task.
+
+    Tasks of the oldest split job are handed out first so videos finish in
+    upload order. Tasks whose claim expired are released first (counting as a
+    failed attempt). The worker that split a job passes job_id: it already has
+    the source, and GPU priority does not apply to its own job.
+    """
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
+
+    if job_id is None:
+        refusal = await _claim_refusal(worker, now)
+        if refusal:
+            return ClaimTaskResponse(message=refusal)
+
+    is_postgresql = str(database.url).startswith("postgresql")
+    params = {"now": now}
+    job_filter = ""
+    if job_id is not None:
+        job_filter = "AND ts.job_id = :job_id"
+        params["job_id"] = job_id
+    select_query = f"""
+        SELECT ts.id, ts.job_id, ts.quality, ts.streaming_format, ts.codec,
+               tj.video_id, v.slug, v.duration, v.source_width, v.source_height
+        FROM transcoding_tasks ts
+        JOIN transcoding_jobs tj ON ts.job_id = tj.id
+        JOIN videos v ON tj.video_id = v.id
+        WHERE ts.status = 'pending'
+          AND tj.completed_at IS NULL
+          AND tj.worker_id IS NULL
+          AND tj.current_step = 'transcode'
+          AND v.deleted_at IS NULL
+          {job_filter}
+        ORDER BY ts.job_id ASC, ts.id ASC
+        LIMIT 1
+        {"FOR UPDATE OF ts SKIP LOCKED" if is_postgresql else ""}
+    """
+    result = {"task": None, "exhausted_jobs": {}}
+
+    async def do_claim_transaction():
+        """Release expired task claims and claim the next task - wrapped with retry logic."""
+        async with database.transaction():
+            result["exhausted_jobs"] = await _release_expired_tasks(now)
+
+            task = await database.fetch_one(sa.text(select_query).bindparams(**params))
+            if not task:
+                result["task"] = None
+                return
+            result["task"] = dict(task)
+
+            await database.execute(
+                transcoding_tasks.update()
+                .where(transcoding_tasks.c.id == task["id"])
+                .values(
+                    status="in_progress",
+                    worker_id=worker["worker_id"],
+                    claimed_at=now,
+                    claim_expires_at=expires_at,
+                )
+            )
+            await database.execute(
+                quality_progress.update()
+                .where(quality_progress.c.job_id == task["job_id"])
+                .where(quality_progress.c.quality == task["quality"])
+                .values(status="in_progress", progress_percent=0)
+            )
+            await database.execute(
+                workers.update()
+                .where(workers.c.id == worker["id"])
+                .values(current_job_id=task["job_id"], status="busy")
+            )
+
+    try:
+        await execute_with_retry(do_claim_transaction)
+    except DatabaseLockedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable, please retry",
+        ) from e
+
+    await _finish_exhausted_split_jobs(result["exhausted_jobs"])
+
+    task = result["task"]
+    if not task:
+        return ClaimTaskResponse(message="No tasks available")
+
+    return ClaimTaskResponse(
+        task_id=task["id"],
+        job_id=task["job_id"],
+        video_id=task["video_id"],
+        video_slug=task["slug"],
+        quality=task["quality"],
+        video_duration=task["duration"],
+        source_width=task["source_width"],
+        source_height=task["source_height"],
+        source_filename=_find_source_filename(task["video_id"]),
+        streaming_format=task["streaming_format"],
+        streaming_codec=task["codec"],
+        audio_bandwidth=await _audio_rendition_bandwidth(task["slug"]),
+        claim_expires_at=expires_at,
+        message="Task claimed successfully",
+    )
+
+
+async def _get_worker_task(task_id: int, worker: dict) -> dict:
+    """
+    Fetch a rendition task held by this worker.
+
+    Raises:
+        HTTPException: 404 if the task does not exist, 403 if the worker does
+            not hold it, 409 if the claim expired
+    """
+    task = await database.fetch_one(transcoding_tasks.select().where(transcoding_tasks.c.id == task_id))
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task["worker_id"] != worker["worker_id"] or task["status"] != "in_progress":
+        raise HTTPException(status_code=403, detail="Not your task")
+    if task["claim_expires_at"] and ensure_utc(task["claim_expires_at"]) < datetime.now(timezone.utc):
+        raise HTTPException(
+            status_code=409,
+            detail="Claim expired - task may have been reassigned",
+        )
+    return dict(task)
+
+
+async def _publish_split_job_progress(job_id: int) -> None:
+    """Roll the task progress of a split job up into the job and announce it."""
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+    if not job:
+        return
+    rows = await database.fetch_all(quality_progress.select().where(quality_progress.c.job_id == job_id))
+    qualities = [{"name": row["quality"], "status": row["status"], "progress": row["progress_percent"]} for row in rows]
+    average = sum(q["progress"] for q in qualities) / len(qualities) if qualities else 0
+    # Same scale as whole jobs: probing and thumbnail are the first 15%
+    progress_percent = 15 + int(average * 0.8)
+    await database.execute(
+        transcoding_jobs.update()
+        .where(transcoding_jobs.c.id == job_id)
+        .values(progress_percent=progress_percent, last_checkpoint=datetime.now(timezone.utc))
+    )
+    await Publisher.publish_progress(
+        video_id=job["video_id"],
+        job_id=job_id,
+        current_step="transcode",
+        progress_percent=progress_percent,
+        qualities=qualities,
+        status=await _running_job_video_status(job["video_id"]),
+    )
+
+
+@app.post("/api/worker/task/{task_id}/progress", response_model=ProgressUpdateResponse)
+@limiter.limit(RATE_LIMIT_WORKER_PROGRESS)
+async def update_task_progress(
+    request: Request,
+    task_id: int,
+    data: TaskProgressRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """Update a rendition task's progress and extend its claim."""
+    task = await _get_worker_task(task_id, worker)
+    new_expiry = datetime.now(timezone.utc) + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
+
+    await database.execute(
+        transcoding_tasks.update().where(transcoding_tasks.c.id == task_id).values(claim_expires_at=new_expiry)
+    )
+    await database.execute(
+        quality_progress.update()
+        .where(quality_progress.c.job_id == task["job_id"])
+        .where(quality_progress.c.quality == task["quality"])
+        .values(status=data.status, progress_percent=data.progress)
+    )
+    await _publish_split_job_progress(task["job_id"])
+
+    return ProgressUpdateResponse(status="ok", claim_expires_at=new_expiry)
+
+
+@app.post("/api/worker/task/{task_id}/complete", response_model=CompleteTaskResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def complete_task(
+    request: Request,
+    task_id: int,
+    data: CompleteTaskRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Mark a rendition task complete after its files were uploaded.
+
+    Finishes the job if this was its last task. Idempotent: completing a task
+    again returns early.
+    """
+    existing = await database.fetch_one(transcoding_tasks.select().where(transcoding_tasks.c.id == task_id))
+    if existing and existing["status"] == "completed" and existing["worker_id"] == worker["worker_id"]:
+        return CompleteTaskResponse(status="ok", message="Task already completed")
+    task = await _get_worker_task(task_id, worker)
+
+    now = datetime.now(timezone.utc)
+
+    async def do_complete_transaction():
+        """Record the rendition - wrapped with retry logic."""
+        async with database.transaction():
+            await database.execute(
+                transcoding_tasks.update()
+                .where(transcoding_tasks.c.id == task_id)
+                .values(
+                    status="completed",
+                    width=data.width,
+                    height=data.height,
+                    bitrate=data.bitrate,
+                    completed_at=now,
+                    claim_expires_at=None,
+                    last_error=None,
+                )
+            )
+            await database.execute(
+                quality_progress.update()
+                .where(quality_progress.c.job_id == task["job_id"])
+                .where(quality_progress.c.quality == task["quality"])
+                .values(status="uploaded", progress_percent=100)
+            )
+            await database.execute(workers.update().where(workers.c.id == worker["id"]).values(current_job_id=None))
+
+    try:
+        await execute_with_retry(do_complete_transaction)
+    except DatabaseLockedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable, please retry",
+        ) from e
+
+    job_finished = await _finish_split_job(task["job_id"], worker)
+    if not job_finished:
+        if PROGRESSIVE_PUBLISH_ENABLED:
+            await _publish_split_job_renditions(task["job_id"])
+        await _publish_split_job_progress(task["job_id"])
+
+    return CompleteTaskResponse(
+        status="ok",
+        job_finished=job_finished,
+        message="Task completed successfully",
+    )
+
+
+@app.post("/api/worker/task/{task_id}/fail", response_model=FailJobResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def fail_task(
+    request: Request,
+    task_id: int,
+    data: FailJobRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """Report a rendition task failure (retried by any worker while attempts remain)."""
+    task = await _get_worker_task(task_id, worker)
+    will_retry = data.retry and task["attempt_number"] < task["max_attempts"]
+    now = datetime.now(timezone.utc)
+
+    async def do_fail_transaction():
+        """Execute the failure transaction - wrapped with retry logic."""
+        async with database.transaction():
+            if will_retry:
+                task_updates = {
+                    "status": "pending",
+                    "worker_id": None,
+                    "claimed_at": None,
+                    "attempt_number": task["attempt_number"] + 1,
+                }
+            else:
+                task_updates = {"status": "failed", "completed_at": now}
+            await database.execute(
+                transcoding_tasks.update()
+                .where(transcoding_tasks.c.id == task_id)
+                .values(claim_expires_at=None, last_error=data.error_message[:500], **task_updates)
+            )
+            await database.execute(
+                quality_progress.update()
+                .where(quality_progress.c.job_id == task["job_id"])
+                .where(quality_progress.c.quality == task["quality"])
+                .values(status="pending" if will_retry else "failed", progress_percent=0)
+            )
+            await database.execute(workers.update().where(workers.c.id == worker["id"]).values(current_job_id=None))
+
+    try:
+        await execute_with_retry(do_fail_transaction)
+    except DatabaseLockedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable, please retry",
+        ) from e
+
+    logger.warning(
+        f"Task {task_id} ({task['quality']}) of job {task['job_id']} failed "
+        f"(attempt {task['attempt_number']}/{task['max_attempts']}): {data.error_message[:200]}"
+    )
+    if will_retry:
+        job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == task["job_id"]))
+        if job:
+            await notify_job_available(task["job_id"], job["video_id"])
+    else:
+        await _finish_split_job(task["job_id"], worker)
+
+    return FailJobResponse(
+        status="ok",
+        will_retry=will_retry,
+        attempt_number=task["attempt_number"] + (1 if will_retry else 0),
+    )
+
+
+async def _write_video_manifests(video, streaming_format: str, codec: str, partial: bool = False) -> None:
+    """
+    Write the master playlist (and DASH manifest for CMAF) from the video's renditions.
+
+    Args:
+        partial: Interim manifests while further renditions are still being encoded
+            (progressive publishing), marked so they are not cached as complete
+    """
+    from worker.hwaccel import VideoCodec
+    from worker.transcoder import generate_dash_manifest, generate_master_playlist, generate_master_playlist_cmaf
+
+    rows = await database.fetch_all(video_qualities.select().where(video_qualities.c.video_id == video["id"]))
+    manifest_qualities = []
+    for row in rows:
+        mq = {"name": row["quality"], "width": row["width"], "height": row["height"], "bitrate": f"{row['bitrate']}k"}
+        if row["quality"] == "original":
+            mq.update(bitrate="0k", is_original=True, bitrate_bps=row["bitrate"] * 1000)
+        manifest_qualities.append(mq)
+
+    output_dir = VIDEOS_DIR / video["slug"]
+    if streaming_format == "cmaf":
+        codec_enum = {"h264": VideoCodec.H264, "hevc": VideoCodec.HEVC, "av1": VideoCodec.AV1}.get(
+            codec, VideoCodec.AV1
+        )
+        audio_bandwidth = await _audio_rendition_bandwidth(video["slug"])
+        await generate_master_playlist_cmaf(output_dir, manifest_qualities, codec_enum, audio_bandwidth=audio_bandwidth)
+        if await get_db_setting("streaming.enable_dash", True):
+            await generate_dash_manifest(
+                output_dir,
+                manifest_qualities,
+                codec=codec_enum,
+                total_duration=video["duration"],
+                audio_bandwidth=audio_bandwidth,
+            )
+    else:
+        await generate_master_playlist(output_dir, manifest_qualities)
+
+    master_playlist_path = output_dir / "master.m3u8"
+    if not master_playlist_path.exists() or "#EXT-X-STREAM-INF" not in master_playlist_path.read_text():
+        raise RuntimeError("Master playlist was not generated")
+    if partial:
+        mark_partial_manifest(master_playlist_path)
+        if (output_dir / "manifest.mpd").exists():
+            mark_partial_manifest(output_dir / "manifest.mpd")
+    await invalidate_video_manifests(video["slug"])
+
+
+async def _publish_split_job_renditions(job_id: int) -> None:
+    """Make the completed renditions of a running split job playable (progressive publishing)."""
+    job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+    if not job or job["completed_at"] is not None or job["current_step"] != "transcode":
+        return
+    tasks = await database.fetch_all(
+        transcoding_tasks.select()
+        .where(transcoding_tasks.c.job_id == job_id)
+        .where(transcoding_tasks.c.status == "completed")
+    )
+    if not tasks:
+        return
+    qualities = [
+        {"name": task["quality"], "width": task["width"], "height": task["height"], "bitrate": task["bitrate"]}
+        for task in tasks
+    ]
+    streaming_format, codec = tasks[0]["streaming_format"], tasks[0]["codec"]
+    try:
+        await _publish_renditions(job, qualities, streaming_format, codec)
+
+        # The last task may have finished the job while the interim manifests were written
+        current_step = await database.fetch_val(
+            sa.select(transcoding_jobs.c.current_step).where(transcoding_jobs.c.id == job_id)
+        )
+        if current_step != "transcode":
+            video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
+            if video and video["status"] == "ready":
+                await _write_video_manifests(video, streaming_format, codec)
+    except Exception:
+        # The renditions are published with the rest when the job finishes
+        logger.exception(f"Failed to publish renditions of split job {job_id}")
+
+
+async def _fail_split_job(job: dict, video, error: str, worker: dict) -> None:
+    """Fail a split job for good (its tasks already used their retries)."""
+    now = datetime.now(timezone.utc)
+
+    async def do_fail_transaction():
+        async with database.transaction():
+            await database.execute(
+                transcoding_jobs.update()
+                .where(transcoding_jobs.c.id == job["id"])
+                .values(last_error=error, completed_at=now, claimed_at=None, claim_expires_at=None)
+            )
+            await database.execute(
+                videos.update().where(videos.c.id == job["video_id"]).values(status="failed", error_message=error)
+            )
+
+    await execute_with_retry(do_fail_transaction)
+    TRANSCODING_JOBS_TOTAL.labels(status="failed").inc()
+
+    from worker.transcoder import cleanup_source_file
+
+    cleanup_source_file(job["video_id"])
+
+    await Publisher.publish_job_failed(
+        job_id=job["id"],
+        video_id=job["video_id"],
+        video_slug=video["slug"] if video else "unknown",
+        worker_id=worker["worker_id"],
+        worker_name=worker["worker_name"] or worker["worker_id"][:8],
+        error=error[:200],
+        will_retry=False,
+        attempt=job["attempt_number"],
+        max_attempts=job["max_attempts"],
+    )
+
+
+async def _finish_split_job(job_id: int, worker: dict) -> bool:
+    """
+    Finish a split job once none of its tasks is pending or in progress.
+
+    Safe to call concurrently: a single caller moves the job from the
+    transcode step to master_playlist and finishes it.
+
+    Returns:
+        True if this call finished the job (completed or failed)
+    """
+    row = await database.fetch_one(
+        sa.text(
+            """
+            UPDATE transcoding_jobs SET current_step = 'master_playlist'
+            WHERE id = :job_id AND completed_at IS NULL AND worker_id IS NULL
+              AND current_step = 'transcode'
+              AND EXISTS (SELECT 1 FROM transcoding_tasks WHERE job_id = :job_id)
+              AND NOT EXISTS (
+                  SELECT 1 FROM transcoding_tasks
+                  WHERE job_id = :job_id AND status IN ('pending', 'in_progress')
+              )
+            RETURNING id
+            """
+        ).bindparams(job_id=job_id)
+    )
+    if not row:
+        return False
+
+    job = dict(await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id)))
+    video = await database.fetch_one(videos.select().where(videos.c.id == job["video_id"]))
+    tasks = await database.fetch_all(
+        transcoding_tasks.select().where(transcoding_tasks.c.job_id == job_id).order_by(transcoding_tasks.c.id)
+    )
+    completed = [task for task in tasks if task["status"] == "completed"]
+    if not completed or not video:
+        errors = "; ".join(f"{task['quality']}: {task['last_error']}" for task in tasks if task["status"] == "failed")
+        await _fail_split_job(job, video, f"All renditions failed - {errors}"[:500], worker)
+        return True
+
+    streaming_format = completed[0]["streaming_format"]
+    codec = completed[0]["codec"]
+    try:
+        async with database.transaction():
+            for task in completed:
+                existing = await database.fetch_one(
+                    video_qualities.select()
+                    .where(video_qualities.c.video_id == job["video_id"])
+                    .where(video_qualities.c.quality == task["quality"])
+                )
+                if not existing:
+                    await database.execute(
+                        video_qualities.insert().values(
+                            video_id=job["video_id"],
+                            quality=task["quality"],
+                            width=task["width"],
+                            height=task["height"],
+                            bitrate=task["bitrate"],
+                        )
+                    )
+        await _write_video_manifests(video, streaming_format, codec)
     except Exception as e:
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
-        logger.exception(f"Failed to save quality upload for video {video_id}/{quality_name}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to save upload")
+        logger.exception(f"Failed to finalize split job {job_id}")
+        await _fail_split_job(job, video, f"Failed to write manifests: {e}"[:500], worker)
+        return True
+
+    now = datetime.now(timezone.utc)
+    video_updates = {"status": "ready"}
+    if video["published_at"] is None:
+        video_updates["published_at"] = now
+    if video["streaming_format"] is None:
+        video_updates["streaming_format"] = streaming_format
+    if video["primary_codec"] is None:
+        video_updates["primary_codec"] = codec
+
+    async def do_complete_transaction():
+        async with database.transaction():
+            await database.execute(
+                transcoding_jobs.update()
+                .where(transcoding_jobs.c.id == job_id)
+                .values(
+                    completed_at=now,
+                    progress_percent=100,
+                    current_step="finalize",
+                    claimed_at=None,
+                    claim_expires_at=None,
+                )
+            )
+            await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(**video_updates))
+
+    await execute_with_retry(do_complete_transaction)
+
+    failed = [task["quality"] for task in tasks if task["status"] == "failed"]
+    if failed:
+        logger.warning(f"Split job {job_id} completed without renditions: {', '.join(failed)}")
+    logger.info(f"Split job {job_id} completed with {len(completed)} renditions")
+
+    await _after_job_completed(
+        job_id,
+        job["video_id"],
+        worker,
+        [
+            {"name": task["quality"], "width": task["width"], "height": task["height"], "bitrate": task["bitrate"]}
+            for task in completed
+        ],
+    )
+    return True
+
+
+# =============================================================================
+# File Transfer
+# =============================================================================
+
+
+# Read size when streaming a byte range of a source file
+SOURCE_RANGE_CHUNK_SIZE = 1024 * 1024
 
+
+def parse_byte_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header.
+
+    Supports "bytes=start-end", "bytes=start-" and suffix ranges "bytes=-length".
+
+    Args:
+        range_header: Value of the Range request header
+        file_size: Size of the file being served in bytes
+
+    Returns:
+        (start, end) byte offsets, inclusive, or None if the header is malformed
+        or requests multiple ranges (the whole file should be served instead)
+
+    Raises:
+        HTTPException(416) if the range starts beyond the end of the file
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep:
+        return None
     try:
-        # Run tar extraction in thread pool to avoid blocking event loop
-        # This is critical: slow NAS I/O was blocking the entire API for minutes
-        await extract_tar_async(
-            tmp_path,
-            output_dir,
-            allowed_extensions=(".m3u8", ".ts", ".m4s", ".mp4", ".jpg", ".vtt"),
-            max_files=MAX_HLS_ARCHIVE_FILES,
-            max_size=MAX_HLS_ARCHIVE_SIZE,
-            max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+        else:
+            start = max(0, file_size - int(end_str))
+            end = file_size - 1
+    except ValueError:
+        return None
+
+    if start >= file_size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    finally:
-        tmp_path.unlink(missing_ok=True)
+    if start > end:
+        return None
+    return start, min(end, file_size - 1)
+
+
+def _iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield the bytes of path from start to end (inclusive) in chunks."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(SOURCE_RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@app.get("/api/worker/source/{video_id}")
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def download_source(
+    request: Request,
+    video_id: int,
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Stream source file to worker.
+
+    Honors single byte-range requests (Range: bytes=start-[end]) with a 206 response,
+    so workers can resume interrupted downloads and start probing before the
+    download completes.
+    """
+    # Verify worker has claimed this video's job
+    job = await _find_worker_claim(video_id, worker["worker_id"])
+    if not job:
+        raise HTTPException(status_code=403, detail="Not your job or job not found")
+
+    # Check if claim has expired
+    now = datetime.now(timezone.utc)
+    if job["claim_expires_at"]:
+        claim_expiry = job["claim_expires_at"]
+        if claim_expiry.tzinfo is None:
+            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
+        if claim_expiry < now:
+            raise HTTPException(
+                status_code=409,
+                detail="Claim expired - job may have been reassigned",
+            )
+
+    # Find source file
+    source_file: Optional[Path] = None
+    for ext in SUPPORTED_VIDEO_EXTENSIONS:
+        candidate = UPLOADS_DIR / f"{video_id}{ext}"
+        if candidate.exists():
+            source_file = candidate
+            break
+
+    if not source_file:
+        raise HTTPException(status_code=404, detail="Source file not found")
+
+    range_header = request.headers.get("range")
+    if range_header:
+        file_size = source_file.stat().st_size
+        byte_range = parse_byte_range(range_header, file_size)
+        if byte_range:
+            start, end = byte_range
+            return StreamingResponse(
+                _iter_file_range(source_file, start, end),
+                status_code=206,
+                media_type="application/octet-stream",
+                headers={
+                    "Accept-Ranges": "bytes",
+                    "Content-Range": f"bytes {start}-{end}/{file_size}",
+                    "Content-Length": str(end - start + 1),
+                },
+            )
+
+    return FileResponse(
+        source_file,
+        media_type="application/octet-stream",
+        filename=source_file.name,
+        headers={"Accept-Ranges": "bytes"},
+    )
+
+
+@app.post("/api/worker/upload/{video_id}/quality/{quality_name}", response_model=StatusResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def upload_quality(
+    request: Request,
+    video_id: int,
+    quality_name: str,
+    file: Optional[UploadFile] = File(None),
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Upload a single quality's HLS files (tar archive of playlist + segments).
+
+    The archive is either a multipart tar.gz file field, or the raw request body
+    with Content-Type: application/x-tar, which is extracted while it streams in.
+
+    Called after each quality finishes transcoding. This allows:
+    - Incremental upload as qualities complete
+    - Reduced disk space on worker (delete after upload)
+    - Partial progress saved if worker crashes
+    - Server can start serving partial content earlier
+
+    Expected files in archive:
+    - {quality_name}.m3u8 (quality playlist)
+    - {quality_name}_XXXX.ts (segments)
+    """
+    job = await _find_worker_claim(video_id, worker["worker_id"], quality_name)
+    if not job:
+        raise HTTPException(status_code=403, detail="Not your job or job not found")
+
+    # Check if claim has expired
+    now = datetime.now(timezone.utc)
+    if job["claim_expires_at"]:
+        claim_expiry = job["claim_expires_at"]
+        if claim_expiry.tzinfo is None:
+            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
+        if claim_expiry < now:
+            raise HTTPException(
+                status_code=409,
+                detail="Claim expired - job may have been reassigned",
+            )
+
+    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    output_dir = VIDEOS_DIR / video["slug"]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    allowed_extensions = (".m3u8", ".ts", ".m4s", ".mp4", ".jpg", ".vtt")
+    if is_tar_stream_request(request):
+        # Streamed archive: extract straight from the request body, no temp file
+        try:
+            await extract_tar_stream_async(
+                request.stream(),
+                output_dir,
+                allowed_extensions=allowed_extensions,
+                max_files=MAX_HLS_ARCHIVE_FILES,
+                max_size=MAX_HLS_ARCHIVE_SIZE,
+                max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        if file is None:
+            raise HTTPException(status_code=400, detail="Missing archive upload")
+
+        # Save uploaded tar.gz to temp file using streaming writes
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
+                tmp_path = Path(tmp.name)
+
+            with open(tmp_path, "wb") as f:
+                while chunk := await file.read(1024 * 1024):
+                    f.write(chunk)
+        except HTTPException:
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+            logger.exception(f"Failed to save quality upload for video {video_id}/{quality_name}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to save upload")
+
+        try:
+            # Run tar extraction in thread pool to avoid blocking event loop
+            # This is critical: slow NAS I/O was blocking the entire API for minutes
+            await extract_tar_async(
+                tmp_path,
+                output_dir,
+                allowed_extensions=allowed_extensions,
+                max_files=MAX_HLS_ARCHIVE_FILES,
+                max_size=MAX_HLS_ARCHIVE_SIZE,
+                max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    await _deduplicate_segments(output_dir)
+    await record_video_storage(video_id, output_dir)
 
     # Update quality_progress to mark as uploaded
     await database.execute(
@@ -2406,87 +3833,235 @@ async def upload_finalize(
         raise HTTPException(status_code=400, detail=str(e))
     finally:
         tmp_path.unlink(missing_ok=True)
+    await record_video_storage(video_id, output_dir)
+
+    # Public API instances must stop serving cached copies of the previous manifests
+    await invalidate_video_manifests(video["slug"])
+
+    logger.info(f"Finalize files uploaded for video {video['slug']}")
+    return StatusResponse(status="ok", message="Finalize files uploaded successfully")
+
+
+@app.post("/api/worker/upload/{video_id}", response_model=StatusResponse)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def upload_hls(
+    request: Request,
+    video_id: int,
+    file: Optional[UploadFile] = File(None),
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Upload HLS output files (tar archive of video directory).
+
+    Accepts a multipart tar.gz file field or a raw application/x-tar request body.
+
+    Worker packages: master.m3u8, quality playlists, .ts segments, thumbnail.jpg
+
+    DEPRECATED: Use /upload/{video_id}/quality/{name} for incremental uploads.
+    This endpoint remains for backwards compatibility.
+    """
+    job = await database.fetch_one(
+        transcoding_jobs.select()
+        .where(transcoding_jobs.c.video_id == video_id)
+        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
+    )
+    if not job:
+        raise HTTPException(status_code=403, detail="Not your job or job not found")
+
+    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    output_dir = VIDEOS_DIR / video["slug"]
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    allowed_extensions = (".m3u8", ".ts", ".m4s", ".mp4", ".jpg", ".vtt")
+    if is_tar_stream_request(request):
+        # Streamed archive: extract straight from the request body, no temp file
+        try:
+            await extract_tar_stream_async(
+                request.stream(),
+                output_dir,
+                allowed_extensions=allowed_extensions,
+                max_files=MAX_HLS_ARCHIVE_FILES,
+                max_size=MAX_HLS_ARCHIVE_SIZE,
+                max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        if file is None:
+            raise HTTPException(status_code=400, detail="Missing archive upload")
+
+        # Save uploaded tar.gz to temp file using streaming writes to avoid memory exhaustion
+        tmp_path = None
+        try:
+            # Create temp file path
+            with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
+                tmp_path = Path(tmp.name)
+
+            # Stream file contents to disk in chunks
+            with open(tmp_path, "wb") as f:
+                while chunk := await file.read(1024 * 1024):  # 1MB chunks
+                    f.write(chunk)
+        except HTTPException:
+            # Cleanup temp file on error
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            # Cleanup temp file on error
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+            logger.exception(f"Failed to save upload for video {video_id}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to save upload")
+
+        try:
+            # Run tar extraction in thread pool to avoid blocking event loop
+            # This is critical: slow NAS I/O was blocking the entire API for minutes
+            await extract_tar_async(
+                tmp_path,
+                output_dir,
+                allowed_extensions=allowed_extensions,
+                max_files=MAX_HLS_ARCHIVE_FILES,
+                max_size=MAX_HLS_ARCHIVE_SIZE,
+                max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
-    logger.info(f"Finalize files uploaded for video {video['slug']}")
-    return StatusResponse(status="ok", message="Finalize files uploaded successfully")
+    await _deduplicate_segments(output_dir)
+    await record_video_storage(video_id, output_dir)
+    await invalidate_video_manifests(video["slug"])
 
+    return StatusResponse(status="ok", message="HLS files uploaded successfully")
 
-@app.post("/api/worker/upload/{video_id}", response_model=StatusResponse)
-@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
-async def upload_hls(
-    request: Request,
-    video_id: int,
-    file: UploadFile = File(...),
-    worker: dict = Depends(verify_worker_key),
-):
+
+# =============================================================================
+# Streaming Segment Upload (Issue #478)
+# =============================================================================
+
+
+async def _find_worker_claim(video_id: int, worker_id: str, quality: Optional[str] = None) -> Optional[dict]:
     """
-    Upload HLS output files (tar.gz archive of video directory).
+    The claim a worker holds on a video's job.
 
-    Worker packages: master.m3u8, quality playlists, .ts segments, thumbnail.jpg
+    That is either the whole job, or an in-progress rendition sub-task of a split
+    job (restricted to quality when one is given). Sub-task claims carry their
+    own expiry and task_id, so callers extend the right claim (see _extend_claim).
 
-    DEPRECATED: Use /upload/{video_id}/quality/{name} for incremental uploads.
-    This endpoint remains for backwards compatibility.
+    Returns:
+        Dict with the job id, video_id, claim_expires_at and task_id (None for
+        whole-job claims), or None if the worker holds no claim
     """
     job = await database.fetch_one(
         transcoding_jobs.select()
         .where(transcoding_jobs.c.video_id == video_id)
-        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
+        .where(transcoding_jobs.c.worker_id == worker_id)
     )
-    if not job:
-        raise HTTPException(status_code=403, detail="Not your job or job not found")
+    if job:
+        return {"id": job["id"], "video_id": video_id, "claim_expires_at": job["claim_expires_at"], "task_id": None}
 
-    video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
-    if not video:
-        raise HTTPException(status_code=404, detail="Video not found")
+    query = (
+        sa.select(transcoding_tasks.c.id, transcoding_tasks.c.job_id, transcoding_tasks.c.claim_expires_at)
+        .select_from(transcoding_tasks.join(transcoding_jobs, transcoding_tasks.c.job_id == transcoding_jobs.c.id))
+        .where(transcoding_jobs.c.video_id == video_id)
+        .where(transcoding_tasks.c.worker_id == worker_id)
+        .where(transcoding_tasks.c.status == "in_progress")
+        .where(transcoding_jobs.c.worker_id.is_(None))
+        .where(transcoding_jobs.c.current_step == "transcode")
+    )
+    if quality is not None:
+        query = query.where(transcoding_tasks.c.quality == quality)
+    task = await database.fetch_one(query)
+    if not task:
+        return None
+    return {
+        "id": task["job_id"],
+        "video_id": video_id,
+        "claim_expires_at": task["claim_expires_at"],
+        "task_id": task["id"],
+    }
 
-    output_dir = VIDEOS_DIR / video["slug"]
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save uploaded tar.gz to temp file using streaming writes to avoid memory exhaustion
-    tmp_path = None
-    try:
-        # Create temp file path
-        with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+async def _extend_claim(claim: dict, expires_at: datetime) -> None:
+    """Extend a claim from _find_worker_claim to expires_at."""
+    if claim["task_id"] is not None:
+        await database.execute(
+            transcoding_tasks.update()
+            .where(transcoding_tasks.c.id == claim["task_id"])
+            .values(claim_expires_at=expires_at)
+        )
+    else:
+        await database.execute(
+            transcoding_jobs.update().where(transcoding_jobs.c.id == claim["id"]).values(claim_expires_at=expires_at)
+        )
 
-        # Stream file contents to disk in chunks
-        with open(tmp_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):  # 1MB chunks
-                f.write(chunk)
-    except HTTPException:
-        # Cleanup temp file on error
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
-        raise
-    except Exception as e:
-        # Cleanup temp file on error
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
-        logger.exception(f"Failed to save upload for video {video_id}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to save upload")
 
-    try:
-        # Run tar extraction in thread pool to avoid blocking event loop
-        # This is critical: slow NAS I/O was blocking the entire API for minutes
-        await extract_tar_async(
-            tmp_path,
-            output_dir,
-            allowed_extensions=(".m3u8", ".ts", ".m4s", ".mp4", ".jpg", ".vtt"),
-            max_files=MAX_HLS_ARCHIVE_FILES,
-            max_size=MAX_HLS_ARCHIVE_SIZE,
-            max_single_file=MAX_HLS_SINGLE_FILE_SIZE,
+async def _get_segment_upload_job(video_id: int, worker_id: int, quality: Optional[str] = None) -> dict:
+    """
+    Fetch the job a worker is uploading segments for, verifying ownership and claim.
+
+    Workers holding a rendition sub-task of a split job may upload that quality.
+
+    Returns:
+        Claim dict (see _find_worker_claim) with the video slug added
+
+    Raises:
+        HTTPException: 403 if the worker doesn't own the job, 409 if the claim expired
+    """
+    # FOR UPDATE prevents race conditions during claim verification
+    db_url = str(database.url)
+    is_postgresql = db_url.startswith("postgresql")
+
+    if is_postgresql:
+        job = await database.fetch_one(
+            sa.text("""
+                SELECT tj.id, tj.claim_expires_at, v.slug
+                FROM transcoding_jobs tj
+                JOIN videos v ON tj.video_id = v.id
+                WHERE tj.video_id = :video_id
+                  AND tj.worker_id = :worker_id
+                FOR UPDATE OF tj
+            """).bindparams(video_id=video_id, worker_id=worker_id)
+        )
+    else:
+        job = await database.fetch_one(
+            sa.text("""
+                SELECT tj.id, tj.claim_expires_at, v.slug
+                FROM transcoding_jobs tj
+                JOIN videos v ON tj.video_id = v.id
+                WHERE tj.video_id = :video_id
+                  AND tj.worker_id = :worker_id
+            """).bindparams(video_id=video_id, worker_id=worker_id)
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    finally:
-        tmp_path.unlink(missing_ok=True)
 
-    return StatusResponse(status="ok", message="HLS files uploaded successfully")
+    if job:
+        job = {**dict(job), "video_id": video_id, "task_id": None}
+    else:
+        job = await _find_worker_claim(video_id, worker_id, quality)
+        if job:
+            video = await database.fetch_one(videos.select().where(videos.c.id == video_id))
+            job = {**job, "slug": video["slug"]} if video else None
 
+    if not job:
+        raise HTTPException(status_code=403, detail="Not your job")
 
-# =============================================================================
-# Streaming Segment Upload (Issue #478)
-# =============================================================================
+    # Check if claim has expired
+    now = datetime.now(timezone.utc)
+    if job["claim_expires_at"]:
+        claim_expiry = job["claim_expires_at"]
+        if claim_expiry.tzinfo is None:
+            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
+        if claim_expiry < now:
+            raise HTTPException(
+                status_code=409,
+                detail="Claim expired",
+            )
+
+    return job
 
 
 @app.post(
@@ -2542,46 +4117,8 @@ async def upload_segment(
         raise HTTPException(status_code=400, detail="Invalid request")
 
     # Verify worker owns this job with DB lock (Bruce's recommendation)
-    # FOR UPDATE prevents race conditions during claim verification
-    db_url = str(database.url)
-    is_postgresql = db_url.startswith("postgresql")
-
-    if is_postgresql:
-        job = await database.fetch_one(
-            sa.text("""
-                SELECT tj.id, tj.claim_expires_at, v.slug
-                FROM transcoding_jobs tj
-                JOIN videos v ON tj.video_id = v.id
-                WHERE tj.video_id = :video_id
-                  AND tj.worker_id = :worker_id
-                FOR UPDATE OF tj
-            """).bindparams(video_id=video_id, worker_id=worker["worker_id"])
-        )
-    else:
-        job = await database.fetch_one(
-            sa.text("""
-                SELECT tj.id, tj.claim_expires_at, v.slug
-                FROM transcoding_jobs tj
-                JOIN videos v ON tj.video_id = v.id
-                WHERE tj.video_id = :video_id
-                  AND tj.worker_id = :worker_id
-            """).bindparams(video_id=video_id, worker_id=worker["worker_id"])
-        )
-
-    if not job:
-        raise HTTPException(status_code=403, detail="Not your job")
-
-    # Check if claim has expired
+    job = await _get_segment_upload_job(video_id, worker["worker_id"], quality)
     now = datetime.now(timezone.utc)
-    if job["claim_expires_at"]:
-        claim_expiry = job["claim_expires_at"]
-        if claim_expiry.tzinfo is None:
-            claim_expiry = claim_expiry.replace(tzinfo=timezone.utc)
-        if claim_expiry < now:
-            raise HTTPException(
-                status_code=409,
-                detail="Claim expired",
-            )
 
     # Build destination path with canonical resolution (Bruce's recommendation)
     video_slug = job["slug"]
@@ -2664,23 +4201,11 @@ async def upload_segment(
 
     # Issue #207: Track storage bytes for new/overwritten segments
     # If overwriting, adjust for the old file size to maintain accuracy
-    if old_file_size > 0:
-        # Overwrite case: net change = new size - old size
-        net_change = bytes_written - old_file_size
-        if net_change > 0:
-            STORAGE_VIDEOS_BYTES.inc(net_change)
-        elif net_change < 0:
-            STORAGE_VIDEOS_BYTES.dec(abs(net_change))
-        # If net_change == 0, no adjustment needed
-    else:
-        # New file case
-        STORAGE_VIDEOS_BYTES.inc(bytes_written)
+    await _adjust_storage_bytes(video_id, quality, bytes_written, old_file_size)
 
     # Extend claim on successful upload (each upload keeps claim alive)
     new_expiry = now + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
-    await database.execute(
-        transcoding_jobs.update().where(transcoding_jobs.c.id == job["id"]).values(claim_expires_at=new_expiry)
-    )
+    await _extend_claim(job, new_expiry)
 
     logger.debug(f"Segment {quality}/{filename} uploaded for video {video_slug}")
     return SegmentUploadResponse(
@@ -2691,6 +4216,223 @@ async def upload_segment(
     )
 
 
+async def _adjust_storage_bytes(video_id: int, quality: str, bytes_written: int, old_file_size: int) -> None:
+    """Track storage bytes for a new or overwritten segment (Issue #207) in the storage ledger."""
+    await add_video_storage_bytes(video_id, quality, bytes_written - old_file_size)
+
+
+@app.post(
+    "/api/worker/upload/{video_id}/segments/{quality}/batch",
+    response_model=SegmentBatchUploadResponse,
+)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def upload_segment_batch(
+    request: Request,
+    video_id: int,
+    quality: str,
+    x_segment_manifest: str = Header(..., alias="X-Segment-Manifest"),
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Upload several segments of one quality in a single request.
+
+    The X-Segment-Manifest header is a JSON list of {filename, size, sha256}
+    entries and the body is the segments' bytes concatenated in manifest order.
+    Job ownership is verified and the claim extended once per batch, and the
+    segments are written with a single group commit instead of one fsync'd
+    request each. Every segment gets the same validation as upload_segment().
+
+    Returns per-segment results: a bad segment (checksum, magic bytes) fails on
+    its own without rejecting the rest of the batch.
+    """
+    try:
+        SegmentQuality.validate(quality)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+    # Parse and validate the manifest before touching the database
+    try:
+        manifest = [SegmentBatchItem(**entry) for entry in json.loads(x_segment_manifest)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid segment manifest")
+    if not manifest or len(manifest) > MAX_SEGMENT_BATCH_FILES:
+        raise HTTPException(status_code=400, detail=f"Batch must contain 1-{MAX_SEGMENT_BATCH_FILES} segments")
+    if len({item.filename for item in manifest}) != len(manifest):
+        raise HTTPException(status_code=400, detail="Duplicate filename in batch")
+    for item in manifest:
+        if not validate_segment_filename(item.filename):
+            logger.warning(f"Invalid segment filename rejected: {item.filename!r}")
+            raise HTTPException(status_code=400, detail="Invalid request")
+        if item.size > MAX_HLS_SINGLE_FILE_SIZE:
+            raise HTTPException(status_code=400, detail="File too large")
+    total_size = sum(item.size for item in manifest)
+    if len(manifest) > 1 and total_size > MAX_SEGMENT_BATCH_BYTES:
+        raise HTTPException(status_code=413, detail="Batch too large")
+
+    job = await _get_segment_upload_job(video_id, worker["worker_id"], quality)
+    now = datetime.now(timezone.utc)
+
+    output_dir = (VIDEOS_DIR / job["slug"] / quality).resolve()
+    try:
+        output_dir.relative_to(VIDEOS_DIR.resolve())
+    except ValueError:
+        logger.warning(f"Path traversal attempt blocked: {output_dir}")
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+    # Stream the body with the size declared by the manifest as the limit
+    chunks = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > total_size:
+            raise HTTPException(status_code=400, detail="Body does not match manifest")
+        chunks.append(chunk)
+    if received != total_size:
+        raise HTTPException(status_code=400, detail="Body does not match manifest")
+    body = b"".join(chunks)
+
+    results: dict[str, SegmentBatchResult] = {}
+    to_write = []
+    offset = 0
+    for item in manifest:
+        data = body[offset : offset + item.size]
+        offset += item.size
+        if not validate_segment_magic_bytes(data, item.filename):
+            logger.warning(f"Magic byte validation failed for {item.filename}")
+            results[item.filename] = SegmentBatchResult(
+                filename=item.filename, status="error", error="Invalid file format"
+            )
+            continue
+        to_write.append((item.filename, data, item.sha256.removeprefix("sha256:")))
+
+    if to_write:
+        loop = asyncio.get_event_loop()
+        try:
+            written = await loop.run_in_executor(
+                _io_executor, functools.partial(_write_segment_batch_sync, to_write, output_dir)
+            )
+        except Exception as e:
+            logger.exception(f"Failed to write segment batch for video {video_id}/{quality}: {e}")
+            raise HTTPException(status_code=500, detail="Write failed")
+
+        for filename, error, was_written, bytes_written, old_size in written:
+            if error:
+                results[filename] = SegmentBatchResult(filename=filename, status="error", error=error)
+                continue
+            if was_written:
+                await _adjust_storage_bytes(video_id, quality, bytes_written, old_size)
+            results[filename] = SegmentBatchResult(
+                filename=filename,
+                status="ok",
+                written=was_written,
+                bytes_written=bytes_written,
+                checksum_verified=True,
+            )
+
+    ordered = [results[item.filename] for item in manifest]
+    if any(result.status == "ok" for result in ordered):
+        # Extend claim once for the whole batch
+        new_expiry = now + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
+        await _extend_claim(job, new_expiry)
+
+    logger.debug(f"Segment batch of {len(manifest)} uploaded to {quality} for video {job['slug']}")
+    return SegmentBatchUploadResponse(
+        status="ok" if all(result.status == "ok" for result in ordered) else "partial",
+        results=ordered,
+    )
+
+
+@app.post(
+    "/api/worker/upload/{video_id}/segments/{quality}/link",
+    response_model=SegmentLinkResponse,
+)
+@limiter.limit(RATE_LIMIT_WORKER_DEFAULT)
+async def link_segments(
+    request: Request,
+    video_id: int,
+    quality: str,
+    data: SegmentLinkRequest,
+    worker: dict = Depends(verify_worker_key),
+):
+    """
+    Place segments from the segment store instead of uploading them.
+
+    Workers send the filename, size and SHA-256 of segments before uploading
+    them. Segments whose content the server already has (e.g. unchanged
+    renditions of a re-transcode) are linked into the video directory and need
+    no upload; the rest are returned as missing.
+
+    Returns 404 when the segment store is disabled, so workers stop asking.
+    """
+    if not SEGMENT_STORE_ENABLED:
+        raise HTTPException(status_code=404, detail="Segment store disabled")
+
+    try:
+        SegmentQuality.validate(quality)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+    items = data.segments
+    if not items or len(items) > MAX_SEGMENT_BATCH_FILES:
+        raise HTTPException(status_code=400, detail=f"Request must contain 1-{MAX_SEGMENT_BATCH_FILES} segments")
+    for item in items:
+        if not validate_segment_filename(item.filename):
+            logger.warning(f"Invalid segment filename rejected: {item.filename!r}")
+            raise HTTPException(status_code=400, detail="Invalid request")
+        if item.size > MAX_HLS_SINGLE_FILE_SIZE:
+            raise HTTPException(status_code=400, detail="File too large")
+
+    job = await _get_segment_upload_job(video_id, worker["worker_id"], quality)
+    now = datetime.now(timezone.utc)
+
+    output_dir = (VIDEOS_DIR / job["slug"] / quality).resolve()
+    try:
+        output_dir.relative_to(VIDEOS_DIR.resolve())
+    except ValueError:
+        logger.warning(f"Path traversal attempt blocked: {output_dir}")
+        raise HTTPException(status_code=400, detail="Invalid request")
+
+    def link_all() -> list[tuple[bool, int]]:
+        """Link each segment; returns (linked, size of the file it replaced)."""
+        found = []
+        for item in items:
+            checksum = item.sha256.removeprefix("sha256:").lower()
+            dest_path = output_dir / item.filename
+            try:
+                old_size = dest_path.stat().st_size
+            except OSError:
+                old_size = 0
+            try:
+                found.append((link_segment(checksum, item.size, dest_path), old_size))
+            except ValueError:
+                found.append((False, 0))
+        return found
+
+    loop = asyncio.get_event_loop()
+    try:
+        found = await loop.run_in_executor(_io_executor, link_all)
+    except OSError as e:
+        logger.exception(f"Failed to link segments for video {video_id}/{quality}: {e}")
+        raise HTTPException(status_code=500, detail="Link failed")
+
+    linked = [item.filename for item, (ok, _) in zip(items, found) if ok]
+    missing = [item.filename for item, (ok, _) in zip(items, found) if not ok]
+    if linked:
+        # Files that were already linked or replaced count only their change in size
+        await _adjust_storage_bytes(
+            video_id,
+            quality,
+            sum(item.size for item, (ok, _) in zip(items, found) if ok),
+            sum(old_size for ok, old_size in found if ok),
+        )
+        # Linking counts as upload progress: extend the claim
+        new_expiry = now + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
+        await _extend_claim(job, new_expiry)
+
+    logger.debug(f"Linked {len(linked)}/{len(items)} {quality} segments from the segment store for {job['slug']}")
+    return SegmentLinkResponse(linked=linked, missing=missing)
+
+
 @app.get(
     "/api/worker/upload/{video_id}/segments/status",
     response_model=SegmentStatusResponse,
@@ -2722,11 +4464,7 @@ async def get_segments_status(
         raise HTTPException(status_code=400, detail="Invalid quality")
 
     # Verify worker owns this job
-    job = await database.fetch_one(
-        transcoding_jobs.select()
-        .where(transcoding_jobs.c.video_id == video_id)
-        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
-    )
+    job = await _find_worker_claim(video_id, worker["worker_id"], quality)
     if not job:
         raise HTTPException(status_code=403, detail="Not your job")
 
@@ -2802,11 +4540,7 @@ async def finalize_segment_upload(
     quality = data.quality
 
     # Verify worker owns this job with claim check
-    job = await database.fetch_one(
-        transcoding_jobs.select()
-        .where(transcoding_jobs.c.video_id == video_id)
-        .where(transcoding_jobs.c.worker_id == worker["worker_id"])
-    )
+    job = await _find_worker_claim(video_id, worker["worker_id"], quality)
     if not job:
         raise HTTPException(status_code=403, detail="Not your job")
 
@@ -2914,9 +4648,10 @@ async def finalize_segment_upload(
 
         # Extend claim
         new_expiry = now + timedelta(minutes=WORKER_CLAIM_DURATION_MINUTES)
-        await database.execute(
-            transcoding_jobs.update().where(transcoding_jobs.c.id == job["id"]).values(claim_expires_at=new_expiry)
-        )
+        await _extend_claim(job, new_expiry)
+
+    # Playlists and overwritten segments are not tracked per upload: re-measure the video
+    await record_video_storage(video_id, VIDEOS_DIR / video["slug"])
 
     logger.info(f"Quality {quality} finalized for video {video['slug']} ({actual_count} segments)")
     return SegmentFinalizeResponse(
@@ -3032,6 +4767,7 @@ async def revoke_worker(
 
     # Mark worker as disabled
     await database.execute(workers.update().where(workers.c.id == worker["id"]).values(status="disabled"))
+    await invalidate_worker_key_cache(worker["id"])
 
     return StatusResponse(status="ok", message=f"Worker {worker_id} has been revoked")
 
@@ -3307,6 +5043,9 @@ async def upload_reencode_result(
         finally:
             tmp_path.unlink(missing_ok=True)
 
+        # Serve the swapped-in files from VIDEOS_DIR until they are republished
+        await database.execute(videos.update().where(videos.c.id == job["video_id"]).values(**STORAGE_SYNC_RESET))
+
         # Atomic swap
         if video_dir.exists():
             shutil.move(str(video_dir), str(backup_dir))
@@ -3335,6 +5074,9 @@ async def upload_reencode_result(
         # Clean up backup
         if backup_dir.exists():
             shutil.rmtree(backup_dir, ignore_errors=True)
+        await record_video_storage(job["video_id"], video_dir)
+
+        schedule_video_publish(video["slug"])
 
         return {"status": "success", "message": "Re-encode upload complete"}
 
@@ -4,8 +4,11 @@ import asyncio
 import hashlib
 import hmac
 import logging
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
@@ -14,7 +17,8 @@ from fastapi.security import APIKeyHeader
 
 from api.common import ensure_utc
 from api.database import database, worker_api_keys, workers
-from config import TRUSTED_PROXIES
+from api.pubsub import Publisher, Subscriber, channel_name
+from config import REDIS_URL, TRUSTED_PROXIES, WORKER_AUTH_CACHE_MAX_SIZE, WORKER_AUTH_CACHE_TTL
 
 # Security event logger - separate from regular application logging
 # Configure with appropriate handlers for security monitoring/SIEM integration
@@ -40,6 +44,115 @@ _password_hasher = PasswordHasher(
 )
 
 
+# Delay before re-subscribing to key revocations after a Redis error (seconds)
+KEY_REVOCATION_RESUBSCRIBE_DELAY = 5.0
+
+
+class VerifiedKeyCache:
+    """
+    In-memory TTL cache of successfully verified worker API keys.
+
+    Maps a presented key to its worker_api_keys record so repeat requests skip
+    the deliberately slow argon2id verification. Keys are stored as an HMAC-SHA256
+    digest under a per-process random secret, so the plaintext key is never held
+    by the cache.
+
+    Entries are evicted by TTL, by LRU when full, and immediately when a worker's
+    keys are revoked (invalidate_worker). Each invalidation bumps a generation
+    counter; a verification that started before it cannot repopulate the cache
+    with a key that was revoked mid-request.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_size: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Time to live in seconds for cache entries (0 disables caching)
+            max_size: Maximum number of entries before evicting least recently used
+        """
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._secret = secrets.token_bytes(32)
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass to set() to detect races."""
+        return self._generation
+
+    def _digest(self, api_key: str) -> bytes:
+        """Compute the cache key for a presented API key."""
+        return hmac.new(self._secret, api_key.encode(), hashlib.sha256).digest()
+
+    def get(self, api_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached key record for a presented API key.
+
+        Returns:
+            A copy of the key record if cached and not expired, None otherwise
+        """
+        if self._ttl <= 0:
+            return None
+        digest = self._digest(api_key)
+        cached = self._entries.get(digest)
+        if cached is None:
+            return None
+        record, cached_at = cached
+        if time.monotonic() - cached_at > self._ttl:
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return dict(record)
+
+    def set(self, api_key: str, record: Dict[str, Any], generation: int) -> None:
+        """
+        Cache a verified key record.
+
+        Args:
+            api_key: The plaintext API key that was verified
+            record: The matching worker_api_keys record
+            generation: The value of `generation` read before the record was fetched;
+                the entry is dropped if any invalidation happened since
+        """
+        if self._ttl <= 0 or generation != self._generation:
+            return
+        digest = self._digest(api_key)
+        self._entries[digest] = (dict(record), time.monotonic())
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_worker(self, worker_id: int) -> int:
+        """
+        Evict every cached key belonging to a worker.
+
+        Args:
+            worker_id: Worker database ID (workers.id)
+
+        Returns:
+            Number of entries removed
+        """
+        self._generation += 1
+        stale = [digest for digest, (record, _) in self._entries.items() if record["worker_id"] == worker_id]
+        for digest in stale:
+            del self._entries[digest]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Evict all entries."""
+        self._generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_verified_key_cache = VerifiedKeyCache(ttl_seconds=WORKER_AUTH_CACHE_TTL, max_size=WORKER_AUTH_CACHE_MAX_SIZE)
+_revocation_listener_task: Optional[asyncio.Task] = None
+
+
 def hash_api_key(key: str) -> Tuple[str, int]:
     """
     Hash an API key using argon2id.
@@ -129,7 +242,8 @@ async def authenticate_api_key(api_key: str, request: Optional[Request] = None)
 
     This is a shared helper used by both verify_worker_key() and admin endpoints.
     It handles the prefix-based lookup and hash verification for both argon2id
-    and legacy SHA-256 keys.
+    and legacy SHA-256 keys. Successful verifications are cached (see
+    VerifiedKeyCache); expiry is checked by the caller on every request.
 
     Args:
         api_key: The plaintext API key from the request header
@@ -158,6 +272,11 @@ async def authenticate_api_key(api_key: str, request: Optional[Request] = None)
 
     prefix = get_key_prefix(api_key)
 
+    cached = _verified_key_cache.get(api_key)
+    if cached is not None:
+        return cached
+    generation = _verified_key_cache.generation
+
     # Query database for ALL matching keys by prefix (non-revoked only)
     # Multiple keys may share a prefix (1 in 2^32 collision chance per key)
     # We must check each candidate to find the matching one
@@ -180,11 +299,16 @@ async def authenticate_api_key(api_key: str, request: Optional[Request] = None)
         raise HTTPException(status_code=401, detail="Invalid API key")
 
     # Try each candidate key with matching prefix
+    # argon2id is deliberately slow (~tens of ms, 64MB), so verify off the event loop
     for key_record in key_records:
         hash_version = _get_hash_version(key_record)
-        if verify_api_key_hash(api_key, key_record["key_hash"], hash_version, key_prefix=prefix):
+        if await asyncio.to_thread(
+            verify_api_key_hash, api_key, key_record["key_hash"], hash_version, prefix
+        ):
             # Found matching key
-            return dict(key_record)
+            record = dict(key_record)
+            _verified_key_cache.set(api_key, record, generation)
+            return record
 
     # None of the candidates matched - log with first candidate's version for debugging
     security_logger.warning(
@@ -352,3 +476,71 @@ async def get_worker_by_id(worker_id: str) -> Optional[dict]:
     """Get a worker by its UUID."""
     worker = await database.fetch_one(workers.select().where(workers.c.worker_id == worker_id))
     return dict(worker) if worker else None
+
+
+async def invalidate_worker_key_cache(worker_id: int) -> None:
+    """
+    Evict a worker's API keys from the verified-key cache.
+
+    Call after revoking a worker's keys. Evicts locally, then broadcasts the
+    revocation so other API instances evict as well (no-op without Redis; their
+    entries then expire after VLOG_WORKER_AUTH_CACHE_TTL).
+
+    Args:
+        worker_id: Worker database ID (workers.id, not the UUID)
+    """
+    removed = _verified_key_cache.invalidate_worker(worker_id)
+    logger.debug(f"Evicted {removed} cached API key(s) for worker {worker_id}")
+    await Publisher.publish_worker_keys_revoked(worker_id)
+
+
+async def _listen_for_key_revocations() -> None:
+    """Background task evicting cached keys revoked on other API instances."""
+    while True:
+        subscriber = Subscriber()
+        try:
+            if await subscriber.subscribe(channel_name("workers", "keys_revoked")):
+                async for message in subscriber.listen():
+                    worker_id = message.get("worker_id")
+                    if isinstance(worker_id, int):
+                        _verified_key_cache.invalidate_worker(worker_id)
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.warning(f"Worker key revocation listener error: {e}")
+        finally:
+            await subscriber.close()
+
+        # Revocations published while disconnected were missed; start from an empty cache
+        _verified_key_cache.clear()
+        await asyncio.sleep(KEY_REVOCATION_RESUBSCRIBE_DELAY)
+
+
+def start_key_revocation_listener() -> Optional[asyncio.Task]:
+    """
+    Start listening for worker key revocations from other API instances.
+
+    Returns:
+        The asyncio Task, or None if Redis is not configured or caching is disabled.
+    """
+    global _revocation_listener_task
+
+    if not REDIS_URL or WORKER_AUTH_CACHE_TTL <= 0:
+        return None
+
+    if _revocation_listener_task is None or _revocation_listener_task.done():
+        _revocation_listener_task = asyncio.create_task(_listen_for_key_revocations())
+    return _revocation_listener_task
+
+
+async def stop_key_revocation_listener() -> None:
+    """Stop the key revocation listener task."""
+    global _revocation_listener_task
+
+    if _revocation_listener_task and not _revocation_listener_task.done():
+        _revocation_listener_task.cancel()
+        try:
+            await _revocation_listener_task
+        except asyncio.CancelledError:
+            pass
+    _revocation_listener_task = None
@@ -236,6 +236,12 @@ class ClaimJobResponse(BaseModel):
     source_filename: Optional[str] = None
     claim_expires_at: Optional[datetime] = None
     existing_qualities: Optional[List[str]] = None  # Qualities already transcoded (skip these)
+    # No job, but rendition sub-tasks of split jobs are waiting (claim them via /claim-task)
+    tasks_available: bool = False
+    # Encode the cheapest rendition first and publish renditions as they are uploaded
+    progressive_publish: bool = False
+    # Bandwidth (bits/s) of the video's shared audio rendition; if set, renditions are video-only
+    audio_bandwidth: Optional[int] = None
     message: str
 
 
@@ -306,6 +312,28 @@ class CompleteJobResponse(BaseModel):
     message: str
 
 
+class PublishRenditionsRequest(BaseModel):
+    """Renditions uploaded so far, to make playable before the job finishes."""
+
+    qualities: List[QualityInfo] = Field(..., min_length=1, max_length=7)
+    streaming_format: str = Field(pattern="^(hls_ts|cmaf)$")
+    streaming_codec: str = Field(pattern="^(h264|hevc|av1)$")
+
+    @field_validator("qualities")
+    @classmethod
+    def validate_qualities(cls, v: List[QualityInfo]) -> List[QualityInfo]:
+        for quality in v:
+            SegmentQuality.validate(quality.name)
+        return v
+
+
+class PublishRenditionsResponse(BaseModel):
+    status: str
+    # Renditions in the video's manifests after this call
+    published: List[str] = []
+    message: str
+
+
 # Job failure
 class FailJobRequest(BaseModel):
     error_message: str = Field(..., max_length=500)
@@ -318,6 +346,67 @@ class FailJobResponse(BaseModel):
     attempt_number: int
 
 
+# Rendition-level job splitting
+class SplitJobRequest(BaseModel):
+    """Renditions to produce for a probed job (original remux included), most expensive first."""
+
+    qualities: List[str] = Field(..., min_length=1, max_length=7)
+    streaming_format: str = Field(pattern="^(hls_ts|cmaf)$")
+    streaming_codec: str = Field(pattern="^(h264|hevc|av1)$")
+
+    @field_validator("qualities")
+    @classmethod
+    def validate_qualities(cls, v: List[str]) -> List[str]:
+        for quality in v:
+            SegmentQuality.validate(quality)
+        if len(set(v)) != len(v):
+            raise ValueError("Duplicate qualities")
+        return v
+
+
+class SplitJobResponse(BaseModel):
+    # False: the job was not split and the worker transcodes it whole
+    split: bool
+    task_count: int = 0
+    message: str
+
+
+class ClaimTaskResponse(BaseModel):
+    task_id: Optional[int] = None
+    job_id: Optional[int] = None
+    video_id: Optional[int] = None
+    video_slug: Optional[str] = None
+    quality: Optional[str] = None
+    video_duration: Optional[float] = None
+    source_width: Optional[int] = None
+    source_height: Optional[int] = None
+    source_filename: Optional[str] = None
+    streaming_format: Optional[str] = None
+    streaming_codec: Optional[str] = None
+    # Bandwidth (bits/s) of the video's shared audio rendition; if set, encode video only
+    audio_bandwidth: Optional[int] = None
+    claim_expires_at: Optional[datetime] = None
+    message: str
+
+
+class TaskProgressRequest(BaseModel):
+    status: str = Field(default="in_progress", pattern="^(in_progress|uploading)$")
+    progress: int = Field(ge=0, le=100)
+
+
+class CompleteTaskRequest(BaseModel):
+    width: int = Field(ge=0)
+    height: int = Field(ge=0)
+    bitrate: int = Field(ge=0)  # kbps
+
+
+class CompleteTaskResponse(BaseModel):
+    status: str
+    # True when this was the job's last task and the video was finalized
+    job_finished: bool = False
+    message: str
+
+
 # Worker listing (for admin/CLI)
 class WorkerStatusResponse(BaseModel):
     id: int
@@ -384,6 +473,45 @@ class SegmentUploadResponse(BaseModel):
     checksum_verified: bool
 
 
+class SegmentBatchItem(BaseModel):
+    """One segment in a batched upload manifest (X-Segment-Manifest header)."""
+
+    filename: str = Field(max_length=255)
+    size: int = Field(ge=0)
+    sha256: str = Field(min_length=64, max_length=71, description="Hex digest, optionally 'sha256:' prefixed")
+
+
+class SegmentBatchResult(BaseModel):
+    """Per-segment result of a batched upload."""
+
+    filename: str
+    status: str  # "ok" or "error"
+    written: bool = False
+    bytes_written: int = 0
+    checksum_verified: bool = False
+    error: Optional[str] = None
+
+
+class SegmentBatchUploadResponse(BaseModel):
+    """Response from the batched segment upload endpoint."""
+
+    status: str  # "ok" if every segment was stored, otherwise "partial"
+    results: List[SegmentBatchResult]
+
+
+class SegmentLinkRequest(BaseModel):
+    """Segments a worker wants placed from the server's segment store instead of uploading."""
+
+    segments: List[SegmentBatchItem]
+
+
+class SegmentLinkResponse(BaseModel):
+    """Response from the segment link endpoint."""
+
+    linked: List[str]  # In place from the segment store, no upload needed
+    missing: List[str]  # Not in the store, must be uploaded
+
+
 class SegmentStatusResponse(BaseModel):
     """Response from segments status endpoint."""
 
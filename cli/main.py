@@ -4,8 +4,13 @@ VLog CLI - Command line interface for video management.
 """
 
 import argparse
+import hashlib
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -56,6 +61,15 @@ DEFAULT_API_TIMEOUT = int(os.getenv("VLOG_API_TIMEOUT", "30"))
 # Very long timeout for large uploads, but not infinite to prevent hanging
 UPLOAD_TIMEOUT = int(os.getenv("VLOG_UPLOAD_TIMEOUT", "7200"))
 
+# Files at least this large (MB) are sent as resumable chunked uploads
+CHUNKED_UPLOAD_THRESHOLD_MB = int(os.getenv("VLOG_UPLOAD_CHUNKED_THRESHOLD_MB", "64"))
+# Chunks sent in parallel (override with --parallel)
+UPLOAD_PARALLEL = int(os.getenv("VLOG_UPLOAD_PARALLEL", "4"))
+# Attempts per chunk before the upload is left to be resumed
+CHUNK_UPLOAD_ATTEMPTS = 3
+# Where unfinished chunked uploads are remembered for resuming
+UPLOAD_STATE_DIR = Path(os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / "vlog" / "uploads"
+
 # Admin API URL - can override host and port, or use the port from config
 _default_api_url = f"http://localhost:{ADMIN_PORT}"
 API_BASE = os.getenv("VLOG_ADMIN_API_URL", _default_api_url).rstrip("/") + "/api"
@@ -247,6 +261,101 @@ def handle_auth_error(response) -> bool:
     return False
 
 
+def _upload_state_path(file_path: Path) -> Path:
+    """State file of a chunked upload (changes if the file or the server changes)."""
+    file_stat = file_path.stat()
+    key = f"{API_BASE}:{file_path.resolve()}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+    return UPLOAD_STATE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+
+def _upload_chunk(client, upload_id: str, fd: int, index: int, chunk_size: int, file_size: int) -> int:
+    """Send one chunk (retrying transient failures). Returns its size."""
+    data = os.pread(fd, min(chunk_size, file_size - index * chunk_size), index * chunk_size)
+    headers = {**get_admin_headers(), "X-Chunk-SHA256": hashlib.sha256(data).hexdigest()}
+    for attempt in range(1, CHUNK_UPLOAD_ATTEMPTS + 1):
+        try:
+            response = client.put(f"{API_BASE}/uploads/{upload_id}/chunks/{index}", content=data, headers=headers)
+            if response.status_code < 500:
+                handle_auth_error(response)
+                safe_json_response(response)
+                return len(data)
+        except (httpx.TransportError, httpx.TimeoutException):
+            if attempt == CHUNK_UPLOAD_ATTEMPTS:
+                raise
+        if attempt < CHUNK_UPLOAD_ATTEMPTS:
+            time.sleep(2**attempt)
+    safe_json_response(response)
+    return len(data)
+
+
+def _chunked_upload(file_path: Path, file_size: int, data: dict, parallel: int) -> dict:
+    """
+    Upload a file as parallel chunks, resuming an earlier attempt if there is one.
+
+    The upload ID is kept in a state file until the upload completes, so running
+    the same command again after an interruption only sends the missing chunks.
+    """
+    state_path = _upload_state_path(file_path)
+    headers = get_admin_headers()
+
+    with httpx.Client(timeout=httpx.Timeout(UPLOAD_TIMEOUT)) as client:
+        upload = None
+        if state_path.exists():
+            upload_id = json.loads(state_path.read_text()).get("upload_id", "")
+            response = client.get(f"{API_BASE}/uploads/{upload_id}", headers=headers)
+            handle_auth_error(response)
+            if response.status_code != 404:
+                upload = safe_json_response(response)
+                print(f"Resuming upload ({len(upload['missing_chunks'])} of {upload['chunk_count']} chunks left)")
+        if upload is None:
+            response = client.post(
+                f"{API_BASE}/uploads", json={"filename": file_path.name, "size": file_size, **data}, headers=headers
+            )
+            handle_auth_error(response)
+            upload = safe_json_response(response)
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(json.dumps({"upload_id": upload["upload_id"], "file": str(file_path.resolve())}))
+
+        upload_id = upload["upload_id"]
+        chunk_size = upload["chunk_size"]
+        missing = upload["missing_chunks"]
+        sent_before = file_size - sum(min(chunk_size, file_size - i * chunk_size) for i in missing)
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            FileSizeColumn(),
+            TextColumn("/"),
+            TotalFileSizeColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+        ) as progress:
+            task_id = progress.add_task(f"Uploading ({parallel} parallel)...", total=file_size, completed=sent_before)
+            lock = threading.Lock()
+
+            def send(index: int) -> None:
+                sent = _upload_chunk(client, upload_id, fd, index, chunk_size, file_size)
+                with lock:
+                    progress.update(task_id, advance=sent)
+
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                with ThreadPoolExecutor(max_workers=parallel) as pool:
+                    # list() re-raises the first failed chunk
+                    list(pool.map(send, missing))
+            except (httpx.TransportError, httpx.TimeoutException, CLIError) as e:
+                raise CLIError(f"Upload interrupted ({e}). Run the same command again to resume.")
+            finally:
+                os.close(fd)
+
+        response = client.post(f"{API_BASE}/uploads/{upload_id}/complete", headers=headers)
+        handle_auth_error(response)
+        result = safe_json_response(response)
+
+    state_path.unlink(missing_ok=True)
+    return result
+
+
 def cmd_upload(args):
     """Upload a video."""
     try:
@@ -282,28 +391,35 @@ def cmd_upload(args):
                 print(f"Warning: Could not fetch categories: {e}")
                 print("Uploading without category")
 
-        # Upload with progress indicator
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            FileSizeColumn(),
-            TextColumn("/"),
-            TotalFileSizeColumn(),
-            TransferSpeedColumn(),
-            TimeRemainingColumn(),
-        ) as progress:
-            task_id = progress.add_task("Uploading...", total=file_size)
+        if file_size >= CHUNKED_UPLOAD_THRESHOLD_MB * 1024 * 1024:
+            # Large files: parallel, resumable chunks
+            parallel = getattr(args, "parallel", None) or UPLOAD_PARALLEL
+            result = _chunked_upload(file_path, file_size, data, parallel)
+        else:
+            # Upload with progress indicator
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                FileSizeColumn(),
+                TextColumn("/"),
+                TotalFileSizeColumn(),
+                TransferSpeedColumn(),
+                TimeRemainingColumn(),
+            ) as progress:
+                task_id = progress.add_task("Uploading...", total=file_size)
 
-            with open(file_path, "rb") as f:
-                # Wrap the file object with progress tracking
-                wrapped_file = ProgressFileWrapper(f, progress, task_id)
-                files = {"file": (file_path.name, wrapped_file)}
+                with open(file_path, "rb") as f:
+                    # Wrap the file object with progress tracking
+                    wrapped_file = ProgressFileWrapper(f, progress, task_id)
+                    files = {"file": (file_path.name, wrapped_file)}
 
-                with httpx.Client(timeout=httpx.Timeout(UPLOAD_TIMEOUT)) as client:
-                    response = client.post(f"{API_BASE}/videos", files=files, data=data, headers=get_admin_headers())
+                    with httpx.Client(timeout=httpx.Timeout(UPLOAD_TIMEOUT)) as client:
+                        response = client.post(
+                            f"{API_BASE}/videos", files=files, data=data, headers=get_admin_headers()
+                        )
 
-        handle_auth_error(response)
-        result = safe_json_response(response)
+            handle_auth_error(response)
+            result = safe_json_response(response)
         print("Success! Video queued for processing.")
         print(f"  ID: {result['video_id']}")
         print(f"  Slug: {result['slug']}")
@@ -855,6 +971,16 @@ def cmd_manifests(args):
                 try:
                     success, message = asyncio.run(regenerate_video_manifests(video))
                     if success:
+                        # Best effort: public API instances otherwise pick up the new files
+                        # once their cached file lookups expire
+                        try:
+                            httpx.post(
+                                f"{API_BASE}/videos/{video['id']}/manifests/invalidate",
+                                headers=get_admin_headers(),
+                                timeout=DEFAULT_API_TIMEOUT,
+                            )
+                        except httpx.HTTPError:
+                            pass
                         print(f"OK ({message})")
                         success_count += 1
                     else:
@@ -1060,6 +1186,12 @@ def main():
     upload_parser.add_argument("-t", "--title", help="Video title (default: filename)")
     upload_parser.add_argument("-d", "--description", help="Video description")
     upload_parser.add_argument("-c", "--category", help="Category name or slug")
+    upload_parser.add_argument(
+        "-j",
+        "--parallel",
+        type=positive_int,
+        help=f"Chunks sent in parallel for large files (default: {UPLOAD_PARALLEL}); interrupted uploads resume",
+    )
     upload_parser.set_defaults(func=cmd_upload)
 
     # List command
@@ -288,8 +288,35 @@ PARALLEL_QUALITIES = get_int_env("VLOG_PARALLEL_QUALITIES", 1, min_val=1)
 # When true AND a GPU is detected, overrides PARALLEL_QUALITIES with min(3, gpu.max_sessions - 1)
 # When true but no GPU is detected, falls back to PARALLEL_QUALITIES value
 PARALLEL_QUALITIES_AUTO = os.getenv("VLOG_PARALLEL_QUALITIES_AUTO", "true").lower() == "true"
-
-# Worker settings (event-driven processing for local worker)
+# Adaptive scheduling: encode qualities most-expensive-first and start the next one as soon
+# as a slot frees, instead of waiting for a whole batch. New encodes are only admitted while
+# the host has this much headroom (the first encode is always admitted).
+PARALLEL_SCHEDULER_MIN_FREE_MEMORY_MB = get_int_env("VLOG_PARALLEL_SCHEDULER_MIN_FREE_MEMORY_MB", 1024, min_val=0)
+PARALLEL_SCHEDULER_MAX_CPU_PERCENT = get_int_env("VLOG_PARALLEL_SCHEDULER_MAX_CPU_PERCENT", 90, min_val=1, max_val=100)
+# Ladder encoding: decode the source once and encode every pending quality from a single
+# FFmpeg process (split/scale filter graph) instead of one decode per quality.
+# GPU ladders are chunked to stay within HWACCEL_MAX_CONCURRENT_SESSIONS.
+# Renditions that fail in ladder mode are retried with the per-quality encoder.
+TRANSCODE_LADDER_MODE = os.getenv("VLOG_TRANSCODE_LADDER_MODE", "false").lower() in ("true", "1", "yes")
+# Chunked encoding (CMAF only): long videos are cut at source keyframes into chunks of
+# CHUNKED_ENCODING_CHUNK_SECONDS, the chunks of a quality are encoded in parallel and
+# stitched into one continuous rendition. Takes precedence over ladder mode for long videos.
+CHUNKED_ENCODING_ENABLED = os.getenv("VLOG_CHUNKED_ENCODING_ENABLED", "false").lower() in ("true", "1", "yes")
+CHUNKED_ENCODING_MIN_DURATION = get_int_env("VLOG_CHUNKED_ENCODING_MIN_DURATION", 1800, min_val=0)
+CHUNKED_ENCODING_CHUNK_SECONDS = get_int_env("VLOG_CHUNKED_ENCODING_CHUNK_SECONDS", 300, min_val=30)
+# Chunks of one quality encoded at a time (0 = auto: a quarter of the CPU cores for software
+# encoders, the parallel quality encode slots for hardware encoders). Chunked qualities are
+# encoded one at a time; hardware chunks never exceed HWACCEL_MAX_CONCURRENT_SESSIONS.
+CHUNKED_ENCODING_PARALLEL = get_int_env("VLOG_CHUNKED_ENCODING_PARALLEL", 0, min_val=0)
+# Shared audio (CMAF only): the audio is encoded once into an audio-only rendition that all
+# video-only renditions play with (HLS EXT-X-MEDIA audio group, DASH audio AdaptationSet),
+# instead of being re-encoded into every rendition. AAC-LC mono/stereo sources are copied
+# without re-encoding when CMAF_AUDIO_PASSTHROUGH is enabled.
+CMAF_SHARED_AUDIO_ENABLED = os.getenv("VLOG_CMAF_SHARED_AUDIO_ENABLED", "false").lower() in ("true", "1", "yes")
+CMAF_AUDIO_PASSTHROUGH = os.getenv("VLOG_CMAF_AUDIO_PASSTHROUGH", "true").lower() in ("true", "1", "yes")
+
+# Worker settings (event-driven processing for local worker, and streaming
+# segment detection on remote workers)
 WORKER_USE_FILESYSTEM_WATCHER = os.getenv("VLOG_WORKER_USE_FILESYSTEM_WATCHER", "true").lower() == "true"
 WORKER_FALLBACK_POLL_INTERVAL = get_int_env("VLOG_WORKER_FALLBACK_POLL_INTERVAL", 60, min_val=1)
 WORKER_DEBOUNCE_DELAY = get_float_env("VLOG_WORKER_DEBOUNCE_DELAY", 1.0, min_val=0.0)
@@ -306,6 +333,14 @@ WORKER_API_KEY = os.getenv("VLOG_WORKER_API_KEY", "")
 # Generate with: python -c "import secrets; print(secrets.token_urlsafe(32))"
 WORKER_ADMIN_SECRET = os.getenv("VLOG_WORKER_ADMIN_SECRET", "")
 
+# Verified worker API key cache
+# Successful argon2id verifications are cached in-process so heartbeats, progress updates
+# and segment uploads don't re-hash the key on every request. Revoking a worker evicts
+# its entries immediately (on other instances via Redis pub/sub when VLOG_REDIS_URL is set).
+# TTL in seconds; 0 disables the cache.
+WORKER_AUTH_CACHE_TTL = get_int_env("VLOG_WORKER_AUTH_CACHE_TTL", 300, min_val=0)
+WORKER_AUTH_CACHE_MAX_SIZE = get_int_env("VLOG_WORKER_AUTH_CACHE_MAX_SIZE", 1000, min_val=1)
+
 # Admin API secret for authentication (#234)
 # When set, all /api/ endpoints on the Admin API require X-Admin-Secret header
 # If empty/unset, Admin API endpoints are unauthenticated (for backwards compatibility)
@@ -317,8 +352,26 @@ ADMIN_SESSION_EXPIRY_HOURS = get_int_env("VLOG_ADMIN_SESSION_EXPIRY_HOURS", 24,
 WORKER_HEARTBEAT_INTERVAL = get_int_env("VLOG_WORKER_HEARTBEAT_INTERVAL", 30, min_val=1)
 WORKER_CLAIM_DURATION_MINUTES = get_int_env("VLOG_WORKER_CLAIM_DURATION", 30, min_val=1)
 WORKER_POLL_INTERVAL = get_int_env("VLOG_WORKER_POLL_INTERVAL", 10, min_val=1)
+# Long-poll job claims: idle workers without Redis Streams park on /api/worker/claim for up
+# to this many seconds and are woken as soon as a job is published (0 = plain polling).
+# While parked, the server re-checks the database every WORKER_POLL_INTERVAL seconds.
+WORKER_CLAIM_LONG_POLL_SECONDS = get_int_env("VLOG_WORKER_CLAIM_LONG_POLL_SECONDS", 25, min_val=0)
+# Server-side cap on how long a claim request may be parked
+WORKER_CLAIM_LONG_POLL_MAX_SECONDS = get_int_env("VLOG_WORKER_CLAIM_LONG_POLL_MAX_SECONDS", 30, min_val=0)
 WORKER_WORK_DIR = Path(os.getenv("VLOG_WORKER_WORK_DIR", "/tmp/vlog-worker"))
 WORKER_OFFLINE_THRESHOLD_MINUTES = get_int_env("VLOG_WORKER_OFFLINE_THRESHOLD", 5, min_val=1)
+# Rendition-level job splitting: once a worker has probed a video, each rendition
+# (and the original remux) becomes a sub-task any idle worker can claim, and the
+# Worker API assembles the manifests when the last one finishes.
+JOB_SPLITTING_ENABLED = os.getenv("VLOG_JOB_SPLITTING_ENABLED", "false").lower() in ("true", "1", "yes")
+# Videos shorter than this (seconds) are transcoded whole by one worker
+JOB_SPLIT_MIN_DURATION = get_int_env("VLOG_JOB_SPLIT_MIN_DURATION", 300, min_val=0)
+# Attempts per rendition sub-task (failures and expired claims) before it is given up
+JOB_TASK_MAX_ATTEMPTS = get_int_env("VLOG_JOB_TASK_MAX_ATTEMPTS", 3, min_val=1)
+# Progressive publishing: the cheapest rendition is encoded first and a video becomes
+# playable (status ready) as soon as it is uploaded; the Worker API rewrites the
+# manifests as each further rendition lands and the job finishes as usual.
+PROGRESSIVE_PUBLISH_ENABLED = os.getenv("VLOG_PROGRESSIVE_PUBLISH_ENABLED", "false").lower() in ("true", "1", "yes")
 
 # Worker health check server port (for K8s liveness/readiness probes)
 WORKER_HEALTH_PORT = get_int_env("VLOG_WORKER_HEALTH_PORT", 8080, min_val=1, max_val=65535)
@@ -338,6 +391,13 @@ PROGRESS_UPDATE_INTERVAL = get_float_env("VLOG_PROGRESS_UPDATE_INTERVAL", 5.0, m
 # Upload size limits (default 100GB - reasonable for 4K video)
 MAX_UPLOAD_SIZE = get_int_env("VLOG_MAX_UPLOAD_SIZE", 100 * 1024 * 1024 * 1024, min_val=1)  # 100 GB
 UPLOAD_CHUNK_SIZE = get_int_env("VLOG_UPLOAD_CHUNK_SIZE", 1024 * 1024, min_val=1024)  # 1 MB chunks
+# Resumable chunked uploads (see api/chunked_upload.py)
+# Size of the chunks clients send in parallel (larger for files with more than
+# CHUNKED_UPLOAD_MAX_CHUNKS chunks)
+CHUNKED_UPLOAD_CHUNK_SIZE_MB = get_int_env("VLOG_CHUNKED_UPLOAD_CHUNK_SIZE_MB", 16, min_val=1, max_val=1024)
+CHUNKED_UPLOAD_MAX_CHUNKS = 10000
+# Hours before an unfinished chunked upload is discarded
+CHUNKED_UPLOAD_EXPIRY_HOURS = get_int_env("VLOG_CHUNKED_UPLOAD_EXPIRY_HOURS", 24, min_val=1)
 
 # Thumbnail settings
 SUPPORTED_IMAGE_EXTENSIONS = frozenset([".jpg", ".jpeg", ".png", ".webp"])
@@ -468,11 +528,78 @@ ANALYTICS_CACHE_STORAGE_URL = os.getenv("VLOG_ANALYTICS_CACHE_STORAGE_URL", "mem
 # This controls the Cache-Control header sent to clients
 ANALYTICS_CLIENT_CACHE_MAX_AGE = get_int_env("VLOG_ANALYTICS_CLIENT_CACHE_MAX_AGE", 60, min_val=0)
 
+# Public API response cache (video lists, related videos)
+# Entries are cached in-process and, when VLOG_REDIS_URL is set, in Redis as well so every
+# public API instance shares them. Admin publish/update/delete and transcode completion
+# invalidate the cache immediately (across instances via Redis pub/sub), so the shared
+# TTL can be much longer than the in-process one.
+PUBLIC_RESPONSE_CACHE_ENABLED = os.getenv("VLOG_PUBLIC_RESPONSE_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+# TTL in seconds without Redis (other instances' changes are only seen after expiry)
+PUBLIC_RESPONSE_CACHE_TTL = get_int_env("VLOG_PUBLIC_RESPONSE_CACHE_TTL", 30, min_val=1)
+# TTL in seconds when Redis is configured
+PUBLIC_RESPONSE_CACHE_SHARED_TTL = get_int_env("VLOG_PUBLIC_RESPONSE_CACHE_SHARED_TTL", 600, min_val=1)
+PUBLIC_RESPONSE_CACHE_MAX_SIZE = get_int_env("VLOG_PUBLIC_RESPONSE_CACHE_MAX_SIZE", 500, min_val=1)
+
+# Per-video counters (views, unique viewers, watch time, completions) are updated
+# incrementally by the analytics endpoints and periodically recomputed from
+# playback_sessions to correct drift. Interval in seconds; 0 disables reconciliation.
+VIDEO_STATS_RECONCILE_INTERVAL = get_int_env("VLOG_VIDEO_STATS_RECONCILE_INTERVAL", 3600, min_val=0)
+
+# Analytics rollups (admin dashboard)
+# The admin API rolls playback sessions up into hourly and daily per-video tables, so
+# dashboard queries read rollups plus only the sessions since the last rolled-up hour.
+# Interval in seconds between rollup runs; 0 disables rollups (dashboard reads sessions).
+ANALYTICS_ROLLUP_INTERVAL = get_int_env("VLOG_ANALYTICS_ROLLUP_INTERVAL", 300, min_val=0)
+# Hours before the last rolled-up hour that are recomputed on every run, so sessions
+# still accruing watch time or completing after their hour closed are picked up
+ANALYTICS_ROLLUP_LOOKBACK_HOURS = get_int_env("VLOG_ANALYTICS_ROLLUP_LOOKBACK_HOURS", 6, min_val=0)
+# Maximum new hours rolled up per run (bounds each backfill step)
+ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN = get_int_env("VLOG_ANALYTICS_ROLLUP_MAX_HOURS_PER_RUN", 72, min_val=1)
+
+# Analytics write-behind buffer
+# Playback heartbeats are coalesced per session in memory and written in one batched
+# UPDATE every flush interval (and on shutdown) instead of a SELECT + UPDATE per heartbeat.
+# Disable to write every heartbeat immediately.
+ANALYTICS_WRITE_BUFFER_ENABLED = os.getenv("VLOG_ANALYTICS_WRITE_BUFFER_ENABLED", "true").lower() in ("true", "1", "yes")
+# Seconds between flushes (at most this much buffered playback progress is lost on a crash)
+ANALYTICS_WRITE_BUFFER_FLUSH_INTERVAL = get_int_env("VLOG_ANALYTICS_WRITE_BUFFER_FLUSH_INTERVAL", 10, min_val=1)
+# Flush early once this many sessions have buffered heartbeats
+ANALYTICS_WRITE_BUFFER_MAX_PENDING = get_int_env("VLOG_ANALYTICS_WRITE_BUFFER_MAX_PENDING", 5000, min_val=1)
+
+# Related videos
+# Each video's related list is precomputed (shared category, tag similarity and
+# co-watching) by a background job in the admin API, so the public endpoint is a
+# single lookup. Interval in seconds between refresh runs; 0 disables the job
+# (the endpoint then computes related videos live).
+RELATED_VIDEOS_REFRESH_INTERVAL = get_int_env("VLOG_RELATED_VIDEOS_REFRESH_INTERVAL", 300, min_val=0)
+# Maximum number of related lists recomputed per run
+RELATED_VIDEOS_MAX_PER_RUN = get_int_env("VLOG_RELATED_VIDEOS_MAX_PER_RUN", 500, min_val=1)
+# Lists older than this are recomputed to pick up new co-watching data
+RELATED_VIDEOS_MAX_AGE_HOURS = get_int_env("VLOG_RELATED_VIDEOS_MAX_AGE_HOURS", 24, min_val=1)
+# Days of playback sessions considered for co-watching
+RELATED_VIDEOS_COWATCH_DAYS = get_int_env("VLOG_RELATED_VIDEOS_COWATCH_DAYS", 30, min_val=1)
+
 # Storage Health Check Configuration
 # Timeout for health check storage access test (seconds)
 # Reduced from 5 to 2 for faster failure detection on stale NFS mounts
 STORAGE_CHECK_TIMEOUT = get_int_env("VLOG_STORAGE_CHECK_TIMEOUT", 2, min_val=1)
 
+# Media file serving (HLS/DASH segments, thumbnails, downloads)
+# File lookups (path resolution + stat) are cached per process so hot segments are
+# served without a NAS metadata round trip. Seconds a lookup is reused (0 = no cache);
+# files replaced in place are picked up after at most this long.
+MEDIA_STAT_CACHE_TTL = get_int_env("VLOG_MEDIA_STAT_CACHE_TTL", 10, min_val=0)
+# Maximum cached lookups (least recently used are evicted)
+MEDIA_STAT_CACHE_MAX_ENTRIES = get_int_env("VLOG_MEDIA_STAT_CACHE_MAX_ENTRIES", 20000, min_val=1)
+# HLS/DASH manifests are kept in memory per process, keyed by path and file version
+# (mtime, inode, size), with content-hash ETags. Maximum cached manifests (0 = read
+# from storage on every request).
+MANIFEST_CACHE_MAX_ENTRIES = get_int_env("VLOG_MANIFEST_CACHE_MAX_ENTRIES", 5000, min_val=0)
+# Browser/CDN max-age for manifests of completed VOD content (ENDLIST playlists,
+# static MPDs, and master playlists whose variants are all complete). Manifests
+# still being written are always served with no-cache. 0 = always no-cache.
+MANIFEST_CACHE_MAX_AGE = get_int_env("VLOG_MANIFEST_CACHE_MAX_AGE", 3600, min_val=0)
+
 # TAR Extraction Timeout (Issue #451)
 # Timeout for tar extraction operations in seconds
 # NAS I/O can hang indefinitely on stale mounts - this prevents thread pool exhaustion
@@ -488,6 +615,57 @@ ORPHAN_CLEANUP_INTERVAL = get_int_env("VLOG_ORPHAN_CLEANUP_INTERVAL", 3600, min_
 # Directories younger than this are not cleaned up - allows time for job completion
 ORPHAN_CLEANUP_MIN_AGE = get_int_env("VLOG_ORPHAN_CLEANUP_MIN_AGE", 86400, min_val=3600)
 
+# Storage ledger (see api/storage_ledger.py)
+# Bytes used per video and rendition are recorded in the database as files are written
+# and deleted, so storage metrics don't need filesystem scans. The reconciliation scanner
+# re-checks one video directory at a time (every VLOG_STORAGE_RECONCILIATION_INTERVAL
+# seconds) to correct drift and to fill the ledger for videos stored before it existed.
+STORAGE_LEDGER_RECONCILE_ENABLED = os.getenv("VLOG_STORAGE_LEDGER_RECONCILE_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+# Video directories scanned concurrently
+STORAGE_LEDGER_RECONCILE_CONCURRENCY = get_int_env("VLOG_STORAGE_LEDGER_RECONCILE_CONCURRENCY", 4, min_val=1)
+# Reconciliation can be split across admin instances: each checks the videos whose
+# id % SHARD_COUNT == SHARD_INDEX
+STORAGE_LEDGER_SHARD_COUNT = get_int_env("VLOG_STORAGE_LEDGER_SHARD_COUNT", 1, min_val=1)
+STORAGE_LEDGER_SHARD_INDEX = get_int_env("VLOG_STORAGE_LEDGER_SHARD_INDEX", 0, min_val=0)
+
+# Content-addressed segment store (see api/segment_store.py)
+# Store uploaded segments once by SHA-256 and hard link them into video directories,
+# so re-transcodes and re-uploads don't write (or upload) identical segments again
+SEGMENT_STORE_ENABLED = os.getenv("VLOG_SEGMENT_STORE_ENABLED", "false").lower() in ("true", "1", "yes")
+# Must be on the same filesystem as VIDEOS_DIR for hard links
+SEGMENT_STORE_DIR = NAS_STORAGE / os.getenv("VLOG_SEGMENT_STORE_SUBDIR", "segment-store")
+# Hours a segment no video links to is kept (so re-transcodes can reuse deleted segments)
+SEGMENT_STORE_UNREFERENCED_HOURS = get_int_env("VLOG_SEGMENT_STORE_UNREFERENCED_HOURS", 24, min_val=1)
+
+# Object storage for published video files (see api/object_storage.py)
+# "filesystem" serves everything from VIDEOS_DIR; "s3" also publishes completed videos,
+# thumbnails and sprites to an S3-compatible bucket (AWS S3, MinIO, Ceph RGW, R2, ...)
+STORAGE_BACKEND = os.getenv("VLOG_STORAGE_BACKEND", "filesystem").lower()
+S3_BUCKET = os.getenv("VLOG_S3_BUCKET", "")
+# Endpoint of S3-compatible services (e.g. http://minio:9000); empty = AWS S3
+S3_ENDPOINT_URL = os.getenv("VLOG_S3_ENDPOINT_URL", "")
+S3_REGION = os.getenv("VLOG_S3_REGION", "us-east-1")
+# Credentials (empty = boto3 default credential chain: env vars, instance profile, ...)
+S3_ACCESS_KEY_ID = os.getenv("VLOG_S3_ACCESS_KEY_ID", "")
+S3_SECRET_ACCESS_KEY = os.getenv("VLOG_S3_SECRET_ACCESS_KEY", "")
+# Key prefix of video files in the bucket (objects are {prefix}{slug}/{path})
+S3_KEY_PREFIX = os.getenv("VLOG_S3_KEY_PREFIX", "videos/")
+# Files at least this large are uploaded as multipart uploads with parallel parts
+S3_MULTIPART_THRESHOLD_MB = get_int_env("VLOG_S3_MULTIPART_THRESHOLD_MB", 64, min_val=5)
+# Part size of multipart uploads (S3 minimum is 5 MB)
+S3_MULTIPART_PART_SIZE_MB = get_int_env("VLOG_S3_MULTIPART_PART_SIZE_MB", 16, min_val=5)
+# Maximum concurrent uploads (files per sync, and parts per multipart upload)
+S3_MAX_CONCURRENCY = get_int_env("VLOG_S3_MAX_CONCURRENCY", 8, min_val=1, max_val=64)
+# Redirect segment requests to presigned bucket URLs once a video is published,
+# so segment bytes are served by the bucket (or its CDN) instead of the public API
+S3_PRESIGNED_REDIRECTS = os.getenv("VLOG_S3_PRESIGNED_REDIRECTS", "true").lower() in ("true", "1", "yes")
+# Validity of presigned URLs in seconds
+S3_PRESIGNED_URL_EXPIRY = get_int_env("VLOG_S3_PRESIGNED_URL_EXPIRY", 3600, min_val=60, max_val=604800)
+
 # Audit Logging Configuration
 AUDIT_LOG_ENABLED = os.getenv("VLOG_AUDIT_LOG_ENABLED", "true").lower() not in ("false", "0", "no")
 AUDIT_LOG_PATH = Path(os.getenv("VLOG_AUDIT_LOG_PATH", "/var/log/vlog/audit.log"))
@@ -519,6 +697,27 @@ ALERT_RATE_LIMIT_SECONDS = get_int_env("VLOG_ALERT_RATE_LIMIT_SECONDS", 300, min
 # instead of creating a tar.gz after all qualities complete. This eliminates
 # event loop blocking during upload and keeps heartbeats alive.
 WORKER_STREAMING_UPLOAD = os.getenv("VLOG_WORKER_STREAMING_UPLOAD", "false").lower() in ("true", "1", "yes")
+# Segments sent per upload request (1 = one request per segment)
+WORKER_SEGMENT_BATCH_SIZE = get_int_env("VLOG_WORKER_SEGMENT_BATCH_SIZE", 10, min_val=1, max_val=64)
+# Maximum segment upload requests in flight at once per quality
+WORKER_SEGMENT_UPLOAD_CONCURRENCY = get_int_env("VLOG_WORKER_SEGMENT_UPLOAD_CONCURRENCY", 4, min_val=1, max_val=32)
+# Negotiate HTTP/2 with the Worker API (requires the h2 package and an HTTP/2-capable
+# reverse proxy in front of the API; uvicorn itself only speaks HTTP/1.1)
+WORKER_HTTP2 = os.getenv("VLOG_WORKER_HTTP2", "false").lower() in ("true", "1", "yes")
+
+# Streamed Tar Upload
+# When enabled, remote workers upload each finished quality as an uncompressed tar
+# generated on the fly and sent as the request body, which the Worker API extracts
+# as it arrives. When disabled, a tar.gz temp file is built and uploaded instead.
+WORKER_STREAMING_TAR_UPLOAD = os.getenv("VLOG_WORKER_STREAMING_TAR_UPLOAD", "true").lower() in ("true", "1", "yes")
+
+# Streaming Source Ingest
+# When enabled, remote workers download the source in the background and probe it
+# and generate the thumbnail from the first VLOG_WORKER_INGEST_PROBE_BYTES while the
+# rest downloads; the first encoding pass of header-first sources reads the growing
+# file. Interrupted downloads resume from the last byte received either way.
+WORKER_STREAMING_INGEST = os.getenv("VLOG_WORKER_STREAMING_INGEST", "true").lower() in ("true", "1", "yes")
+WORKER_INGEST_PROBE_BYTES = get_int_env("VLOG_WORKER_INGEST_PROBE_BYTES", 32 * 1024 * 1024, min_val=1024 * 1024)
 
 # Watermark Configuration (client-side overlay, does not modify video files)
 # Enable/disable watermark overlay on video player
@@ -0,0 +1,68 @@
+"""add_video_stats
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-01-06
+
+Adds the video_stats table holding per-video playback counters (views,
+unique viewers, watch seconds, completions). Video listings read view
+counts from this table instead of aggregating playback_sessions, which
+grows without bound.
+
+The table is backfilled from existing playback_sessions; afterwards it is
+maintained incrementally by the analytics endpoints and periodically
+reconciled (see api/video_stats.py).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "028"
+down_revision: Union[str, Sequence[str], None] = "027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and backfill the video_stats table."""
+    op.create_table(
+        "video_stats",
+        sa.Column(
+            "video_id",
+            sa.Integer,
+            sa.ForeignKey("videos.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("view_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("unique_viewers", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("watch_seconds", sa.Float, nullable=False, server_default="0"),
+        sa.Column("completions", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_video_stats_view_count", "video_stats", ["view_count"])
+
+    # Backfill from existing playback sessions
+    op.execute("""
+        INSERT INTO video_stats
+            (video_id, view_count, unique_viewers, watch_seconds, completions, updated_at, reconciled_at)
+        SELECT
+            video_id,
+            COUNT(*),
+            COUNT(DISTINCT viewer_id),
+            COALESCE(SUM(duration_watched), 0),
+            SUM(CASE WHEN completed THEN 1 ELSE 0 END),
+            CURRENT_TIMESTAMP,
+            CURRENT_TIMESTAMP
+        FROM playback_sessions
+        GROUP BY video_id
+    """)
+
+
+def downgrade() -> None:
+    """Remove the video_stats table."""
+    op.drop_index("ix_video_stats_view_count", table_name="video_stats")
+    op.drop_table("video_stats")
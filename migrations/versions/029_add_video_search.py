@@ -0,0 +1,145 @@
+"""add_video_search
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-01-08
+
+Adds full-text search for the public video search, replacing ILIKE scans over
+title and description:
+- video_search: one search document per video (title, description, tag names,
+  transcript) with a weighted, generated tsvector column and a GIN index
+- video_search_refresh(): rebuilds a video's search document
+- Triggers on videos, video_tags, tags and transcriptions that keep video_search
+  in sync on every write
+
+Existing videos are indexed during the upgrade. SQLite development databases get
+an equivalent FTS5 index from create_tables() (see api/database.py).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "029"
+down_revision: Union[str, Sequence[str], None] = "028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (trigger, table, events, function)
+TRIGGERS = [
+    ("trg_video_search_videos", "videos", "INSERT OR UPDATE OF title, description", "video_search_videos_sync"),
+    ("trg_video_search_video_tags", "video_tags", "INSERT OR DELETE", "video_search_video_ref_sync"),
+    ("trg_video_search_tags", "tags", "UPDATE OF name", "video_search_tags_sync"),
+    (
+        "trg_video_search_transcriptions",
+        "transcriptions",
+        "INSERT OR UPDATE OF transcript_text OR DELETE",
+        "video_search_video_ref_sync",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create the video_search table, its sync triggers, and index existing videos."""
+    op.create_table(
+        "video_search",
+        sa.Column(
+            "video_id",
+            sa.Integer,
+            sa.ForeignKey("videos.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("title", sa.Text, nullable=False, server_default=""),
+        sa.Column("description", sa.Text, nullable=False, server_default=""),
+        sa.Column("tags", sa.Text, nullable=False, server_default=""),
+        sa.Column("transcript", sa.Text, nullable=False, server_default=""),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Weighted document: title > tags > description > transcript
+    op.execute("""
+        ALTER TABLE video_search ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', title), 'A')
+                || setweight(to_tsvector('english', tags), 'B')
+                || setweight(to_tsvector('english', description), 'C')
+                || setweight(to_tsvector('english', transcript), 'D')
+            ) STORED
+    """)
+    op.execute("CREATE INDEX ix_video_search_vector ON video_search USING GIN (search_vector)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION video_search_refresh(p_video_id integer) RETURNS void AS $$
+        BEGIN
+            INSERT INTO video_search (video_id, title, description, tags, transcript, updated_at)
+            SELECT
+                v.id,
+                v.title,
+                COALESCE(v.description, ''),
+                COALESCE((
+                    SELECT string_agg(t.name, ' ' ORDER BY t.name)
+                    FROM video_tags vt JOIN tags t ON t.id = vt.tag_id
+                    WHERE vt.video_id = v.id
+                ), ''),
+                COALESCE((
+                    SELECT substr(tr.transcript_text, 1, 100000)
+                    FROM transcriptions tr
+                    WHERE tr.video_id = v.id
+                ), ''),
+                CURRENT_TIMESTAMP
+            FROM videos v
+            WHERE v.id = p_video_id
+            ON CONFLICT (video_id) DO UPDATE SET
+                title = excluded.title,
+                description = excluded.description,
+                tags = excluded.tags,
+                transcript = excluded.transcript,
+                updated_at = excluded.updated_at;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION video_search_videos_sync() RETURNS trigger AS $$
+        BEGIN
+            PERFORM video_search_refresh(NEW.id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION video_search_video_ref_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM video_search_refresh(OLD.video_id);
+            ELSE
+                PERFORM video_search_refresh(NEW.video_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION video_search_tags_sync() RETURNS trigger AS $$
+        BEGIN
+            PERFORM video_search_refresh(vt.video_id) FROM video_tags vt WHERE vt.tag_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for name, table, events, function in TRIGGERS:
+        op.execute(f"CREATE TRIGGER {name} AFTER {events} ON {table} FOR EACH ROW EXECUTE FUNCTION {function}()")
+
+    # Index existing videos
+    op.execute("SELECT video_search_refresh(v.id) FROM videos v")
+
+
+def downgrade() -> None:
+    """Remove the search triggers, functions and the video_search table."""
+    for name, table, _events, _function in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    for function in ("video_search_videos_sync", "video_search_video_ref_sync", "video_search_tags_sync"):
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+    op.execute("DROP FUNCTION IF EXISTS video_search_refresh(integer)")
+    op.drop_table("video_search")
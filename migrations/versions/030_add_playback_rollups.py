@@ -0,0 +1,60 @@
+"""add_playback_rollups
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-01-12
+
+Adds hourly and daily playback rollup tables for the admin analytics
+dashboard (views, watch time, completions, a HyperLogLog sketch of viewers
+and quality counts per video and bucket; video_id 0 holds all-video totals).
+
+The tables start empty: the rollup job in the admin API backfills them from
+playback_sessions, oldest hour first, and the dashboard reads raw sessions for
+anything not rolled up yet (see api/analytics_rollups.py).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "030"
+down_revision: Union[str, Sequence[str], None] = "029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the playback rollup tables."""
+    op.create_table(
+        "playback_rollups_hourly",
+        sa.Column("video_id", sa.Integer, primary_key=True),
+        sa.Column("hour", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("views", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("watch_seconds", sa.Float, nullable=False, server_default="0"),
+        sa.Column("completions", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("viewer_sketch", sa.LargeBinary, nullable=True),
+        sa.Column("quality_counts", sa.Text, nullable=True),
+    )
+    op.create_index("ix_playback_rollups_hourly_hour", "playback_rollups_hourly", ["hour"])
+
+    op.create_table(
+        "playback_rollups_daily",
+        sa.Column("video_id", sa.Integer, primary_key=True),
+        sa.Column("day", sa.Date, primary_key=True),
+        sa.Column("views", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("watch_seconds", sa.Float, nullable=False, server_default="0"),
+        sa.Column("completions", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("viewer_sketch", sa.LargeBinary, nullable=True),
+        sa.Column("quality_counts", sa.Text, nullable=True),
+    )
+    op.create_index("ix_playback_rollups_daily_day", "playback_rollups_daily", ["day"])
+
+
+def downgrade() -> None:
+    """Remove the playback rollup tables."""
+    op.drop_index("ix_playback_rollups_daily_day", table_name="playback_rollups_daily")
+    op.drop_table("playback_rollups_daily")
+    op.drop_index("ix_playback_rollups_hourly_hour", table_name="playback_rollups_hourly")
+    op.drop_table("playback_rollups_hourly")
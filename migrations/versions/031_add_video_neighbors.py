@@ -0,0 +1,54 @@
+"""add_video_neighbors
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-01-13
+
+Adds precomputed related-video lists (video_neighbors) and their refresh
+state (related_video_state).
+
+The tables start empty: the related videos job in the admin API computes
+lists incrementally, and the related videos endpoint computes results live
+for any video without a list yet (see api/related_videos.py).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: Union[str, Sequence[str], None] = "030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the related video tables."""
+    op.create_table(
+        "video_neighbors",
+        sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("neighbor_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("score", sa.Float, nullable=False),
+        sa.PrimaryKeyConstraint("video_id", "neighbor_id"),
+    )
+    op.create_index("ix_video_neighbors_video_score", "video_neighbors", ["video_id", "score"])
+    op.create_index("ix_video_neighbors_neighbor_id", "video_neighbors", ["neighbor_id"])
+
+    op.create_table(
+        "related_video_state",
+        sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("signature", sa.String(64), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_related_video_state_refreshed_at", "related_video_state", ["refreshed_at"])
+
+
+def downgrade() -> None:
+    """Remove the related video tables."""
+    op.drop_index("ix_related_video_state_refreshed_at", table_name="related_video_state")
+    op.drop_table("related_video_state")
+    op.drop_index("ix_video_neighbors_neighbor_id", table_name="video_neighbors")
+    op.drop_index("ix_video_neighbors_video_score", table_name="video_neighbors")
+    op.drop_table("video_neighbors")
@@ -0,0 +1,61 @@
+"""add_transcoding_tasks
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-01-14
+
+Adds rendition sub-tasks for split transcoding jobs (transcoding_tasks).
+
+Jobs are only split when VLOG_JOB_SPLITTING_ENABLED is set, so the table
+starts empty and existing jobs are unaffected.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "032"
+down_revision: Union[str, Sequence[str], None] = "031"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the transcoding_tasks table."""
+    op.create_table(
+        "transcoding_tasks",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("job_id", sa.Integer, sa.ForeignKey("transcoding_jobs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("quality", sa.String(10), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("streaming_format", sa.String(10), nullable=False),
+        sa.Column("codec", sa.String(10), nullable=False),
+        sa.Column("worker_id", sa.String(36), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("claim_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempt_number", sa.Integer, nullable=False, server_default="1"),
+        sa.Column("max_attempts", sa.Integer, nullable=False, server_default="3"),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("width", sa.Integer, nullable=True),
+        sa.Column("height", sa.Integer, nullable=True),
+        sa.Column("bitrate", sa.Integer, nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "quality IN ('2160p', '1440p', '1080p', '720p', '480p', '360p', 'original')",
+            name="ck_transcoding_tasks_quality",
+        ),
+        sa.CheckConstraint(
+            "status IN ('pending', 'in_progress', 'completed', 'failed')",
+            name="ck_transcoding_tasks_status",
+        ),
+        sa.UniqueConstraint("job_id", "quality", name="uq_transcoding_tasks_job_quality"),
+    )
+    op.create_index("ix_transcoding_tasks_status", "transcoding_tasks", ["status"])
+
+
+def downgrade() -> None:
+    """Remove the transcoding_tasks table."""
+    op.drop_index("ix_transcoding_tasks_status", table_name="transcoding_tasks")
+    op.drop_table("transcoding_tasks")
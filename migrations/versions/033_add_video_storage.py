@@ -0,0 +1,41 @@
+"""add_video_storage
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-01-21
+
+Adds the per-video storage ledger (video_storage), which replaces full
+filesystem scans for storage metrics.
+
+The table starts empty; the admin API's reconciliation scanner fills it for
+existing videos, one video directory at a time.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "033"
+down_revision: Union[str, Sequence[str], None] = "032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the video_storage table."""
+    op.create_table(
+        "video_storage",
+        sa.Column("video_id", sa.Integer, sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("quality", sa.String(20), nullable=False),
+        sa.Column("bytes", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("video_id", "quality"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the video_storage table."""
+    op.drop_table("video_storage")
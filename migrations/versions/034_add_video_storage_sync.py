@@ -0,0 +1,36 @@
+"""add_video_storage_sync
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-01-22
+
+Records when a video was last published to object storage, so the public API
+can redirect segments of published videos without checking the video
+directory.
+
+Existing videos start unpublished and are served from VIDEOS_DIR until their
+next publish.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "034"
+down_revision: Union[str, Sequence[str], None] = "033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add object storage sync columns to videos."""
+    op.add_column("videos", sa.Column("storage_sync_started_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("videos", sa.Column("storage_synced_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove object storage sync columns from videos."""
+    op.drop_column("videos", "storage_synced_at")
+    op.drop_column("videos", "storage_sync_started_at")
@@ -0,0 +1,82 @@
+"""
+Tests for api/analytics_buffer.py write-behind heartbeat buffering.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.analytics_buffer import AnalyticsWriteBuffer
+
+
+class TestAnalyticsWriteBuffer:
+    """Test heartbeat coalescing and batched flushes."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_coalesced_per_session(self):
+        """Many heartbeats become one row per session and one counter increment per video."""
+        buffer = AnalyticsWriteBuffer()
+        for position in (30.0, 60.0, 45.0):
+            buffer.add_heartbeat("a", 1, 30.0, position, "720p")
+        buffer.add_heartbeat("a", 1, 0.0, 50.0)
+        buffer.add_heartbeat("b", 1, 30.0, 10.0)
+        buffer.add_heartbeat("c", 2, 30.0, 10.0, "1080p")
+
+        write = AsyncMock()
+        increment = AsyncMock()
+        with (
+            patch("api.analytics_buffer._write_session_deltas", write),
+            patch("api.analytics_buffer.increment_watch_seconds_batch", increment),
+        ):
+            assert await buffer.flush() == 3
+            assert await buffer.flush() == 0
+
+        write.assert_awaited_once()
+        batch = write.await_args.args[0]
+        assert batch["a"].watch_seconds == 90.0
+        assert batch["a"].max_position == 60.0
+        assert batch["a"].quality == "720p"
+        assert batch["b"].quality is None
+        increment.assert_awaited_once_with({1: 120.0, 2: 30.0})
+        assert len(buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_batch(self):
+        """A failed write is retried on the next flush, merged with newer heartbeats."""
+        buffer = AnalyticsWriteBuffer()
+        buffer.add_heartbeat("a", 1, 30.0, 100.0, "720p")
+
+        with patch("api.analytics_buffer._write_session_deltas", AsyncMock(side_effect=RuntimeError("db down"))):
+            assert await buffer.flush() == 0
+
+        buffer.add_heartbeat("a", 1, 30.0, 40.0, "1080p")
+        write = AsyncMock()
+        with (
+            patch("api.analytics_buffer._write_session_deltas", write),
+            patch("api.analytics_buffer.increment_watch_seconds_batch", AsyncMock()),
+        ):
+            assert await buffer.flush() == 1
+
+        delta = write.await_args.args[0]["a"]
+        assert delta.watch_seconds == 60.0
+        assert delta.max_position == 100.0
+        assert delta.quality == "1080p"
+
+    def test_should_flush_and_pop_session(self):
+        """Flush early when full or unbuffered; ending a session takes its progress and forgets it."""
+        buffer = AnalyticsWriteBuffer(max_pending=2)
+        buffer.remember_session("a", 1)
+        buffer.add_heartbeat("a", 1, 30.0, 30.0)
+        assert not buffer.should_flush()
+        buffer.add_heartbeat("b", 1, 30.0, 30.0)
+        assert buffer.should_flush()
+
+        delta = buffer.pop_session("a")
+        assert delta.watch_seconds == 30.0
+        assert buffer.get_session_video("a") is None
+        assert buffer.pop_session("a") is None
+
+        unbuffered = AnalyticsWriteBuffer(enabled=False)
+        assert not unbuffered.should_flush()
+        unbuffered.add_heartbeat("a", 1, 30.0, 30.0)
+        assert unbuffered.should_flush()
@@ -0,0 +1,147 @@
+"""
+Tests for hourly/daily playback rollups (api/analytics_rollups.py).
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.analytics_rollups import (
+    ALL_VIDEOS,
+    ViewerSketch,
+    fetch_daily_buckets,
+    get_rollup_ranges,
+    get_rollup_watermark,
+    merge_buckets,
+    roll_up_analytics,
+)
+from api.database import playback_rollups_daily, playback_sessions, viewers
+
+
+class TestViewerSketch:
+    """Test the HyperLogLog viewer sketch."""
+
+    def test_estimates_and_merges(self):
+        """Small sets are near exact, large ones within a few percent, and merging is a union."""
+        small = ViewerSketch()
+        for viewer_id in range(20):
+            small.add(viewer_id)
+            small.add(viewer_id)
+        assert small.estimate() == 20
+
+        first, second = ViewerSketch(), ViewerSketch()
+        for viewer_id in range(6000):
+            first.add(viewer_id)
+        for viewer_id in range(3000, 10000):
+            second.add(viewer_id)
+        first.merge(second)
+        assert abs(first.estimate() - 10000) < 1000
+
+        restored = ViewerSketch.from_bytes(first.to_bytes())
+        assert restored.estimate() == first.estimate()
+        assert ViewerSketch.from_bytes(None).estimate() == 0
+
+
+class TestRollupRanges:
+    """Test splitting a range into daily rollups, hourly rollups and raw sessions."""
+
+    def test_ranges(self):
+        watermark = datetime(2026, 3, 10, 5, tzinfo=timezone.utc)
+        since = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        ranges = get_rollup_ranges(since, watermark)
+        assert ranges.daily == (since.date(), watermark.date())
+        assert ranges.hourly == (datetime(2026, 3, 10, tzinfo=timezone.utc), watermark)
+        assert ranges.raw_from == watermark
+
+        # Range starting after the watermark reads only sessions
+        later = datetime(2026, 3, 12, tzinfo=timezone.utc)
+        ranges = get_rollup_ranges(later, watermark)
+        assert ranges.daily is None
+        assert ranges.hourly is None
+        assert ranges.raw_from == later
+
+        # Nothing rolled up yet
+        ranges = get_rollup_ranges(None, None)
+        assert ranges.daily is None and ranges.hourly is None and ranges.raw_from is None
+
+
+class TestRollUpAnalytics:
+    """Rollups match aggregates over the raw sessions."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_match_sessions(self, test_database, sample_video, monkeypatch):
+        import api.analytics_rollups
+        import api.database
+
+        monkeypatch.setattr(api.database, "database", test_database)
+
+        now = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+        viewer_ids = []
+        for _ in range(2):
+            viewer_ids.append(
+                await test_database.execute(
+                    viewers.insert().values(session_id=str(uuid.uuid4()), first_seen=now, last_seen=now)
+                )
+            )
+        # Two days ago, yesterday (same viewer twice) and the current, unrolled hour
+        sessions = [
+            (now - timedelta(days=2), viewer_ids[0], 60.0, True, "1080p"),
+            (now - timedelta(days=1), viewer_ids[1], 30.0, False, "720p"),
+            (now - timedelta(days=1), viewer_ids[1], 30.0, False, "720p"),
+            (now, viewer_ids[0], 10.0, False, "720p"),
+        ]
+        for started_at, viewer_id, duration, completed, quality in sessions:
+            await test_database.execute(
+                playback_sessions.insert().values(
+                    video_id=sample_video["id"],
+                    viewer_id=viewer_id,
+                    session_token=str(uuid.uuid4()),
+                    started_at=started_at,
+                    duration_watched=duration,
+                    completed=completed,
+                    quality_used=quality,
+                )
+            )
+
+        # Nothing rolled up yet: sessions are aggregated per day by the database,
+        # with per-day distinct viewers adding up across days
+        for video_ids in (None, [sample_video["id"]]):
+            totals = merge_buckets((await fetch_daily_buckets(video_ids=video_ids)).values())
+            assert totals.views == 4
+            assert totals.watch_seconds == 130.0
+            assert totals.completions == 1
+            assert totals.unique_viewers == 3
+            assert totals.peak_quality == "720p"
+
+        # Backfill in steps until caught up to the current hour
+        while await roll_up_analytics(now=now):
+            pass
+        assert await get_rollup_watermark() == now.replace(minute=0)
+
+        daily_rows = await test_database.fetch_all(
+            playback_rollups_daily.select().where(playback_rollups_daily.c.video_id == sample_video["id"])
+        )
+        assert sum(row["views"] for row in daily_rows) == 3
+
+        for video_ids in (None, [sample_video["id"]]):
+            totals = merge_buckets((await fetch_daily_buckets(video_ids=video_ids)).values())
+            assert totals.views == 4
+            assert totals.watch_seconds == 130.0
+            assert totals.completions == 1
+            assert totals.unique_viewers == 2
+            assert totals.peak_quality == "720p"
+
+        today = now.replace(hour=0, minute=0)
+        recent = await fetch_daily_buckets(since=today - timedelta(days=1))
+        days_with_views = sorted(day for (_video_id, day), bucket in recent.items() if bucket.views)
+        assert days_with_views == [(now - timedelta(days=1)).date(), now.date()]
+        assert all(video_id == ALL_VIDEOS for video_id, _day in recent)
+
+        # Rollups disabled: stale rollup rows are ignored and the range bounds the aggregation
+        monkeypatch.setattr(api.analytics_rollups, "ANALYTICS_ROLLUP_INTERVAL", 0)
+        recent = await fetch_daily_buckets(since=today - timedelta(days=1), video_ids=[sample_video["id"]])
+        assert sorted(day for _video_id, day in recent) == [(now - timedelta(days=1)).date(), now.date()]
+        assert sum(bucket.views for bucket in recent.values()) == 3
+        assert [bucket.unique_viewers for _key, bucket in sorted(recent.items())] == [1, 1]
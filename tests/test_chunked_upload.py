@@ -0,0 +1,86 @@
+"""
+Tests for resumable chunked uploads (api/chunked_upload.py).
+"""
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+import pytest
+
+import api.chunked_upload
+from api.chunked_upload import (
+    ChunkError,
+    complete_session,
+    create_session,
+    load_session,
+    missing_chunks,
+    sweep_expired_sessions,
+    write_chunk,
+)
+
+
+@pytest.fixture(autouse=True)
+def uploads_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(api.chunked_upload, "UPLOADS_DIR", tmp_path)
+    return tmp_path
+
+
+async def _body(data: bytes, piece_size: int = 7):
+    for start in range(0, len(data), piece_size):
+        yield data[start : start + piece_size]
+
+
+def _send(session, index: int, data: bytes, checksum: str = None) -> None:
+    checksum = checksum if checksum is not None else hashlib.sha256(data).hexdigest()
+    asyncio.run(write_chunk(session, index, _body(data), checksum))
+
+
+class TestChunkedUpload:
+    """Test sessions, chunk writes and completion."""
+
+    def test_out_of_order_chunks_assemble_in_place(self, uploads_dir: Path):
+        content = bytes(range(256)) * 5
+        session = create_session(len(content), 512, "movie.mp4", {"title": "Movie"})
+        assert session.chunk_count == 3
+        assert session.chunk_length(2) == 256
+
+        for index in (2, 0):
+            _send(session, index, content[index * 512 : (index + 1) * 512])
+        assert missing_chunks(session) == [1]
+        with pytest.raises(ChunkError):
+            complete_session(session, uploads_dir / "1.mp4")
+
+        _send(session, 1, content[512:1024])
+        assert missing_chunks(session) == []
+        assert load_session(session.upload_id).metadata == {"title": "Movie"}
+
+        complete_session(session, uploads_dir / "1.mp4")
+        assert (uploads_dir / "1.mp4").read_bytes() == content
+        assert load_session(session.upload_id) is None
+
+    def test_rejected_chunks_are_not_recorded(self):
+        session = create_session(1024, 512, "movie.mp4", {})
+
+        with pytest.raises(ChunkError, match="checksum"):
+            _send(session, 0, b"a" * 512, checksum="0" * 64)
+        with pytest.raises(ChunkError):
+            _send(session, 1, b"a" * 100)
+        with pytest.raises(ChunkError):
+            _send(session, 1, b"a" * 600)
+        with pytest.raises(ChunkError):
+            _send(session, 2, b"a" * 512)
+        assert missing_chunks(session) == [0, 1]
+
+        # Resending a chunk after a failure is fine
+        _send(session, 0, b"a" * 512)
+        assert missing_chunks(session) == [1]
+
+    def test_sweep_expired_sessions(self):
+        old = create_session(10, 10, "old.mp4", {})
+        new = create_session(10, 10, "new.mp4", {})
+
+        assert sweep_expired_sessions(3600, now=new.created_at + 60) == 0
+        assert sweep_expired_sessions(3600, now=old.created_at + 7200) == 2
+        assert load_session(old.upload_id) is None
+        assert load_session("../../etc") is None
@@ -1087,6 +1087,76 @@ class TestCmdUpload:
         captured = capsys.readouterr()
         assert "Success" in captured.out
 
+    def test_chunked_upload_resumes(self, capsys, tmp_path, monkeypatch):
+        """Test that large files are sent in chunks and an interrupted upload resumes."""
+        import hashlib
+
+        import cli.main
+        from cli.main import cmd_upload
+
+        monkeypatch.setattr(cli.main, "CHUNKED_UPLOAD_THRESHOLD_MB", 0)
+        monkeypatch.setattr(cli.main, "UPLOAD_STATE_DIR", tmp_path / "state")
+        monkeypatch.setattr(cli.main.time, "sleep", lambda seconds: None)
+
+        test_file = tmp_path / "test_video.mp4"
+        content = bytes(range(256)) * 40
+        test_file.write_bytes(content)
+
+        args = mock.Mock()
+        args.file = str(test_file)
+        args.title = "Test Video"
+        args.description = ""
+        args.category = None
+        args.parallel = 2
+
+        chunk_size = 4096
+        received = {}
+        failing = {2}
+
+        def post(url, json=None, headers=None):
+            if url.endswith("/uploads"):
+                assert json["size"] == len(content)
+                session = {"upload_id": "abc123", "chunk_size": chunk_size, "chunk_count": 3}
+                return httpx.Response(200, json={**session, "missing_chunks": [0, 1, 2]})
+            assert url.endswith("/uploads/abc123/complete")
+            return httpx.Response(200, json={"video_id": 1, "slug": "test-video"})
+
+        def get(url, headers=None):
+            missing = [index for index in range(3) if index not in received]
+            session = {"upload_id": "abc123", "chunk_size": chunk_size, "chunk_count": 3}
+            return httpx.Response(200, json={**session, "missing_chunks": missing})
+
+        def put(url, content=None, headers=None):
+            index = int(url.rsplit("/", 1)[1])
+            if index in failing:
+                raise httpx.ConnectError("connection reset")
+            assert headers["X-Chunk-SHA256"] == hashlib.sha256(content).hexdigest()
+            received[index] = content
+            return httpx.Response(200, json={"status": "ok", "index": index})
+
+        mock_client = mock.Mock()
+        mock_client.post.side_effect = post
+        mock_client.get.side_effect = get
+        mock_client.put.side_effect = put
+        mock_client.__enter__ = mock.Mock(return_value=mock_client)
+        mock_client.__exit__ = mock.Mock(return_value=False)
+
+        with mock.patch("httpx.Client", return_value=mock_client):
+            with pytest.raises(SystemExit):
+                cmd_upload(args)
+            assert "resume" in capsys.readouterr().out
+            assert sorted(received) == [0, 1]
+
+            # Running the same command again only sends the missing chunk
+            failing.clear()
+            received_before = dict(received)
+            cmd_upload(args)
+
+        assert "Resuming upload (1 of 3 chunks left)" in capsys.readouterr().out
+        assert received[0] is received_before[0]
+        assert b"".join(received[index] for index in range(3)) == content
+        assert not list((tmp_path / "state").iterdir())
+
 
 class TestCmdDownload:
     """Test the cmd_download command."""
@@ -265,6 +265,29 @@ class TestConcurrentDownloadLimits:
         # Clean up
         _active_downloads_per_ip.clear()
 
+    def test_slot_released_when_download_finishes(
+        self, mock_settings, mock_storage_available, mock_database, temp_upload_dir
+    ):
+        """The concurrency slot is held while the file streams and released when it ends."""
+        from api.public import _active_downloads_per_ip, app
+
+        _, test_file = temp_upload_dir
+        _active_downloads_per_ip.clear()
+        mock_database.return_value = {"id": 123, "slug": "test-video", "title": "Test Video", "status": "ready"}
+
+        client = TestClient(app)
+        response = client.get("/api/videos/test-video/download/original")
+        assert response.status_code == 200
+        assert response.content == test_file.read_bytes()
+        assert 'filename="Test_Video.mp4"' in response.headers["content-disposition"]
+        assert "testclient" not in _active_downloads_per_ip
+
+        # Resumed downloads get byte ranges
+        response = client.get("/api/videos/test-video/download/original", headers={"Range": "bytes=0-9"})
+        assert response.status_code == 206
+        assert response.content == test_file.read_bytes()[:10]
+        assert "testclient" not in _active_downloads_per_ip
+
 
 class TestFileValidation:
     """Tests for file validation in _find_original_file."""
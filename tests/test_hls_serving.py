@@ -84,6 +84,18 @@ class TestHLSStaticFiles:
         assert response.status_code == 200
         assert response.headers["cache-control"] == "no-cache"
 
+    def test_complete_playlists_are_cacheable(self, hls_client, hls_test_dir):
+        """Test that ended playlists, and masters whose variants all ended, are cacheable."""
+        from config import MANIFEST_CACHE_MAX_AGE
+
+        response = hls_client.get("/videos/test-video/1080p.m3u8")
+        assert response.headers["cache-control"] == f"public, max-age={MANIFEST_CACHE_MAX_AGE}"
+
+        # The master stays no-cache while 720p.m3u8 is missing (see above)
+        (hls_test_dir / "test-video" / "720p.m3u8").write_text("#EXTM3U\n#EXT-X-ENDLIST\n")
+        response = hls_client.get("/videos/test-video/master.m3u8")
+        assert response.headers["cache-control"] == f"public, max-age={MANIFEST_CACHE_MAX_AGE}"
+
     def test_quality_playlist_returns_correct_content_type(self, hls_client):
         """Test that quality playlists return correct HLS content-type."""
         response = hls_client.get("/videos/test-video/1080p.m3u8")
@@ -2,6 +2,9 @@
 Tests for worker/http_client.py error handling.
 """
 
+import io
+import json
+import tarfile
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +17,7 @@ from worker.http_client import (
     CIRCUIT_BREAKER_BASE_RESET_SECONDS,
     CIRCUIT_BREAKER_FAILURE_THRESHOLD,
     CircuitBreakerOpen,
+    DownloadProgress,
     WorkerAPIClient,
     WorkerAPIError,
 )
@@ -344,3 +348,207 @@ class TestCircuitBreaker:
         assert isinstance(error, WorkerAPIError)
         assert error.status_code == 0
         assert "Circuit breaker open" in error.message
+
+
+class TestDownloadSourceResume:
+    """Test resumable source downloads in download_source."""
+
+    @staticmethod
+    def _client_with_transport(handler) -> WorkerAPIClient:
+        client = WorkerAPIClient("http://test.example.com", "test-api-key")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_interrupted_download_resumes_with_range(self, tmp_path):
+        """A dropped connection resumes from the last byte written."""
+        content = b"0123456789" * 10
+        range_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            range_header = request.headers.get("range")
+            range_headers.append(range_header)
+            if range_header is None:
+                # Advertise the full size but send only the first 40 bytes
+                return httpx.Response(200, headers={"Content-Length": str(len(content))}, content=content[:40])
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            return httpx.Response(
+                206,
+                headers={"Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"},
+                content=content[start:],
+            )
+
+        client = self._client_with_transport(handler)
+        dest = tmp_path / "source.mp4"
+        progress = DownloadProgress()
+
+        with mock.patch("worker.http_client.asyncio.sleep", new=mock.AsyncMock()):
+            await client.download_source(1, dest, progress=progress)
+
+        assert dest.read_bytes() == content
+        assert range_headers == [None, "bytes=40-"]
+        assert progress.complete is True
+        assert progress.bytes_written == progress.total_bytes == len(content)
+
+    @pytest.mark.asyncio
+    async def test_ignored_range_restarts_download(self, tmp_path):
+        """If the server answers a resume with 200, the file is rewritten from the start."""
+        content = b"abcdefghij" * 5
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.headers.get("range"))
+            if len(calls) == 1:
+                return httpx.Response(200, headers={"Content-Length": str(len(content))}, content=content[:20])
+            return httpx.Response(200, content=content)
+
+        client = self._client_with_transport(handler)
+        dest = tmp_path / "source.mp4"
+
+        with mock.patch("worker.http_client.asyncio.sleep", new=mock.AsyncMock()):
+            await client.download_source(1, dest)
+
+        assert dest.read_bytes() == content
+        assert calls == [None, "bytes=20-"]
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self, tmp_path):
+        """4xx responses fail immediately and mark the progress as failed."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(409, json={"detail": "Claim expired"})
+
+        client = self._client_with_transport(handler)
+        progress = DownloadProgress()
+
+        with pytest.raises(WorkerAPIError) as exc_info:
+            await client.download_source(1, tmp_path / "source.mp4", progress=progress)
+
+        assert exc_info.value.status_code == 409
+        assert len(calls) == 1
+        assert progress.failed is True
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_without_progress(self, tmp_path):
+        """Repeated failures with no data received give up after max_retries."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectError("Connection refused")
+
+        client = self._client_with_transport(handler)
+        client.max_retries = 2
+
+        with mock.patch("worker.http_client.asyncio.sleep", new=mock.AsyncMock()):
+            with pytest.raises(WorkerAPIError) as exc_info:
+                await client.download_source(1, tmp_path / "source.mp4")
+
+        assert exc_info.value.status_code == 0
+        assert len(calls) == 3
+
+
+class TestStreamedTarUpload:
+    """Test uploading quality output as an on-the-fly uncompressed tar."""
+
+    @staticmethod
+    def _client_with_transport(handler) -> WorkerAPIClient:
+        client = WorkerAPIClient("http://test.example.com", "test-api-key", stream_archives=True)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_upload_quality_streams_plain_tar(self, tmp_path):
+        """The body is a valid tar whose length matches the precomputed Content-Length."""
+        cmaf_dir = tmp_path / "1080p"
+        cmaf_dir.mkdir()
+        (cmaf_dir / "init.mp4").write_bytes(b"init")
+        (cmaf_dir / "seg_0001.m4s").write_bytes(b"x" * 3000)
+        (cmaf_dir / "playlist.m3u8").write_text("#EXTM3U\n")
+        captured = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            captured["headers"] = request.headers
+            captured["body"] = await request.aread()
+            return httpx.Response(200, json={"status": "ok"})
+
+        client = self._client_with_transport(handler)
+        with mock.patch("tarfile.open", side_effect=AssertionError("no temp archive expected")):
+            result = await client.upload_quality(video_id=1, quality_name="1080p", output_dir=tmp_path)
+
+        assert result == {"status": "ok"}
+        assert captured["headers"]["content-type"] == "application/x-tar"
+        assert int(captured["headers"]["content-length"]) == len(captured["body"])
+
+        with tarfile.open(fileobj=io.BytesIO(captured["body"]), mode="r:") as tar:
+            contents = {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+        assert contents == {
+            "1080p/init.mp4": b"init",
+            "1080p/playlist.m3u8": b"#EXTM3U\n",
+            "1080p/seg_0001.m4s": b"x" * 3000,
+        }
+
+    @pytest.mark.asyncio
+    async def test_upload_quality_timeout_reports_archive_size(self, tmp_path):
+        """Timeouts keep the existing error message format."""
+        (tmp_path / "720p.m3u8").write_text("#EXTM3U\n")
+        (tmp_path / "720p_0001.ts").write_bytes(b"x" * (2 * 1024 * 1024))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.WriteTimeout("Timeout during upload", request=request)
+
+        client = self._client_with_transport(handler)
+        with pytest.raises(WorkerAPIError) as exc_info:
+            await client.upload_quality(video_id=1, quality_name="720p", output_dir=tmp_path)
+
+        assert exc_info.value.status_code == 0
+        assert "Upload timeout for 720p (2.0MB)" in exc_info.value.message
+
+
+class TestUploadSegmentBatch:
+    """Test batched segment uploads."""
+
+    @pytest.mark.asyncio
+    async def test_sends_manifest_and_concatenated_body(self):
+        captured = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["url"] = str(request.url)
+            captured["manifest"] = json.loads(request.headers["x-segment-manifest"])
+            captured["body"] = request.content
+            return httpx.Response(200, json={"status": "ok", "results": []})
+
+        client = WorkerAPIClient("http://test.example.com", "test-api-key")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.upload_segment_batch(
+            video_id=7,
+            quality="720p",
+            segments=[("init.mp4", b"init", "a" * 64), ("seg_0001.m4s", b"segment", "b" * 64)],
+        )
+
+        assert captured["url"] == "http://test.example.com/api/worker/upload/7/segments/720p/batch"
+        assert captured["manifest"] == [
+            {"filename": "init.mp4", "size": 4, "sha256": "a" * 64},
+            {"filename": "seg_0001.m4s", "size": 7, "sha256": "b" * 64},
+        ]
+        assert captured["body"] == b"initsegment"
+
+    @pytest.mark.asyncio
+    async def test_http2_without_h2_falls_back(self):
+        """Requesting HTTP/2 without the h2 package degrades to HTTP/1.1."""
+        client = WorkerAPIClient("http://test.example.com", "test-api-key", http2=True)
+        real_client = httpx.AsyncClient
+
+        def fake_client(*args, **kwargs):
+            if kwargs.get("http2"):
+                raise ImportError("h2 not installed")
+            return real_client(*args, **kwargs)
+
+        with mock.patch("worker.http_client.httpx.AsyncClient", side_effect=fake_client):
+            http_client = await client._get_client()
+
+        assert client.http2 is False
+        await http_client.aclose()
@@ -15,6 +15,11 @@ from worker.hwaccel import (
     _get_nvidia_session_limit,
     _test_nvenc_encoder,
     _test_vaapi_encoder,
+    build_audio_rendition_command,
+    build_chunk_encode_command,
+    build_chunk_stitch_command,
+    build_cmaf_transcode_command,
+    build_ladder_transcode_command,
     build_transcode_command,
     detect_gpu_capabilities,
     detect_nvidia_gpu,
@@ -254,6 +259,180 @@ class TestBuildTranscodeCommand:
         assert "-vaapi_device" not in cmd
 
 
+
+class TestBuildLadderTranscodeCommand:
+    """Tests for single-decode ladder command generation."""
+
+    QUALITIES = [
+        {"name": "1080p", "height": 1080, "bitrate": "5000k", "audio_bitrate": "128k"},
+        {"name": "720p", "height": 720, "bitrate": "2500k", "audio_bitrate": "128k"},
+    ]
+
+    def _cpu_selection(self, height):
+        return select_encoder(None, height, VideoCodec.H264)
+
+    def test_single_input_with_split_filter(self):
+        """Test the source is decoded once and split to every rendition."""
+        selections = [self._cpu_selection(q["height"]) for q in self.QUALITIES]
+        cmd = build_ladder_transcode_command(Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITIES, selections)
+
+        assert cmd.count("-i") == 1
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.startswith("[0:v]split=2[v0][v1]")
+        assert "[v0]scale=-2:1080[out0]" in graph
+        assert "[v1]scale=-2:720[out1]" in graph
+        assert cmd.count("-progress") == 1
+        assert "-vf" not in cmd
+
+    def test_hls_ts_outputs(self):
+        """Test each rendition gets its own mapped HLS/TS output."""
+        selections = [self._cpu_selection(q["height"]) for q in self.QUALITIES]
+        cmd = build_ladder_transcode_command(Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITIES, selections)
+
+        assert "[out0]" in cmd and "[out1]" in cmd
+        assert cmd.count("0:a:0?") == 2
+        assert "5000k" in cmd and "2500k" in cmd
+        assert "/tmp/output/1080p.m3u8" in cmd
+        assert "/tmp/output/720p_%04d.ts" in cmd
+        assert "fmp4" not in cmd
+
+    def test_cmaf_outputs(self):
+        """Test CMAF renditions use the per-quality subdirectory layout."""
+        selections = [self._cpu_selection(q["height"]) for q in self.QUALITIES]
+        cmd = build_ladder_transcode_command(
+            Path("/tmp/input.mp4"),
+            Path("/tmp/output"),
+            self.QUALITIES,
+            selections,
+            streaming_format="cmaf",
+        )
+
+        assert cmd.count("fmp4") == 2
+        assert "/tmp/output/1080p/stream.m3u8" in cmd
+        assert "/tmp/output/720p/seg_%04d.m4s" in cmd
+
+    def test_vaapi_uses_selection_filters(self):
+        """Test hardware input args are shared and branch filters come from the selection."""
+        selections = [
+            EncoderSelection(
+                encoder=EncoderInfo(
+                    name="h264_vaapi",
+                    codec=VideoCodec.H264,
+                    hwaccel_type=HWAccelType.INTEL,
+                    is_hardware=True,
+                ),
+                input_args=["-vaapi_device", "/dev/dri/renderD128"],
+                output_args=["-c:v", "h264_vaapi", "-qp", "23"],
+                scale_filter=f"format=nv12,hwupload,scale_vaapi=-2:{q['height']}",
+            )
+            for q in self.QUALITIES
+        ]
+        cmd = build_ladder_transcode_command(Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITIES, selections)
+
+        assert cmd.count("-vaapi_device") == 1
+        assert cmd.index("-vaapi_device") < cmd.index("-i")
+        assert cmd.count("h264_vaapi") == 2
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "[v1]format=nv12,hwupload,scale_vaapi=-2:720[out1]" in graph
+
+    def test_mismatched_selections_rejected(self):
+        """Test qualities and selections must line up."""
+        with pytest.raises(ValueError):
+            build_ladder_transcode_command(
+                Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITIES, [self._cpu_selection(1080)]
+            )
+
+
+class TestBuildChunkCommands:
+    """Tests for chunked encoding command generation."""
+
+    QUALITY = {"name": "1080p", "height": 1080, "bitrate": "5000k", "audio_bitrate": "128k"}
+
+    def test_chunk_encode_seeks_and_drops_audio(self):
+        """Test a chunk is an input-seeked, video-only encode of its source range."""
+        selection = select_encoder(None, 1080, VideoCodec.H264)
+        cmd = build_chunk_encode_command(
+            Path("/tmp/input.mp4"), Path("/tmp/chunks/chunk_0001.mkv"), self.QUALITY, selection, 299.999, 300.5
+        )
+
+        assert cmd.index("-ss") < cmd.index("-i") and cmd.index("-t") < cmd.index("-i")
+        assert cmd[cmd.index("-ss") + 1] == "299.999000"
+        assert cmd[cmd.index("-t") + 1] == "300.500000"
+        assert "-an" in cmd and "libx264" in cmd and "5000k" in cmd
+        assert cmd[-3:] == ["-f", "matroska", "/tmp/chunks/chunk_0001.mkv"]
+
+    def test_first_and_last_chunks(self):
+        """Test the first chunk doesn't seek and the last one runs to the end."""
+        selection = select_encoder(None, 1080, VideoCodec.H264)
+        first = build_chunk_encode_command(Path("/in.mp4"), Path("/c0.mkv"), self.QUALITY, selection, 0.0, 300.0)
+        last = build_chunk_encode_command(Path("/in.mp4"), Path("/c9.mkv"), self.QUALITY, selection, 2700.0, None)
+
+        assert "-ss" not in first and "-t" in first
+        assert "-ss" in last and "-t" not in last
+
+    def test_stitch_copies_video_and_encodes_audio_once(self):
+        """Test chunks are joined by stream copy into the CMAF layout, with audio from the source."""
+        selection = select_encoder(None, 1080, VideoCodec.HEVC)
+        cmd = build_chunk_stitch_command(
+            Path("/tmp/chunks/chunks.txt"), Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITY, selection
+        )
+
+        assert cmd[cmd.index("concat") + 3 : cmd.index("concat") + 5] == ["-i", "/tmp/chunks/chunks.txt"]
+        assert cmd[cmd.index("-c:v") + 1] == "copy"
+        assert cmd[cmd.index("-tag:v") + 1] == "hvc1"
+        assert "1:a:0?" in cmd and "128k" in cmd
+        assert "/tmp/output/1080p/seg_%04d.m4s" in cmd
+        assert cmd[-1] == "/tmp/output/1080p/stream.m3u8"
+
+
+class TestSharedAudioCommands:
+    """Tests for the shared CMAF audio rendition commands."""
+
+    QUALITY = {"name": "1080p", "height": 1080, "bitrate": "5000k", "audio_bitrate": "128k"}
+
+    def test_audio_rendition_encode_and_passthrough(self):
+        """Test the audio rendition is audio-only and copies AAC on passthrough."""
+        encode = build_audio_rendition_command(Path("/tmp/input.mp4"), Path("/tmp/output"), "192k")
+        copy = build_audio_rendition_command(Path("/tmp/input.mp4"), Path("/tmp/output"), "192k", passthrough=True)
+
+        assert "0:a:0" in encode and "-vn" in encode
+        assert encode[encode.index("-c:a") + 1] == "aac" and "192k" in encode
+        assert copy[copy.index("-c:a") + 1] == "copy" and "192k" not in copy
+        assert "/tmp/output/audio/seg_%04d.m4s" in copy
+        assert copy[-1] == "/tmp/output/audio/stream.m3u8"
+
+    def test_audio_rendition_follows_downloading_source(self):
+        """Test a source that is still downloading is read with the file protocol's follow mode."""
+        cmd = build_audio_rendition_command(Path("/tmp/input.mp4"), Path("/tmp/output"), "192k", follow_timeout=60.0)
+
+        assert cmd[cmd.index("-i") + 1] == "file:/tmp/input.mp4"
+        assert cmd[cmd.index("-follow") + 1] == "1"
+        assert cmd[cmd.index("-rw_timeout") + 1] == "60000000"
+        assert cmd.index("-follow") < cmd.index("-i")
+
+    def test_video_only_renditions(self):
+        """Test audio=False drops the audio from every CMAF rendition command."""
+        selection = select_encoder(None, 1080, VideoCodec.H264)
+        cmaf = build_cmaf_transcode_command(
+            Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITY, selection, audio=False
+        )
+        stitch = build_chunk_stitch_command(
+            Path("/tmp/chunks.txt"), Path("/tmp/input.mp4"), Path("/tmp/output"), self.QUALITY, selection, audio=False
+        )
+        ladder = build_ladder_transcode_command(
+            Path("/tmp/input.mp4"),
+            Path("/tmp/output"),
+            [self.QUALITY],
+            [selection],
+            streaming_format="cmaf",
+            audio=False,
+        )
+
+        assert "-an" in cmaf and "-c:a" not in cmaf
+        assert "-c:a" not in stitch and "/tmp/input.mp4" not in stitch
+        assert "0:a:0?" not in ladder and "-c:a" not in ladder
+
+
 class TestFFmpegErrorExtraction:
     """Tests for FFmpeg error message extraction."""
 
@@ -22,6 +22,7 @@ from api.job_queue import (
     DEAD_LETTER_STREAM,
     PRIORITY_STREAMS,
     STREAM_PRIORITIES,
+    ClaimWaiters,
     JobDispatch,
     JobQueue,
     get_job_queue,
@@ -347,13 +348,67 @@ class TestJobQueueClaim:
             with patch("api.job_queue.get_redis", return_value=mock_redis):
                 await queue.claim_job()
 
-        # Should have checked all three streams in order
-        assert mock_redis.xreadgroup.call_count == 3
+        # Each stream is read without blocking in priority order, then all three with one blocking call
         calls = mock_redis.xreadgroup.call_args_list
-        streams_checked = [list(call[0][2].keys())[0] for call in calls]
-        assert "high" in streams_checked[0]
-        assert "normal" in streams_checked[1]
-        assert "low" in streams_checked[2]
+        assert mock_redis.xreadgroup.call_count == 4
+        streams_checked = [list(call[0][2].keys()) for call in calls]
+        assert [len(streams) for streams in streams_checked] == [1, 1, 1, 3]
+        for streams in (streams_checked[:3], [[name] for name in streams_checked[3]]):
+            assert "high" in streams[0][0]
+            assert "normal" in streams[1][0]
+            assert "low" in streams[2][0]
+        assert [call.kwargs["block"] for call in calls[:3]] == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_claim_job_stops_at_first_stream_with_a_message(self):
+        """A message on the high stream is returned without reading the other streams."""
+        queue = JobQueue()
+        queue._redis_available = True
+        queue._consumer_name = "test-consumer"
+        mock_redis = AsyncMock()
+        mock_redis.xpending_range = AsyncMock(return_value=[])
+        mock_redis.xreadgroup = AsyncMock(
+            return_value=[[PRIORITY_STREAMS["high"], [("1-0", {"job_id": "1", "video_id": "100", "video_slug": "v1"})]]]
+        )
+
+        with patch("api.job_queue.JOB_QUEUE_MODE", "redis"):
+            with patch("api.job_queue.get_redis", return_value=mock_redis):
+                claimed = await queue.claim_job()
+
+        assert claimed.job_id == 1
+        assert mock_redis.xreadgroup.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_claim_job_releases_extra_messages_from_blocking_read(self):
+        """Messages delivered from several streams at once: the highest wins, the rest are released."""
+        queue = JobQueue()
+        queue._redis_available = True
+        queue._consumer_name = "test-consumer"
+        mock_redis = AsyncMock()
+        mock_redis.xpending_range = AsyncMock(return_value=[])
+        mock_redis.xreadgroup = AsyncMock(
+            side_effect=[
+                None,
+                None,
+                None,
+                [
+                    [PRIORITY_STREAMS["low"], [("3-0", {"job_id": "3", "video_id": "300", "video_slug": "v3"})]],
+                    [PRIORITY_STREAMS["high"], [("1-0", {"job_id": "1", "video_id": "100", "video_slug": "v1"})]],
+                ],
+            ]
+        )
+
+        with patch("api.job_queue.JOB_QUEUE_MODE", "redis"):
+            with patch("api.job_queue.get_redis", return_value=mock_redis):
+                claimed = await queue.claim_job()
+
+        assert claimed.job_id == 1
+        assert claimed._stream_name == PRIORITY_STREAMS["high"]
+        # The low-priority message is put back for other workers and acknowledged here
+        mock_redis.xadd.assert_awaited_once()
+        assert mock_redis.xadd.call_args[0][0] == PRIORITY_STREAMS["low"]
+        assert mock_redis.xadd.call_args[0][1]["job_id"] == "3"
+        mock_redis.xack.assert_awaited_once_with(PRIORITY_STREAMS["low"], api.job_queue.REDIS_CONSUMER_GROUP, "3-0")
 
     @pytest.mark.asyncio
     async def test_claim_job_returns_job_from_stream(self):
@@ -391,6 +446,51 @@ class TestJobQueueClaim:
         assert result._message_id == "1234-0"
 
 
+class TestClaimWaiters:
+    """Tests for waking long-polling claims."""
+
+    @pytest.mark.asyncio
+    async def test_notify_one_wakes_oldest_waiter_only(self):
+        """Each notification wakes exactly one parked waiter, oldest first."""
+        waiters = ClaimWaiters()
+        first = asyncio.create_task(waiters.wait(5))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(waiters.wait(5))
+        await asyncio.sleep(0)
+        assert len(waiters) == 2
+
+        assert waiters.notify_one() is True
+        assert await first is True
+        assert not second.done()
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert len(waiters) == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Without a notification, wait returns False after the timeout."""
+        waiters = ClaimWaiters()
+        assert await waiters.wait(0.01) is False
+        assert len(waiters) == 0
+
+    @pytest.mark.asyncio
+    async def test_recent_unclaimed_notification_consumed(self):
+        """A notification with nobody parked is picked up by the next waiter within the grace period."""
+        waiters = ClaimWaiters()
+        assert waiters.notify_one() is False
+
+        assert await waiters.wait(5) is True
+        # Consumed: the next waiter has to wait
+        assert await waiters.wait(0.01) is False
+
+        with patch.object(ClaimWaiters, "NOTIFICATION_GRACE_SECONDS", 0):
+            waiters.notify_one()
+            await asyncio.sleep(0.01)
+            assert await waiters.wait(0.01) is False
+
+
 class TestJobQueueRecoverAbandoned:
     """Tests for recovering abandoned messages."""
 
@@ -0,0 +1,234 @@
+"""
+Tests for media file serving (api/media_files.py).
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from api.media_files import (
+    MAX_RANGES,
+    FileInfo,
+    ManifestCache,
+    MediaFileResponse,
+    MediaStaticFiles,
+    RangeNotSatisfiable,
+    StatIndex,
+    invalidate_directory,
+    mark_partial_manifest,
+    parse_manifest,
+    parse_range_header,
+)
+
+CONTENT = bytes(range(256)) * 4  # 1024 bytes
+
+
+class TestParseRangeHeader:
+    """Test Range header parsing."""
+
+    def test_ranges(self):
+        assert parse_range_header("bytes=0-99", 1024) == [(0, 100)]
+        assert parse_range_header("bytes=1000-", 1024) == [(1000, 1024)]
+        assert parse_range_header("bytes=-24", 1024) == [(1000, 1024)]
+        assert parse_range_header("bytes=1000-5000", 1024) == [(1000, 1024)]
+        # Sorted and merged when overlapping or adjacent
+        assert parse_range_header("bytes=500-599, 0-99, 50-149, 600-699", 1024) == [(0, 150), (500, 700)]
+
+    def test_ignored_and_unsatisfiable(self):
+        assert parse_range_header("items=0-1", 1024) is None
+        assert parse_range_header("bytes=abc", 1024) is None
+        assert parse_range_header("bytes=5-1", 1024) is None
+        assert parse_range_header("bytes=" + ",".join(f"{i}-{i}" for i in range(MAX_RANGES + 1)), 1024) is None
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=2000-3000", 1024)
+
+
+class TestMediaFileResponse:
+    """Test responses served from cached file info."""
+
+    @pytest.fixture
+    def media_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "segment.m4s"
+        path.write_bytes(CONTENT)
+        return path
+
+    @pytest.fixture
+    def completed(self):
+        return []
+
+    @pytest.fixture
+    def client(self, media_file: Path, completed):
+        async def on_complete():
+            completed.append(True)
+
+        async def serve(request):
+            info = FileInfo.from_stat(str(media_file), os.stat(media_file))
+            return MediaFileResponse(info, media_type="video/iso.segment", on_complete=on_complete)
+
+        return TestClient(Starlette(routes=[Route("/file", serve)]))
+
+    def test_full_and_single_range(self, client, completed):
+        response = client.get("/file")
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["accept-ranges"] == "bytes"
+
+        response = client.get("/file", headers={"Range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert response.content == CONTENT[100:200]
+        assert response.headers["content-range"] == "bytes 100-199/1024"
+        assert response.headers["content-length"] == "100"
+        assert completed == [True, True]
+
+    def test_multiple_ranges(self, client):
+        response = client.get("/file", headers={"Range": "bytes=0-9,500-509"})
+        assert response.status_code == 206
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert int(response.headers["content-length"]) == len(response.content)
+
+        parts = response.content.split(f"--{boundary}".encode())
+        assert parts[0] == b""
+        assert parts[-1] == b"--\r\n"
+        assert b"Content-Range: bytes 0-9/1024\r\n\r\n" + CONTENT[0:10] + b"\r\n" in parts[1]
+        assert parts[2].endswith(b"Content-Range: bytes 500-509/1024\r\n\r\n" + CONTENT[500:510] + b"\r\n")
+
+    def test_conditional_requests(self, client, completed):
+        etag = client.get("/file").headers["etag"]
+        last_modified = client.get("/file").headers["last-modified"]
+
+        response = client.get("/file", headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        assert client.get("/file", headers={"If-Modified-Since": last_modified}).status_code == 304
+        assert client.get("/file", headers={"If-None-Match": '"other"'}).status_code == 200
+
+        # A stale If-Range validator gets the whole file
+        response = client.get("/file", headers={"Range": "bytes=0-9", "If-Range": '"other"'})
+        assert response.status_code == 200
+        assert len(response.content) == len(CONTENT)
+
+        response = client.get("/file", headers={"Range": "bytes=5000-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */1024"
+        assert len(completed) == 7
+
+
+class TestMediaStaticFiles:
+    """Test lookups through the stat index."""
+
+    def test_lookups_cached(self, tmp_path: Path):
+        (tmp_path / "a.ts").write_bytes(CONTENT)
+        index = StatIndex(ttl=60)
+        app = Starlette(routes=[Mount("/videos", MediaStaticFiles(directory=str(tmp_path), stat_index=index))])
+        client = TestClient(app)
+
+        for _ in range(3):
+            assert client.get("/videos/a.ts").content == CONTENT
+        assert (index.misses, index.hits) == (1, 2)
+
+        # Missing files are not cached, so they are served once written
+        assert client.get("/videos/b.ts").status_code == 404
+        (tmp_path / "b.ts").write_bytes(b"later")
+        assert client.get("/videos/b.ts").content == b"later"
+
+        assert index.invalidate(lambda info: info.path.endswith("a.ts")) == 1
+        assert len(index) == 1
+
+
+MASTER = """#EXTM3U
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="audio",NAME="default",URI="audio/playlist.m3u8"
+#EXT-X-STREAM-INF:BANDWIDTH=5000000,RESOLUTION=1920x1080,AUDIO="audio"
+1080p/playlist.m3u8
+"""
+MEDIA = "#EXTM3U\n#EXT-X-TARGETDURATION:6\n#EXTINF:6.0,\nsegment_00000.m4s\n"
+
+
+class TestManifests:
+    """Test manifests served from the manifest cache."""
+
+    def test_parse_manifest(self):
+        assert parse_manifest("master.m3u8", MASTER.encode()) == (False, ("audio/playlist.m3u8", "1080p/playlist.m3u8"))
+        assert parse_manifest("playlist.m3u8", MEDIA.encode()) == (False, ())
+        assert parse_manifest("playlist.m3u8", (MEDIA + "#EXT-X-ENDLIST\n").encode()) == (True, ())
+        assert parse_manifest("manifest.mpd", b'<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="static">') == (
+            True,
+            (),
+        )
+        assert parse_manifest("manifest.mpd", b'<MPD type="dynamic" minimumUpdatePeriod="PT2S">') == (False, ())
+
+    def test_master_completes_with_variants(self, tmp_path: Path):
+        video_dir = tmp_path / "video"
+        (video_dir / "1080p").mkdir(parents=True)
+        (video_dir / "audio").mkdir()
+        (video_dir / "master.m3u8").write_text(MASTER)
+        (video_dir / "1080p" / "playlist.m3u8").write_text(MEDIA + "#EXT-X-ENDLIST\n")
+        (video_dir / "audio" / "playlist.m3u8").write_text(MEDIA)
+
+        class Files(MediaStaticFiles):
+            def file_headers(self, path, complete=False):
+                return None, {"X-Complete": str(complete)}
+
+        cache = ManifestCache()
+        files = Files(directory=str(tmp_path), stat_index=StatIndex(ttl=0), manifest_cache=cache)
+        client = TestClient(Starlette(routes=[Mount("/videos", files)]))
+
+        response = client.get("/videos/video/master.m3u8")
+        assert response.text == MASTER
+        assert response.headers["x-complete"] == "False"
+        etag = response.headers["etag"]
+
+        # The audio playlist ends: the master is complete, and only the variants are read
+        audio = video_dir / "audio" / "playlist.m3u8"
+        audio.write_text(MEDIA + "#EXT-X-ENDLIST\n")
+        os.utime(audio, ns=(1, 1))
+        misses = cache.misses
+        response = client.get("/videos/video/master.m3u8")
+        assert response.headers["x-complete"] == "True"
+        assert cache.misses == misses + 2
+
+        # Content-hash ETags survive rewriting the same content
+        os.utime(video_dir / "master.m3u8", ns=(2, 2))
+        assert client.get("/videos/video/master.m3u8").headers["etag"] == etag
+        response = client.get("/videos/video/master.m3u8", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_partial_master_is_not_complete(self, tmp_path: Path):
+        video_dir = tmp_path / "video"
+        (video_dir / "1080p").mkdir(parents=True)
+        (video_dir / "audio").mkdir()
+        (video_dir / "master.m3u8").write_text(MASTER)
+        (video_dir / "1080p" / "playlist.m3u8").write_text(MEDIA + "#EXT-X-ENDLIST\n")
+        (video_dir / "audio" / "playlist.m3u8").write_text(MEDIA + "#EXT-X-ENDLIST\n")
+        mark_partial_manifest(video_dir / "master.m3u8")
+        assert (video_dir / "master.m3u8").read_text() == MASTER + "#VLOG-PARTIAL\n"
+        assert [path.name for path in video_dir.iterdir() if path.is_file()] == ["master.m3u8"]
+
+        class Files(MediaStaticFiles):
+            def file_headers(self, path, complete=False):
+                return None, {"X-Complete": str(complete)}
+
+        files = Files(directory=str(tmp_path), stat_index=StatIndex(ttl=0))
+        client = TestClient(Starlette(routes=[Mount("/videos", files)]))
+        # Every variant has ended, but more renditions are still to come
+        assert client.get("/videos/video/master.m3u8").headers["x-complete"] == "False"
+
+    def test_invalidate_directory(self, tmp_path: Path):
+        (tmp_path / "video").mkdir()
+        (tmp_path / "video" / "playlist.m3u8").write_text(MEDIA)
+        (tmp_path / "other.m3u8").write_text(MEDIA)
+        client = TestClient(Starlette(routes=[Mount("/videos", MediaStaticFiles(directory=str(tmp_path)))]))
+        client.get("/videos/video/playlist.m3u8")
+        client.get("/videos/other.m3u8")
+
+        # The file lookup and the manifest of the video's directory only
+        assert invalidate_directory(str(tmp_path / "video")) == 2
+        assert invalidate_directory(str(tmp_path / "video")) == 0
@@ -384,14 +384,11 @@ class TestStorageReconciliationConfig:
         """Test that storage reconciliation has sensible defaults."""
         from api.metrics import (
             STORAGE_RECONCILIATION_INTERVAL_SECONDS,
-            STORAGE_SCAN_MAX_FILES,
             STORAGE_SCAN_TIMEOUT_SECONDS,
         )
 
         # Default 6 hours
         assert STORAGE_RECONCILIATION_INTERVAL_SECONDS == 6 * 60 * 60
-        # Default 5 million files
-        assert STORAGE_SCAN_MAX_FILES == 5_000_000
         # Default 30 minutes timeout
         assert STORAGE_SCAN_TIMEOUT_SECONDS == 1800
 
@@ -0,0 +1,288 @@
+"""
+Tests for the object storage backends (api/object_storage.py).
+
+The S3 backend runs against an in-memory S3-compatible stand-in.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+import api.object_storage
+from api.database import videos
+from api.media_files import MediaStaticFiles, PublishedVideos, StatIndex
+from api.object_storage import (
+    STORAGE_SYNC_RESET,
+    FilesystemBackend,
+    S3Backend,
+    StorageBackend,
+    publish_video,
+    sync_directory,
+    video_published,
+)
+
+MB = 1024 * 1024
+
+
+class FakeS3Client:
+    """Minimal in-memory S3 API (the calls S3Backend makes)."""
+
+    def __init__(self, page_size: int = 1000):
+        self.objects = {}
+        self.uploads = {}
+        self.part_threads = set()
+        self.page_size = page_size
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, **extra):
+        self.objects[Key] = (Body.read(), extra, datetime.now(timezone.utc))
+
+    def create_multipart_upload(self, Bucket, Key, **extra):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {"key": Key, "extra": extra, "parts": {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self._lock:
+            self.part_threads.add(threading.get_ident())
+            self.uploads[UploadId]["parts"][PartNumber] = Body
+        time.sleep(0.01)
+        return {"ETag": hashlib.md5(Body).hexdigest()}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.uploads.pop(UploadId)
+        data = b"".join(upload["parts"][part["PartNumber"]] for part in MultipartUpload["Parts"])
+        self.objects[Key] = (data, upload["extra"], datetime.now(timezone.utc))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key][0])}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + self.page_size]
+        response = {
+            "Contents": [
+                {"Key": key, "Size": len(self.objects[key][0]), "LastModified": self.objects[key][2]} for key in page
+            ],
+            "IsTruncated": start + self.page_size < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+    def delete_objects(self, Bucket, Delete):
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://bucket.example/{Params['Key']}?expires={ExpiresIn}"
+
+
+@pytest.fixture
+def s3() -> FakeS3Client:
+    return FakeS3Client(page_size=2)
+
+
+@pytest.fixture
+def backend(s3: FakeS3Client) -> S3Backend:
+    return S3Backend(bucket="vlog", key_prefix="videos/", multipart_threshold=5 * MB, part_size=5 * MB, client=s3)
+
+
+class TestS3Backend:
+    """Test uploads, listing and deletes against the S3 stand-in."""
+
+    def test_put_file_and_multipart(self, tmp_path: Path, s3: FakeS3Client, backend: S3Backend):
+        small = tmp_path / "seg_0001.m4s"
+        small.write_bytes(b"segment")
+        large = tmp_path / "source.mp4"
+        large.write_bytes(bytes(range(256)) * (11 * MB // 256 + 1))
+
+        backend.put_file("demo/1080p/seg_0001.m4s", small)
+        backend.put_file("demo/source.mp4", large)
+
+        data, extra, _ = s3.objects["videos/demo/1080p/seg_0001.m4s"]
+        assert data == b"segment"
+        assert extra == {"ContentType": "video/iso.segment", "CacheControl": "public, max-age=31536000"}
+        # 3 parts of at most 5 MB, uploaded in parallel and reassembled in order
+        assert s3.objects["videos/demo/source.mp4"][0] == large.read_bytes()
+        assert len(s3.part_threads) > 1
+        assert not s3.uploads
+
+        backend.get_file("demo/1080p/seg_0001.m4s", tmp_path / "download" / "seg.m4s")
+        assert (tmp_path / "download" / "seg.m4s").read_bytes() == b"segment"
+        assert (
+            backend.presigned_url("demo/source.mp4", 60) == "https://bucket.example/videos/demo/source.mp4?expires=60"
+        )
+
+    def test_failed_multipart_upload_is_aborted(self, tmp_path: Path, s3: FakeS3Client, backend: S3Backend):
+        large = tmp_path / "source.mp4"
+        large.write_bytes(b"\0" * (6 * MB))
+
+        def fail(**kwargs):
+            raise ConnectionError("reset")
+
+        s3.complete_multipart_upload = fail
+        with pytest.raises(ConnectionError):
+            backend.put_file("demo/source.mp4", large)
+        assert not s3.uploads
+        assert not s3.objects
+
+    def test_sync_directory(self, tmp_path: Path, s3: FakeS3Client, backend: S3Backend):
+        video_dir = tmp_path / "demo"
+        (video_dir / "1080p").mkdir(parents=True)
+        for name in ("master.m3u8", "1080p/init.mp4", "1080p/seg_0001.m4s", "1080p/seg_0002.m4s"):
+            (video_dir / name).write_bytes(name.encode())
+        (video_dir / "1080p" / "seg_0003.m4s.tmp").write_bytes(b"partial")
+
+        assert sync_directory(backend, video_dir, "demo/") == (4, 0)
+        # Unchanged files are skipped (listing is paginated)
+        assert sync_directory(backend, video_dir, "demo/") == (0, 0)
+
+        (video_dir / "1080p" / "seg_0002.m4s").unlink()
+        (video_dir / "master.m3u8").write_bytes(b"#EXTM3U\n")
+        assert sync_directory(backend, video_dir, "demo/") == (1, 1)
+        assert sorted(s3.objects) == [
+            "videos/demo/1080p/init.mp4",
+            "videos/demo/1080p/seg_0001.m4s",
+            "videos/demo/master.m3u8",
+        ]
+
+        # Same size, old mtime (e.g. linked in from the segment store): still re-uploaded
+        time.sleep(0.05)
+        init = video_dir / "1080p" / "init.mp4"
+        mtime = init.stat().st_mtime - 3600
+        init.write_bytes(b"x" * init.stat().st_size)
+        os.utime(init, (mtime, mtime))
+        assert sync_directory(backend, video_dir, "demo/") == (1, 0)
+
+        assert backend.delete_prefix("demo/") == 3
+        assert not s3.objects
+
+
+class TestFilesystemBackend:
+    """Test the filesystem backend."""
+
+    def test_round_trip(self, tmp_path: Path):
+        backend = FilesystemBackend(tmp_path / "bucket")
+        source = tmp_path / "thumbnail.jpg"
+        source.write_bytes(b"jpg")
+
+        assert backend.remote
+        backend.put_file("demo/thumbnail.jpg", source)
+        assert backend.list_objects("demo/") == {
+            "demo/thumbnail.jpg": (3, (tmp_path / "bucket" / "demo" / "thumbnail.jpg").stat().st_mtime)
+        }
+        backend.get_file("demo/thumbnail.jpg", tmp_path / "copy.jpg")
+        assert (tmp_path / "copy.jpg").read_bytes() == b"jpg"
+        assert backend.presigned_url("demo/thumbnail.jpg", 60) is None
+        with pytest.raises(ValueError):
+            backend.put_file("../escape.jpg", source)
+        assert backend.delete_prefix("demo/") == 1
+        assert backend.list_objects("demo/") == {}
+
+
+class TestPresignedRedirects:
+    """Test public serving of published videos."""
+
+    def test_published_segments_redirect(self, tmp_path: Path, s3: FakeS3Client, backend: S3Backend):
+        video_dir = tmp_path / "demo"
+        (video_dir / "1080p").mkdir(parents=True)
+        (video_dir / "1080p" / "seg_0001.m4s").write_bytes(b"one")
+        (video_dir / "master.m3u8").write_bytes(b"#EXTM3U\n")
+
+        published = {"demo": False}
+        lookups = []
+
+        async def load(slug: str) -> bool:
+            lookups.append(slug)
+            return published.get(slug, False)
+
+        published_videos = PublishedVideos(load, ttl=60)
+        files = MediaStaticFiles(
+            directory=str(tmp_path),
+            stat_index=StatIndex(ttl=0),
+            storage_backend=backend,
+            published_videos=published_videos,
+        )
+        client = TestClient(Starlette(routes=[Mount("/videos", files)]))
+
+        # Not published yet: served directly
+        assert client.get("/videos/demo/1080p/seg_0001.m4s", follow_redirects=False).content == b"one"
+
+        published["demo"] = True
+        published_videos.invalidate("demo")
+        response = client.get("/videos/demo/1080p/seg_0001.m4s", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://bucket.example/videos/demo/1080p/seg_0001.m4s?expires=3600"
+        assert response.headers["cache-control"] == "private, max-age=1800"
+
+        # Decided from the published state alone: the video directory is not looked at
+        (video_dir / "1080p" / "seg_0001.m4s").unlink()
+        assert client.get("/videos/demo/1080p/seg_0001.m4s", follow_redirects=False).status_code == 307
+        assert lookups == ["demo", "demo"]
+        # Manifests are always served by the API
+        assert client.get("/videos/demo/master.m3u8", follow_redirects=False).status_code == 200
+
+    def test_storage_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            StorageBackend()
+
+
+class TestPublishVideo:
+    """Test recording published videos in the database."""
+
+    async def test_publish_records_sync(self, tmp_path: Path, monkeypatch, test_database, sample_video):
+        monkeypatch.setattr(api.object_storage, "database", test_database)
+        monkeypatch.setattr(api.object_storage, "VIDEOS_DIR", tmp_path)
+        monkeypatch.setattr(api.object_storage, "_backend", FilesystemBackend(tmp_path / "bucket"))
+        video_dir = tmp_path / sample_video["slug"]
+        video_dir.mkdir()
+        (video_dir / "master.m3u8").write_bytes(b"#EXTM3U\n")
+
+        assert not await video_published(sample_video["slug"])
+        await publish_video(sample_video["slug"])
+        assert await video_published(sample_video["slug"])
+        assert (tmp_path / "bucket" / sample_video["slug"] / "master.m3u8").exists()
+
+        # Files changing again (e.g. a re-transcode claim) take the video off object storage
+        await test_database.execute(
+            videos.update().where(videos.c.id == sample_video["id"]).values(**STORAGE_SYNC_RESET)
+        )
+        assert not await video_published(sample_video["slug"])
+
+    async def test_changes_during_upload_are_not_published(
+        self, tmp_path: Path, monkeypatch, test_database, sample_video
+    ):
+        monkeypatch.setattr(api.object_storage, "database", test_database)
+        monkeypatch.setattr(api.object_storage, "VIDEOS_DIR", tmp_path)
+        monkeypatch.setattr(api.object_storage, "_backend", FilesystemBackend(tmp_path / "bucket"))
+        (tmp_path / sample_video["slug"]).mkdir()
+
+        def sync_then_claim(slug):
+            # A job claim resets the sync state while the upload runs
+            asyncio.run_coroutine_threadsafe(
+                test_database.execute(
+                    videos.update().where(videos.c.id == sample_video["id"]).values(**STORAGE_SYNC_RESET)
+                ),
+                loop,
+            ).result()
+            return (0, 0)
+
+        loop = asyncio.get_running_loop()
+        monkeypatch.setattr(api.object_storage, "publish_video_sync", sync_then_claim)
+        await publish_video(sample_video["slug"])
+        assert not await video_published(sample_video["slug"])
@@ -0,0 +1,160 @@
+"""
+Tests for worker/quality_scheduler.py adaptive parallel quality scheduling.
+"""
+
+import asyncio
+
+import pytest
+
+from worker.quality_scheduler import estimate_quality_cost, run_qualities_adaptive
+
+
+def _quality(name: str, height: int) -> dict:
+    return {"name": name, "height": height, "bitrate": "1000k"}
+
+
+class TestEstimateQualityCost:
+    """Test rendition cost estimates."""
+
+    def test_cost_scales_with_pixels_duration_and_codec(self):
+        """Higher resolution, longer duration and slower codecs all cost more."""
+        q1080 = _quality("1080p", 1080)
+        q720 = _quality("720p", 720)
+
+        assert estimate_quality_cost(q1080, 60) > estimate_quality_cost(q720, 60)
+        assert estimate_quality_cost(q720, 120) == pytest.approx(2 * estimate_quality_cost(q720, 60))
+        assert estimate_quality_cost(q720, 60, "av1") > estimate_quality_cost(q720, 60, "h264")
+
+
+class TestRunQualitiesAdaptive:
+    """Test work-stealing scheduling of quality encodes."""
+
+    @pytest.mark.asyncio
+    async def test_starts_next_quality_when_any_slot_frees(self):
+        """A short encode finishing frees its slot immediately, without waiting for the long one."""
+        qualities = [_quality("2160p", 2160), _quality("720p", 720), _quality("480p", 480), _quality("360p", 360)]
+        started = []
+        release_2160 = asyncio.Event()
+
+        async def run_quality(quality):
+            started.append(quality["name"])
+            if quality["name"] == "2160p":
+                await release_2160.wait()
+            return quality["name"]
+
+        task = asyncio.create_task(run_qualities_adaptive(qualities, run_quality, 2, 60, headroom_check=lambda: True))
+        # Every low-res quality runs alongside the still-running 2160p encode
+        for _ in range(100):
+            if len(started) == 4:
+                break
+            await asyncio.sleep(0.01)
+        assert started == ["2160p", "720p", "480p", "360p"]
+        assert not task.done()
+
+        release_2160.set()
+        assert await task == ["2160p", "720p", "480p", "360p"]
+
+    @pytest.mark.asyncio
+    async def test_respects_parallel_limit_and_high_res_cap(self):
+        """Never exceeds max_parallel, and pairs a high-res encode with a low-res one."""
+        qualities = [
+            _quality("360p", 360),
+            _quality("2160p", 2160),
+            _quality("1080p", 1080),
+            _quality("720p", 720),
+            _quality("1440p", 1440),
+        ]
+        started = []
+        running = set()
+        max_running = 0
+
+        async def run_quality(quality):
+            nonlocal max_running
+            started.append(quality["name"])
+            running.add(quality["name"])
+            max_running = max(max_running, len(running))
+            await asyncio.sleep(0.01)
+            running.discard(quality["name"])
+            return quality["name"]
+
+        results = await run_qualities_adaptive(qualities, run_quality, 2, 60, headroom_check=lambda: True)
+
+        assert results == ["360p", "2160p", "1080p", "720p", "1440p"]
+        assert max_running == 2
+        # Most expensive first, paired with a low-res quality rather than the next high-res one
+        assert started[:2] == ["2160p", "720p"]
+
+    @pytest.mark.asyncio
+    async def test_holds_back_work_without_headroom(self):
+        """Only one encode runs while the host reports no headroom."""
+        qualities = [_quality("1080p", 1080), _quality("720p", 720), _quality("480p", 480)]
+        running = 0
+        max_running = 0
+
+        async def run_quality(quality):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return quality["name"]
+
+        results = await run_qualities_adaptive(qualities, run_quality, 3, 60, headroom_check=lambda: False)
+
+        assert results == ["1080p", "720p", "480p"]
+        assert max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_check_prevents_new_encodes(self):
+        """Once a stop is requested, running encodes finish and no new ones start."""
+        qualities = [_quality("1080p", 1080), _quality("720p", 720), _quality("480p", 480)]
+        started = []
+        stop = False
+
+        async def run_quality(quality):
+            nonlocal stop
+            started.append(quality["name"])
+            await asyncio.sleep(0.01)
+            stop = True
+            return quality["name"]
+
+        results = await run_qualities_adaptive(
+            qualities, run_quality, 2, 60, headroom_check=lambda: True, stop_check=lambda: stop
+        )
+
+        assert started == ["1080p", "720p"]
+        assert results == ["1080p", "720p", None]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_returned_and_on_complete_abort(self):
+        """Encode exceptions are returned in place; on_complete raising cancels running work."""
+        qualities = [_quality("1080p", 1080), _quality("720p", 720)]
+        cancelled = asyncio.Event()
+
+        async def run_quality(quality):
+            if quality["name"] == "720p":
+                raise RuntimeError("encode failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def on_complete(quality, result):
+            if isinstance(result, RuntimeError):
+                raise result
+
+        with pytest.raises(RuntimeError, match="encode failed"):
+            await run_qualities_adaptive(
+                qualities, run_quality, 2, 60, on_complete=on_complete, headroom_check=lambda: True
+            )
+        assert cancelled.is_set()
+
+        async def fail_720(quality):
+            if quality["name"] == "720p":
+                raise RuntimeError("encode failed")
+            return quality["name"]
+
+        results = await run_qualities_adaptive(qualities, fail_720, 2, 60, headroom_check=lambda: True)
+        assert results[0] == "1080p"
+        assert isinstance(results[1], RuntimeError)
@@ -0,0 +1,122 @@
+"""
+Tests for precomputed related-video lists (api/related_videos.py).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.database import related_video_state, video_neighbors, video_tags, videos
+from api.enums import VideoStatus
+from api.related_videos import (
+    CATEGORY_WEIGHT,
+    NEIGHBORS_PER_VIDEO,
+    Catalog,
+    CatalogVideo,
+    rank_neighbors,
+    refresh_related_videos,
+)
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _catalog(*entries):
+    catalog = Catalog()
+    for video_id, category_id, tag_ids, eligible, age_days in entries:
+        catalog.add(
+            video_id,
+            CatalogVideo(
+                category_id=category_id,
+                eligible=eligible,
+                published_at=NOW - timedelta(days=age_days),
+                tag_ids=frozenset(tag_ids),
+            ),
+        )
+    return catalog
+
+
+class TestRankNeighbors:
+    """Test candidate scoring."""
+
+    def test_category_tags_and_cowatch(self):
+        """Category outranks tags, tag overlap and co-watching add on, ineligible videos are skipped."""
+        catalog = _catalog(
+            (1, 10, {1, 2}, True, 0),
+            (2, 10, {1, 2}, True, 5),  # same category, same tags
+            (3, 10, set(), True, 1),  # same category only
+            (4, 10, set(), True, 2),  # same category only, older
+            (5, None, {1}, True, 0),  # half the tags
+            (6, 20, set(), True, 0),  # co-watched only
+            (7, 10, {1, 2}, False, 0),  # not public
+            (8, 20, set(), True, 0),  # unrelated
+        )
+        ranked = rank_neighbors(catalog, 1, cowatch={6: 4, 7: 9, 3: 2})
+
+        assert [video_id for video_id, _score in ranked] == [2, 3, 4, 6, 5]
+        scores = dict(ranked)
+        assert scores[2] == CATEGORY_WEIGHT + 1.0
+        assert scores[3] == CATEGORY_WEIGHT + 0.5
+        assert scores[6] == 1.0
+        assert scores[5] == 0.5
+
+    def test_limit_and_signature(self):
+        """Lists are capped, and the signature tracks category, tags and visibility."""
+        entries = [(video_id, 1, set(), True, video_id) for video_id in range(1, NEIGHBORS_PER_VIDEO + 5)]
+        catalog = _catalog(*entries)
+        ranked = rank_neighbors(catalog, 1, cowatch={})
+        assert len(ranked) == NEIGHBORS_PER_VIDEO
+        assert ranked[0][0] == 2  # most recently published first among equal scores
+
+        base = CatalogVideo(category_id=1, eligible=True, published_at=NOW, tag_ids=frozenset({1, 2}))
+        assert base.signature == CatalogVideo(1, True, NOW - timedelta(days=1), frozenset({2, 1})).signature
+        assert base.signature != CatalogVideo(1, True, NOW, frozenset({1})).signature
+        assert base.signature != CatalogVideo(2, True, NOW, frozenset({1, 2})).signature
+        assert base.signature != CatalogVideo(1, False, NOW, frozenset({1, 2})).signature
+
+
+class TestRefreshRelatedVideos:
+    """Incremental refresh against the database."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_tracks_changes(self, test_database, sample_video, sample_category, sample_tag, monkeypatch):
+        import api.database
+
+        monkeypatch.setattr(api.database, "database", test_database)
+
+        now = datetime.now(timezone.utc)
+        other_id = await test_database.execute(
+            videos.insert().values(
+                title="Other",
+                slug="other-video",
+                category_id=sample_category["id"],
+                duration=60.0,
+                status=VideoStatus.READY,
+                created_at=now,
+                published_at=now,
+            )
+        )
+
+        assert await refresh_related_videos(now=now) == 2
+        rows = await test_database.fetch_all(
+            video_neighbors.select().where(video_neighbors.c.video_id == sample_video["id"])
+        )
+        assert [row["neighbor_id"] for row in rows] == [other_id]
+
+        # Nothing changed: nothing recomputed
+        assert await refresh_related_videos(now=now) == 0
+
+        # Tagging the other video recomputes it and invalidates lists that share its category
+        await test_database.execute(video_tags.insert().values(video_id=other_id, tag_id=sample_tag["id"]))
+        assert await refresh_related_videos(now=now) == 2
+
+        # Soft-deleting drops the video's own list
+        await test_database.execute(videos.update().where(videos.c.id == other_id).values(deleted_at=now))
+        assert await refresh_related_videos(now=now) == 1
+        state = await test_database.fetch_all(related_video_state.select())
+        assert [row["video_id"] for row in state] == [sample_video["id"]]
+        assert (
+            await test_database.fetch_all(
+                video_neighbors.select().where(video_neighbors.c.video_id == sample_video["id"])
+            )
+            == []
+        )
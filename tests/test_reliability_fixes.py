@@ -5,6 +5,8 @@ Tests for reliability fixes (Issues #450 and #451).
 #450: Orphaned quality file cleanup - prevents disk space leaks from partial uploads
 """
 
+import asyncio
+import io
 import os
 import tarfile
 import time
@@ -123,6 +125,105 @@ class TestTarExtractionTimeout:
         assert (output_dir / "test.m3u8").exists()
 
 
+class TestTarStreamExtraction:
+    """Tests for extracting tar archives straight from the request body."""
+
+    @staticmethod
+    def _tar_bytes(members, mode="w"):
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode=mode) as tar:
+            for name, data in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return buf.getvalue()
+
+    @staticmethod
+    async def _chunks(data, chunk_size=1000):
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+        yield b""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["w", "w:gz"])
+    async def test_extracts_plain_and_gzip_streams(self, tmp_path, mode):
+        """Both uncompressed and gzip archives are extracted as they stream in."""
+        from api.worker_api import extract_tar_stream_async
+
+        segment = os.urandom(5000)
+        data = self._tar_bytes([("1080p/init.mp4", b"init"), ("1080p/seg_0001.m4s", segment)], mode)
+
+        await extract_tar_stream_async(
+            self._chunks(data),
+            tmp_path,
+            allowed_extensions=(".mp4", ".m4s"),
+            max_files=10,
+            max_size=1024 * 1024,
+            max_single_file=512 * 1024,
+            timeout=30,
+        )
+
+        assert (tmp_path / "1080p" / "init.mp4").read_bytes() == b"init"
+        assert (tmp_path / "1080p" / "seg_0001.m4s").read_bytes() == segment
+
+    @pytest.mark.asyncio
+    async def test_rejects_path_traversal(self, tmp_path):
+        """Streamed archives get the same member validation as uploaded files."""
+        from api.worker_api import extract_tar_stream_async
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        data = self._tar_bytes([("../escape.m3u8", b"#EXTM3U\n")])
+
+        with pytest.raises(ValueError, match="Path traversal"):
+            await extract_tar_stream_async(
+                self._chunks(data),
+                output_dir,
+                allowed_extensions=(".m3u8",),
+                max_files=10,
+                max_size=1024 * 1024,
+                max_single_file=512 * 1024,
+                timeout=30,
+            )
+        assert not (tmp_path / "escape.m3u8").exists()
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_stream(self, tmp_path):
+        """Garbage bodies surface as ValueError (HTTP 400), not a server error."""
+        from api.worker_api import extract_tar_stream_async
+
+        with pytest.raises(ValueError, match="Invalid archive"):
+            await extract_tar_stream_async(
+                self._chunks(b"not a tar archive" * 100),
+                tmp_path,
+                allowed_extensions=(".m3u8",),
+                max_files=10,
+                max_size=1024 * 1024,
+                max_single_file=512 * 1024,
+                timeout=30,
+            )
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out(self, tmp_path):
+        """A body that stops arriving hits the extraction timeout."""
+        from api.worker_api import extract_tar_stream_async
+
+        async def stalled():
+            yield self._tar_bytes([("test.m3u8", b"#EXTM3U\n")])[:100]
+            await asyncio.sleep(10)
+
+        with pytest.raises(ValueError, match="timed out"):
+            await extract_tar_stream_async(
+                stalled(),
+                tmp_path,
+                allowed_extensions=(".m3u8",),
+                max_files=10,
+                max_size=1024 * 1024,
+                max_single_file=512 * 1024,
+                timeout=0.2,
+            )
+
+
 class TestOrphanedQualityCleanup:
     """Tests for orphaned quality file cleanup functionality (Issue #450)."""
 
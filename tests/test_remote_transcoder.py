@@ -9,14 +9,18 @@ Tests the full lifecycle of a remote worker:
 - Error recovery and retry logic
 """
 
+import asyncio
 import io
 import tarfile
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
+import worker.remote_transcoder
 from api.database import transcoding_jobs, video_qualities, videos, workers
 from api.enums import VideoStatus
+from worker.http_client import DownloadProgress
+from worker.remote_transcoder import encode_downloading_source
 
 
 class TestRemoteTranscoderLifecycle:
@@ -569,3 +573,68 @@ class TestRemoteTranscoderFileDownload:
         assert download_response.status_code == 200
         assert len(download_response.content) == len(source_content)
         assert download_response.content == source_content
+
+
+class TestEncodeDownloadingSource:
+    """Test encoding passes that read the source while it downloads."""
+
+    class FakeClient:
+        def __init__(self):
+            self.progress = []
+
+        async def update_progress(self, job_id, step, percent, *args, **kwargs):
+            self.progress.append((step, percent))
+
+    @staticmethod
+    def start_download(download: DownloadProgress, stall: float = 0.0) -> asyncio.Task:
+        async def download_source():
+            download._advance(1024)
+            await asyncio.sleep(stall)
+            download._advance(2048)
+            download._finish(success=True)
+
+        return asyncio.create_task(download_source())
+
+    async def test_pass_overlaps_download(self):
+        download = DownloadProgress()
+        download_task = self.start_download(download)
+        follow_timeouts = []
+
+        async def encode(follow_timeout):
+            follow_timeouts.append(follow_timeout)
+            await download.wait_for_bytes(2048)
+            return "encoded"
+
+        result = await encode_downloading_source(self.FakeClient(), 1, download, download_task, "download", 10, encode)
+        assert result == "encoded"
+        assert follow_timeouts == [worker.remote_transcoder.SOURCE_FOLLOW_TIMEOUT]
+
+    async def test_stalled_download_reruns_pass(self, monkeypatch):
+        monkeypatch.setattr(worker.remote_transcoder, "SOURCE_FOLLOW_TIMEOUT", 0.1)
+        download = DownloadProgress()
+        download_task = self.start_download(download, stall=0.3)
+        follow_timeouts = []
+
+        async def encode(follow_timeout):
+            follow_timeouts.append(follow_timeout)
+            if follow_timeout is not None:
+                # FFmpeg gave up waiting and took the partial file as the whole source
+                await asyncio.sleep(0.2)
+                return "truncated"
+            assert download.complete
+            return "encoded"
+
+        result = await encode_downloading_source(self.FakeClient(), 1, download, download_task, "download", 10, encode)
+        assert result == "encoded"
+        assert follow_timeouts == [0.1, None]
+
+    async def test_complete_source_is_read_directly(self):
+        download = DownloadProgress()
+        download_task = self.start_download(download)
+        await download_task
+
+        async def encode(follow_timeout):
+            return follow_timeout
+
+        result = await encode_downloading_source(self.FakeClient(), 1, download, download_task, "download", 10, encode)
+        assert result is None
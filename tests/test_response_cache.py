@@ -0,0 +1,141 @@
+"""
+Tests for api/response_cache.py tiered public API response caching.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api import response_cache
+from api.response_cache import (
+    VIDEO_LISTS_TAG,
+    ResponseCache,
+    invalidate_response_cache,
+    load_tag_versions,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in covering the commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._keys = []
+
+    def incr(self, key):
+        self._keys.append(key)
+
+    async def execute(self):
+        results = []
+        for key in self._keys:
+            self._redis.data[key] = str(int(self._redis.data.get(key, 0)) + 1)
+            results.append(int(self._redis.data[key]))
+        return results
+
+
+@pytest.fixture(autouse=True)
+def reset_tag_versions():
+    """Each test starts from unversioned tags."""
+    response_cache._tag_versions.clear()
+    yield
+    response_cache._tag_versions.clear()
+
+
+class TestResponseCache:
+    """Test two-level caching and tag invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_local_only_cache_invalidated_by_tag(self):
+        """Without Redis, invalidating a tag bumps the local version so old keys miss."""
+        cache = ResponseCache(ttl_seconds=60)
+        with patch("api.response_cache.get_redis", AsyncMock(return_value=None)):
+            key = cache.versioned_key("videos:abc")
+            await cache.set(key, {"videos": [1]})
+            assert await cache.get(cache.versioned_key("videos:abc")) == {"videos": [1]}
+
+            await invalidate_response_cache(VIDEO_LISTS_TAG)
+
+            assert cache.versioned_key("videos:abc") != key
+            assert await cache.get(cache.versioned_key("videos:abc")) is None
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_visible_to_other_instances(self):
+        """An entry stored by one instance is served from Redis to another and promoted to L1."""
+        redis = FakeRedis()
+        writer = ResponseCache(ttl_seconds=600, shared=True)
+        reader = ResponseCache(ttl_seconds=600, shared=True)
+
+        with patch("api.response_cache.get_redis", AsyncMock(return_value=redis)):
+            key = writer.versioned_key("related:xyz")
+            await writer.set(key, [{"slug": "a"}])
+
+            assert await reader.get(reader.versioned_key("related:xyz")) == [{"slug": "a"}]
+            redis.data.clear()
+            # Now served from the reader's in-process level
+            assert await reader.get(key) == [{"slug": "a"}]
+
+        stats = reader.get_stats()
+        assert stats["shared_hits"] == 1
+        assert stats["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_publishes_new_versions(self):
+        """Invalidation increments the version in Redis and broadcasts it to other instances."""
+        redis = FakeRedis()
+        publish = AsyncMock(return_value=True)
+
+        with (
+            patch("api.response_cache.get_redis", AsyncMock(return_value=redis)),
+            patch("api.response_cache.Publisher.publish_cache_invalidated", publish),
+        ):
+            await invalidate_response_cache()
+            await invalidate_response_cache()
+
+            publish.assert_awaited_with({VIDEO_LISTS_TAG: 2})
+            assert response_cache.get_tag_version(VIDEO_LISTS_TAG) == 2
+
+            # A freshly started instance catches up from Redis
+            response_cache._tag_versions.clear()
+            assert await load_tag_versions()
+            assert response_cache.get_tag_version(VIDEO_LISTS_TAG) == 2
+
+    @pytest.mark.asyncio
+    async def test_response_computed_during_invalidation_not_served(self):
+        """A result computed before an invalidation is stored under the old version."""
+        cache = ResponseCache(ttl_seconds=60)
+        with patch("api.response_cache.get_redis", AsyncMock(return_value=None)):
+            key = cache.versioned_key("videos:abc")
+            assert await cache.get(key) is None
+
+            # Admin publishes a video while the list query is running
+            await invalidate_response_cache()
+            await cache.set(key, {"videos": []})
+
+            assert await cache.get(cache.versioned_key("videos:abc")) is None
+
+    def test_tag_versions_never_go_backwards(self):
+        """Late or duplicate invalidation messages don't roll versions back."""
+        response_cache._apply_tag_versions({VIDEO_LISTS_TAG: 5})
+        response_cache._apply_tag_versions({VIDEO_LISTS_TAG: 3, "bogus": "x"})
+        assert response_cache.get_tag_version(VIDEO_LISTS_TAG) == 5
+        assert response_cache.get_tag_version("bogus") == 0
@@ -5,11 +5,32 @@ Tests for enhanced search filters and sorting.
 from datetime import datetime, timedelta, timezone
 
 import pytest
-
-from api.database import playback_sessions, transcriptions, video_qualities, videos, viewers
+import sqlalchemy as sa
+
+from api.database import (
+    metadata,
+    playback_sessions,
+    tags,
+    transcriptions,
+    video_qualities,
+    video_stats,
+    video_tags,
+    videos,
+    viewers,
+)
 from api.enums import TranscriptionStatus, VideoStatus
 
 
+async def _insert_view_counts(test_database, view_counts):
+    """Insert video_stats counter rows ({video_id: view_count})."""
+    for video_id, view_count in view_counts.items():
+        await test_database.execute(
+            video_stats.insert().values(
+                video_id=video_id, view_count=view_count, unique_viewers=1, watch_seconds=0.0, completions=0
+            )
+        )
+
+
 class TestSearchFilters:
     """Test search filter functionality."""
 
@@ -701,6 +722,9 @@ class TestSearchSorting:
 
         # Unpopular video: no views
 
+        # Listings read view counts from the counters the analytics endpoints maintain
+        await _insert_view_counts(test_database, {video_1_id: 5, video_2_id: 2})
+
         response = public_client.get("/api/videos?sort=views&order=desc")
         assert response.status_code == 200
         data = response.json()
@@ -753,6 +777,7 @@ class TestSearchSorting:
                     started_at=now,
                 )
             )
+        await _insert_view_counts(test_database, {video_1_id: 3})
 
         response = public_client.get("/api/videos?sort=views&order=asc")
         assert response.status_code == 200
@@ -1220,3 +1245,154 @@ class TestTitleSortingCaseSensitivity:
         assert data["videos"][0]["slug"] == "apple-video"
         assert data["videos"][1]["slug"] == "banana-video"
         assert data["videos"][2]["slug"] == "zebra-video"
+
+
+class TestFullTextSearch:
+    """Test full-text search over titles, descriptions, tags and transcripts."""
+
+    async def _insert_video(self, test_database, title, slug, published_at, description=None):
+        return await test_database.execute(
+            videos.insert().values(
+                title=title,
+                slug=slug,
+                description=description,
+                duration=600,
+                status=VideoStatus.READY,
+                published_at=published_at,
+            )
+        )
+
+    def _search_slugs(self, public_client, search):
+        response = public_client.get("/api/videos", params={"search": search})
+        assert response.status_code == 200
+        return [video["slug"] for video in response.json()["videos"]]
+
+    @pytest.mark.asyncio
+    async def test_search_matches_tags(self, public_client, test_database):
+        """Videos are found by the names of their tags, and tag renames are reflected."""
+        now = datetime.now(timezone.utc)
+        video_id = await self._insert_video(test_database, "Weekend Vlog", "weekend-vlog", now)
+        await self._insert_video(test_database, "Other Video", "other-video", now)
+        tag_id = await test_database.execute(
+            tags.insert().values(name="Woodworking", slug="woodworking", created_at=now)
+        )
+        await test_database.execute(video_tags.insert().values(video_id=video_id, tag_id=tag_id))
+
+        assert self._search_slugs(public_client, "woodworking") == ["weekend-vlog"]
+
+        await test_database.execute(tags.update().where(tags.c.id == tag_id).values(name="Carpentry"))
+        assert self._search_slugs(public_client, "carpentry") == ["weekend-vlog"]
+
+    @pytest.mark.asyncio
+    async def test_search_matches_transcript(self, public_client, test_database):
+        """Videos are found by words spoken in their transcript."""
+        now = datetime.now(timezone.utc)
+        video_id = await self._insert_video(test_database, "Episode 12", "episode-12", now)
+        await test_database.execute(
+            transcriptions.insert().values(
+                video_id=video_id,
+                status=TranscriptionStatus.COMPLETED,
+                language="en",
+                transcript_text="Today we are restoring an antique gramophone",
+            )
+        )
+
+        assert self._search_slugs(public_client, "gramophone restoring") == ["episode-12"]
+
+    @pytest.mark.asyncio
+    async def test_search_matches_word_prefixes_and_stems(self, public_client, test_database):
+        """Partially typed and inflected words match."""
+        now = datetime.now(timezone.utc)
+        await self._insert_video(test_database, "Baking Sourdough Bread", "sourdough", now)
+
+        assert self._search_slugs(public_client, "sourdo") == ["sourdough"]
+        assert self._search_slugs(public_client, "bake") == ["sourdough"]
+
+    @pytest.mark.asyncio
+    async def test_search_without_words_returns_nothing(self, public_client, test_database):
+        """Searches made only of punctuation match nothing."""
+        await self._insert_video(test_database, "Any Video", "any-video", datetime.now(timezone.utc))
+
+        assert self._search_slugs(public_client, "&|!") == []
+
+    @pytest.mark.asyncio
+    async def test_search_excludes_updated_title(self, public_client, test_database):
+        """Editing a title updates the index."""
+        now = datetime.now(timezone.utc)
+        video_id = await self._insert_video(test_database, "Draft Title", "draft", now)
+        await test_database.execute(videos.update().where(videos.c.id == video_id).values(title="Final Title"))
+
+        assert self._search_slugs(public_client, "draft") == []
+        assert self._search_slugs(public_client, "final") == ["draft"]
+
+    @pytest.mark.asyncio
+    async def test_relevance_ranks_title_matches_first(self, public_client, test_database):
+        """A title match outranks newer description and transcript matches."""
+        now = datetime.now(timezone.utc)
+        await self._insert_video(test_database, "Kayaking Basics", "title-match", now - timedelta(days=30))
+        await self._insert_video(
+            test_database, "River Trip", "description-match", now - timedelta(days=1), description="Some kayaking"
+        )
+        transcript_video_id = await self._insert_video(test_database, "Vlog", "transcript-match", now)
+        await test_database.execute(
+            transcriptions.insert().values(
+                video_id=transcript_video_id,
+                status=TranscriptionStatus.COMPLETED,
+                language="en",
+                transcript_text="we went kayaking",
+            )
+        )
+
+        assert self._search_slugs(public_client, "kayaking") == ["title-match", "description-match", "transcript-match"]
+
+    @pytest.mark.asyncio
+    async def test_relevance_pages_by_offset(self, public_client, test_database):
+        """Relevance-sorted pages follow the ranking, so no date cursor is returned."""
+        now = datetime.now(timezone.utc)
+        await self._insert_video(test_database, "Kayaking Basics", "title-match", now - timedelta(days=30))
+        await self._insert_video(
+            test_database, "River Trip", "description-match", now - timedelta(days=1), description="Some kayaking"
+        )
+
+        params = {"search": "kayaking", "limit": 1}
+        first = public_client.get("/api/videos", params=params).json()
+        assert [video["slug"] for video in first["videos"]] == ["title-match"]
+        assert first["has_more"] is True
+        assert first["next_cursor"] is None
+
+        second = public_client.get("/api/videos", params={**params, "offset": 1}).json()
+        assert [video["slug"] for video in second["videos"]] == ["description-match"]
+
+
+class TestSqliteSearchIndex:
+    """The SQLite development database keeps an FTS5 index in sync."""
+
+    def test_fts_index_tracks_source_tables(self, tmp_path):
+        engine = sa.create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+        metadata.create_all(engine)
+        # Statements must be safe to re-run on every startup
+        metadata.create_all(engine)
+
+        def matches(conn, query):
+            rows = conn.exec_driver_sql("SELECT rowid FROM video_search_fts WHERE video_search_fts MATCH ?", (query,))
+            return [row[0] for row in rows]
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO videos (id, title, slug, description, status, duration, created_at) "
+                "VALUES (1, 'Cooking Pasta', 'pasta', 'Boiling water', 'ready', 60, CURRENT_TIMESTAMP)"
+            )
+            conn.exec_driver_sql("INSERT INTO tags (id, name, slug) VALUES (1, 'italian', 'italian')")
+            conn.exec_driver_sql("INSERT INTO video_tags (video_id, tag_id) VALUES (1, 1)")
+            conn.exec_driver_sql(
+                "INSERT INTO transcriptions (video_id, status, transcript_text) "
+                "VALUES (1, 'completed', 'today we make carbonara')"
+            )
+
+            assert matches(conn, "pasta") == [1]
+            assert matches(conn, "italian") == [1]
+            assert matches(conn, "carbonara") == [1]
+
+            conn.exec_driver_sql("DELETE FROM video_tags")
+            assert matches(conn, "italian") == []
+        engine.dispose()
@@ -0,0 +1,155 @@
+"""
+Tests for the content-addressed segment store (api/segment_store.py).
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import api.database
+import api.segment_store
+import api.worker_api
+from api.database import transcoding_jobs
+from api.segment_store import (
+    BLOB_MODE,
+    _write_blob,
+    blob_path,
+    ingest_directory,
+    link_segment,
+    store_segment,
+    sweep_segment_store,
+)
+
+SEGMENT = b"\x00\x00\x00\x18moof" + b"\x01" * 100
+CHECKSUM = hashlib.sha256(SEGMENT).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path: Path, monkeypatch) -> Path:
+    store_dir = tmp_path / "segment-store"
+    monkeypatch.setattr(api.segment_store, "SEGMENT_STORE_DIR", store_dir)
+    return store_dir
+
+
+class TestSegmentStore:
+    """Test storing, linking, ingesting and sweeping segments."""
+
+    def test_store_and_link(self, tmp_path: Path, store: Path):
+        first = tmp_path / "videos" / "a" / "1080p" / "seg_0001.m4s"
+        second = tmp_path / "videos" / "b" / "1080p" / "seg_0001.m4s"
+
+        assert store_segment(SEGMENT, CHECKSUM, first) is False
+        assert store_segment(SEGMENT, CHECKSUM, first) is True
+        assert link_segment(CHECKSUM, len(SEGMENT), second) is True
+
+        blob = blob_path(CHECKSUM)
+        assert blob.parent.parent == store
+        assert second.read_bytes() == SEGMENT
+        assert first.stat().st_ino == second.stat().st_ino == blob.stat().st_ino
+        assert blob.stat().st_nlink == 3
+        assert blob.stat().st_mode & 0o777 == BLOB_MODE
+
+        # Unknown content, or a size mismatch, must be uploaded
+        assert link_segment("0" * 64, 10, tmp_path / "c.m4s") is False
+        assert link_segment(CHECKSUM, len(SEGMENT) + 1, tmp_path / "c.m4s") is False
+        with pytest.raises(ValueError):
+            blob_path("../../etc/passwd")
+
+    def test_concurrent_blob_writes(self, store: Path):
+        blob = blob_path(CHECKSUM)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: _write_blob(SEGMENT, blob), range(32)))
+
+        assert blob.read_bytes() == SEGMENT
+        assert [path.name for path in blob.parent.iterdir()] == [blob.name]
+
+    def test_ingest_directory(self, tmp_path: Path, store: Path):
+        store_segment(SEGMENT, CHECKSUM, tmp_path / "existing" / "seg_0001.m4s")
+        video_dir = tmp_path / "video"
+        video_dir.mkdir()
+        (video_dir / "seg_0001.m4s").write_bytes(SEGMENT)  # known content
+        (video_dir / "seg_0002.m4s").write_bytes(b"new")  # becomes a blob
+        (video_dir / "thumbnail.jpg").write_bytes(b"jpg")
+
+        assert ingest_directory(video_dir, (".m4s",)) == 1
+        assert (video_dir / "seg_0001.m4s").stat().st_ino == blob_path(CHECKSUM).stat().st_ino
+        assert blob_path(hashlib.sha256(b"new").hexdigest()).stat().st_nlink == 2
+        assert (video_dir / "thumbnail.jpg").stat().st_nlink == 1
+        # Already stored files are not hashed again
+        assert ingest_directory(video_dir, (".m4s",)) == 0
+
+    def test_sweep_removes_unreferenced_blobs(self, tmp_path: Path, store: Path):
+        video_file = tmp_path / "video" / "seg_0001.m4s"
+        store_segment(SEGMENT, CHECKSUM, video_file)
+        store_segment(b"other", hashlib.sha256(b"other").hexdigest(), tmp_path / "video" / "seg_0002.m4s")
+        (tmp_path / "video" / "seg_0002.m4s").unlink()
+
+        later = blob_path(CHECKSUM).stat().st_ctime + 3600
+        # Not unreferenced for long enough
+        assert sweep_segment_store(max_unreferenced_seconds=7200, now=later) == (0, 0)
+        # Only the blob no video links to is removed; the linked one stays
+        assert sweep_segment_store(max_unreferenced_seconds=60, now=later) == (1, len(b"other"))
+        assert blob_path(CHECKSUM).exists()
+
+        # Removing a blob never affects the video files linking to it
+        video_file.unlink()
+        os.link(blob_path(CHECKSUM), video_file)
+        blob_path(CHECKSUM).unlink()
+        assert video_file.read_bytes() == SEGMENT
+
+
+class TestWorkerAPISegmentStore:
+    """Test segment writes through the worker API with the store enabled."""
+
+    def test_batch_write_deduplicates(self, tmp_path: Path, store: Path, monkeypatch):
+        monkeypatch.setattr(api.worker_api, "SEGMENT_STORE_ENABLED", True)
+        new = b"\x00\x00\x00\x18moof" + b"\x02" * 100
+        new_checksum = hashlib.sha256(new).hexdigest()
+        store_segment(SEGMENT, CHECKSUM, tmp_path / "old" / "seg_0001.m4s")
+
+        output_dir = tmp_path / "video" / "1080p"
+        results = api.worker_api._write_segment_batch_sync(
+            [("seg_0001.m4s", SEGMENT, CHECKSUM), ("seg_0002.m4s", new, new_checksum)], output_dir
+        )
+
+        assert [(name, error, written) for name, error, written, _, _ in results] == [
+            ("seg_0001.m4s", None, True),
+            ("seg_0002.m4s", None, True),
+        ]
+        assert (output_dir / "seg_0001.m4s").stat().st_ino == blob_path(CHECKSUM).stat().st_ino
+        assert (output_dir / "seg_0002.m4s").stat().st_ino == blob_path(new_checksum).stat().st_ino
+        assert (output_dir / "seg_0002.m4s").read_bytes() == new
+        assert not list(output_dir.glob("*.tmp"))
+
+        written, size, verified = api.worker_api._write_segment_sync(new, tmp_path / "other" / "a.m4s", new_checksum)
+        assert (written, size, verified) == (True, len(new), True)
+        assert blob_path(new_checksum).stat().st_nlink == 3
+
+    @pytest.mark.asyncio
+    async def test_link_counts_storage_once(
+        self, worker_client, registered_worker, test_database, sample_pending_video, test_storage, store, monkeypatch
+    ):
+        """Linking a segment that is already in place does not count its bytes again."""
+        from api.storage_ledger import get_video_storage
+
+        monkeypatch.setattr(api.worker_api, "SEGMENT_STORE_ENABLED", True)
+        monkeypatch.setattr(api.database, "database", test_database)
+        store_segment(SEGMENT, CHECKSUM, test_storage["videos"] / "other-video" / "1080p" / "seg_0001.m4s")
+        await test_database.execute(
+            transcoding_jobs.insert().values(video_id=sample_pending_video["id"], attempt_number=1, max_attempts=3)
+        )
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        worker_client.post("/api/worker/claim", headers=headers)
+
+        request = {"segments": [{"filename": "seg_0001.m4s", "size": len(SEGMENT), "sha256": CHECKSUM}]}
+        for _ in range(2):
+            response = worker_client.post(
+                f"/api/worker/upload/{sample_pending_video['id']}/segments/1080p/link", headers=headers, json=request
+            )
+            assert response.status_code == 200
+            assert response.json()["linked"] == ["seg_0001.m4s"]
+
+        assert await get_video_storage(sample_pending_video["id"]) == {"1080p": len(SEGMENT)}
@@ -0,0 +1,72 @@
+"""
+Tests for worker/segment_watcher.py segment readiness detection.
+"""
+
+import asyncio
+
+import pytest
+
+from worker.segment_watcher import INOTIFY_AVAILABLE, SegmentWatcher
+
+
+class TestSegmentWatcher:
+    """Test inotify and polling segment detection."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify not available")
+    async def test_inotify_queues_segment_when_closed(self, tmp_path):
+        """A segment is queued as soon as it is closed, never while still open."""
+        queue: asyncio.Queue = asyncio.Queue()
+        watcher = SegmentWatcher(tmp_path, "1080p", "cmaf", queue, poll_interval=30.0, use_inotify=True)
+        task = asyncio.create_task(watcher.watch())
+        try:
+            while not watcher.is_running or not (tmp_path / "1080p").exists():
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.2)  # Let the observer thread start
+
+            with open(tmp_path / "1080p" / "seg_0001.m4s", "wb") as f:
+                f.write(b"partial")
+                f.flush()
+                await asyncio.sleep(0.3)
+                assert queue.empty()
+                f.write(b" segment")
+
+            # Far quicker than the 30s poll interval
+            segment = await asyncio.wait_for(queue.get(), timeout=5)
+            assert segment.filename == "seg_0001.m4s"
+            assert segment.size == len(b"partial segment")
+
+            # Non-segment files (playlists) are ignored
+            (tmp_path / "1080p" / "stream.m3u8").write_text("#EXTM3U\n")
+            await asyncio.sleep(0.3)
+            assert queue.empty()
+        finally:
+            await watcher.stop()
+            await asyncio.wait_for(task, timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_polling_fallback_waits_for_stable_size(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        watcher = SegmentWatcher(tmp_path, "720p", "hls_ts", queue, poll_interval=0.05, use_inotify=False)
+        (tmp_path / "720p_0001.ts").write_bytes(b"\x47" * 188)
+        (tmp_path / "1080p_0001.ts").write_bytes(b"\x47" * 188)
+
+        task = asyncio.create_task(watcher.watch())
+        try:
+            segment = await asyncio.wait_for(queue.get(), timeout=5)
+            assert segment.filename == "720p_0001.ts"
+            await asyncio.sleep(0.2)
+            assert queue.empty()
+        finally:
+            await watcher.stop()
+            await asyncio.wait_for(task, timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_flush_remaining_catches_unreported_segments(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        watcher = SegmentWatcher(tmp_path, "1080p", "cmaf", queue, use_inotify=True)
+        (tmp_path / "1080p").mkdir()
+        (tmp_path / "1080p" / "init.mp4").write_bytes(b"init")
+
+        remaining = await watcher.flush_remaining()
+        assert [s.filename for s in remaining] == ["init.mp4"]
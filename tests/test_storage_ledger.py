@@ -0,0 +1,109 @@
+"""
+Tests for the per-video storage ledger (api/storage_ledger.py).
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import api.database
+from api.database import video_storage, videos
+from api.enums import VideoStatus
+from api.storage_ledger import (
+    OTHER_BUCKET,
+    add_video_storage_bytes,
+    clear_video_storage,
+    get_storage_totals,
+    get_video_storage,
+    ledger_bucket,
+    reconcile_storage_ledger,
+    record_video_storage,
+    scan_video_directory,
+)
+
+
+def _write(path: Path, size: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+class TestScanVideoDirectory:
+    """Test measuring a video directory."""
+
+    def test_ledger_buckets(self):
+        assert ledger_bucket("1080p", is_dir=True) == "1080p"
+        assert ledger_bucket("audio", is_dir=True) == "audio"
+        assert ledger_bucket("sprites", is_dir=True) == OTHER_BUCKET
+        assert ledger_bucket("720p_0001.ts") == "720p"
+        assert ledger_bucket("original.m3u8") == "original"
+        assert ledger_bucket("master.m3u8") == OTHER_BUCKET
+
+    def test_scan_groups_by_rendition(self, tmp_path: Path):
+        video_dir = tmp_path / "my-video"
+        _write(video_dir / "1080p" / "init.mp4", 100)
+        _write(video_dir / "1080p" / "seg_0000.m4s", 5000)
+        _write(video_dir / "original.m3u8", 10)
+        _write(video_dir / "original_0000.ts", 9000)
+        _write(video_dir / "master.m3u8", 20)
+        _write(video_dir / "thumbnail.jpg", 300)
+        _write(video_dir / "sprites" / "sprite_01.jpg", 700)
+        _write(tmp_path / "outside.bin", 10**6)
+        os.symlink(tmp_path / "outside.bin", video_dir / "1080p" / "seg_0001.m4s")
+
+        assert scan_video_directory(video_dir) == {"1080p": 5100, "original": 9010, OTHER_BUCKET: 1020}
+        assert scan_video_directory(tmp_path / "missing") == {OTHER_BUCKET: 0}
+
+
+class TestStorageLedger:
+    """Test ledger updates and reconciliation against the database."""
+
+    async def test_write_time_updates(self, test_database, sample_video, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(api.database, "database", test_database)
+        video_id = sample_video["id"]
+        video_dir = tmp_path / sample_video["slug"]
+        _write(video_dir / "720p" / "seg_0000.m4s", 4000)
+        _write(video_dir / "thumbnail.jpg", 500)
+
+        await record_video_storage(video_id, video_dir)
+        assert await get_video_storage(video_id) == {"720p": 4000, OTHER_BUCKET: 500}
+
+        await add_video_storage_bytes(video_id, "720p", 1500)
+        await add_video_storage_bytes(video_id, "1080p", 8000)
+        assert await get_video_storage(video_id) == {"720p": 5500, "1080p": 8000, OTHER_BUCKET: 500}
+        assert await get_storage_totals() == {"720p": 5500, "1080p": 8000, OTHER_BUCKET: 500}
+
+        await clear_video_storage(video_id)
+        assert await get_video_storage(video_id) == {}
+
+    async def test_reconcile_corrects_drift_and_resumes(self, test_database, sample_video, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(api.database, "database", test_database)
+        now = datetime.now(timezone.utc)
+        other_id = await test_database.execute(
+            videos.insert().values(
+                title="Other", slug="other-video", status=VideoStatus.READY, created_at=now, published_at=now
+            )
+        )
+        _write(tmp_path / sample_video["slug"] / "720p" / "seg_0000.m4s", 4000)
+        _write(tmp_path / "other-video" / "thumbnail.jpg", 300)
+        # Drift: the ledger counts bytes that are no longer on disk
+        await add_video_storage_bytes(sample_video["id"], "720p", 9000)
+
+        result = await reconcile_storage_ledger(tmp_path, 3600, now=now)
+        assert result.videos_checked == 2
+        assert result.drift_bytes == 5000 + 300
+        assert await get_video_storage(sample_video["id"]) == {"720p": 4000, OTHER_BUCKET: 0}
+        assert await get_video_storage(other_id) == {OTHER_BUCKET: 300}
+
+        # Videos measured in this interval are skipped (an interrupted pass resumes)
+        result = await reconcile_storage_ledger(tmp_path, 3600, now=now + timedelta(minutes=10))
+        assert result.videos_checked == 0
+
+        # Shards split the videos by id
+        later = now + timedelta(hours=1)
+        checked = [
+            (await reconcile_storage_ledger(tmp_path, 3600, shard_count=2, shard_index=i, now=later)).videos_checked
+            for i in range(2)
+        ]
+        assert checked == [1, 1]
+        rows = await test_database.fetch_all(video_storage.select())
+        assert {row["reconciled_at"] for row in rows} == {later}
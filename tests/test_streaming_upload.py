@@ -0,0 +1,152 @@
+"""
+Tests for worker/streaming_upload.py segment upload batching.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from worker.http_client import WorkerAPIError
+from worker.segment_watcher import SegmentInfo
+from worker.streaming_upload import LINK_MAX_MISSES, ClaimExpiredError, SegmentUploadWorker
+
+
+def _queue_segments(tmp_path, queue: asyncio.Queue, count: int) -> list:
+    segments = []
+    for i in range(count):
+        path = tmp_path / f"seg_{i:04d}.m4s"
+        path.write_bytes(b"segment-%d" % i)
+        segment = SegmentInfo(filepath=path, quality="1080p", filename=path.name, size=path.stat().st_size)
+        queue.put_nowait(segment)
+        segments.append(segment)
+    return segments
+
+
+def _client() -> mock.Mock:
+    """Client for a server without a segment store."""
+    client = mock.Mock()
+    client.link_segments = mock.AsyncMock(side_effect=WorkerAPIError(404, "Segment store disabled"))
+    return client
+
+
+def _ok_batch(video_id, quality, segments):
+    return {
+        "status": "ok",
+        "results": [
+            {"filename": name, "status": "ok", "written": True, "bytes_written": len(data), "checksum_verified": True}
+            for name, data, _ in segments
+        ],
+    }
+
+
+class TestBatchedSegmentUpload:
+    """Test SegmentUploadWorker with batch_size / max_concurrency above 1."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_queue_in_batches(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        segments = _queue_segments(tmp_path, queue, 5)
+        client = _client()
+        client.upload_segment_batch = mock.AsyncMock(side_effect=_ok_batch)
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue, batch_size=2, max_concurrency=2)
+        await worker.stop()
+        await asyncio.wait_for(worker.run(), timeout=5)
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        batch_sizes = [len(call.kwargs["segments"]) for call in client.upload_segment_batch.await_args_list]
+        assert sorted(batch_sizes) == [1, 2, 2]
+        assert worker.uploaded_count == 5
+        assert not any(segment.filepath.exists() for segment in segments)
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_size(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("worker.streaming_upload.MAX_BATCH_BYTES", 25)
+        queue: asyncio.Queue = asyncio.Queue()
+        _queue_segments(tmp_path, queue, 5)
+        client = _client()
+        client.upload_segment_batch = mock.AsyncMock(side_effect=_ok_batch)
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue, batch_size=5)
+        await worker.stop()
+        await asyncio.wait_for(worker.run(), timeout=5)
+
+        batch_sizes = [len(call.kwargs["segments"]) for call in client.upload_segment_batch.await_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert worker.uploaded_count == 5
+
+    @pytest.mark.asyncio
+    async def test_rejected_segment_is_retried(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        _queue_segments(tmp_path, queue, 2)
+        calls = []
+
+        async def upload(video_id, quality, segments):
+            calls.append([name for name, _, _ in segments])
+            result = _ok_batch(video_id, quality, segments)
+            if len(calls) == 1:
+                result["results"][1].update(status="error", checksum_verified=False, error="Invalid file format")
+            return result
+
+        client = _client()
+        client.upload_segment_batch = mock.AsyncMock(side_effect=upload)
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue, batch_size=4)
+        await worker.stop()
+        await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert calls == [["seg_0000.m4s", "seg_0001.m4s"], ["seg_0001.m4s"]]
+        assert worker.uploaded_count == 2
+        assert worker.failed_count == 0
+
+    @pytest.mark.asyncio
+    async def test_claim_expiry_aborts(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        _queue_segments(tmp_path, queue, 3)
+        client = _client()
+        client.upload_segment_batch = mock.AsyncMock(side_effect=WorkerAPIError(409, "Claim expired"))
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue, batch_size=2, max_concurrency=2)
+        await worker.stop()
+        with pytest.raises(ClaimExpiredError):
+            await asyncio.wait_for(worker.run(), timeout=5)
+        assert isinstance(worker.error, ClaimExpiredError)
+
+
+class TestSegmentStoreLinking:
+    """Test skipping uploads of segments the server's segment store already has."""
+
+    @pytest.mark.asyncio
+    async def test_linked_segments_are_not_uploaded(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        segments = _queue_segments(tmp_path, queue, 3)
+        client = _client()
+        client.link_segments = mock.AsyncMock(return_value={"linked": ["seg_0001.m4s"], "missing": []})
+        client.upload_segment_batch = mock.AsyncMock(side_effect=_ok_batch)
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue, batch_size=4)
+        await worker.stop()
+        await asyncio.wait_for(worker.run(), timeout=5)
+
+        sent = [
+            [name for name, _, _ in call.kwargs["segments"]] for call in client.upload_segment_batch.await_args_list
+        ]
+        assert sent == [["seg_0000.m4s", "seg_0002.m4s"]]
+        assert worker.uploaded_count == 3
+        assert not any(segment.filepath.exists() for segment in segments)
+
+    @pytest.mark.asyncio
+    async def test_stops_asking_after_misses(self, tmp_path):
+        queue: asyncio.Queue = asyncio.Queue()
+        _queue_segments(tmp_path, queue, LINK_MAX_MISSES + 2)
+        client = _client()
+        client.link_segments = mock.AsyncMock(return_value={"linked": [], "missing": []})
+        client.upload_segment = mock.AsyncMock(return_value={"checksum_verified": True})
+
+        worker = SegmentUploadWorker(client, video_id=1, upload_queue=queue)
+        await worker.stop()
+        await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert client.link_segments.await_count == LINK_MAX_MISSES
+        assert client.upload_segment.await_count == LINK_MAX_MISSES + 2
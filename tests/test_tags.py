@@ -6,6 +6,8 @@ Tests tag CRUD operations, video-tag associations, and filtering videos by tags.
 
 import pytest
 
+from api.response_cache import VIDEO_LISTS_TAG, get_tag_version
+
 # ============================================================================
 # Admin API Tests - Tag Management
 # ============================================================================
@@ -70,6 +72,7 @@ class TestTagManagementHTTP:
     @pytest.mark.asyncio
     async def test_update_tag(self, admin_client, sample_tag):
         """Test updating a tag name."""
+        version = get_tag_version(VIDEO_LISTS_TAG)
         response = admin_client.put(
             f"/api/tags/{sample_tag['id']}",
             json={"name": "Updated Tag"},
@@ -78,6 +81,8 @@ class TestTagManagementHTTP:
         data = response.json()
         assert data["name"] == "Updated Tag"
         assert data["slug"] == "updated-tag"
+        # Public video lists embed tag names
+        assert get_tag_version(VIDEO_LISTS_TAG) > version
 
     def test_update_tag_not_found(self, admin_client):
         """Test updating non-existent tag returns 404."""
@@ -90,9 +95,11 @@ class TestTagManagementHTTP:
     @pytest.mark.asyncio
     async def test_delete_tag(self, admin_client, sample_tag):
         """Test deleting a tag."""
+        version = get_tag_version(VIDEO_LISTS_TAG)
         response = admin_client.delete(f"/api/tags/{sample_tag['id']}")
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
+        assert get_tag_version(VIDEO_LISTS_TAG) > version
 
         # Verify tag is deleted
         response = admin_client.get("/api/tags")
@@ -19,8 +19,17 @@ from config import (
 from worker.transcoder import (
     MAX_DURATION_SECONDS,
     calculate_ffmpeg_timeout,
+    can_pass_through_audio,
+    generate_dash_manifest,
     generate_master_playlist,
+    generate_master_playlist_cmaf,
     get_applicable_qualities,
+    get_audio_rendition_bandwidth,
+    get_chunk_parallelism,
+    plan_keyframe_chunks,
+    shared_audio_bitrate,
+    transcode_ladder_with_progress,
+    transcode_quality_chunked,
     validate_duration,
 )
 
@@ -457,182 +466,6 @@ class TestConfigConstants:
         assert MAX_DURATION_SECONDS <= 30 * 24 * 3600
 
 
-class TestGroupQualitiesByResolution:
-    """Tests for parallel quality batching."""
-
-    def test_sequential_mode(self):
-        """Test parallel_count=1 produces one quality per batch."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        qualities = [
-            {"name": "1080p", "height": 1080},
-            {"name": "720p", "height": 720},
-            {"name": "480p", "height": 480},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=1)
-
-        # Each quality should be in its own batch
-        assert len(batches) == 3
-        assert batches[0] == [{"name": "1080p", "height": 1080}]
-        assert batches[1] == [{"name": "720p", "height": 720}]
-        assert batches[2] == [{"name": "480p", "height": 480}]
-
-    def test_parallel_mode_interleaves_by_resolution(self):
-        """Test qualities are interleaved between high-res and low-res for memory balance."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        # Mix of high-res and low-res
-        qualities = [
-            {"name": "2160p", "height": 2160},
-            {"name": "1440p", "height": 1440},
-            {"name": "1080p", "height": 1080},
-            {"name": "720p", "height": 720},
-            {"name": "480p", "height": 480},
-            {"name": "360p", "height": 360},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=2)
-
-        # With interleaving, batches should mix high and low res
-        # High-res: [2160p, 1440p, 1080p]
-        # Low-res: [720p, 480p, 360p]
-        # Expected interleaved batches (2 per batch):
-        # [[2160p, 720p], [1440p, 480p], [1080p, 360p]]
-        assert len(batches) == 3
-        # Each batch should have one high-res and one low-res
-        for batch in batches:
-            assert len(batch) == 2
-            heights = [q["height"] for q in batch]
-            assert any(h >= 1080 for h in heights)  # Has high-res
-            assert any(h < 1080 for h in heights)   # Has low-res
-
-    def test_parallel_mode_interleaves_uneven_groups(self):
-        """Test uneven high-res/low-res groups are interleaved correctly."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        # 3 high-res, 1 low-res with parallel_count=2
-        qualities = [
-            {"name": "2160p", "height": 2160},
-            {"name": "1440p", "height": 1440},
-            {"name": "1080p", "height": 1080},
-            {"name": "720p", "height": 720},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=2)
-
-        # With interleaving (3 high-res, 1 low-res):
-        # High-res: [2160p, 1440p, 1080p]
-        # Low-res: [720p]
-        # Expected: [[2160p, 720p], [1440p, 1080p]]
-        # (first batch interleaves, second has remaining high-res)
-        assert len(batches) == 2
-        # First batch should have one high-res and one low-res
-        assert len(batches[0]) == 2
-        # Second batch should have remaining high-res qualities
-        assert len(batches[1]) == 2
-        # Total should be 4 qualities
-        total_qualities = sum(len(b) for b in batches)
-        assert total_qualities == 4
-
-    def test_empty_qualities(self):
-        """Test empty input produces empty output."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        batches = group_qualities_by_resolution([], parallel_count=3)
-        assert batches == []
-
-    def test_single_quality(self):
-        """Test single quality produces single batch."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        qualities = [{"name": "720p", "height": 720}]
-        batches = group_qualities_by_resolution(qualities, parallel_count=3)
-
-        assert len(batches) == 1
-        assert batches[0] == [{"name": "720p", "height": 720}]
-
-    def test_all_high_res_only(self):
-        """Test all high-res qualities are batched correctly."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        # Only high-res qualities (>= 1080p)
-        qualities = [
-            {"name": "2160p", "height": 2160},
-            {"name": "1440p", "height": 1440},
-            {"name": "1080p", "height": 1080},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=2)
-
-        # With no low-res to interleave, should batch high-res sequentially
-        assert len(batches) == 2
-        # First batch: 2 high-res
-        assert len(batches[0]) == 2
-        # Second batch: 1 high-res
-        assert len(batches[1]) == 1
-        # All should be high-res
-        all_heights = [q["height"] for batch in batches for q in batch]
-        assert all(h >= 1080 for h in all_heights)
-        # Total should be 3 qualities
-        assert sum(len(b) for b in batches) == 3
-
-    def test_all_low_res_only(self):
-        """Test all low-res qualities are batched correctly."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        # Only low-res qualities (< 1080p)
-        qualities = [
-            {"name": "720p", "height": 720},
-            {"name": "480p", "height": 480},
-            {"name": "360p", "height": 360},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=2)
-
-        # With no high-res to interleave, should batch low-res sequentially
-        assert len(batches) == 2
-        # First batch: 2 low-res
-        assert len(batches[0]) == 2
-        # Second batch: 1 low-res
-        assert len(batches[1]) == 1
-        # All should be low-res
-        all_heights = [q["height"] for batch in batches for q in batch]
-        assert all(h < 1080 for h in all_heights)
-        # Total should be 3 qualities
-        assert sum(len(b) for b in batches) == 3
-
-    def test_parallel_count_three(self):
-        """Test interleaving with parallel_count=3."""
-        from worker.transcoder import group_qualities_by_resolution
-
-        qualities = [
-            {"name": "2160p", "height": 2160},
-            {"name": "1440p", "height": 1440},
-            {"name": "1080p", "height": 1080},
-            {"name": "720p", "height": 720},
-            {"name": "480p", "height": 480},
-            {"name": "360p", "height": 360},
-        ]
-
-        batches = group_qualities_by_resolution(qualities, parallel_count=3)
-
-        # With 3 high-res and 3 low-res, parallel_count=3 should create 2 batches
-        # Each batch should have a mix of high and low res
-        assert len(batches) == 2
-        assert len(batches[0]) == 3
-        assert len(batches[1]) == 3
-
-        # Each batch should have both high-res and low-res
-        for batch in batches:
-            heights = [q["height"] for q in batch]
-            assert any(h >= 1080 for h in heights), "Batch should have high-res"
-            assert any(h < 1080 for h in heights), "Batch should have low-res"
-
-        # Total should be 6 qualities
-        assert sum(len(b) for b in batches) == 6
-
-
 class TestGetRecommendedParallelSessions:
     """Tests for parallel session recommendation."""
 
@@ -712,3 +545,314 @@ class TestGetRecommendedParallelSessions:
                 result = get_recommended_parallel_sessions(gpu_caps)
                 # Should be max(1, ...) = 1
                 assert result >= 1
+
+
+class TestTranscodeLadderWithProgress:
+    """Tests for single-decode ladder transcoding (ffmpeg mocked)."""
+
+    QUALITIES = [
+        {"name": "1080p", "height": 1080, "bitrate": "5000k", "audio_bitrate": "128k"},
+        {"name": "720p", "height": 720, "bitrate": "2500k", "audio_bitrate": "128k"},
+        {"name": "480p", "height": 480, "bitrate": "1000k", "audio_bitrate": "96k"},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_single_process_and_progress_fan_out(self, tmp_path):
+        """Test all qualities share one ffmpeg run and each gets progress updates."""
+        commands = []
+
+        async def mock_run(cmd, video_duration, timeout, progress_callback=None, logging_description=""):
+            commands.append(cmd)
+            await progress_callback(50)
+            await progress_callback(100)
+            return True, None
+
+        async def mock_validate(path, mode=None):
+            return True, None
+
+        received = {q["name"]: [] for q in self.QUALITIES}
+
+        def make_cb(name):
+            async def cb(progress):
+                received[name].append(progress)
+
+            return cb
+
+        callbacks = {name: make_cb(name) for name in received}
+
+        with (
+            patch("worker.transcoder.run_ffmpeg_with_progress", new=mock_run),
+            patch("worker.transcoder.validate_hls_playlist", new=mock_validate),
+        ):
+            results = await transcode_ladder_with_progress(
+                tmp_path / "in.mp4", tmp_path, self.QUALITIES, 60.0, callbacks
+            )
+
+        assert len(commands) == 1
+        assert results == {q["name"]: (True, None) for q in self.QUALITIES}
+        assert all(progress == [50, 100] for progress in received.values())
+
+    @pytest.mark.asyncio
+    async def test_failed_rendition_falls_back_to_single_encode(self, tmp_path):
+        """Test renditions with incomplete ladder output are re-encoded individually."""
+
+        async def mock_run(cmd, video_duration, timeout, progress_callback=None, logging_description=""):
+            return False, "ladder exited with code 1"
+
+        async def mock_validate(path, mode=None):
+            if "720p" in str(path):
+                return False, "Playlist missing #EXT-X-ENDLIST"
+            return True, None
+
+        fallback_calls = []
+
+        async def mock_single(input_path, output_dir, quality, duration, progress_callback=None, **kwargs):
+            fallback_calls.append(quality["name"])
+            return True, None
+
+        with (
+            patch("worker.transcoder.run_ffmpeg_with_progress", new=mock_run),
+            patch("worker.transcoder.validate_hls_playlist", new=mock_validate),
+            patch("worker.transcoder.transcode_quality_with_progress", new=mock_single),
+        ):
+            results = await transcode_ladder_with_progress(tmp_path / "in.mp4", tmp_path, self.QUALITIES, 60.0)
+
+        assert fallback_calls == ["720p"]
+        assert all(success for success, _ in results.values())
+
+    @pytest.mark.asyncio
+    async def test_gpu_ladder_chunked_by_session_limit(self, tmp_path):
+        """Test hardware ladders never open more sessions than the GPU allows."""
+        from worker.hwaccel import EncoderInfo, GPUCapabilities, HWAccelType, VideoCodec
+
+        gpu_caps = GPUCapabilities(
+            hwaccel_type=HWAccelType.NVIDIA,
+            device_name="RTX 3090",
+            max_concurrent_sessions=3,
+            encoders={
+                VideoCodec.H264: [
+                    EncoderInfo(
+                        name="h264_nvenc",
+                        codec=VideoCodec.H264,
+                        hwaccel_type=HWAccelType.NVIDIA,
+                        is_hardware=True,
+                    )
+                ]
+            },
+        )
+        commands = []
+
+        async def mock_run(cmd, video_duration, timeout, progress_callback=None, logging_description=""):
+            commands.append(cmd)
+            return True, None
+
+        async def mock_validate(path, mode=None):
+            return True, None
+
+        with (
+            patch("worker.transcoder.run_ffmpeg_with_progress", new=mock_run),
+            patch("worker.transcoder.validate_hls_playlist", new=mock_validate),
+        ):
+            await transcode_ladder_with_progress(
+                tmp_path / "in.mp4", tmp_path, self.QUALITIES, 60.0, gpu_caps=gpu_caps, preferred_codec="h264"
+            )
+
+        # 3 sessions minus 1 for headroom = 2 renditions per ladder
+        assert len(commands) == 2
+        assert [cmd.count("h264_nvenc") for cmd in commands] == [2, 1]
+
+
+class TestPlanKeyframeChunks:
+    """Tests for cutting a video into keyframe-aligned chunks."""
+
+    def test_chunks_start_just_before_keyframes(self):
+        """Test boundaries sit on the first keyframe after each chunk length."""
+        keyframes = [float(t) for t in range(0, 1000, 7)]
+        chunks = plan_keyframe_chunks(keyframes, 1000.0, 300)
+
+        assert [round(start, 3) for start, _ in chunks] == [0.0, 300.999, 601.999]
+        assert chunks[-1][1] is None
+        assert all(length >= 300 for _, length in chunks[:-1])
+        # Consecutive chunks cover the video without gaps
+        assert chunks[0][0] + chunks[0][1] == chunks[1][0]
+
+    def test_no_short_tail_chunk(self):
+        """Test the last chunk is not cut off shorter than half a chunk."""
+        chunks = plan_keyframe_chunks([0.0, 310.0, 620.0], 700.0, 300)
+
+        assert [round(start) for start, _ in chunks] == [0, 310]
+
+    def test_sparse_keyframes_give_single_chunk(self):
+        """Test a source without usable keyframes isn't chunked."""
+        assert plan_keyframe_chunks([0.0], 3600.0, 300) == [(0.0, None)]
+
+
+class TestGetChunkParallelism:
+    """Tests for the number of chunks encoded at a time."""
+
+    def _gpu_caps(self, max_sessions):
+        from worker.hwaccel import GPUCapabilities, HWAccelType
+
+        return GPUCapabilities(
+            hwaccel_type=HWAccelType.NVIDIA, device_name="RTX 3090", max_concurrent_sessions=max_sessions
+        )
+
+    def test_hardware_uses_the_scheduler_slots(self):
+        """Test GPU chunks get the quality encode slots, not a budget of their own."""
+        gpu_caps = self._gpu_caps(8)
+        with (
+            patch("worker.transcoder.CHUNKED_ENCODING_PARALLEL", 0),
+            patch("worker.transcoder.get_max_parallel_encodes", return_value=2) as slots,
+        ):
+            assert get_chunk_parallelism(True, gpu_caps) == 2
+        slots.assert_called_once_with(gpu_caps)
+
+    def test_override_capped_by_session_limit(self):
+        """Test an explicit chunk count never opens more GPU sessions than allowed."""
+        with (
+            patch("worker.transcoder.CHUNKED_ENCODING_PARALLEL", 6),
+            patch("worker.transcoder.HWACCEL_MAX_CONCURRENT_SESSIONS", 3),
+        ):
+            assert get_chunk_parallelism(True, self._gpu_caps(8)) == 3
+            assert get_chunk_parallelism(False) == 6
+
+    def test_software_uses_a_quarter_of_the_cores(self):
+        """Test software chunks default to a quarter of the CPU cores."""
+        with patch("worker.transcoder.CHUNKED_ENCODING_PARALLEL", 0), patch("os.cpu_count", return_value=16):
+            assert get_chunk_parallelism(False) == 4
+
+
+class TestTranscodeQualityChunked:
+    """Tests for chunked quality encoding (ffmpeg mocked)."""
+
+    QUALITY = {"name": "1080p", "height": 1080, "bitrate": "5000k", "audio_bitrate": "128k"}
+
+    @pytest.mark.asyncio
+    async def test_chunks_then_join(self, tmp_path):
+        """Test each chunk is encoded, then joined in order with progress reaching 100."""
+        commands = []
+        progress = []
+
+        async def mock_keyframes(input_path, timeout=300.0):
+            return [float(t) for t in range(0, 1000, 10)]
+
+        async def mock_run(cmd, video_duration, timeout, progress_callback=None, logging_description=""):
+            commands.append(cmd)
+            if "concat" in cmd:
+                concat_list = Path(cmd[cmd.index("concat") + 4])
+                assert concat_list.read_text().count("file '") == 3
+            await progress_callback(100)
+            return True, None
+
+        async def on_progress(value):
+            progress.append(value)
+
+        with (
+            patch("worker.transcoder.get_keyframe_times", new=mock_keyframes),
+            patch("worker.transcoder.run_ffmpeg_with_progress", new=mock_run),
+            patch("worker.transcoder.CHUNKED_ENCODING_CHUNK_SECONDS", 300),
+        ):
+            result = await transcode_quality_chunked(
+                tmp_path / "in.mp4", tmp_path, self.QUALITY, 1000.0, progress_callback=on_progress
+            )
+
+        assert result == (True, None)
+        assert len(commands) == 4
+        assert all("matroska" in cmd for cmd in commands[:3])
+        assert "concat" in commands[3]
+        assert progress == sorted(progress) and progress[-1] == 100
+        assert not (tmp_path / ".1080p-chunks").exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_fails_quality(self, tmp_path):
+        """Test a failed chunk stops the encode without joining."""
+        commands = []
+
+        async def mock_keyframes(input_path, timeout=300.0):
+            return [float(t) for t in range(0, 1000, 10)]
+
+        async def mock_run(cmd, video_duration, timeout, progress_callback=None, logging_description=""):
+            commands.append(cmd)
+            if "-ss" in cmd:
+                return False, "exited with code 1"
+            return True, None
+
+        with (
+            patch("worker.transcoder.get_keyframe_times", new=mock_keyframes),
+            patch("worker.transcoder.run_ffmpeg_with_progress", new=mock_run),
+            patch("worker.transcoder.CHUNKED_ENCODING_CHUNK_SECONDS", 300),
+        ):
+            success, error_msg = await transcode_quality_chunked(tmp_path / "in.mp4", tmp_path, self.QUALITY, 1000.0)
+
+        assert not success
+        assert "exited with code 1" in error_msg
+        assert not any("concat" in cmd for cmd in commands)
+        assert not (tmp_path / ".1080p-chunks").exists()
+
+
+class TestSharedAudioRendition:
+    """Tests for manifests with a shared CMAF audio rendition."""
+
+    QUALITIES = [
+        {"name": "original", "width": 1920, "height": 1080, "bitrate": "0k", "bitrate_bps": 8000000},
+        {"name": "720p", "width": 1280, "height": 720, "bitrate": "2500k", "audio_bitrate": "128k"},
+        {"name": "360p", "width": 640, "height": 360, "bitrate": "600k", "audio_bitrate": "96k"},
+    ]
+
+    def test_shared_audio_bitrate(self):
+        """Test the shared rendition uses the highest audio bitrate of the ladder."""
+        assert shared_audio_bitrate(self.QUALITIES) == "128k"
+        assert shared_audio_bitrate([]) == "128k"
+
+    def test_passthrough_only_aac_lc_stereo(self):
+        """Test only audio matching the advertised mp4a.40.2 codec string is copied."""
+        assert can_pass_through_audio({"audio_codec": "aac", "audio_profile": "LC", "audio_channels": 2})
+        assert can_pass_through_audio({"audio_codec": "aac", "audio_profile": "LC", "audio_channels": 1})
+        assert not can_pass_through_audio({"audio_codec": "aac", "audio_profile": "HE-AAC", "audio_channels": 2})
+        assert not can_pass_through_audio({"audio_codec": "aac", "audio_profile": "HE-AACv2", "audio_channels": 2})
+        assert not can_pass_through_audio({"audio_codec": "aac", "audio_profile": "LC", "audio_channels": 6})
+        assert not can_pass_through_audio({"audio_codec": "ac3", "audio_profile": None, "audio_channels": 2})
+        assert not can_pass_through_audio({"audio_codec": "aac"})
+
+    def test_bandwidth_from_segments(self, tmp_path: Path):
+        """Test the audio bandwidth is measured from its segments, once the playlist is complete."""
+        audio_dir = tmp_path / "audio"
+        assert get_audio_rendition_bandwidth(tmp_path) is None
+
+        audio_dir.mkdir()
+        (audio_dir / "seg_0000.m4s").write_bytes(b"x" * 60000)
+        (audio_dir / "seg_0001.m4s").write_bytes(b"x" * 30000)
+        playlist = "#EXTM3U\n#EXTINF:4.0,\nseg_0000.m4s\n#EXTINF:2.0,\nseg_0001.m4s\n"
+        (audio_dir / "stream.m3u8").write_text(playlist)
+        assert get_audio_rendition_bandwidth(tmp_path) is None
+
+        (audio_dir / "stream.m3u8").write_text(playlist + "#EXT-X-ENDLIST\n")
+        assert get_audio_rendition_bandwidth(tmp_path) == 120000
+
+    async def test_master_playlist_references_audio_group(self, tmp_path: Path):
+        """Test transcoded variants use the audio group and include its bandwidth."""
+        await generate_master_playlist_cmaf(tmp_path, [dict(q) for q in self.QUALITIES], audio_bandwidth=130000)
+
+        content = (tmp_path / "master.m3u8").read_text()
+        assert '#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="audio"' in content
+        assert 'URI="audio/stream.m3u8"' in content
+        assert 'BANDWIDTH=2630000,RESOLUTION=1280x720,CODECS="avc1.640028,mp4a.40.2",AUDIO="audio"' in content
+        assert 'BANDWIDTH=8000000,RESOLUTION=1920x1080,CODECS="avc1.640028,mp4a.40.2"\n' in content
+
+    async def test_master_playlist_without_audio_group(self, tmp_path: Path):
+        """Test muxed renditions are listed as before."""
+        await generate_master_playlist_cmaf(tmp_path, [dict(q) for q in self.QUALITIES])
+
+        content = (tmp_path / "master.m3u8").read_text()
+        assert "EXT-X-MEDIA" not in content and "AUDIO=" not in content
+        assert "BANDWIDTH=2500000," in content
+
+    async def test_dash_manifest_audio_adaptation_set(self, tmp_path: Path):
+        """Test DASH gets video-only representations and an audio AdaptationSet."""
+        await generate_dash_manifest(tmp_path, self.QUALITIES, total_duration=60, audio_bandwidth=130000)
+
+        content = (tmp_path / "manifest.mpd").read_text()
+        assert 'mimeType="video/mp4" codecs="avc1.640028"' in content
+        assert 'mimeType="audio/mp4" codecs="mp4a.40.2"' in content
+        assert '<Representation id="audio" bandwidth="130000">' in content
+        assert 'media="audio/seg_$Number%04d$.m4s"' in content
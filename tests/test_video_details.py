@@ -0,0 +1,61 @@
+"""
+Tests for the batched per-request video detail loader (api/video_details.py).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.schemas import VideoTagInfo
+from api.video_details import (
+    CHAPTERS,
+    QUALITIES,
+    TAGS,
+    TRANSCRIPTIONS,
+    VideoDetailLoader,
+    get_detail_loader,
+)
+
+
+class TestVideoDetailLoader:
+    """Test batching and memoization of detail queries."""
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_kind_and_memoized(self):
+        """Each kind is fetched once for the whole set; repeated loads only fetch new videos."""
+        tag = VideoTagInfo(id=1, name="Python", slug="python")
+        fetch_tags = AsyncMock(return_value={1: [tag]})
+        fetch_transcriptions = AsyncMock(return_value={2: {"status": "completed", "vtt_path": "a.vtt"}})
+        fetchers = {
+            TAGS: fetch_tags,
+            CHAPTERS: AsyncMock(return_value={}),
+            QUALITIES: AsyncMock(return_value={}),
+            TRANSCRIPTIONS: fetch_transcriptions,
+        }
+
+        loader = VideoDetailLoader()
+        with patch.dict("api.video_details._FETCHERS", fetchers):
+            await loader.load([1, 2, 1], TAGS, TRANSCRIPTIONS)
+            await loader.load([1, 2], TAGS)
+            await loader.load([2, 3], TAGS)
+
+        assert fetch_tags.await_args_list[0].args == ([1, 2],)
+        assert fetch_tags.await_args_list[1].args == ([3],)
+        assert fetch_tags.await_count == 2
+        fetch_transcriptions.assert_awaited_once_with([1, 2])
+        fetchers[CHAPTERS].assert_not_awaited()
+
+        assert loader.tags(1) == [tag]
+        assert loader.tags(2) == []
+        assert loader.tags_map() == {1: [tag]}
+        assert loader.transcription(2)["vtt_path"] == "a.vtt"
+        assert loader.transcription(1) is None
+        assert loader.qualities(1) == []
+
+    def test_loader_shared_per_request(self):
+        """Helpers called for the same request share one loader."""
+        first = SimpleNamespace(state=SimpleNamespace())
+        second = SimpleNamespace(state=SimpleNamespace())
+        assert get_detail_loader(first) is get_detail_loader(first)
+        assert get_detail_loader(first) is not get_detail_loader(second)
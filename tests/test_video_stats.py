@@ -0,0 +1,123 @@
+"""
+Tests for per-video playback counters (api/video_stats.py).
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from api.database import playback_sessions, video_stats
+
+
+async def _get_stats(test_database, video_id):
+    return await test_database.fetch_one(video_stats.select().where(video_stats.c.video_id == video_id))
+
+
+async def _insert_stats(test_database, video_id, view_count):
+    await test_database.execute(
+        video_stats.insert().values(
+            video_id=video_id, view_count=view_count, unique_viewers=0, watch_seconds=0.0, completions=0
+        )
+    )
+
+
+class TestIncrementalCounters:
+    """Counters are maintained by the analytics endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_update_views_and_unique_viewers(self, public_client, test_database, sample_video):
+        """Repeat sessions from the same viewer count as views but not new unique viewers."""
+        first = public_client.post("/api/analytics/session", json={"video_id": sample_video["id"]})
+        assert first.status_code == 200
+        viewer_cookie = {"vlog_viewer": first.cookies["vlog_viewer"]}
+        second = public_client.post(
+            "/api/analytics/session", json={"video_id": sample_video["id"]}, cookies=viewer_cookie
+        )
+        assert second.status_code == 200
+
+        stats = await _get_stats(test_database, sample_video["id"])
+        assert stats["view_count"] == 2
+        assert stats["unique_viewers"] == 1
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_and_end_update_watch_time_and_completions(
+        self, public_client, test_database, sample_video
+    ):
+        """Playing heartbeats add watch time; completion is counted once per session."""
+        token = public_client.post("/api/analytics/session", json={"video_id": sample_video["id"]}).json()[
+            "session_token"
+        ]
+
+        public_client.post("/api/analytics/heartbeat", json={"session_token": token, "position": 30.0, "playing": True})
+        public_client.post(
+            "/api/analytics/heartbeat", json={"session_token": token, "position": 30.0, "playing": False}
+        )
+        for _ in range(2):
+            response = public_client.post(
+                "/api/analytics/end", json={"session_token": token, "position": 120.0, "completed": True}
+            )
+            assert response.status_code == 200
+
+        stats = await _get_stats(test_database, sample_video["id"])
+        assert stats["watch_seconds"] == 30.0
+        assert stats["completions"] == 1
+
+    def test_video_list_defaults_to_zero_views(self, public_client, sample_video):
+        """Videos without a counter row list with zero views."""
+        response = public_client.get("/api/videos")
+        assert response.json()["videos"][0]["view_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_video_list_reads_view_count_from_counters(self, public_client, test_database, sample_video):
+        """The listing reports view counts from the counter row."""
+        await _insert_stats(test_database, sample_video["id"], 42)
+
+        response = public_client.get("/api/videos")
+        assert response.json()["videos"][0]["view_count"] == 42
+
+
+class TestReconciliation:
+    """Reconciliation recomputes counters from playback_sessions."""
+
+    @pytest.mark.asyncio
+    async def test_reconcile_corrects_drift(self, test_database, sample_video, monkeypatch):
+        import api.database
+        from api.video_stats import reconcile_video_stats
+
+        monkeypatch.setattr(api.database, "database", test_database)
+
+        now = datetime.now(timezone.utc)
+        for duration, completed in ((60.0, True), (15.0, False)):
+            await test_database.execute(
+                playback_sessions.insert().values(
+                    video_id=sample_video["id"],
+                    session_token=str(uuid.uuid4()),
+                    started_at=now,
+                    duration_watched=duration,
+                    completed=completed,
+                )
+            )
+        # Drifted counter row
+        await _insert_stats(test_database, sample_video["id"], 99)
+
+        await reconcile_video_stats()
+
+        stats = await _get_stats(test_database, sample_video["id"])
+        assert stats["view_count"] == 2
+        assert stats["watch_seconds"] == 75.0
+        assert stats["completions"] == 1
+        assert stats["reconciled_at"] is not None
+
+    @pytest.mark.asyncio
+    async def test_reconcile_resets_videos_without_sessions(self, test_database, sample_video, monkeypatch):
+        import api.database
+        from api.video_stats import reconcile_video_stats
+
+        monkeypatch.setattr(api.database, "database", test_database)
+        await _insert_stats(test_database, sample_video["id"], 5)
+
+        await reconcile_video_stats()
+
+        stats = await _get_stats(test_database, sample_video["id"])
+        assert stats["view_count"] == 0
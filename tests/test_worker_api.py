@@ -13,8 +13,18 @@ import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
-
-from api.database import quality_progress, transcoding_jobs, videos, worker_api_keys, workers
+from fastapi import HTTPException
+
+from api.database import (
+    quality_progress,
+    transcoding_jobs,
+    transcoding_tasks,
+    video_qualities,
+    videos,
+    worker_api_keys,
+    workers,
+)
+from api.worker_api import parse_byte_range
 from api.worker_auth import (
     HASH_VERSION_ARGON2,
     HASH_VERSION_SHA256,
@@ -434,12 +444,197 @@ class TestSourceDownload:
         assert response.status_code == 200
         assert response.content == source_content
 
+    @pytest.mark.asyncio
+    async def test_download_source_byte_range(
+        self, worker_client, registered_worker, test_database, sample_pending_video, test_storage
+    ):
+        """Test that a Range request returns the requested bytes for resuming downloads."""
+        await test_database.execute(
+            transcoding_jobs.insert().values(
+                video_id=sample_pending_video["id"],
+                attempt_number=1,
+                max_attempts=3,
+            )
+        )
+        source_content = b"0123456789abcdefghij"
+        source_file = test_storage["uploads"] / f"{sample_pending_video['id']}.mp4"
+        source_file.write_bytes(source_content)
+        worker_client.post(
+            "/api/worker/claim",
+            headers={"X-Worker-API-Key": registered_worker["api_key"]},
+        )
+
+        response = worker_client.get(
+            f"/api/worker/source/{sample_pending_video['id']}",
+            headers={"X-Worker-API-Key": registered_worker["api_key"], "Range": "bytes=10-"},
+        )
+        assert response.status_code == 206
+        assert response.content == b"abcdefghij"
+        assert response.headers["content-range"] == "bytes 10-19/20"
+
+        response = worker_client.get(
+            f"/api/worker/source/{sample_pending_video['id']}",
+            headers={"X-Worker-API-Key": registered_worker["api_key"], "Range": "bytes=20-"},
+        )
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */20"
+
+
+class TestParseByteRange:
+    """Tests for Range header parsing on the source download endpoint."""
+
+    def test_open_ended_range(self):
+        assert parse_byte_range("bytes=100-", 1000) == (100, 999)
+
+    def test_bounded_range_is_clamped(self):
+        assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+        assert parse_byte_range("bytes=900-2000", 1000) == (900, 999)
+
+    def test_suffix_range(self):
+        assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+        assert parse_byte_range("bytes=-5000", 1000) == (0, 999)
+
+    def test_unsupported_ranges_serve_whole_file(self):
+        assert parse_byte_range("bytes=0-10,20-30", 1000) is None
+        assert parse_byte_range("items=0-10", 1000) is None
+        assert parse_byte_range("bytes=abc-", 1000) is None
+        assert parse_byte_range("bytes=50-10", 1000) is None
+
+    def test_range_beyond_end_is_unsatisfiable(self):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_byte_range("bytes=1000-", 1000)
+        assert exc_info.value.status_code == 416
+
 
 # ============================================================================
 # Path Traversal Prevention (Issue #119)
 # ============================================================================
 
 
+class TestSegmentBatchUpload:
+    """Tests for the batched segment upload endpoint."""
+
+    @staticmethod
+    def _segment(index: int) -> bytes:
+        return b"\x00\x00\x00\x18moof" + bytes([index]) * 64
+
+    @pytest.mark.asyncio
+    async def test_batch_upload_reports_per_segment_results(
+        self, worker_client, registered_worker, test_database, sample_pending_video, test_storage
+    ):
+        """Good segments are stored even when another segment in the batch is rejected."""
+        import json
+
+        await test_database.execute(
+            transcoding_jobs.insert().values(
+                video_id=sample_pending_video["id"],
+                attempt_number=1,
+                max_attempts=3,
+            )
+        )
+        worker_client.post(
+            "/api/worker/claim",
+            headers={"X-Worker-API-Key": registered_worker["api_key"]},
+        )
+
+        good = [("seg_0001.m4s", self._segment(1)), ("seg_0002.m4s", self._segment(2))]
+        bad = ("seg_0003.m4s", self._segment(3))
+        manifest = [
+            {"filename": name, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()} for name, data in good
+        ]
+        manifest.append({"filename": bad[0], "size": len(bad[1]), "sha256": "0" * 64})
+
+        response = worker_client.post(
+            f"/api/worker/upload/{sample_pending_video['id']}/segments/1080p/batch",
+            headers={
+                "X-Worker-API-Key": registered_worker["api_key"],
+                "X-Segment-Manifest": json.dumps(manifest),
+            },
+            content=b"".join(data for _, data in good) + bad[1],
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "partial"
+        assert [r["status"] for r in body["results"]] == ["ok", "ok", "error"]
+
+        quality_dir = test_storage["videos"] / sample_pending_video["slug"] / "1080p"
+        for name, data in good:
+            assert (quality_dir / name).read_bytes() == data
+        assert not (quality_dir / bad[0]).exists()
+
+    def test_body_must_match_manifest(self, worker_client, registered_worker):
+        """A body shorter than the manifest declares is rejected."""
+        import json
+
+        data = self._segment(1)
+        manifest = [{"filename": "seg_0001.m4s", "size": len(data) + 10, "sha256": hashlib.sha256(data).hexdigest()}]
+        response = worker_client.post(
+            "/api/worker/upload/1/segments/1080p/batch",
+            headers={
+                "X-Worker-API-Key": registered_worker["api_key"],
+                "X-Segment-Manifest": json.dumps(manifest),
+            },
+            content=data,
+        )
+        assert response.status_code in (400, 403)
+
+    def test_oversized_batch_rejected_before_reading_body(self, worker_client, registered_worker):
+        """Batches of several segments above the body limit are refused up front."""
+        import json
+
+        from api.worker_api import MAX_SEGMENT_BATCH_BYTES
+
+        size = MAX_SEGMENT_BATCH_BYTES // 2 + 1
+        manifest = [{"filename": f"seg_000{i}.m4s", "size": size, "sha256": "0" * 64} for i in range(2)]
+        response = worker_client.post(
+            "/api/worker/upload/1/segments/1080p/batch",
+            headers={
+                "X-Worker-API-Key": registered_worker["api_key"],
+                "X-Segment-Manifest": json.dumps(manifest),
+            },
+            content=b"",
+        )
+        assert response.status_code == 413
+
+
+class TestWriteSegmentBatch:
+    """Tests for the group-commit segment batch writer."""
+
+    def test_writes_all_segments(self, tmp_path):
+        from api.worker_api import _write_segment_batch_sync
+
+        items = [(f"seg_{i}.m4s", bytes([i]) * 100, hashlib.sha256(bytes([i]) * 100).hexdigest()) for i in range(3)]
+        results = _write_segment_batch_sync(items, tmp_path / "1080p")
+
+        assert [r[:4] for r in results] == [(f"seg_{i}.m4s", None, True, 100) for i in range(3)]
+        for name, data, _ in items:
+            assert (tmp_path / "1080p" / name).read_bytes() == data
+        assert not list((tmp_path / "1080p").glob("*.tmp"))
+
+    def test_existing_identical_segment_is_not_rewritten(self, tmp_path):
+        from api.worker_api import _write_segment_batch_sync
+
+        data = b"segment" * 10
+        (tmp_path / "seg_1.m4s").write_bytes(data)
+        results = _write_segment_batch_sync([("seg_1.m4s", data, hashlib.sha256(data).hexdigest())], tmp_path)
+
+        assert results == [("seg_1.m4s", None, False, len(data), 0)]
+
+    def test_checksum_mismatch_only_fails_that_segment(self, tmp_path):
+        from api.worker_api import _write_segment_batch_sync
+
+        good = b"good" * 10
+        results = _write_segment_batch_sync(
+            [("bad.m4s", b"bad" * 10, "0" * 64), ("good.m4s", good, hashlib.sha256(good).hexdigest())],
+            tmp_path,
+        )
+
+        assert results[0][1] == "Checksum verification failed"
+        assert results[1][1] is None
+        assert not (tmp_path / "bad.m4s").exists()
+        assert (tmp_path / "good.m4s").read_bytes() == good
+
+
 class TestPathTraversalPrevention:
     """Tests for path traversal prevention in HLS upload."""
 
@@ -822,6 +1017,57 @@ class TestJobClaiming:
         assert gpu_claim_response.status_code == 200
         assert gpu_claim_response.json()["job_id"] is not None
 
+    @pytest.mark.asyncio
+    async def test_long_poll_rechecks_gpu_priority_after_wake(
+        self, worker_client, test_database, sample_pending_video, worker_admin_headers, monkeypatch
+    ):
+        """Test a parked CPU worker passes a wake-up on when a GPU worker became idle meanwhile."""
+        import api.worker_api
+
+        workers_by_name = {}
+        for name, capabilities in (
+            ("cpu-worker", {"hwaccel_enabled": False, "hwaccel_type": "none", "supported_codecs": ["h264"]}),
+            ("gpu-worker", {"hwaccel_enabled": True, "hwaccel_type": "nvidia", "supported_codecs": ["h264"]}),
+        ):
+            response = worker_client.post(
+                "/api/worker/register",
+                headers=worker_admin_headers,
+                json={"worker_name": name, "capabilities": capabilities},
+            )
+            assert response.status_code == 200
+            workers_by_name[name] = response.json()
+
+        async def wake_after_job_published(timeout):
+            # While the CPU worker was parked, the GPU worker went idle and a job arrived
+            app_database = api.worker_api.database
+            await app_database.execute(
+                workers.update()
+                .where(workers.c.worker_id == workers_by_name["gpu-worker"]["worker_id"])
+                .values(status="idle", last_heartbeat=datetime.now(timezone.utc))
+            )
+            await app_database.execute(
+                transcoding_jobs.insert().values(video_id=sample_pending_video["id"], attempt_number=1, max_attempts=3)
+            )
+            return True
+
+        handed_on = []
+        monkeypatch.setattr(api.worker_api.claim_waiters, "wait", wake_after_job_published)
+        monkeypatch.setattr(api.worker_api.claim_waiters, "notify_one", lambda: handed_on.append(True) or True)
+
+        response = worker_client.post(
+            "/api/worker/claim?wait=5",
+            headers={"X-Worker-API-Key": workers_by_name["cpu-worker"]["api_key"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["message"] == "Waiting for GPU workers"
+        assert response.json()["job_id"] is None
+        assert handed_on == [True]
+
+        job = await test_database.fetch_one(
+            transcoding_jobs.select().where(transcoding_jobs.c.video_id == sample_pending_video["id"])
+        )
+        assert job["worker_id"] is None
+
     @pytest.mark.asyncio
     async def test_claim_job_records_processed_by_worker(
         self, worker_client, registered_worker, test_database, sample_pending_video
@@ -1853,6 +2099,378 @@ class TestJobFailure:
         assert source_file.exists(), "Source file should be preserved when job will be retried"
 
 
+class TestRenditionTasks:
+    """Tests for splitting jobs into rendition sub-tasks."""
+
+    @pytest.fixture
+    def splitting_enabled(self, worker_client, monkeypatch):
+        import api.worker_api
+
+        written = []
+
+        async def fake_write_manifests(video, streaming_format, codec, partial=False):
+            written.append((video["slug"], streaming_format, codec) + (("partial",) if partial else ()))
+
+        monkeypatch.setattr(api.worker_api, "JOB_SPLITTING_ENABLED", True)
+        monkeypatch.setattr(api.worker_api, "JOB_SPLIT_MIN_DURATION", 300)
+        monkeypatch.setattr(api.worker_api, "_write_video_manifests", fake_write_manifests)
+        return written
+
+    async def _claimed_job(self, worker_client, registered_worker, test_database, video, duration):
+        await test_database.execute(
+            videos.update()
+            .where(videos.c.id == video["id"])
+            .values(duration=duration, source_width=1920, source_height=1080)
+        )
+        job_id = await test_database.execute(
+            transcoding_jobs.insert().values(video_id=video["id"], attempt_number=1, max_attempts=3)
+        )
+        response = worker_client.post("/api/worker/claim", headers={"X-Worker-API-Key": registered_worker["api_key"]})
+        assert response.json()["job_id"] == job_id
+        return job_id
+
+    @pytest.mark.asyncio
+    async def test_split_job_tasks_finish_the_video(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled
+    ):
+        """Each rendition is claimed and completed separately; the last one finishes the job."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+
+        response = worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        assert response.status_code == 200
+        assert response.json()["split"] is True
+        assert response.json()["task_count"] == 2
+
+        # The job is no longer held by the worker, and can't be claimed again
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["worker_id"] is None
+        assert job["claimed_at"] is not None
+        assert worker_client.post("/api/worker/claim", headers=headers).json()["job_id"] is None
+
+        tasks = []
+        for expected_quality in ("720p", "original"):
+            task = worker_client.post("/api/worker/claim-task", headers=headers, params={"job_id": job_id}).json()
+            assert task["quality"] == expected_quality
+            assert task["video_duration"] == 600
+            tasks.append(task)
+        assert worker_client.post("/api/worker/claim-task", headers=headers).json()["task_id"] is None
+
+        response = worker_client.post(
+            f"/api/worker/task/{tasks[0]['task_id']}/progress", headers=headers, json={"progress": 50}
+        )
+        assert response.status_code == 200
+
+        response = worker_client.post(
+            f"/api/worker/task/{tasks[0]['task_id']}/complete",
+            headers=headers,
+            json={"width": 1280, "height": 720, "bitrate": 2500},
+        )
+        assert response.json()["job_finished"] is False
+        response = worker_client.post(
+            f"/api/worker/task/{tasks[1]['task_id']}/complete",
+            headers=headers,
+            json={"width": 1920, "height": 1080, "bitrate": 8000},
+        )
+        assert response.json()["job_finished"] is True
+        assert splitting_enabled == [(sample_pending_video["slug"], "cmaf", "h264")]
+
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["completed_at"] is not None
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+        assert video["streaming_format"] == "cmaf"
+        rows = await test_database.fetch_all(
+            video_qualities.select().where(video_qualities.c.video_id == sample_pending_video["id"])
+        )
+        assert sorted(row["quality"] for row in rows) == ["720p", "original"]
+
+    @pytest.mark.asyncio
+    async def test_short_video_is_not_split(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled
+    ):
+        """Videos under JOB_SPLIT_MIN_DURATION stay with the claiming worker."""
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 60)
+
+        response = worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers={"X-Worker-API-Key": registered_worker["api_key"]},
+            json={"qualities": ["720p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        assert response.json()["split"] is False
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["worker_id"] == registered_worker["worker_id"]
+
+    @pytest.mark.asyncio
+    async def test_job_fails_when_every_task_fails(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled
+    ):
+        """Tasks retry up to their max attempts; a job without any rendition fails."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+        worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "original"], "streaming_format": "hls_ts", "streaming_codec": "h264"},
+        )
+        await test_database.execute(
+            transcoding_tasks.update().where(transcoding_tasks.c.job_id == job_id).values(max_attempts=1)
+        )
+
+        for _ in range(2):
+            task = worker_client.post("/api/worker/claim-task", headers=headers).json()
+            response = worker_client.post(
+                f"/api/worker/task/{task['task_id']}/fail",
+                headers=headers,
+                json={"error_message": "Encoder crashed", "retry": True},
+            )
+            assert response.json()["will_retry"] is False
+
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["completed_at"] is not None
+        assert "Encoder crashed" in job["last_error"]
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "failed"
+        assert not splitting_enabled
+
+    @pytest.mark.asyncio
+    async def test_progressive_publish_cheapest_task_first(
+        self,
+        worker_client,
+        registered_worker,
+        test_database,
+        test_storage,
+        sample_pending_video,
+        splitting_enabled,
+        monkeypatch,
+    ):
+        """The cheapest rendition is queued first and makes the video playable on completion."""
+        import api.worker_api
+
+        monkeypatch.setattr(api.worker_api, "PROGRESSIVE_PUBLISH_ENABLED", True)
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+        worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "360p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+
+        task = worker_client.post("/api/worker/claim-task", headers=headers).json()
+        assert task["quality"] == "360p"
+        playlist = test_storage["videos"] / sample_pending_video["slug"] / "360p" / "stream.m3u8"
+        playlist.parent.mkdir(parents=True, exist_ok=True)
+        playlist.write_text("#EXTM3U\n")
+        response = worker_client.post(
+            f"/api/worker/task/{task['task_id']}/complete",
+            headers=headers,
+            json={"width": 640, "height": 360, "bitrate": 800},
+        )
+        assert response.json()["job_finished"] is False
+        assert splitting_enabled == [(sample_pending_video["slug"], "cmaf", "h264", "partial")]
+
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["completed_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_reset_job_drops_its_tasks(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled
+    ):
+        """Tasks of a reset split job can't be claimed alongside the new whole-job claim."""
+        from api.admin import create_or_reset_transcoding_job
+
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+        worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        assert worker_client.post("/api/worker/claim-task", headers=headers).json()["task_id"] is not None
+
+        await create_or_reset_transcoding_job(sample_pending_video["id"])
+        await test_database.execute(
+            videos.update().where(videos.c.id == sample_pending_video["id"]).values(status="pending")
+        )
+
+        assert not await test_database.fetch_all(transcoding_tasks.select().where(transcoding_tasks.c.job_id == job_id))
+        assert worker_client.post("/api/worker/claim-task", headers=headers).json()["task_id"] is None
+        assert worker_client.post("/api/worker/claim", headers=headers).json()["job_id"] == job_id
+
+    @pytest.mark.asyncio
+    async def test_tasks_only_claimable_while_job_is_split(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled
+    ):
+        """Leftover tasks of a job held by a worker are not handed out."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+        worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        await test_database.execute(
+            transcoding_jobs.update()
+            .where(transcoding_jobs.c.id == job_id)
+            .values(worker_id=registered_worker["worker_id"], current_step="claimed")
+        )
+
+        assert worker_client.post("/api/worker/claim-task", headers=headers).json()["task_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_stale_check_releases_expired_tasks(
+        self, worker_client, registered_worker, test_database, sample_pending_video, splitting_enabled, monkeypatch
+    ):
+        """Expired task claims are released by the stale job checker, not only by claim-task."""
+        import api.worker_api
+        from api.worker_api import _detect_and_release_stale_jobs
+
+        monkeypatch.setattr(api.worker_api, "_api_start_time", None)
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await self._claimed_job(worker_client, registered_worker, test_database, sample_pending_video, 600)
+        worker_client.post(
+            f"/api/worker/{job_id}/split",
+            headers=headers,
+            json={"qualities": ["720p", "original"], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        task = worker_client.post("/api/worker/claim-task", headers=headers).json()
+        await test_database.execute(
+            transcoding_tasks.update()
+            .where(transcoding_tasks.c.id == task["task_id"])
+            .values(claim_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+        )
+
+        await _detect_and_release_stale_jobs()
+
+        row = await test_database.fetch_one(transcoding_tasks.select().where(transcoding_tasks.c.id == task["task_id"]))
+        assert row["status"] == "pending"
+        assert row["worker_id"] is None
+        assert row["attempt_number"] == 2
+
+
+class TestProgressivePublish:
+    """Tests for publishing renditions of a running job."""
+
+    QUALITY = {"name": "360p", "width": 640, "height": 360, "bitrate": 800}
+
+    @pytest.fixture
+    def progressive_publish(self, monkeypatch):
+        import api.worker_api
+
+        written = []
+
+        async def fake_write_manifests(video, streaming_format, codec, partial=False):
+            written.append((video["slug"], partial))
+
+        monkeypatch.setattr(api.worker_api, "PROGRESSIVE_PUBLISH_ENABLED", True)
+        monkeypatch.setattr(api.worker_api, "_write_video_manifests", fake_write_manifests)
+        return written
+
+    async def _published_job(self, worker_client, registered_worker, test_database, test_storage, video):
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await test_database.execute(
+            transcoding_jobs.insert().values(video_id=video["id"], attempt_number=1, max_attempts=3)
+        )
+        assert worker_client.post("/api/worker/claim", headers=headers).json()["job_id"] == job_id
+
+        playlist = test_storage["videos"] / video["slug"] / "360p" / "stream.m3u8"
+        playlist.parent.mkdir(parents=True, exist_ok=True)
+        playlist.write_text("#EXTM3U\n")
+        response = worker_client.post(
+            f"/api/worker/{job_id}/publish",
+            headers=headers,
+            json={"qualities": [self.QUALITY], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        assert response.status_code == 200
+        return job_id, response.json()
+
+    @pytest.mark.asyncio
+    async def test_publish_makes_video_ready(
+        self, worker_client, registered_worker, test_database, test_storage, sample_pending_video, progressive_publish
+    ):
+        """Uploaded renditions are recorded and the video is playable while the job runs."""
+        job_id, data = await self._published_job(
+            worker_client, registered_worker, test_database, test_storage, sample_pending_video
+        )
+
+        assert data["published"] == ["360p"]
+        assert progressive_publish == [(sample_pending_video["slug"], True)]
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+        assert video["published_at"] is not None
+        job = await test_database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.id == job_id))
+        assert job["completed_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_publish_skips_renditions_not_uploaded(
+        self, worker_client, registered_worker, test_database, sample_pending_video, progressive_publish
+    ):
+        """Nothing is published for renditions whose playlist isn't on disk."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id = await test_database.execute(
+            transcoding_jobs.insert().values(video_id=sample_pending_video["id"], attempt_number=1, max_attempts=3)
+        )
+        worker_client.post("/api/worker/claim", headers=headers)
+
+        response = worker_client.post(
+            f"/api/worker/{job_id}/publish",
+            headers=headers,
+            json={"qualities": [self.QUALITY], "streaming_format": "cmaf", "streaming_codec": "h264"},
+        )
+        assert response.status_code == 200
+        assert response.json()["published"] == []
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "processing"
+
+    @pytest.mark.asyncio
+    async def test_retried_job_keeps_video_ready(
+        self, worker_client, registered_worker, test_database, test_storage, sample_pending_video, progressive_publish
+    ):
+        """A published video stays listed while its retried job is claimed again."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id, _ = await self._published_job(
+            worker_client, registered_worker, test_database, test_storage, sample_pending_video
+        )
+
+        response = worker_client.post(
+            f"/api/worker/{job_id}/fail", headers=headers, json={"error_message": "Encoder crashed", "retry": True}
+        )
+        assert response.json()["will_retry"] is True
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+
+        claimed = worker_client.post("/api/worker/claim", headers=headers).json()
+        assert claimed["job_id"] == job_id
+        assert "360p" in claimed["existing_qualities"]
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+
+    @pytest.mark.asyncio
+    async def test_expired_claim_keeps_video_ready(
+        self, worker_client, registered_worker, test_database, test_storage, sample_pending_video, progressive_publish
+    ):
+        """An expired claim on a published video's job is reclaimed without unpublishing it."""
+        headers = {"X-Worker-API-Key": registered_worker["api_key"]}
+        job_id, _ = await self._published_job(
+            worker_client, registered_worker, test_database, test_storage, sample_pending_video
+        )
+        await test_database.execute(
+            transcoding_jobs.update()
+            .where(transcoding_jobs.c.id == job_id)
+            .values(claim_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+        )
+
+        assert worker_client.post("/api/worker/claim", headers=headers).json()["job_id"] == job_id
+        video = await test_database.fetch_one(videos.select().where(videos.c.id == sample_pending_video["id"]))
+        assert video["status"] == "ready"
+
+
 class TestWorkerListing:
     """Tests for worker listing endpoint."""
 
@@ -3,16 +3,24 @@ Unit tests for worker authentication helper functions.
 
 These tests focus on the _get_request_context() function which handles
 request context extraction for security logging, including trusted proxy
-handling and X-Forwarded-For header processing.
+handling and X-Forwarded-For header processing, and on the verified-key
+cache used by authenticate_api_key().
 
 Integration tests for verify_worker_key are in test_worker_api.py.
 """
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from fastapi import HTTPException
 
-from api.worker_auth import _get_request_context
+from api.worker_auth import (
+    VerifiedKeyCache,
+    _get_request_context,
+    authenticate_api_key,
+    hash_api_key,
+    invalidate_worker_key_cache,
+)
 
 
 @pytest.fixture
@@ -110,3 +118,125 @@ class TestGetRequestContext:
 
         assert ctx["direct_ip"] == "unknown"
         assert ctx["ip_address"] == "unknown"
+
+
+class TestVerifiedKeyCache:
+    """Tests for the verified worker API key cache."""
+
+    def test_get_returns_cached_record(self):
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=10)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 7}, cache.generation)
+
+        assert cache.get("vlog_key_a") == {"id": 1, "worker_id": 7}
+        assert cache.get("vlog_key_b") is None
+
+    def test_plaintext_key_not_stored(self):
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=10)
+        cache.set("vlog_secret_key", {"id": 1, "worker_id": 7}, cache.generation)
+
+        assert "vlog_secret_key" not in cache._entries
+
+    def test_expired_entry_is_evicted(self, monkeypatch):
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=10)
+        now = 1000.0
+        monkeypatch.setattr("api.worker_auth.time.monotonic", lambda: now)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 7}, cache.generation)
+
+        now = 1061.0
+        assert cache.get("vlog_key_a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted_when_full(self):
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=2)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 1}, cache.generation)
+        cache.set("vlog_key_b", {"id": 2, "worker_id": 2}, cache.generation)
+        cache.get("vlog_key_a")
+        cache.set("vlog_key_c", {"id": 3, "worker_id": 3}, cache.generation)
+
+        assert cache.get("vlog_key_a") is not None
+        assert cache.get("vlog_key_b") is None
+        assert cache.get("vlog_key_c") is not None
+
+    def test_invalidate_worker_removes_only_its_keys(self):
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=10)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 7}, cache.generation)
+        cache.set("vlog_key_b", {"id": 2, "worker_id": 7}, cache.generation)
+        cache.set("vlog_key_c", {"id": 3, "worker_id": 8}, cache.generation)
+
+        assert cache.invalidate_worker(7) == 2
+        assert cache.get("vlog_key_a") is None
+        assert cache.get("vlog_key_b") is None
+        assert cache.get("vlog_key_c") is not None
+
+    def test_set_after_invalidation_is_dropped(self):
+        """A verification that raced with a revocation must not repopulate the cache."""
+        cache = VerifiedKeyCache(ttl_seconds=60, max_size=10)
+        generation = cache.generation
+        cache.invalidate_worker(7)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 7}, generation)
+
+        assert cache.get("vlog_key_a") is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = VerifiedKeyCache(ttl_seconds=0, max_size=10)
+        cache.set("vlog_key_a", {"id": 1, "worker_id": 7}, cache.generation)
+
+        assert cache.get("vlog_key_a") is None
+
+
+class TestAuthenticateApiKeyCaching:
+    """Tests for verified-key caching in authenticate_api_key()."""
+
+    @pytest.fixture
+    def key_lookup(self, monkeypatch):
+        """Serve a single argon2id key record and count database lookups."""
+        api_key = "vlog_test_key_0123456789"
+        key_hash, hash_version = hash_api_key(api_key)
+        record = {
+            "id": 1,
+            "worker_id": 7,
+            "key_hash": key_hash,
+            "key_prefix": api_key[:8],
+            "hash_version": hash_version,
+            "expires_at": None,
+            "revoked_at": None,
+        }
+        fetch_all = AsyncMock(return_value=[record])
+        monkeypatch.setattr("api.worker_auth.database.fetch_all", fetch_all)
+        monkeypatch.setattr("api.worker_auth._verified_key_cache", VerifiedKeyCache(ttl_seconds=60, max_size=10))
+        return api_key, fetch_all
+
+    @pytest.mark.asyncio
+    async def test_second_request_skips_verification(self, key_lookup):
+        api_key, fetch_all = key_lookup
+
+        first = await authenticate_api_key(api_key)
+        second = await authenticate_api_key(api_key)
+
+        assert first["worker_id"] == second["worker_id"] == 7
+        assert fetch_all.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wrong_key_is_not_cached(self, key_lookup):
+        api_key, fetch_all = key_lookup
+        wrong_key = api_key[:8] + "wrong_suffix"
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await authenticate_api_key(wrong_key)
+            assert exc_info.value.status_code == 401
+        assert fetch_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revocation_forces_reverification(self, key_lookup, monkeypatch):
+        api_key, fetch_all = key_lookup
+        publish = AsyncMock(return_value=False)
+        monkeypatch.setattr("api.worker_auth.Publisher.publish_worker_keys_revoked", publish)
+
+        await authenticate_api_key(api_key)
+        await invalidate_worker_key_cache(7)
+        fetch_all.return_value = []
+
+        with pytest.raises(HTTPException):
+            await authenticate_api_key(api_key)
+        publish.assert_awaited_once_with(7)
@@ -44,6 +44,7 @@ export interface Video {
   is_featured?: boolean; // Issue #413 Phase 3
   featured_at?: string;  // Issue #413 Phase 3
   sprite_sheet_status?: SpriteSheetStatus; // Issue #413 Phase 7B
+  transcoding?: boolean; // Job still running (a ready video may lack some qualities)
 }
 
 export interface VideoProgress {
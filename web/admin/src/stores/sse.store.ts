@@ -124,6 +124,6 @@ export function createSSEStore(): SSEStore {
  */
 export function getActiveVideoIds(videos: Video[]): number[] {
   return videos
-    .filter((v) => v.status === 'pending' || v.status === 'processing')
+    .filter((v) => v.status === 'pending' || v.status === 'processing' || v.transcoding)
     .map((v) => v.id);
 }
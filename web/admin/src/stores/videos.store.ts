@@ -665,7 +665,7 @@ export function createVideosStore(): VideosStore {
 
     async loadProgressForActiveVideos(): Promise<void> {
       const activeVideos = this.videos.filter(
-        (v) => v.status === 'pending' || v.status === 'processing'
+        (v) => v.status === 'pending' || v.status === 'processing' || v.transcoding
       );
 
       for (const video of activeVideos) {
@@ -1,6 +1,7 @@
 """HTTP client for worker-to-API communication."""
 
 import asyncio
+import json
 import logging
 import random
 import tarfile
@@ -9,7 +10,7 @@ import time
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Awaitable, Callable, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 
 import httpx
 
@@ -52,6 +53,156 @@ CIRCUIT_BREAKER_BASE_RESET_SECONDS = 30.0  # Base reset time (doubles each time)
 CIRCUIT_BREAKER_MAX_RESET_SECONDS = 300.0  # Max reset time (5 minutes)
 
 
+class DownloadProgress:
+    """
+    Progress of an in-flight file download, shared with consumers of the partial file.
+
+    Bytes counted in bytes_written have been flushed to the destination file, so
+    readers can safely process the file up to that offset while it grows.
+    """
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+        self.total_bytes: Optional[int] = None
+        self.complete = False
+        self.failed = False
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        """True once the download completed or failed."""
+        return self.complete or self.failed
+
+    def _notify(self) -> None:
+        """Wake everyone waiting for a change."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _advance(self, bytes_written: int) -> None:
+        self.bytes_written = bytes_written
+        self._notify()
+
+    def _restart(self) -> None:
+        """Discard written bytes (the server ignored a resume request)."""
+        self.bytes_written = 0
+
+    def _finish(self, success: bool) -> None:
+        self.complete = success
+        self.failed = not success
+        self._notify()
+
+    async def wait_for_bytes(self, min_bytes: int) -> None:
+        """Wait until at least min_bytes are on disk, or the download has finished."""
+        while not self.finished and self.bytes_written < min_bytes:
+            await self._changed.wait()
+
+
+def _response_total_bytes(resp: httpx.Response, offset: int) -> Optional[int]:
+    """Get the full file size from a (possibly partial) download response, if known."""
+    content_range = resp.headers.get("content-range")
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    content_length = resp.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        return offset + int(content_length)
+    return None
+
+
+def _quality_archive_files(output_dir: Path, quality_name: str) -> List[Tuple[Path, str]]:
+    """List (path, arcname) pairs for a single quality's output files."""
+    # Check for CMAF subdirectory structure (output_dir/{quality_name}/)
+    cmaf_dir = output_dir / quality_name
+    if cmaf_dir.is_dir():
+        # CMAF format: files are in subdirectory
+        # Preserve subdirectory structure: {quality_name}/filename
+        return [(f, f"{quality_name}/{f.name}") for f in sorted(cmaf_dir.iterdir()) if f.is_file()]
+
+    # HLS/TS format: files are in root with quality prefix
+    files = []
+    playlist = output_dir / f"{quality_name}.m3u8"
+    if playlist.exists():
+        files.append((playlist, playlist.name))
+    for segment in sorted(output_dir.glob(f"{quality_name}_*.ts")):
+        files.append((segment, segment.name))
+    return files
+
+
+def _tar_stream_entries(files: List[Tuple[Path, str]]) -> List[Tuple[Path, bytes, int]]:
+    """
+    Build tar headers up front so the archive length is known before streaming.
+
+    Returns:
+        List of (path, header bytes, file size) tuples
+    """
+    entries = []
+    for path, arcname in files:
+        st = path.stat()
+        info = tarfile.TarInfo(arcname)
+        info.size = st.st_size
+        info.mtime = int(st.st_mtime)
+        info.mode = 0o644
+        entries.append((path, info.tobuf(format=tarfile.PAX_FORMAT), st.st_size))
+    return entries
+
+
+def _tar_stream_length(entries: List[Tuple[Path, bytes, int]]) -> int:
+    """Exact byte length of the archive produced by _iter_tar_stream()."""
+    length = 2 * tarfile.BLOCKSIZE  # End-of-archive marker
+    for _, header, size in entries:
+        length += len(header) + -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+    return length
+
+
+async def _iter_tar_stream(
+    entries: List[Tuple[Path, bytes, int]],
+    total_bytes: int,
+    progress_callback: Optional[Callable[[int, int], Awaitable[None]]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Generate an uncompressed tar archive directly from files on disk.
+
+    Segments are already compressed video, so gzip only burns worker CPU; writing
+    the archive straight into the request body avoids the temp file entirely.
+
+    Raises:
+        OSError: If a file changed size while it was being streamed
+    """
+    chunk_size = 1024 * 1024  # 1MB chunks
+    bytes_sent = 0
+    last_callback_time = time.time()
+    callback_interval = 60.0  # Call progress callback every 60 seconds
+
+    for path, header, size in entries:
+        yield header
+        bytes_sent += len(header)
+
+        remaining = size
+        with open(path, "rb") as f:
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    raise OSError(f"{path.name} shrank while uploading")
+                remaining -= len(chunk)
+                yield chunk
+                bytes_sent += len(chunk)
+
+                # Call progress callback periodically to extend claim
+                if progress_callback:
+                    now = time.time()
+                    if now - last_callback_time >= callback_interval:
+                        # Let exceptions propagate - ClaimExpiredError needs to stop the upload
+                        await progress_callback(bytes_sent, total_bytes)
+                        last_callback_time = now
+
+        padding = -size % tarfile.BLOCKSIZE
+        if padding:
+            yield b"\0" * padding
+            bytes_sent += padding
+
+    yield b"\0" * (2 * tarfile.BLOCKSIZE)
+
+
 class WorkerAPIClient:
     """HTTP client for communicating with the Worker API."""
 
@@ -61,6 +212,8 @@ class WorkerAPIClient:
         api_key: str,
         timeout: float = TIMEOUT_FILE_TRANSFER,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        stream_archives: bool = False,
+        http2: bool = False,
     ):
         """
         Initialize the worker API client.
@@ -70,12 +223,18 @@ class WorkerAPIClient:
             api_key: Worker API key for authentication
             timeout: Default request timeout in seconds (5 minutes for file transfers)
             max_retries: Max retry attempts for transient errors
+            stream_archives: Upload quality/HLS output as an uncompressed tar generated
+                             on the fly, instead of building a tar.gz temp file first
+            http2: Negotiate HTTP/2 (needs the optional h2 package) so concurrent
+                   segment uploads share one multiplexed connection
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.headers = {"X-Worker-API-Key": api_key}
         self.timeout = timeout
         self.max_retries = max_retries
+        self.stream_archives = stream_archives
+        self.http2 = http2
         self._client: Optional[httpx.AsyncClient] = None
 
         # Circuit breaker state (Issue #453)
@@ -165,10 +324,19 @@ class WorkerAPIClient:
                 max_keepalive_connections=10,
                 keepalive_expiry=30.0,  # Keep connections alive longer
             )
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                limits=limits,
-            )
+            try:
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=limits,
+                    http2=self.http2,
+                )
+            except ImportError:
+                logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+                self.http2 = False
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=limits,
+                )
         return self._client
 
     def _is_retryable_error(self, exc: Exception) -> bool:
@@ -286,7 +454,7 @@ class WorkerAPIClient:
             timeout=TIMEOUT_HEARTBEAT,
         )
 
-    async def claim_job(self, job_id: Optional[int] = None) -> dict:
+    async def claim_job(self, job_id: Optional[int] = None, wait: int = 0) -> dict:
         """
         Attempt to claim a transcoding job.
 
@@ -294,6 +462,8 @@ class WorkerAPIClient:
             job_id: Optional specific job ID to claim (for Redis-dispatched jobs).
                     If provided, will only claim this specific job.
                     If not provided, claims any available job from the database.
+            wait: Long-poll seconds. If no job is available, the server holds the
+                  request open until one is published or the wait expires.
 
         Returns:
             Job info if claimed, or message indicating no jobs available
@@ -301,11 +471,13 @@ class WorkerAPIClient:
         params = {}
         if job_id is not None:
             params["job_id"] = job_id
+        if wait > 0:
+            params["wait"] = wait
 
         return await self._request(
             "POST",
             "/api/worker/claim",
-            timeout=TIMEOUT_CLAIM,
+            timeout=TIMEOUT_CLAIM + max(wait, 0),
             params=params if params else None,
         )
 
@@ -353,28 +525,143 @@ class WorkerAPIClient:
             timeout=TIMEOUT_PROGRESS,
         )
 
-    async def download_source(self, video_id: int, dest_path: Path) -> None:
+    async def download_source(
+        self,
+        video_id: int,
+        dest_path: Path,
+        progress: Optional[DownloadProgress] = None,
+    ) -> None:
         """
         Download source file from server.
 
+        Interrupted transfers are resumed from the last byte written using an HTTP
+        Range request, with exponential backoff between attempts. The retry budget
+        (max_retries) resets whenever an attempt makes progress, so a large file on a
+        flaky connection still completes.
+
         Args:
             video_id: The video ID
             dest_path: Local path to save the file
+            progress: Optional progress tracker, updated after every chunk written
         """
         # Check circuit breaker before attempting download
         self._check_circuit_breaker()
 
         client = await self._get_client()
         url = f"{self.base_url}/api/worker/source/{video_id}"
+        progress = progress or DownloadProgress()
+        bytes_written = 0
+        attempt = 0
 
         try:
-            async with client.stream("GET", url, headers=self.headers) as resp:
-                resp.raise_for_status()
-                with open(dest_path, "wb") as f:
-                    async for chunk in resp.aiter_bytes(chunk_size=1024 * 1024):
-                        f.write(chunk)
+            with open(dest_path, "wb") as f:
+                while True:
+                    attempt_start = bytes_written
+                    headers = dict(self.headers)
+                    if bytes_written:
+                        headers["Range"] = f"bytes={bytes_written}-"
+                    try:
+                        async with client.stream("GET", url, headers=headers) as resp:
+                            resp.raise_for_status()
+                            if bytes_written and resp.status_code != 206:
+                                # Server ignored the range - start over
+                                f.seek(0)
+                                f.truncate()
+                                bytes_written = attempt_start = 0
+                                progress._restart()
+                            progress.total_bytes = _response_total_bytes(resp, bytes_written)
+                            async for chunk in resp.aiter_bytes(chunk_size=1024 * 1024):
+                                f.write(chunk)
+                                f.flush()
+                                bytes_written += len(chunk)
+                                progress._advance(bytes_written)
+                        if progress.total_bytes is not None and bytes_written < progress.total_bytes:
+                            raise httpx.ReadError(
+                                f"Connection closed after {bytes_written} of {progress.total_bytes} bytes"
+                            )
+                        break
+                    except httpx.HTTPStatusError as e:
+                        status_code = e.response.status_code
+                        if (status_code < 500 and status_code != 429) or attempt >= self.max_retries:
+                            # Record failure for 5xx errors (server issues)
+                            if status_code >= 500:
+                                self._record_failure()
+                            try:
+                                detail = e.response.json().get("detail", str(e))
+                            except Exception:
+                                detail = str(e)
+                            raise WorkerAPIError(status_code, detail)
+                        error: Exception = e
+                    except (httpx.TimeoutException, httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError) as e:
+                        if attempt >= self.max_retries:
+                            # Connection/timeout errors count against circuit breaker
+                            self._record_failure()
+                            raise WorkerAPIError(0, f"Download failed: {e}")
+                        error = e
+
+                    attempt = 0 if bytes_written > attempt_start else attempt + 1
+                    delay = min(DEFAULT_RETRY_BASE_DELAY * (2 ** max(attempt - 1, 0)), DEFAULT_RETRY_MAX_DELAY)
+                    logger.warning(
+                        f"Source download interrupted at {bytes_written} bytes ({error}), "
+                        f"resuming in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+        except BaseException:
+            progress._finish(success=False)
+            raise
+
+        # Success - record for circuit breaker
+        self._record_success()
+        progress._finish(success=True)
+
+    async def _upload_tar_stream(
+        self,
+        url: str,
+        files: List[Tuple[Path, str]],
+        description: str,
+        progress_callback: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> dict:
+        """
+        Upload files as an uncompressed tar generated on the fly (no temp file).
+
+        The archive is sent as the raw request body (Content-Type: application/x-tar)
+        with an exact Content-Length, and the server extracts it as it arrives.
+
+        Args:
+            url: Upload endpoint URL
+            files: (path, arcname) pairs to archive
+            description: What is being uploaded, for error messages
+            progress_callback: Optional async callback(bytes_sent, total_bytes)
+
+        Returns:
+            Server response
+        """
+        archive_size_mb = 0.0  # Default value in case of early exception
+        try:
+            entries = _tar_stream_entries(files)
+            archive_size = _tar_stream_length(entries)
+            archive_size_mb = archive_size / (1024 * 1024)
+
+            # Dynamic timeout: 5 min base + 1 min per 100MB
+            upload_timeout = max(300, 300 + (archive_size // (100 * 1024 * 1024)) * 60)
+            upload_timeout = min(upload_timeout, 3600)  # Cap at 1 hour
+
+            client = await self._get_client()
+            headers = {
+                **self.headers,
+                "Content-Type": "application/x-tar",
+                "Content-Length": str(archive_size),
+            }
+            resp = await client.post(
+                url,
+                content=_iter_tar_stream(entries, archive_size, progress_callback),
+                headers=headers,
+                timeout=upload_timeout,
+            )
+            resp.raise_for_status()
             # Success - record for circuit breaker
             self._record_success()
+            return resp.json()
         except httpx.HTTPStatusError as e:
             # Record failure for 5xx errors (server issues)
             if e.response.status_code >= 500:
@@ -384,10 +671,16 @@ class WorkerAPIClient:
             except Exception:
                 detail = str(e)
             raise WorkerAPIError(e.response.status_code, detail)
-        except (httpx.TimeoutException, httpx.ConnectError, httpx.ReadError) as e:
-            # Connection/timeout errors count against circuit breaker
+        except httpx.TimeoutException as e:
+            # Timeout counts against circuit breaker
             self._record_failure()
-            raise WorkerAPIError(0, f"Download failed: {e}")
+            raise WorkerAPIError(0, f"Upload timeout for {description} ({archive_size_mb:.1f}MB): {e}")
+        except (httpx.ConnectError, httpx.ReadError, httpx.WriteError) as e:
+            # Connection errors count against circuit breaker
+            self._record_failure()
+            raise WorkerAPIError(0, f"Upload failed for {description}: {e}")
+        except OSError as e:
+            raise WorkerAPIError(0, f"Upload failed for {description}: {e}")
 
     async def upload_quality(
         self,
@@ -416,6 +709,15 @@ class WorkerAPIClient:
         # Check circuit breaker before attempting upload
         self._check_circuit_breaker()
 
+        files = _quality_archive_files(output_dir, quality_name)
+        if self.stream_archives:
+            return await self._upload_tar_stream(
+                f"{self.base_url}/api/worker/upload/{video_id}/quality/{quality_name}",
+                files,
+                description=quality_name,
+                progress_callback=progress_callback,
+            )
+
         # Create tar.gz of just this quality's files
         with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
             tmp_path = Path(tmp.name)
@@ -423,25 +725,8 @@ class WorkerAPIClient:
         file_size_mb = 0.0  # Default value in case of early exception
         try:
             with tarfile.open(tmp_path, "w:gz") as tar:
-                # Check for CMAF subdirectory structure (output_dir/{quality_name}/)
-                cmaf_dir = output_dir / quality_name
-                if cmaf_dir.is_dir():
-                    # CMAF format: files are in subdirectory
-                    # Add all files from the quality subdirectory
-                    for f in cmaf_dir.iterdir():
-                        if f.is_file():
-                            # Preserve subdirectory structure: {quality_name}/filename
-                            tar.add(f, arcname=f"{quality_name}/{f.name}")
-                else:
-                    # HLS/TS format: files are in root with quality prefix
-                    # Add playlist file
-                    playlist = output_dir / f"{quality_name}.m3u8"
-                    if playlist.exists():
-                        tar.add(playlist, arcname=playlist.name)
-
-                    # Add segment files
-                    for segment in output_dir.glob(f"{quality_name}_*.ts"):
-                        tar.add(segment, arcname=segment.name)
+                for path, arcname in files:
+                    tar.add(path, arcname=arcname)
 
             file_size = tmp_path.stat().st_size
             file_size_mb = file_size / (1024 * 1024)
@@ -632,6 +917,14 @@ class WorkerAPIClient:
         # Check circuit breaker before attempting upload
         self._check_circuit_breaker()
 
+        if self.stream_archives:
+            return await self._upload_tar_stream(
+                f"{self.base_url}/api/worker/upload/{video_id}",
+                [(f, f.name) for f in sorted(output_dir.iterdir()) if f.is_file()],
+                description="HLS output",
+                progress_callback=progress_callback,
+            )
+
         # Create tar.gz of output directory
         with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
             tmp_path = Path(tmp.name)
@@ -815,6 +1108,134 @@ class WorkerAPIClient:
             timeout=TIMEOUT_DEFAULT,
         )
 
+    async def publish_renditions(
+        self,
+        job_id: int,
+        qualities: List[dict],
+        streaming_format: str,
+        streaming_codec: str,
+    ) -> dict:
+        """
+        Make the renditions uploaded so far playable before the job finishes.
+
+        Args:
+            job_id: The job ID (must be claimed by this worker)
+            qualities: Uploaded renditions (name, width, height, bitrate)
+            streaming_format: Streaming format ("hls_ts" or "cmaf")
+            streaming_codec: Video codec ("h264", "hevc", "av1")
+
+        Returns:
+            Server response with the published quality names
+        """
+        data = {
+            "qualities": qualities,
+            "streaming_format": streaming_format,
+            "streaming_codec": streaming_codec,
+        }
+        return await self._request(
+            "POST",
+            f"/api/worker/{job_id}/publish",
+            json=data,
+            timeout=TIMEOUT_DEFAULT,
+        )
+
+    # Rendition sub-task methods (job splitting)
+    async def split_job(
+        self,
+        job_id: int,
+        qualities: List[str],
+        streaming_format: str,
+        streaming_codec: str,
+    ) -> dict:
+        """
+        Ask the server to split a probed job into rendition tasks.
+
+        Args:
+            job_id: The job ID (must be claimed by this worker)
+            qualities: Renditions to produce, most expensive first
+            streaming_format: Streaming format ("hls_ts" or "cmaf")
+            streaming_codec: Video codec ("h264", "hevc", "av1")
+
+        Returns:
+            Server response; "split" is False if the job should be transcoded whole
+        """
+        data = {
+            "qualities": qualities,
+            "streaming_format": streaming_format,
+            "streaming_codec": streaming_codec,
+        }
+        return await self._request(
+            "POST",
+            f"/api/worker/{job_id}/split",
+            json=data,
+            timeout=TIMEOUT_DEFAULT,
+        )
+
+    async def claim_task(self, job_id: Optional[int] = None) -> dict:
+        """
+        Attempt to claim a rendition task of a split job.
+
+        Args:
+            job_id: Only claim a task of this job
+
+        Returns:
+            Task info if claimed, or message indicating no tasks available
+        """
+        return await self._request(
+            "POST",
+            "/api/worker/claim-task",
+            timeout=TIMEOUT_CLAIM,
+            params={"job_id": job_id} if job_id is not None else None,
+        )
+
+    async def update_task_progress(self, task_id: int, percent: int, status: str = "in_progress") -> dict:
+        """
+        Update a rendition task's progress.
+
+        Returns:
+            Server response with extended claim_expires_at
+        """
+        return await self._request(
+            "POST",
+            f"/api/worker/task/{task_id}/progress",
+            json={"status": status, "progress": percent},
+            timeout=TIMEOUT_PROGRESS,
+        )
+
+    async def complete_task(self, task_id: int, width: int, height: int, bitrate: int) -> dict:
+        """
+        Mark a rendition task complete after its files were uploaded.
+
+        Args:
+            task_id: The task ID
+            width: Rendition width
+            height: Rendition height
+            bitrate: Rendition bitrate in kbps
+
+        Returns:
+            Server response; "job_finished" is True if this was the job's last task
+        """
+        return await self._request(
+            "POST",
+            f"/api/worker/task/{task_id}/complete",
+            json={"width": width, "height": height, "bitrate": bitrate},
+            timeout=TIMEOUT_DEFAULT,
+        )
+
+    async def fail_task(self, task_id: int, error: str, retry: bool = True) -> dict:
+        """
+        Report a rendition task failure.
+
+        Returns:
+            Server response with retry info
+        """
+        return await self._request(
+            "POST",
+            f"/api/worker/task/{task_id}/fail",
+            json={"error_message": error[:500], "retry": retry},
+            timeout=TIMEOUT_DEFAULT,
+        )
+
     # Re-encode job methods
     async def claim_reencode_job(self) -> dict:
         """
@@ -1004,10 +1425,6 @@ class WorkerAPIClient:
             WorkerAPIError: On HTTP error or connection failure
             WorkerAPIError(409, ...): If claim has expired
         """
-        # Check circuit breaker before attempting upload
-        self._check_circuit_breaker()
-
-        client = await self._get_client()
         url = f"{self.base_url}/api/worker/upload/{video_id}/segment/{quality}/{filename}"
 
         headers = {
@@ -1016,12 +1433,104 @@ class WorkerAPIClient:
             "X-Content-SHA256": checksum,
         }
 
+        return await self._post_with_retry(url, data, headers, timeout, "Upload segment")
+
+    async def upload_segment_batch(
+        self,
+        video_id: int,
+        quality: str,
+        segments: List[Tuple[str, bytes, str]],
+        timeout: float = 120.0,
+    ) -> dict:
+        """
+        Upload several segments of one quality in a single request.
+
+        The server checks job ownership once per batch and writes the segments with
+        a single group commit, so a long video needs far fewer round trips than
+        with upload_segment().
+
+        Args:
+            video_id: The video ID
+            quality: Quality name (e.g., "1080p", "720p")
+            segments: (filename, data, sha256 hex digest) tuples
+            timeout: Request timeout in seconds
+
+        Returns:
+            Server response with overall status and one result per segment
+
+        Raises:
+            WorkerAPIError: On HTTP error or connection failure
+            WorkerAPIError(409, ...): If claim has expired
+        """
+        url = f"{self.base_url}/api/worker/upload/{video_id}/segments/{quality}/batch"
+        manifest = [{"filename": filename, "size": len(data), "sha256": checksum} for filename, data, checksum in segments]
+        headers = {
+            **self.headers,
+            "Content-Type": "application/octet-stream",
+            "X-Segment-Manifest": json.dumps(manifest, separators=(",", ":")),
+        }
+        body = b"".join(data for _, data, _ in segments)
+        return await self._post_with_retry(url, body, headers, timeout, "Upload segment batch")
+
+    async def link_segments(
+        self,
+        video_id: int,
+        quality: str,
+        segments: List[Tuple[str, int, str]],
+    ) -> dict:
+        """
+        Ask the server to place segments from its segment store instead of uploading them.
+
+        Args:
+            video_id: The video ID
+            quality: Quality name (e.g., "1080p", "720p")
+            segments: (filename, size, sha256 hex digest) tuples
+
+        Returns:
+            Dict with:
+                - linked: Filenames the server placed (no upload needed)
+                - missing: Filenames that must be uploaded
+
+        Raises:
+            WorkerAPIError: On HTTP error or connection failure
+            WorkerAPIError(404, ...): If the server has no segment store
+            WorkerAPIError(409, ...): If claim has expired
+        """
+        return await self._request(
+            "POST",
+            f"/api/worker/upload/{video_id}/segments/{quality}/link",
+            json={
+                "segments": [
+                    {"filename": filename, "size": size, "sha256": checksum} for filename, size, checksum in segments
+                ]
+            },
+            timeout=TIMEOUT_DEFAULT,
+        )
+
+    async def _post_with_retry(
+        self,
+        url: str,
+        content: bytes,
+        headers: dict,
+        timeout: float,
+        description: str,
+    ) -> dict:
+        """
+        POST a request body with exponential backoff on 5xx and transient errors.
+
+        4xx responses are not retried. description prefixes connection error messages.
+        """
+        # Check circuit breaker before attempting upload
+        self._check_circuit_breaker()
+
+        client = await self._get_client()
+
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
                 resp = await client.post(
                     url,
-                    content=data,
+                    content=content,
                     headers=headers,
                     timeout=timeout,
                 )
@@ -1040,7 +1549,7 @@ class WorkerAPIClient:
             except httpx.RequestError as e:
                 last_error = e
                 if not self._is_retryable_error(e):
-                    raise WorkerAPIError(0, f"Upload segment failed: {e}")
+                    raise WorkerAPIError(0, f"{description} failed: {e}")
 
             # Backoff before retry
             if attempt < self.max_retries:
@@ -1060,7 +1569,7 @@ class WorkerAPIClient:
                 detail = str(last_error)
             raise WorkerAPIError(last_error.response.status_code, detail)
         else:
-            raise WorkerAPIError(0, f"Upload segment failed after retries: {last_error}")
+            raise WorkerAPIError(0, f"{description} failed after retries: {last_error}")
 
     async def get_segments_status(
         self,
@@ -53,6 +53,11 @@ class StreamingFormat(Enum):
     CMAF = "cmaf"  # Modern: CMAF with fMP4 segments (HLS + DASH compatible)
 
 
+# Directory (and playlist group) of the audio-only CMAF rendition shared by all
+# video renditions of a video (see build_audio_rendition_command)
+AUDIO_RENDITION_NAME = "audio"
+
+
 @dataclass
 class EncoderInfo:
     """Information about an available encoder."""
@@ -644,6 +649,20 @@ def _select_software_encoder(codec: VideoCodec, target_height: int) -> EncoderSe
     )
 
 
+def build_input_args(input_path: Path, follow_timeout: Optional[float] = None) -> List[str]:
+    """
+    FFmpeg arguments reading the source file.
+
+    With follow_timeout, the file may still be growing (a source being
+    downloaded): FFmpeg's file protocol waits for more data at the end of the
+    file, and takes the file as ended once nothing was appended for
+    follow_timeout seconds.
+    """
+    if follow_timeout is None:
+        return ["-i", str(input_path)]
+    return ["-follow", "1", "-rw_timeout", str(int(follow_timeout * 1000000)), "-i", f"file:{input_path}"]
+
+
 def build_transcode_command(
     input_path: Path,
     output_dir: Path,
@@ -735,6 +754,7 @@ def build_cmaf_transcode_command(
     quality: dict,
     selection: EncoderSelection,
     segment_duration: int = 6,
+    audio: bool = True,
 ) -> List[str]:
     """
     Build FFmpeg command for CMAF transcoding (fMP4 segments).
@@ -754,6 +774,8 @@ def build_cmaf_transcode_command(
         quality: Quality preset dict with name, height, bitrate, audio_bitrate
         selection: EncoderSelection from select_encoder()
         segment_duration: Segment length in seconds
+        audio: Include the audio track (False for a video-only rendition that
+            plays with the shared audio rendition)
 
     Returns:
         Complete FFmpeg command as list of arguments.
@@ -795,16 +817,19 @@ def build_cmaf_transcode_command(
     cmd.extend(["-vf", selection.scale_filter])
 
     # Audio encoding
-    cmd.extend(
-        [
-            "-c:a",
-            "aac",
-            "-b:a",
-            audio_bitrate,
-            "-ac",
-            "2",
-        ]
-    )
+    if audio:
+        cmd.extend(
+            [
+                "-c:a",
+                "aac",
+                "-b:a",
+                audio_bitrate,
+                "-ac",
+                "2",
+            ]
+        )
+    else:
+        cmd.append("-an")
 
     # CMAF/fMP4 HLS output
     # -hls_segment_type fmp4: Use fragmented MP4 instead of MPEG-TS
@@ -839,6 +864,319 @@ def build_cmaf_transcode_command(
     return cmd
 
 
+def build_audio_rendition_command(
+    input_path: Path,
+    output_dir: Path,
+    audio_bitrate: str,
+    passthrough: bool = False,
+    segment_duration: int = 6,
+    follow_timeout: Optional[float] = None,
+) -> List[str]:
+    """
+    Build FFmpeg command for the shared audio-only CMAF rendition.
+
+    The audio is encoded once per video instead of into every video rendition;
+    the master playlist references it as an EXT-X-MEDIA audio group and the
+    DASH manifest as an audio AdaptationSet.
+
+    Output structure:
+        {output_dir}/audio/
+            ├── stream.m3u8    # HLS audio playlist
+            ├── init.mp4       # CMAF initialization segment
+            └── seg_*.m4s      # CMAF media segments
+
+    Args:
+        input_path: Source video file
+        output_dir: Output directory (audio subdir must already exist)
+        audio_bitrate: AAC bitrate (e.g. "128k"), unused with passthrough
+        passthrough: Copy the source audio instead of encoding it (source must be AAC-LC, at most stereo)
+        segment_duration: Segment length in seconds
+        follow_timeout: Read a source that is still downloading (see build_input_args)
+
+    Returns:
+        Complete FFmpeg command as list of arguments.
+    """
+    audio_dir = output_dir / AUDIO_RENDITION_NAME
+
+    cmd = ["ffmpeg", "-y", *build_input_args(input_path, follow_timeout), "-map", "0:a:0", "-vn", "-sn", "-dn"]
+    if passthrough:
+        cmd.extend(["-c:a", "copy"])
+    else:
+        cmd.extend(["-c:a", "aac", "-b:a", audio_bitrate, "-ac", "2"])
+    cmd.extend(
+        [
+            "-hls_time",
+            str(segment_duration),
+            "-hls_list_size",
+            "0",
+            "-hls_segment_type",
+            "fmp4",
+            "-hls_fmp4_init_filename",
+            "init.mp4",
+            "-hls_segment_filename",
+            str(audio_dir / "seg_%04d.m4s"),
+            "-movflags",
+            "+frag_keyframe+empty_moov+default_base_moof",
+            "-progress",
+            "pipe:1",
+            "-f",
+            "hls",
+            str(audio_dir / "stream.m3u8"),
+        ]
+    )
+    return cmd
+
+
+def build_chunk_encode_command(
+    input_path: Path,
+    output_path: Path,
+    quality: dict,
+    selection: EncoderSelection,
+    start: float,
+    length: Optional[float],
+) -> List[str]:
+    """
+    Build FFmpeg command encoding one chunk of a quality (video only).
+
+    Used by chunked encoding: the source range [start, start + length) is encoded
+    with the same encoder settings as build_cmaf_transcode_command into a
+    standalone Matroska file. build_chunk_stitch_command joins the chunks.
+
+    Args:
+        input_path: Source video file
+        output_path: Chunk file to write
+        quality: Quality preset dict with name, height, bitrate
+        selection: EncoderSelection from select_encoder()
+        start: Chunk start in seconds from the beginning of the source
+        length: Chunk length in seconds (None for the last chunk)
+
+    Returns:
+        Complete FFmpeg command as list of arguments.
+    """
+    bitrate = quality["bitrate"]
+
+    cmd = ["ffmpeg", "-y"]
+    cmd.extend(selection.input_args)
+    # Input seeking: jumps to the keyframe before start, then decodes up to start
+    if start > 0:
+        cmd.extend(["-ss", f"{start:.6f}"])
+    if length is not None:
+        cmd.extend(["-t", f"{length:.6f}"])
+    cmd.extend(["-i", str(input_path)])
+
+    cmd.extend(selection.output_args)
+    cmd.extend(
+        [
+            "-b:v",
+            bitrate,
+            "-maxrate",
+            bitrate,
+            "-bufsize",
+            f"{int(bitrate.replace('k', '')) * 2}k",
+            "-vf",
+            selection.scale_filter,
+            "-an",
+            "-sn",
+            "-dn",
+            "-progress",
+            "pipe:1",
+            "-f",
+            "matroska",
+            str(output_path),
+        ]
+    )
+    return cmd
+
+
+def build_chunk_stitch_command(
+    concat_list_path: Path,
+    input_path: Path,
+    output_dir: Path,
+    quality: dict,
+    selection: EncoderSelection,
+    segment_duration: int = 6,
+    audio: bool = True,
+) -> List[str]:
+    """
+    Build FFmpeg command joining encoded chunks into a CMAF rendition.
+
+    The chunks (listed in an FFmpeg concat file) are stream-copied, so the HLS
+    muxer writes a single init segment and continuously numbered segments with
+    continuous timestamps. Audio is encoded once from the source instead of per
+    chunk, which would leave encoder-delay gaps at every chunk boundary.
+    Output layout is identical to build_cmaf_transcode_command.
+
+    Args:
+        concat_list_path: FFmpeg concat demuxer file listing the chunk files in order
+        input_path: Source video file (for audio)
+        output_dir: Output directory (quality subdir must already exist)
+        quality: Quality preset dict with name, audio_bitrate
+        selection: EncoderSelection the chunks were encoded with
+        segment_duration: Segment length in seconds
+        audio: Include the source audio (False for a video-only rendition)
+
+    Returns:
+        Complete FFmpeg command as list of arguments.
+    """
+    quality_dir = output_dir / quality["name"]
+
+    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", str(concat_list_path)]
+    if audio:
+        cmd.extend(["-i", str(input_path), "-map", "0:v:0", "-map", "1:a:0?"])
+    else:
+        cmd.extend(["-map", "0:v:0"])
+    cmd.extend(["-c:v", "copy"])
+    # Keep the sample entry tag the encoder args asked for (e.g. hvc1 for Apple devices)
+    if "-tag:v" in selection.output_args:
+        tag_index = selection.output_args.index("-tag:v")
+        cmd.extend(selection.output_args[tag_index : tag_index + 2])
+    if audio:
+        cmd.extend(["-c:a", "aac", "-b:a", quality["audio_bitrate"], "-ac", "2"])
+    cmd.extend(
+        [
+            "-hls_time",
+            str(segment_duration),
+            "-hls_list_size",
+            "0",
+            "-hls_segment_type",
+            "fmp4",
+            "-hls_fmp4_init_filename",
+            "init.mp4",
+            "-hls_segment_filename",
+            str(quality_dir / "seg_%04d.m4s"),
+            "-movflags",
+            "+frag_keyframe+empty_moov+default_base_moof",
+            "-progress",
+            "pipe:1",
+            "-f",
+            "hls",
+            str(quality_dir / "stream.m3u8"),
+        ]
+    )
+    return cmd
+
+
+def build_ladder_transcode_command(
+    input_path: Path,
+    output_dir: Path,
+    qualities: List[dict],
+    selections: List[EncoderSelection],
+    segment_duration: int = 6,
+    streaming_format: str = "hls_ts",
+    audio: bool = True,
+) -> List[str]:
+    """
+    Build a single FFmpeg command that encodes several qualities from one decode.
+
+    The source is decoded once and fanned out through a split filter, with each
+    branch scaled by its own selection's scale filter and written to its own
+    HLS output. Output layout is identical to build_transcode_command (HLS/TS)
+    and build_cmaf_transcode_command (CMAF), so downstream validation, upload
+    and manifest generation do not need to know which mode produced a rendition.
+
+    All selections must share the same input_args (same hardware decoder);
+    callers should only group renditions that use the same encoder family.
+
+    Args:
+        input_path: Source video file
+        output_dir: Output directory (CMAF quality subdirs must already exist)
+        qualities: Quality preset dicts with name, height, bitrate, audio_bitrate
+        selections: EncoderSelection per quality, in the same order as qualities
+        segment_duration: Segment length in seconds
+        streaming_format: "hls_ts" for MPEG-TS or "cmaf" for fMP4
+        audio: Include the audio track in every rendition (False for video-only
+            renditions that play with the shared audio rendition)
+
+    Returns:
+        Complete FFmpeg command as list of arguments.
+    """
+    if not qualities:
+        raise ValueError("At least one quality is required for a ladder encode")
+    if len(qualities) != len(selections):
+        raise ValueError("qualities and selections must have the same length")
+
+    use_cmaf = streaming_format == "cmaf"
+    count = len(qualities)
+
+    cmd = ["ffmpeg", "-y"]
+
+    # Hardware decoding input arguments (before -i), shared by every branch
+    cmd.extend(selections[0].input_args)
+
+    cmd.extend(["-i", str(input_path)])
+
+    # Decode once, split into one branch per rendition, scale each branch
+    split_labels = "".join(f"[v{i}]" for i in range(count))
+    branches = [f"[0:v]split={count}{split_labels}"]
+    for i, selection in enumerate(selections):
+        branches.append(f"[v{i}]{selection.scale_filter}[out{i}]")
+    cmd.extend(["-filter_complex", ";".join(branches)])
+
+    # Progress is reported once for the whole graph
+    cmd.extend(["-progress", "pipe:1"])
+
+    for i, (quality, selection) in enumerate(zip(qualities, selections)):
+        name = quality["name"]
+        bitrate = quality["bitrate"]
+
+        # Explicit mapping is required with -filter_complex; audio is optional
+        cmd.extend(["-map", f"[out{i}]"])
+        if audio:
+            cmd.extend(["-map", "0:a:0?"])
+
+        cmd.extend(selection.output_args)
+        cmd.extend(
+            [
+                "-b:v",
+                bitrate,
+                "-maxrate",
+                bitrate,
+                "-bufsize",
+                f"{int(bitrate.replace('k', '')) * 2}k",
+            ]
+        )
+        if audio:
+            cmd.extend(["-c:a", "aac", "-b:a", quality["audio_bitrate"], "-ac", "2"])
+        cmd.extend(
+            [
+                "-hls_time",
+                str(segment_duration),
+                "-hls_list_size",
+                "0",
+            ]
+        )
+
+        if use_cmaf:
+            quality_dir = output_dir / name
+            cmd.extend(
+                [
+                    "-hls_segment_type",
+                    "fmp4",
+                    "-hls_fmp4_init_filename",
+                    "init.mp4",
+                    "-hls_segment_filename",
+                    str(quality_dir / "seg_%04d.m4s"),
+                    "-movflags",
+                    "+frag_keyframe+empty_moov+default_base_moof",
+                    "-f",
+                    "hls",
+                    str(quality_dir / "stream.m3u8"),
+                ]
+            )
+        else:
+            cmd.extend(
+                [
+                    "-hls_segment_filename",
+                    str(output_dir / f"{name}_%04d.ts"),
+                    "-f",
+                    "hls",
+                    str(output_dir / f"{name}.m3u8"),
+                ]
+            )
+
+    return cmd
+
+
 def get_codec_string(codec: VideoCodec, level: str = "L120") -> str:
     """
     Get codec string for HLS/DASH manifest.
@@ -0,0 +1,219 @@
+"""
+Adaptive scheduler for parallel quality encoding.
+
+Fixed batches of qualities make every batch wait for its slowest member, so a
+2160p encode paired with a 360p encode leaves a slot idle for most of the batch. This scheduler keeps a queue of pending qualities
+ordered by estimated cost (pixels x duration x codec factor), starts the most
+expensive one first, and starts the next one the moment any running encode
+finishes.
+
+Admission is bounded by:
+    - the parallel session count (get_recommended_parallel_sessions, capped at
+      HWACCEL_MAX_CONCURRENT_SESSIONS on GPUs)
+    - live host headroom: free memory and system CPU usage (psutil)
+    - a high-res cap: while lower qualities are still waiting, at most half of
+      the slots (rounded up) run 1080p+ encodes, so the most memory-hungry
+      encodes don't all run at once (Issue #429)
+
+GPU encoder sessions in use are not measured: the session count is a static
+ceiling, and other processes sharing the GPU are not accounted for.
+
+A stop check (e.g. a shutdown request) stops new qualities from starting;
+encodes already running finish.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+import psutil
+
+from config import (
+    HWACCEL_MAX_CONCURRENT_SESSIONS,
+    PARALLEL_SCHEDULER_MAX_CPU_PERCENT,
+    PARALLEL_SCHEDULER_MIN_FREE_MEMORY_MB,
+)
+from worker.hwaccel import get_recommended_parallel_sessions
+
+if TYPE_CHECKING:
+    from worker.hwaccel import GPUCapabilities
+
+logger = logging.getLogger(__name__)
+
+# Relative encode cost per codec (h264 = 1.0)
+CODEC_COST_FACTORS = {
+    "h264": 1.0,
+    "hevc": 2.0,
+    "av1": 3.0,
+}
+
+# Qualities at or above this height count as high-res for the memory cap (Issue #429)
+HIGH_RES_HEIGHT = 1080
+
+# How often to re-check host headroom while work is held back
+HEADROOM_RECHECK_SECONDS = 2.0
+
+
+def estimate_quality_cost(quality: dict, duration: float, codec: Optional[str] = None) -> float:
+    """
+    Estimate the relative cost of encoding a quality.
+
+    Args:
+        quality: Quality preset dict with a 'height' key (and optionally 'width')
+        duration: Source duration in seconds
+        codec: Target codec name ("h264", "hevc", "av1")
+
+    Returns:
+        Relative cost (pixels x duration x codec factor)
+    """
+    height = quality["height"]
+    width = quality.get("width") or int(height * 16 / 9)
+    codec_factor = CODEC_COST_FACTORS.get((codec or "h264").lower(), 1.0)
+    return width * height * max(duration or 0.0, 1.0) * codec_factor
+
+
+def get_max_parallel_encodes(gpu_caps: Optional["GPUCapabilities"] = None) -> int:
+    """
+    Get the maximum number of quality encodes to run at once.
+
+    Args:
+        gpu_caps: Detected GPU capabilities (None for CPU-only)
+
+    Returns:
+        Number of concurrent encode slots (minimum 1)
+    """
+    parallel_count = get_recommended_parallel_sessions(gpu_caps)
+    if gpu_caps is not None:
+        parallel_count = min(parallel_count, HWACCEL_MAX_CONCURRENT_SESSIONS)
+    return max(1, parallel_count)
+
+
+def has_resource_headroom() -> bool:
+    """
+    Check whether the host can take another encode.
+
+    Returns True if free memory and system CPU usage are within the configured
+    limits. Fails open if the check itself fails.
+    """
+    try:
+        mem = psutil.virtual_memory()
+        available_mb = mem.available / (1024 * 1024)
+        if available_mb < PARALLEL_SCHEDULER_MIN_FREE_MEMORY_MB:
+            logger.debug(
+                f"Holding back encode: {available_mb:.0f}MB free (minimum: {PARALLEL_SCHEDULER_MIN_FREE_MEMORY_MB}MB)"
+            )
+            return False
+        # Non-blocking: usage since the previous call
+        cpu_percent = psutil.cpu_percent(interval=None)
+        if cpu_percent >= PARALLEL_SCHEDULER_MAX_CPU_PERCENT:
+            logger.debug(
+                f"Holding back encode: CPU at {cpu_percent:.0f}% (maximum: {PARALLEL_SCHEDULER_MAX_CPU_PERCENT}%)"
+            )
+            return False
+        return True
+    except Exception as e:
+        logger.warning(f"Error checking host headroom: {e}")
+        return True
+
+
+def _next_quality(
+    pending: List[int],
+    qualities: List[dict],
+    running_high_res: int,
+    max_parallel: int,
+) -> int:
+    """
+    Pick the next quality to start from pending (sorted by cost, highest first).
+
+    Returns the most expensive pending quality, unless the high-res cap is
+    reached and a lower quality is waiting, in which case that one runs instead.
+    """
+    high_res_limit = (max_parallel + 1) // 2
+    if running_high_res >= high_res_limit:
+        for idx in pending:
+            if qualities[idx]["height"] < HIGH_RES_HEIGHT:
+                return idx
+    return pending[0]
+
+
+async def run_qualities_adaptive(
+    qualities: List[dict],
+    run_quality: Callable[[dict], Awaitable[Any]],
+    max_parallel: int,
+    duration: float,
+    codec: Optional[str] = None,
+    on_complete: Optional[Callable[[dict, Any], Awaitable[None]]] = None,
+    headroom_check: Callable[[], bool] = has_resource_headroom,
+    stop_check: Optional[Callable[[], bool]] = None,
+) -> List[Any]:
+    """
+    Run run_quality for every quality, most expensive first, refilling slots as they free.
+
+    Like asyncio.gather(..., return_exceptions=True), exceptions raised by
+    run_quality are returned in place of results. If on_complete raises, all
+    running encodes are cancelled and the exception propagates.
+
+    Args:
+        qualities: Quality preset dicts to encode
+        run_quality: Coroutine function that encodes one quality
+        max_parallel: Maximum number of concurrent encodes
+        duration: Source duration in seconds (for cost estimates)
+        codec: Target codec name (for cost estimates)
+        on_complete: Optional callback awaited with (quality, result) as each encode finishes
+        headroom_check: Returns False to hold back new encodes while others are running
+        stop_check: Returns True to start no further qualities (running ones finish)
+
+    Returns:
+        Results in the same order as qualities (None for qualities never started
+        because of stop_check)
+    """
+    max_parallel = max(1, max_parallel)
+    results: List[Any] = [None] * len(qualities)
+    pending = sorted(
+        range(len(qualities)),
+        key=lambda i: estimate_quality_cost(qualities[i], duration, codec),
+        reverse=True,
+    )
+    running: Dict[asyncio.Task, int] = {}
+
+    try:
+        while pending or running:
+            if pending and stop_check is not None and stop_check():
+                logger.info(f"Stop requested, not starting {len(pending)} remaining qualities")
+                pending.clear()
+                if not running:
+                    break
+
+            # Fill free slots; the first encode is always admitted so work can't stall
+            held_back = False
+            while pending and len(running) < max_parallel:
+                if running and not headroom_check():
+                    held_back = True
+                    break
+                running_high_res = sum(1 for i in running.values() if qualities[i]["height"] >= HIGH_RES_HEIGHT)
+                idx = _next_quality(pending, qualities, running_high_res, max_parallel)
+                pending.remove(idx)
+                running[asyncio.create_task(run_quality(qualities[idx]))] = idx
+
+            done, _ = await asyncio.wait(
+                running,
+                timeout=HEADROOM_RECHECK_SECONDS if held_back else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            for task in sorted(done, key=running.__getitem__):
+                idx = running.pop(task)
+                try:
+                    result = task.result()
+                except (Exception, asyncio.CancelledError) as e:
+                    result = e
+                results[idx] = result
+                if on_complete is not None:
+                    await on_complete(qualities[idx], result)
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return results
@@ -31,7 +31,7 @@ import sys
 import time
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from api.enums import PlaylistValidation
 from api.job_queue import JobDispatch, JobQueue
@@ -39,41 +39,56 @@ from api.job_queue import JobDispatch, JobQueue
 # Import code version for compatibility checking
 from code_version import CODE_VERSION
 from config import (
+    CMAF_SHARED_AUDIO_ENABLED,
     JOB_QUEUE_MODE,
     QUALITY_PRESETS,
     STREAMING_FORMAT,
+    TRANSCODE_LADDER_MODE,
     WORKER_API_KEY,
     WORKER_API_URL,
+    WORKER_CLAIM_LONG_POLL_SECONDS,
     WORKER_HEALTH_PORT,
     WORKER_HEARTBEAT_INTERVAL,
+    WORKER_HTTP2,
+    WORKER_INGEST_PROBE_BYTES,
     WORKER_POLL_INTERVAL,
+    WORKER_SEGMENT_BATCH_SIZE,
+    WORKER_SEGMENT_UPLOAD_CONCURRENCY,
+    WORKER_STREAMING_INGEST,
+    WORKER_STREAMING_TAR_UPLOAD,
     WORKER_STREAMING_UPLOAD,
     WORKER_WORK_DIR,
 )
 from worker.health_server import HealthServer
-from worker.http_client import WorkerAPIClient, WorkerAPIError
+from worker.http_client import DownloadProgress, WorkerAPIClient, WorkerAPIError
 from worker.hwaccel import (
+    AUDIO_RENDITION_NAME,
     GPUCapabilities,
     VideoCodec,
     build_cmaf_transcode_command,
     detect_deployment_type,
     detect_gpu_capabilities,
-    get_recommended_parallel_sessions,
     get_worker_capabilities,
     select_encoder,
 )
+from worker.quality_scheduler import get_max_parallel_encodes, run_qualities_adaptive
 from worker.transcoder import (
     calculate_ffmpeg_timeout,
+    can_pass_through_audio,
+    chunked_encoding_applies,
     create_original_quality,
     generate_dash_manifest,
     generate_master_playlist,
     generate_master_playlist_cmaf,
     generate_thumbnail,
     get_applicable_qualities,
+    get_audio_rendition_bandwidth,
     get_output_dimensions,
     get_video_info,
-    group_qualities_by_resolution,
     run_ffmpeg_with_progress,
+    shared_audio_bitrate,
+    transcode_audio_rendition,
+    transcode_ladder_with_progress,
     transcode_quality_with_progress,
     validate_hls_playlist,
 )
@@ -90,6 +105,8 @@ if WORKER_STREAMING_UPLOAD:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Global shutdown flag
 shutdown_requested = False
 
@@ -299,6 +316,158 @@ async def check_claim_expiration(coro):
         raise
 
 
+# Seconds between progress updates while waiting for the source download
+# (keeps the job claim fresh during long downloads)
+SOURCE_DOWNLOAD_PROGRESS_INTERVAL = 10.0
+
+# ffprobe format names whose duration is stored in the header, so probing the
+# first bytes of a partially downloaded file gives the same result as the full file
+HEADER_DURATION_FORMATS = {"mov", "mp4", "matroska", "webm"}
+
+# Seconds FFmpeg waits for more of a downloading source before taking the file as
+# ended. A pass during which the download stalled for half of this is not trusted
+# and runs again on the complete file.
+SOURCE_FOLLOW_TIMEOUT = 60.0
+
+
+async def wait_for_source_bytes(download: DownloadProgress, download_task: asyncio.Task, min_bytes: int) -> None:
+    """Wait until min_bytes of the source are on disk or the download task has ended."""
+    waiter = asyncio.ensure_future(download.wait_for_bytes(min_bytes))
+    try:
+        await asyncio.wait({waiter, download_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+
+
+async def probe_partial_source(
+    source_path: Path, download: DownloadProgress, download_task: asyncio.Task
+) -> Optional[dict]:
+    """
+    Probe a source file from its first bytes while the rest is still downloading.
+
+    Args:
+        source_path: Path the source is being downloaded to
+        download: Progress of the download
+        download_task: Task running client.download_source()
+
+    Returns:
+        Video info as returned by get_video_info(), or None if the download ended
+        first or the partial file can't be probed reliably (e.g. MP4 with the moov
+        atom at the end, or a container without a header duration)
+    """
+    await wait_for_source_bytes(download, download_task, WORKER_INGEST_PROBE_BYTES)
+    if download_task.done():
+        return None
+    try:
+        info = await get_video_info(source_path)
+    except RuntimeError as e:
+        logger.debug(f"    Partial probe failed, probing after download: {e}")
+        return None
+    if not HEADER_DURATION_FORMATS.intersection(info["format_name"].split(",")):
+        logger.debug(f"    Partial probe of {info['format_name']} not trusted, probing after download")
+        return None
+    return info
+
+
+async def wait_for_source_download(
+    client: WorkerAPIClient,
+    job_id: int,
+    download: DownloadProgress,
+    download_task: asyncio.Task,
+    step: str,
+    percent: int,
+) -> None:
+    """
+    Wait for the background source download, reporting progress while it runs.
+
+    Args:
+        client: Worker API client
+        job_id: Job being processed
+        download: Progress of the download
+        download_task: Task running client.download_source()
+        step: Current job step to report
+        percent: Current overall job progress to report
+
+    Raises:
+        ClaimExpiredError: If the claim expired during the download
+        WorkerAPIError: If the download failed
+    """
+    while not download_task.done():
+        await asyncio.wait({download_task}, timeout=SOURCE_DOWNLOAD_PROGRESS_INTERVAL)
+        if not download_task.done():
+            if download.total_bytes:
+                logger.info(f"    Downloaded {download.bytes_written * 100 // download.total_bytes}% of source")
+            await check_claim_expiration(client.update_progress(job_id, step, percent))
+    await download_task
+
+
+async def wait_for_download_stall(download: DownloadProgress, timeout: float) -> bool:
+    """
+    Wait until the download made no progress for timeout seconds, or has ended.
+
+    Returns:
+        True if it stalled or failed, False if it completed
+    """
+    while not download.finished:
+        written = download.bytes_written
+        try:
+            await asyncio.wait_for(download.wait_for_bytes(written + 1), timeout)
+        except asyncio.TimeoutError:
+            return True
+    return download.failed
+
+
+async def encode_downloading_source(
+    client: WorkerAPIClient,
+    job_id: int,
+    download: DownloadProgress,
+    download_task: asyncio.Task,
+    step: str,
+    percent: int,
+    encode: Callable[[Optional[float]], Awaitable[T]],
+) -> T:
+    """
+    Run an FFmpeg pass over the source while it may still be downloading.
+
+    encode gets the follow timeout to read the source with (see
+    build_input_args), or None once the source is complete. The claim is kept
+    fresh while the download runs (reporting step and percent, as in
+    wait_for_source_download). If the download stalled long enough that
+    FFmpeg may have taken the partial file for the whole source, the pass runs
+    again once the download has finished.
+
+    Only for sources whose partial probe was trusted (HEADER_DURATION_FORMATS):
+    an MP4 with its moov atom at the end is read after the full download.
+
+    Raises:
+        ClaimExpiredError: If the claim expired during the download
+        WorkerAPIError: If the download failed
+    """
+    if download_task.done():
+        await download_task
+        return await encode(None)
+
+    encode_task = asyncio.ensure_future(encode(SOURCE_FOLLOW_TIMEOUT))
+    stall = asyncio.ensure_future(wait_for_download_stall(download, SOURCE_FOLLOW_TIMEOUT / 2))
+    downloaded = asyncio.ensure_future(wait_for_source_download(client, job_id, download, download_task, step, percent))
+    try:
+        await asyncio.wait({encode_task, downloaded}, return_when=asyncio.FIRST_COMPLETED)
+        if downloaded.done():
+            # Raises if the download failed or the claim expired
+            downloaded.result()
+        result = await encode_task
+        stalled = stall.done() and stall.result()
+    finally:
+        for task in (encode_task, stall, downloaded):
+            task.cancel()
+
+    if stalled:
+        logger.warning("    Source download stalled while it was being read, running the pass again")
+        await wait_for_source_download(client, job_id, download, download_task, step, percent)
+        return await encode(None)
+    return result
+
+
 def signal_handler(sig, frame):
     """Handle shutdown signals gracefully."""
     global shutdown_requested
@@ -387,6 +556,53 @@ async def heartbeat_loop(client: WorkerAPIClient, state: dict):
         await asyncio.sleep(WORKER_HEARTBEAT_INTERVAL)
 
 
+async def transcode_and_upload_audio(
+    client: WorkerAPIClient,
+    video_id: int,
+    source_path: Path,
+    output_dir: Path,
+    duration: float,
+    qualities: List[dict],
+    source_passthrough: bool,
+    follow_timeout: Optional[float] = None,
+) -> Optional[int]:
+    """
+    Encode and upload the shared audio rendition of a CMAF video.
+
+    With follow_timeout, the source may still be downloading (see
+    encode_downloading_source).
+
+    Returns:
+        Its bandwidth in bits/s, or None if it failed (the renditions then carry
+        their own audio)
+
+    Raises:
+        ClaimExpiredError: If the claim expired during the upload
+    """
+    logger.info("  Encoding shared audio rendition...")
+    success, error = await transcode_audio_rendition(
+        source_path,
+        output_dir,
+        duration,
+        shared_audio_bitrate(qualities),
+        source_passthrough,
+        follow_timeout=follow_timeout,
+    )
+    if not success:
+        logger.warning(f"  Shared audio rendition failed ({error}), renditions keep their own audio")
+        return None
+    audio_bandwidth = get_audio_rendition_bandwidth(output_dir)
+    try:
+        await check_claim_expiration(client.upload_quality(video_id, AUDIO_RENDITION_NAME, output_dir))
+    except WorkerAPIError as e:
+        logger.warning(f"  Shared audio upload failed ({e.message}), renditions keep their own audio")
+        return None
+    finally:
+        shutil.rmtree(output_dir / AUDIO_RENDITION_NAME, ignore_errors=True)
+    logger.info(f"  Shared audio rendition uploaded ({audio_bandwidth // 1000} kbps)")
+    return audio_bandwidth
+
+
 async def process_job(client: WorkerAPIClient, job: dict) -> bool:
     """
     Process a claimed transcoding job.
@@ -425,17 +641,29 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
     # Only cleanup work directory if completion was verified
     completion_verified = False
 
+    download_task: Optional[asyncio.Task] = None
+
     try:
-        # Download source file
+        # Download source file in the background; with streaming ingest, probing and
+        # thumbnail generation run on the partial file while the rest downloads
         logger.info("  Downloading source file...")
         await check_claim_expiration(client.update_progress(job_id, "download", 0))
-        await check_claim_expiration(client.download_source(video_id, source_path))
-        await check_claim_expiration(client.update_progress(job_id, "download", 5))
+        download = DownloadProgress()
+        download_task = asyncio.create_task(
+            check_claim_expiration(client.download_source(video_id, source_path, progress=download))
+        )
 
-        # Probe video
-        logger.info("  Probing video info...")
-        await check_claim_expiration(client.update_progress(job_id, "probe", 5))
-        info = await get_video_info(source_path)
+        info = await probe_partial_source(source_path, download, download_task) if WORKER_STREAMING_INGEST else None
+        if info is not None:
+            logger.info("  Probed video info from partial download")
+        else:
+            await wait_for_source_download(client, job_id, download, download_task, "download", 0)
+            await check_claim_expiration(client.update_progress(job_id, "download", 5))
+
+            # Probe video
+            logger.info("  Probing video info...")
+            await check_claim_expiration(client.update_progress(job_id, "probe", 5))
+            info = await get_video_info(source_path)
         duration = info["duration"]
         source_width = info["width"]
         source_height = info["height"]
@@ -458,7 +686,30 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
         await check_claim_expiration(client.update_progress(job_id, "thumbnail", 10))
         thumb_path = output_dir / "thumbnail.jpg"
         thumbnail_time = min(5.0, duration / 4)
-        await generate_thumbnail(source_path, thumb_path, thumbnail_time)
+        source_downloaded = download_task.done()
+        if not source_downloaded and download.total_bytes:
+            # Wait until the thumbnail frame has most likely arrived (assumes a roughly
+            # constant bitrate, plus the probe size as margin for interleaving)
+            frame_offset = int(download.total_bytes * thumbnail_time / duration) if duration > 0 else 0
+            await wait_for_source_bytes(download, download_task, frame_offset + WORKER_INGEST_PROBE_BYTES)
+            source_downloaded = download_task.done()
+        try:
+            await generate_thumbnail(source_path, thumb_path, thumbnail_time)
+        except RuntimeError:
+            if source_downloaded:
+                raise
+            thumb_path.unlink(missing_ok=True)
+        if not source_downloaded and not (thumb_path.exists() and thumb_path.stat().st_size > 0):
+            # The thumbnail frame had not been downloaded yet
+            await wait_for_source_download(client, job_id, download, download_task, "thumbnail", 10)
+            await generate_thumbnail(source_path, thumb_path, thumbnail_time)
+
+        # The first pass over the source (shared audio, or the original remux of a job
+        # that is not split) reads it while it downloads; the download only got this
+        # far for header-first sources (an MP4 with a trailing moov atom was downloaded
+        # in full before probing). Later passes start once the source is complete.
+        if not download_task.done():
+            logger.info("  Encoding while the source downloads...")
 
         # Determine qualities
         qualities = get_applicable_qualities(source_height)
@@ -470,6 +721,68 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
         existing_qualities = set(job.get("existing_qualities") or [])
         if existing_qualities:
             logger.info(f"  Skipping existing qualities: {sorted(existing_qualities)}")
+        progressive_publish = bool(job.get("progressive_publish"))
+
+        # Shared audio (CMAF): the audio is encoded once, before any rendition (or split
+        # task), and the renditions are encoded video-only. A video keeps the audio
+        # layout its existing renditions were encoded with.
+        audio_bandwidth = job.get("audio_bandwidth") if streaming_format == "cmaf" else None
+        if (
+            audio_bandwidth is None
+            and streaming_format == "cmaf"
+            and CMAF_SHARED_AUDIO_ENABLED
+            and info.get("has_audio", True)
+            and not existing_qualities - {"original"}
+        ):
+            audio_bandwidth = await encode_downloading_source(
+                client,
+                job_id,
+                download,
+                download_task,
+                "download",
+                10,
+                lambda follow_timeout: transcode_and_upload_audio(
+                    client,
+                    video_id,
+                    source_path,
+                    output_dir,
+                    duration,
+                    qualities,
+                    can_pass_through_audio(info),
+                    follow_timeout,
+                ),
+            )
+        rendition_audio = audio_bandwidth is None
+
+        # Long videos may be split into rendition tasks that any worker can claim;
+        # the API decides (most expensive renditions are queued first)
+        renditions = [q["name"] for q in qualities if q["name"] not in existing_qualities]
+        if "original" not in existing_qualities:
+            renditions.append("original")
+        if len(renditions) > 1:
+            # Upload the thumbnail first: after a split this worker no longer holds the job
+            await check_claim_expiration(client.upload_finalize(video_id, output_dir, skip_master=True))
+            split = await check_claim_expiration(
+                client.split_job(job_id, renditions, streaming_format, streaming_codec)
+            )
+            if split.get("split"):
+                logger.info(f"  Split into {split['task_count']} rendition tasks")
+                # Work through the job's tasks with the source on disk. This worker no
+                # longer holds the job, so if the rest of the download fails each task
+                # downloads the source itself.
+                task_source: Optional[Path] = source_path
+                try:
+                    await download_task
+                except (ClaimExpiredError, WorkerAPIError) as e:
+                    logger.warning(f"  Source download failed after the split ({e}), tasks download it")
+                    task_source = None
+                while not shutdown_requested:
+                    task = await claim_rendition_task(client, job_id=job_id)
+                    if not task.get("task_id"):
+                        break
+                    await process_task(client, task, task_source)
+                shutil.rmtree(work_dir, ignore_errors=True)
+                return True
 
         quality_names = [q["name"] for q in qualities]
         logger.info(f"  Transcoding to: original + {quality_names}")
@@ -495,7 +808,17 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
             quality_progress_list[0] = {"name": "original", "status": "in_progress", "progress": 0}
             await check_claim_expiration(client.update_progress(job_id, "transcode", 15, quality_progress_list))
 
-            success, error, quality_info = await create_original_quality(source_path, output_dir, duration, None)
+            success, error, quality_info = await encode_downloading_source(
+                client,
+                job_id,
+                download,
+                download_task,
+                "transcode",
+                15,
+                lambda follow_timeout: create_original_quality(
+                    source_path, output_dir, duration, None, follow_timeout=follow_timeout
+                ),
+            )
             if success:
                 # Get actual bitrate from quality_info
                 bitrate_bps = quality_info.get("bitrate_bps", 0) if quality_info else 0
@@ -562,13 +885,19 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                 failed_qualities.append("original")
                 logger.error(f"    original: Failed - {error}")
 
+        if not download_task.done():
+            logger.info("  Waiting for source download to finish...")
+        await wait_for_source_download(client, job_id, download, download_task, "transcode", 15)
+
         # Transcode other qualities (with parallel batching)
-        # Get parallel encoding count based on GPU capabilities
-        parallel_count = get_recommended_parallel_sessions(GPU_CAPS)
+        # Get parallel encoding count based on GPU capabilities. Chunked qualities run one
+        # at a time, their chunks using the encode slots (see get_chunk_parallelism)
+        chunked = chunked_encoding_applies(duration, streaming_format)
+        parallel_count = 1 if chunked else get_max_parallel_encodes(GPU_CAPS)
         if parallel_count > 1:
-            logger.info(f"  Using parallel encoding: {parallel_count} qualities at a time")
+            logger.info(f"  Using parallel encoding: up to {parallel_count} qualities at a time")
 
-        # Filter out existing qualities and group for parallel processing
+        # Filter out existing qualities before scheduling
         qualities_to_transcode = [q for q in qualities if q["name"] not in existing_qualities]
 
         # Mark existing qualities as skipped
@@ -581,8 +910,24 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                     "progress": 100,
                 }
 
-        # Group qualities for parallel processing
-        quality_batches = group_qualities_by_resolution(qualities_to_transcode, parallel_count)
+        # Progressive publishing: the cheapest quality is encoded alone first and made
+        # playable as soon as it is uploaded, before the rest of the ladder starts
+        first_qualities: List[dict] = []
+        if progressive_publish and len(qualities_to_transcode) > 1:
+            first_qualities = [min(qualities_to_transcode, key=lambda q: q["height"])]
+            logger.info(f"  Progressive publishing: {first_qualities[0]['name']} first")
+        remaining_qualities = [q for q in qualities_to_transcode if q not in first_qualities]
+        qualities_to_transcode = first_qualities + remaining_qualities
+
+        # Ladder mode encodes every remaining quality from one decode; otherwise qualities
+        # are scheduled individually, most expensive first
+        use_ladder = TRANSCODE_LADDER_MODE and len(remaining_qualities) > 1 and not chunked
+        if use_ladder:
+            logger.info("  Using ladder encoding: single decode for all qualities")
+
+        # Running ladder encode (shared by all of its qualities)
+        ladder_task: Optional[asyncio.Task] = None
+        ladder_callbacks: Dict[str, Callable[[int], Awaitable[None]]] = {}
 
         # Build quality name to index mapping for progress list
         quality_to_idx: Dict[str, int] = {}
@@ -661,13 +1006,10 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                         # Other errors are logged but don't abort the job
                         logger.error(f"      {qname}: Progress update failed: {e}")
 
-            # Use streaming segment upload if enabled (Issue #478)
-            # This eliminates blocking tar.gz creation for large videos
-            if WORKER_STREAMING_UPLOAD and streaming_format == "cmaf":
-                logger.info(f"    {quality_name}: Using streaming segment upload")
-                try:
-                    # Create transcode coroutine (unawaited - will be run by streaming_transcode_and_upload_quality)
-                    transcode_coro = transcode_quality_with_progress(
+            def start_transcode():
+                """Return the transcode coroutine, reading from the ladder encode when one is running."""
+                if ladder_task is None:
+                    return transcode_quality_with_progress(
                         source_path,
                         output_dir,
                         quality,
@@ -676,8 +1018,24 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                         gpu_caps=GPU_CAPS,
                         streaming_format=streaming_format,
                         preferred_codec=streaming_codec,
+                        audio=rendition_audio,
                     )
 
+                ladder_callbacks[quality_name] = update_quality_progress
+
+                async def ladder_result(task: asyncio.Task = ladder_task) -> Tuple[bool, Optional[str]]:
+                    return (await task)[quality_name]
+
+                return ladder_result()
+
+            # Use streaming segment upload if enabled (Issue #478)
+            # This eliminates blocking tar.gz creation for large videos
+            if WORKER_STREAMING_UPLOAD and streaming_format == "cmaf":
+                logger.info(f"    {quality_name}: Using streaming segment upload")
+                try:
+                    # Create transcode coroutine (unawaited - will be run by streaming_transcode_and_upload_quality)
+                    transcode_coro = start_transcode()
+
                     # Track segment upload progress (Issue #478 Phase 5)
                     # This callback is called from sync context, so we use create_task for async updates
                     # Note: We track segment progress locally but don't send separate HTTP updates.
@@ -720,6 +1078,8 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                         transcode_coro=transcode_coro,
                         on_segment_progress=on_segment_progress,
                         job_id=job_id,
+                        batch_size=WORKER_SEGMENT_BATCH_SIZE,
+                        upload_concurrency=WORKER_SEGMENT_UPLOAD_CONCURRENCY,
                     )
 
                     if not success:
@@ -769,16 +1129,7 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
                     raise ClaimExpiredError(str(e))
 
             # Standard tar.gz upload path (when streaming upload is disabled or non-CMAF)
-            success, error = await transcode_quality_with_progress(
-                source_path,
-                output_dir,
-                quality,
-                duration,
-                update_quality_progress,
-                gpu_caps=GPU_CAPS,
-                streaming_format=streaming_format,
-                preferred_codec=streaming_codec,
-            )
+            success, error = await start_transcode()
 
             if not success:
                 async with progress_list_lock:
@@ -897,40 +1248,108 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
 
             return (quality_info, None)
 
-        # Process each batch of qualities
-        for batch_idx, batch in enumerate(quality_batches):
-            if shutdown_requested:
-                raise Exception("Shutdown requested")
-
-            if len(batch) > 1:
-                logger.debug(f"  Processing batch {batch_idx + 1}/{len(quality_batches)}: {[q['name'] for q in batch]}")
-
-            # Run batch in parallel
-            tasks = [transcode_and_upload_quality(q) for q in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results - collect successes and failures from returned tuples
-            for quality, result in zip(batch, results):
-                if isinstance(result, ClaimExpiredError):
-                    # Re-raise claim expiry to abort the job
-                    raise result
-                elif isinstance(result, Exception):
-                    # Unexpected exception
-                    quality_idx = quality_to_idx[quality["name"]]
-                    async with progress_list_lock:
-                        quality_progress_list[quality_idx] = {
-                            "name": quality["name"],
-                            "status": "failed",
-                            "progress": 0,
-                        }
-                    failed_qualities.append(quality["name"])
-                    logger.error(f"    {quality['name']}: Unexpected error - {result}")
-                elif isinstance(result, tuple):
-                    success_info, failed_name = result
-                    if success_info is not None:
-                        successful_qualities.append(success_info)
-                    if failed_name is not None:
-                        failed_qualities.append(failed_name)
+        # Qualities uploaded and published so far (progressive publishing)
+        published_qualities: List[dict] = []
+        publish_lock = asyncio.Lock()
+
+        async def transcode_upload_and_publish(
+            quality: dict,
+        ) -> Tuple[Optional[dict], Optional[str]]:
+            """Transcode and upload a quality, then make it playable (progressive publishing)."""
+            result = await transcode_and_upload_quality(quality)
+            quality_info = result[0]
+            if not progressive_publish or quality_info is None:
+                return result
+            async with progress_list_lock:
+                uploaded = quality_progress_list[quality_to_idx[quality["name"]]]["status"] == "uploaded"
+            if not uploaded:
+                # Upload failed: the files are retried with the final upload
+                return result
+
+            async with publish_lock:
+                published_qualities.append(quality_info)
+                try:
+                    response = await check_claim_expiration(
+                        client.publish_renditions(job_id, published_qualities, streaming_format, streaming_codec)
+                    )
+                    logger.info(f"    {quality['name']}: Published ({response.get('message', '')})")
+                except WorkerAPIError as e:
+                    # Publishing early is best effort; the job still completes normally
+                    logger.warning(f"    {quality['name']}: Progressive publish failed - {e.message}")
+            return result
+
+        if shutdown_requested:
+            raise Exception("Shutdown requested")
+
+        async def abort_on_claim_expiry(quality: dict, result: Any) -> None:
+            """Stop scheduling further qualities once the claim has expired."""
+            if isinstance(result, ClaimExpiredError):
+                raise result
+
+        results: List[Any] = []
+        for quality in first_qualities:
+            results.extend(await asyncio.gather(transcode_upload_and_publish(quality), return_exceptions=True))
+            await abort_on_claim_expiry(quality, results[-1])
+
+        try:
+            if use_ladder:
+                ladder_callbacks.clear()
+                ladder_task = asyncio.create_task(
+                    transcode_ladder_with_progress(
+                        source_path,
+                        output_dir,
+                        remaining_qualities,
+                        duration,
+                        ladder_callbacks,
+                        gpu_caps=GPU_CAPS,
+                        streaming_format=streaming_format,
+                        preferred_codec=streaming_codec,
+                        audio=rendition_audio,
+                    )
+                )
+                tasks = [transcode_upload_and_publish(q) for q in remaining_qualities]
+                results.extend(await asyncio.gather(*tasks, return_exceptions=True))
+            else:
+                results += await run_qualities_adaptive(
+                    remaining_qualities,
+                    transcode_upload_and_publish,
+                    parallel_count,
+                    duration,
+                    codec=streaming_codec,
+                    on_complete=abort_on_claim_expiry,
+                    stop_check=lambda: shutdown_requested,
+                )
+        finally:
+            # Every ladder member awaits the ladder, so it only outlives the encodes on early exit
+            if ladder_task is not None and not ladder_task.done():
+                ladder_task.cancel()
+            ladder_task = None
+
+        if shutdown_requested:
+            raise Exception("Shutdown requested")
+
+        # Process results - collect successes and failures from returned tuples
+        for quality, result in zip(qualities_to_transcode, results):
+            if isinstance(result, ClaimExpiredError):
+                # Re-raise claim expiry to abort the job
+                raise result
+            elif isinstance(result, Exception):
+                # Unexpected exception
+                quality_idx = quality_to_idx[quality["name"]]
+                async with progress_list_lock:
+                    quality_progress_list[quality_idx] = {
+                        "name": quality["name"],
+                        "status": "failed",
+                        "progress": 0,
+                    }
+                failed_qualities.append(quality["name"])
+                logger.error(f"    {quality['name']}: Unexpected error - {result}")
+            elif isinstance(result, tuple):
+                success_info, failed_name = result
+                if success_info is not None:
+                    successful_qualities.append(success_info)
+                if failed_name is not None:
+                    failed_qualities.append(failed_name)
 
         # Check if we have any successful qualities (or all were skipped)
         # If all qualities were skipped, we still need to complete the job
@@ -997,14 +1416,20 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
             codec_enum = {"h264": VideoCodec.H264, "hevc": VideoCodec.HEVC, "av1": VideoCodec.AV1}.get(
                 streaming_codec.lower(), VideoCodec.AV1
             )
-            await generate_master_playlist_cmaf(output_dir, all_qualities_for_manifest, codec_enum)
+            await generate_master_playlist_cmaf(
+                output_dir, all_qualities_for_manifest, codec_enum, audio_bandwidth=audio_bandwidth
+            )
 
             # ALWAYS generate DASH manifest for CMAF - this was the bug!
             # Previously this was conditional on enable_dash and skipped for selective retranscode
             if enable_dash:
                 logger.info("  Generating DASH manifest...")
                 await generate_dash_manifest(
-                    output_dir, all_qualities_for_manifest, codec=codec_enum, total_duration=duration
+                    output_dir,
+                    all_qualities_for_manifest,
+                    codec=codec_enum,
+                    total_duration=duration,
+                    audio_bandwidth=audio_bandwidth,
                 )
 
             # Validate master playlist before upload (issue #166)
@@ -1133,6 +1558,14 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
         return False
 
     finally:
+        # Stop a source download abandoned by an earlier failure
+        if download_task is not None and not download_task.done():
+            download_task.cancel()
+            try:
+                await download_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
         # Only cleanup work directory if:
         # 1. Job completion was verified by the server, OR
         # 2. Claim expired (job reassigned to another worker)
@@ -1159,6 +1592,179 @@ async def process_job(client: WorkerAPIClient, job: dict) -> bool:
             logger.info(f"  Note: Work directory preserved at {work_dir} (completion not verified)")
 
 
+async def process_task(client: WorkerAPIClient, task: dict, source_path: Optional[Path] = None) -> bool:
+    """
+    Process a claimed rendition task of a split job.
+
+    Produces and uploads a single quality (a remux for "original"); the Worker
+    API writes the manifests once the job's last task is complete.
+
+    Args:
+        client: Worker API client
+        task: Task info from claim_task response
+        source_path: Source file, if already downloaded (the worker that split the job)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    task_id = task["task_id"]
+    video_id = task["video_id"]
+    quality_name = task["quality"]
+    streaming_format = task["streaming_format"]
+    streaming_codec = task["streaming_codec"]
+    duration = task["video_duration"] or 0
+    source_width = task["source_width"]
+    source_height = task["source_height"]
+
+    logger.info(f"Processing {quality_name} of video {task['video_slug']} (job={task['job_id']}, task={task_id})")
+
+    work_dir = WORKER_WORK_DIR / f"task-{task_id}"
+    output_dir = work_dir / "output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    last_update = 0.0
+
+    async def report_progress(pct: int, status: str = "in_progress") -> None:
+        """Report progress (at most every 5 seconds), which also extends the claim."""
+        nonlocal last_update
+        now = time.time()
+        if now - last_update < 5.0:
+            return
+        last_update = now
+        try:
+            await check_claim_expiration(client.update_task_progress(task_id, pct, status))
+        except ClaimExpiredError:
+            raise
+        except Exception as e:
+            logger.error(f"      {quality_name}: Progress update failed: {e}")
+
+    async def upload_progress(bytes_sent: int, total_bytes: int) -> None:
+        await report_progress(int(bytes_sent * 100 / total_bytes) if total_bytes > 0 else 0, "uploading")
+
+    try:
+        if source_path is None:
+            source_path = work_dir / (task.get("source_filename") or f"{video_id}.mp4")
+            logger.info("  Downloading source file...")
+            download_task = asyncio.create_task(check_claim_expiration(client.download_source(video_id, source_path)))
+            try:
+                while not download_task.done():
+                    await asyncio.wait({download_task}, timeout=SOURCE_DOWNLOAD_PROGRESS_INTERVAL)
+                    if not download_task.done():
+                        await report_progress(0)
+                await download_task
+            finally:
+                if not download_task.done():
+                    download_task.cancel()
+
+        if quality_name == "original":
+            logger.info("    original: Remuxing...")
+            success, error, quality_info = await create_original_quality(source_path, output_dir, duration, None)
+            if not success:
+                raise Exception(f"Remux failed - {error}")
+            width, height = source_width, source_height
+            bitrate = (quality_info.get("bitrate_bps", 0) if quality_info else 0) // 1000
+            playlist_path = output_dir / "original.m3u8"
+            uploaded = False
+        else:
+            quality = next((q for q in QUALITY_PRESETS if q["name"] == quality_name), None)
+            if quality is None:
+                raise Exception(f"Unknown quality: {quality_name}")
+            logger.info(f"    {quality_name}: Transcoding...")
+            transcode_coro = transcode_quality_with_progress(
+                source_path,
+                output_dir,
+                quality,
+                duration,
+                report_progress,
+                gpu_caps=GPU_CAPS,
+                streaming_format=streaming_format,
+                preferred_codec=streaming_codec,
+                # Video only if the claiming worker uploaded a shared audio rendition
+                audio=streaming_format != "cmaf" or task.get("audio_bandwidth") is None,
+            )
+            uploaded = WORKER_STREAMING_UPLOAD and streaming_format == "cmaf"
+            if uploaded:
+                try:
+                    success, error, _segment_count = await streaming_transcode_and_upload_quality(
+                        client=client,
+                        video_id=video_id,
+                        output_dir=output_dir,
+                        quality_name=quality_name,
+                        streaming_format=streaming_format,
+                        transcode_coro=transcode_coro,
+                        job_id=task["job_id"],
+                        batch_size=WORKER_SEGMENT_BATCH_SIZE,
+                        upload_concurrency=WORKER_SEGMENT_UPLOAD_CONCURRENCY,
+                    )
+                except StreamingClaimExpiredError as e:
+                    raise ClaimExpiredError(str(e))
+            else:
+                success, error = await transcode_coro
+            if not success:
+                raise Exception(f"Transcode failed - {error}")
+
+            # CMAF uses init.mp4 for track info (m4s segments are fragmented)
+            if streaming_format == "cmaf":
+                first_segment = output_dir / quality_name / "init.mp4"
+                playlist_path = output_dir / quality_name / "stream.m3u8"
+            else:
+                first_segment = output_dir / f"{quality_name}_0000.ts"
+                playlist_path = output_dir / f"{quality_name}.m3u8"
+            if first_segment.exists():
+                width, height = await get_output_dimensions(first_segment)
+            else:
+                # Estimate based on aspect ratio
+                height = quality["height"]
+                width = int(height * source_width / source_height)
+                width = width + (width % 2)
+            bitrate = int(quality["bitrate"].replace("k", ""))
+
+        if not uploaded:
+            # Validate HLS playlist before upload (issue #166)
+            is_valid, validation_error = await validate_hls_playlist(playlist_path, PlaylistValidation.CHECK_SEGMENTS)
+            if not is_valid:
+                raise Exception(f"HLS validation failed - {validation_error}")
+            logger.info(f"    {quality_name}: Uploading...")
+            await check_claim_expiration(
+                client.upload_quality(video_id, quality_name, output_dir, progress_callback=upload_progress)
+            )
+
+        result = await check_claim_expiration(client.complete_task(task_id, width, height, bitrate))
+        logger.info(f"    {quality_name}: Done ({width}x{height})")
+        if result.get("job_finished"):
+            logger.info(f"  Done! Video {task['video_slug']} is ready.")
+        return True
+
+    except ClaimExpiredError:
+        # The task may already be claimed by another worker; don't report failure
+        logger.error(f"  {CLAIM_EXPIRED_ERROR}")
+        return False
+
+    except Exception as e:
+        error_msg = (f"API error: {e.message}" if isinstance(e, WorkerAPIError) else str(e))[:500]
+        logger.error(f"    {quality_name}: {error_msg}")
+        try:
+            await check_claim_expiration(client.fail_task(task_id, error_msg, retry=True))
+        except ClaimExpiredError:
+            logger.error("  Claim expired while reporting error (task may have been reassigned)")
+        except Exception as fail_e:
+            logger.error(f"  Failed to report error: {fail_e}")
+        return False
+
+    finally:
+        # Rendition files are uploaded (or the task is retried from scratch elsewhere)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+async def claim_rendition_task(client: WorkerAPIClient, job_id: Optional[int] = None) -> dict:
+    """Claim a rendition task of a split job ({} if the Worker API predates job splitting)."""
+    try:
+        return await client.claim_task(job_id=job_id)
+    except WorkerAPIError as e:
+        if e.status_code == 404:
+            return {}
+        raise
+
+
 # Codec map for re-encoding
 REENCODE_CODEC_MAP = {
     "h264": VideoCodec.H264,
@@ -1483,7 +2089,12 @@ async def worker_loop():
     HEALTH_SERVER = HealthServer(port=WORKER_HEALTH_PORT)
     await HEALTH_SERVER.start()
 
-    client = WorkerAPIClient(WORKER_API_URL, WORKER_API_KEY)
+    client = WorkerAPIClient(
+        WORKER_API_URL,
+        WORKER_API_KEY,
+        stream_archives=WORKER_STREAMING_TAR_UPLOAD,
+        http2=WORKER_HTTP2,
+    )
 
     # Get worker settings from database with caching
     worker_settings = await get_remote_worker_settings()
@@ -1568,6 +2179,19 @@ async def worker_loop():
     try:
         while not shutdown_requested:
             try:
+                # Rendition tasks of split jobs come first: their videos are already underway
+                task = await claim_rendition_task(client)
+                if task.get("task_id"):
+                    consecutive_api_failures = 0
+                    worker_state["processing_job"] = task["job_id"]
+                    success = await process_task(client, task)
+                    worker_state["processing_job"] = None
+                    if success:
+                        jobs_processed += 1
+                    else:
+                        jobs_failed += 1
+                    continue
+
                 result = None
                 redis_job: Optional[JobDispatch] = None
 
@@ -1588,9 +2212,17 @@ async def worker_loop():
                             redis_job = None
                             result = None
 
-                # Fallback to HTTP polling if no Redis job
+                # Fallback to HTTP polling if no Redis job. Without Redis Streams,
+                # long-poll so the API answers as soon as a job is created
+                long_poll = 0 if (JOB_QUEUE and JOB_QUEUE.is_redis_enabled) else WORKER_CLAIM_LONG_POLL_SECONDS
+                claim_started = time.monotonic()
                 if not result:
-                    result = await client.claim_job()
+                    result = await client.claim_job(wait=long_poll)
+                claim_elapsed = time.monotonic() - claim_started
+
+                if result.get("tasks_available"):
+                    # Parked claim handed over to rendition tasks of a split job
+                    continue
 
                 if result.get("job_id"):
                     # Reset API failure counter on successful job claim
@@ -1633,7 +2265,11 @@ async def worker_loop():
                         # No jobs of any type available
                         # If Redis is enabled, claim_job already blocks for a short time
                         # Only poll interval sleep if database-only mode
-                        if JOB_QUEUE_MODE == "database" or not (JOB_QUEUE and JOB_QUEUE.is_redis_enabled):
+                        # A long-poll claim that waited out its full window already paced
+                        # the loop; one that returned early (older API, GPU priority) did not
+                        if (
+                            JOB_QUEUE_MODE == "database" or not (JOB_QUEUE and JOB_QUEUE.is_redis_enabled)
+                        ) and (not long_poll or claim_elapsed < long_poll):
                             # Refresh settings periodically (cache has 60s TTL)
                             worker_settings = await get_remote_worker_settings()
                             await asyncio.sleep(worker_settings["poll_interval"])
@@ -2,20 +2,36 @@
 Segment Watcher for Streaming Upload (Issue #478).
 
 Watches the output directory during FFmpeg transcoding and queues
-completed segments for upload. Uses polling to detect when segment
-files are fully written (stable file size).
+completed segments for upload. On Linux, inotify close-write and
+moved-to events (via watchdog) report exactly when FFmpeg finishes a
+segment. Elsewhere, or if inotify can't be used, the watcher falls back
+to polling until the file size is stable.
 
 Architecture (Ada's producer-consumer model):
     FFmpeg --writes--> Filesystem
                            |
-    SegmentWatcher --polls--> asyncio.Queue(maxsize=10) --> UploadWorker
+    SegmentWatcher --inotify/polls--> asyncio.Queue(maxsize=10) --> UploadWorker
 """
 
 import asyncio
+import fnmatch
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Set
+from typing import Callable, Dict, Optional, Set
+
+from config import WORKER_USE_FILESYSTEM_WATCHER
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers.inotify import InotifyObserver
+
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    # watchdog missing or not on Linux - polling only
+    FileSystemEventHandler = object
+    INOTIFY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +42,28 @@ POLL_INTERVAL_SECONDS = 1.0
 STABLE_SIZE_POLLS = 2
 
 
+class _SegmentEventHandler(FileSystemEventHandler):
+    """Forward "file finished" events from the watchdog thread to the event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, callback: Callable[[str], None]):
+        super().__init__()
+        self._loop = loop
+        self._callback = callback
+
+    def _notify(self, path) -> None:
+        self._loop.call_soon_threadsafe(self._callback, os.fsdecode(path))
+
+    def on_closed(self, event):
+        """IN_CLOSE_WRITE: FFmpeg finished writing a segment."""
+        if not event.is_directory:
+            self._notify(event.src_path)
+
+    def on_moved(self, event):
+        """IN_MOVED_TO: a segment was renamed into place."""
+        if not event.is_directory:
+            self._notify(event.dest_path)
+
+
 @dataclass
 class SegmentInfo:
     """Information about a segment file to upload."""
@@ -40,9 +78,10 @@ class SegmentWatcher:
     """
     Watch output directory for new segments during transcoding.
 
-    Polls the directory at regular intervals and detects when segment
-    files are fully written (file size stable across consecutive polls).
-    Queues completed segments for upload to the server.
+    Uses inotify events to queue each segment as soon as FFmpeg closes it.
+    Without inotify, polls the directory at regular intervals and detects
+    when segment files are fully written (file size stable across
+    consecutive polls). Queues completed segments for upload to the server.
 
     Features (per agent recommendations):
     - 1000ms polling interval (Ada: not 500ms)
@@ -76,6 +115,7 @@ class SegmentWatcher:
         streaming_format: str,
         upload_queue: asyncio.Queue,
         poll_interval: float = POLL_INTERVAL_SECONDS,
+        use_inotify: bool = WORKER_USE_FILESYSTEM_WATCHER,
     ):
         """
         Initialize the segment watcher.
@@ -86,12 +126,14 @@ class SegmentWatcher:
             streaming_format: Format being used ("cmaf" or "hls_ts")
             upload_queue: Queue to push completed segments to
             poll_interval: Polling interval in seconds (default: 1.0s)
+            use_inotify: Use inotify events when available instead of polling
         """
         self.output_dir = output_dir
         self.quality_name = quality_name
         self.streaming_format = streaming_format
         self.upload_queue = upload_queue
         self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
 
         # Tracking state
         self._file_sizes: Dict[str, int] = {}  # filename -> size at last poll
@@ -100,6 +142,10 @@ class SegmentWatcher:
         self._running = False
         self._stop_event = asyncio.Event()
 
+        # inotify mode: files FFmpeg has finished, in completion order
+        self._closed_files: Dict[str, None] = {}
+        self._files_closed = asyncio.Event()
+
         # FFmpeg process monitoring (Margo's recommendation)
         self._ffmpeg_crashed = False
 
@@ -113,6 +159,14 @@ class SegmentWatcher:
             # HLS/TS uses flat structure: output_dir/{quality}_*.ts
             return self.output_dir
 
+    def _is_segment_filename(self, filename: str) -> bool:
+        """Check whether a filename is one of this quality's segment files."""
+        if self.streaming_format == "cmaf":
+            # CMAF: init.mp4, seg_XXXX.m4s
+            return filename.endswith((".m4s", ".mp4"))
+        # HLS/TS: {quality}_XXXX.ts
+        return fnmatch.fnmatchcase(filename, f"{self.quality_name}_*.ts")
+
     def _get_segment_files(self) -> Dict[str, int]:
         """
         Scan directory for segment files and their sizes.
@@ -126,27 +180,81 @@ class SegmentWatcher:
         if not quality_dir.exists():
             return files
 
-        if self.streaming_format == "cmaf":
-            # CMAF: init.mp4, seg_XXXX.m4s
-            for f in quality_dir.iterdir():
-                if f.is_file() and f.suffix in (".m4s", ".mp4"):
-                    try:
-                        files[f.name] = f.stat().st_size
-                    except (OSError, FileNotFoundError):
-                        # File was deleted between iterdir and stat
-                        pass
-        else:
-            # HLS/TS: {quality}_XXXX.ts
-            pattern = f"{self.quality_name}_*.ts"
-            for f in self.output_dir.glob(pattern):
-                if f.is_file():
-                    try:
-                        files[f.name] = f.stat().st_size
-                    except (OSError, FileNotFoundError):
-                        pass
+        for f in quality_dir.iterdir():
+            if self._is_segment_filename(f.name) and f.is_file():
+                try:
+                    files[f.name] = f.stat().st_size
+                except (OSError, FileNotFoundError):
+                    # File was deleted between iterdir and stat
+                    pass
 
         return files
 
+    def _on_file_closed(self, path: str) -> None:
+        """Record a finished file reported by inotify (runs on the event loop)."""
+        filepath = Path(path)
+        if filepath.parent != self.quality_dir or not self._is_segment_filename(filepath.name):
+            return
+        if filepath.name not in self._queued_files:
+            self._closed_files[filepath.name] = None
+            self._files_closed.set()
+
+    def _take_closed_segments(self) -> list[SegmentInfo]:
+        """
+        Build SegmentInfo for every file inotify reported as finished.
+
+        Returns:
+            List of SegmentInfo for segments ready to upload
+        """
+        ready_segments = []
+        closed = list(self._closed_files)
+        self._closed_files.clear()
+        self._files_closed.clear()
+
+        for filename in closed:
+            if filename in self._queued_files:
+                continue
+            filepath = self.quality_dir / filename
+            try:
+                size = filepath.stat().st_size
+            except (OSError, FileNotFoundError):
+                continue
+            if size == 0:
+                continue
+            ready_segments.append(
+                SegmentInfo(
+                    filepath=filepath,
+                    quality=self.quality_name,
+                    filename=filename,
+                    size=size,
+                )
+            )
+            self._queued_files.add(filename)
+            logger.debug(f"Segment ready: {self.quality_name}/{filename} ({size} bytes)")
+
+        return ready_segments
+
+    def _start_observer(self) -> Optional["InotifyObserver"]:
+        """
+        Start an inotify observer on the quality directory.
+
+        Returns:
+            The running observer, or None if inotify is unavailable or disabled
+        """
+        if not (self.use_inotify and INOTIFY_AVAILABLE):
+            return None
+        try:
+            # Create the directory up front so it can be watched before FFmpeg starts
+            self.quality_dir.mkdir(parents=True, exist_ok=True)
+            handler = _SegmentEventHandler(asyncio.get_running_loop(), self._on_file_closed)
+            observer = InotifyObserver()
+            observer.schedule(handler, str(self.quality_dir), recursive=False)
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.warning(f"inotify unavailable for {self.quality_dir} ({e}), falling back to polling")
+            return None
+
     def _check_stable_segments(self) -> list[SegmentInfo]:
         """
         Check for segments with stable file sizes (ready for upload).
@@ -200,16 +308,19 @@ class SegmentWatcher:
         """
         Start watching for new segments.
 
-        This coroutine runs until stop() is called. It polls the directory
-        at regular intervals and queues completed segments for upload.
+        This coroutine runs until stop() is called. With inotify it wakes up
+        whenever FFmpeg finishes a segment; otherwise it polls the directory
+        at regular intervals. Completed segments are queued for upload.
 
         If the upload queue is full (backpressure), the watcher will block
         on queue.put() which slows detection but doesn't affect FFmpeg.
         """
         self._running = True
+        observer = self._start_observer()
         logger.info(
             f"Segment watcher started for {self.quality_name} "
-            f"(format={self.streaming_format}, dir={self.quality_dir})"
+            f"(format={self.streaming_format}, dir={self.quality_dir}, "
+            f"mode={'inotify' if observer else 'polling'})"
         )
 
         try:
@@ -218,8 +329,12 @@ class SegmentWatcher:
                     logger.warning(f"FFmpeg crashed, stopping watcher for {self.quality_name}")
                     break
 
-                # Check for stable segments
-                ready_segments = self._check_stable_segments()
+                if observer is not None:
+                    # Segments FFmpeg has closed since the last wake-up
+                    ready_segments = self._take_closed_segments()
+                else:
+                    # Check for stable segments
+                    ready_segments = self._check_stable_segments()
 
                 # Queue ready segments for upload
                 for segment in ready_segments:
@@ -233,6 +348,19 @@ class SegmentWatcher:
                         # Queue is full, we'll try again next poll
                         logger.debug(f"Upload queue full, will retry {segment.filename}")
                         self._queued_files.discard(segment.filename)
+                        if observer is not None:
+                            self._closed_files[segment.filename] = None
+
+                if observer is not None and not self._closed_files:
+                    # Sleep until inotify reports a finished segment or stop() is called
+                    stop_wait = asyncio.ensure_future(self._stop_event.wait())
+                    closed_wait = asyncio.ensure_future(self._files_closed.wait())
+                    try:
+                        await asyncio.wait({stop_wait, closed_wait}, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        stop_wait.cancel()
+                        closed_wait.cancel()
+                    continue
 
                 # Wait for next poll or stop signal
                 try:
@@ -247,6 +375,9 @@ class SegmentWatcher:
                     pass
 
         finally:
+            if observer is not None:
+                observer.stop()
+                await asyncio.to_thread(observer.join, 5)
             self._running = False
             logger.info(
                 f"Segment watcher stopped for {self.quality_name} "
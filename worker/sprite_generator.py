@@ -31,6 +31,7 @@ import asyncpg
 import psutil
 
 import config
+from api.object_storage import publish_path
 
 # Stale job threshold - jobs processing for longer than this are considered stale
 STALE_JOB_THRESHOLD_HOURS = 2
@@ -409,6 +410,7 @@ class SpriteGenerator:
             if sprites_dir.exists():
                 shutil.rmtree(sprites_dir)
             shutil.move(str(temp_sprites), str(sprites_dir))
+            await publish_path(slug, "sprites")
 
             logger.info(f"Generated {actual_count} sprite sheets for {slug}")
 
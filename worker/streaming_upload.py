@@ -42,6 +42,17 @@ UPLOAD_QUEUE_SIZE = 10
 # Maximum retries for failed segment uploads (code review fix)
 MAX_SEGMENT_RETRIES = 3
 
+# How long a batching upload worker waits for more segments to fill a batch
+BATCH_LINGER_SECONDS = 0.5
+
+# Maximum bytes sent per batched upload request (the server rejects batches of
+# several segments above 256MB); larger batches are split into several requests
+MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+# Stop asking the server's segment store for segments after this many requests
+# in a row found none of them (the encode differs from anything stored)
+LINK_MAX_MISSES = 3
+
 
 class ClaimExpiredError(Exception):
     """Raised when the job claim expires during upload."""
@@ -180,6 +191,16 @@ class UploadStateManager:
             filename: Segment filename
             size: Segment size in bytes
         """
+        await self.mark_uploaded_many(quality, [(filename, size)])
+
+    async def mark_uploaded_many(self, quality: str, segments: List[Tuple[str, int]]) -> None:
+        """
+        Mark several segments as uploaded with a single state save.
+
+        Args:
+            quality: Quality name (e.g., "1080p")
+            segments: (filename, size) tuples
+        """
         async with self._lock:
             if quality not in self._state:
                 self._state[quality] = {
@@ -189,13 +210,13 @@ class UploadStateManager:
                 }
 
             q = self._state[quality]
-            if filename not in q["uploaded_segments"]:
-                q["uploaded_segments"].append(filename)
-                q["total_bytes"] = q.get("total_bytes", 0) + size
-                q["updated_at"] = datetime.now().isoformat()
+            for filename, size in segments:
+                if filename not in q["uploaded_segments"]:
+                    q["uploaded_segments"].append(filename)
+                    q["total_bytes"] = q.get("total_bytes", 0) + size
+                    q["updated_at"] = datetime.now().isoformat()
 
-        # Save after each upload for durability
-        # (could batch this for performance, but prioritize data safety)
+        # Save after each upload (or batch) for durability
         await self.save()
 
     async def get_uploaded_segments(self, quality: str) -> Set[str]:
@@ -328,6 +349,8 @@ class SegmentUploadWorker:
         state_manager: Optional["UploadStateManager"] = None,
         already_uploaded: Optional[Set[str]] = None,
         quality_name: Optional[str] = None,
+        batch_size: int = 1,
+        max_concurrency: int = 1,
     ):
         """
         Initialize the upload worker.
@@ -340,6 +363,8 @@ class SegmentUploadWorker:
             state_manager: Optional UploadStateManager for persisting state to disk (Phase 6)
             already_uploaded: Optional set of segment filenames to skip (for resume)
             quality_name: Quality name for state tracking (required if state_manager is set)
+            batch_size: Segments per upload request; above 1 the batched endpoint is used
+            max_concurrency: Maximum upload requests in flight at once
         """
         self.client = client
         self.video_id = video_id
@@ -347,6 +372,8 @@ class SegmentUploadWorker:
         self.on_segment_uploaded = on_segment_uploaded
         self.state_manager = state_manager
         self.quality_name = quality_name
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
 
         # Tracking
         # Start with already_uploaded segments if resuming
@@ -357,6 +384,9 @@ class SegmentUploadWorker:
         self._running = False
         self._stop_event = asyncio.Event()
         self._error: Optional[Exception] = None
+        # Server-side segment store: segments it already has need no upload
+        self._link_enabled = True
+        self._link_misses = 0
 
     async def run(self) -> None:
         """
@@ -382,6 +412,10 @@ class SegmentUploadWorker:
         retry_counts: Dict[str, int] = {}
 
         try:
+            if self.batch_size > 1 or self.max_concurrency > 1:
+                await self._run_batched(retry_counts)
+                return
+
             while True:
                 # Check for stop signal with empty queue and no pending retries
                 if self._stop_event.is_set() and self.upload_queue.empty():
@@ -414,22 +448,7 @@ class SegmentUploadWorker:
                 try:
                     # Phase 6: Skip segments already confirmed by server
                     if segment.filename in self._uploaded_segments:
-                        logger.debug(
-                            f"Skipping already-uploaded segment: {segment.filename}"
-                        )
-                        self._skipped_segments.add(segment.filename)
-                        # Delete local file since it's already on server
-                        # EXCEPT: preserve init.mp4 and stream.m3u8 - needed for metadata
-                        # extraction after upload completes (dimensions, playlist validation)
-                        preserve_files = {"init.mp4", "stream.m3u8"}
-                        if segment.filename not in preserve_files:
-                            try:
-                                await asyncio.to_thread(segment.filepath.unlink)
-                                logger.debug(f"Deleted local segment (already on server): {segment.filename}")
-                            except FileNotFoundError:
-                                pass  # Already gone
-                            except Exception as e:
-                                logger.warning(f"Failed to delete local segment {segment.filename}: {e}")
+                        await self._skip_segment(segment)
                         continue
 
                     retry_count = retry_counts.get(segment.filename, 0)
@@ -452,23 +471,119 @@ class SegmentUploadWorker:
                 f"{self._total_bytes_uploaded} bytes)"
             )
 
-    async def _upload_segment(self, segment: SegmentInfo, retry_count: int = 0) -> bool:
+    async def _run_batched(self, retry_counts: Dict[str, int]) -> None:
         """
-        Upload a single segment to the server.
-
-        Uses asyncio.to_thread for file I/O to avoid blocking the event loop.
-        Verifies file size hasn't changed since stability check (race condition fix).
-
-        Args:
-            segment: SegmentInfo object with filepath, quality, filename, size
-            retry_count: Current retry attempt (for re-queued segments)
+        Batched variant of run(): group queued segments and upload them concurrently.
 
-        Returns:
-            True if upload succeeded, False if should retry
+        Up to batch_size segments are sent per request (waiting up to
+        BATCH_LINGER_SECONDS to fill a batch) and up to max_concurrency requests are
+        in flight at once. Queued segments are marked done only when their batch
+        finishes, so upload_queue.join() still means "everything uploaded".
 
         Raises:
             ClaimExpiredError: If server returns 409 (claim expired)
         """
+        slots = asyncio.Semaphore(self.max_concurrency)
+        in_flight: Set[asyncio.Task] = set()
+        claim_error: List[ClaimExpiredError] = []
+
+        async def upload(batch: List[SegmentInfo], from_queue: bool) -> None:
+            try:
+                await self._upload_batch(batch, retry_counts)
+            except ClaimExpiredError as e:
+                claim_error.append(e)
+            finally:
+                slots.release()
+                if from_queue:
+                    for _ in batch:
+                        self.upload_queue.task_done()
+
+        async def dispatch(batch: List[SegmentInfo], from_queue: bool) -> None:
+            await slots.acquire()
+            task = asyncio.create_task(upload(batch, from_queue))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        try:
+            while True:
+                if claim_error:
+                    raise claim_error[0]
+
+                if self._stop_event.is_set() and self.upload_queue.empty():
+                    if in_flight:
+                        await asyncio.wait(set(in_flight))
+                        continue
+                    if self._failed_segments:
+                        logger.info(f"Processing {len(self._failed_segments)} failed segments for retry")
+                        segments_to_retry = self._failed_segments.copy()
+                        self._failed_segments.clear()
+                        for segment in segments_to_retry:
+                            retry_counts[segment.filename] = retry_counts.get(segment.filename, 0) + 1
+                        for i in range(0, len(segments_to_retry), self.batch_size):
+                            await dispatch(segments_to_retry[i : i + self.batch_size], from_queue=False)
+                        continue
+                    break
+
+                try:
+                    segment: SegmentInfo = await asyncio.wait_for(self.upload_queue.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+
+                received = [segment]
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + BATCH_LINGER_SECONDS
+                while len(received) < self.batch_size:
+                    try:
+                        received.append(self.upload_queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    remaining = deadline - loop.time()
+                    if remaining <= 0 or self._stop_event.is_set():
+                        break
+                    try:
+                        received.append(await asyncio.wait_for(self.upload_queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                batch = []
+                for segment in received:
+                    # Phase 6: Skip segments already confirmed by server
+                    if segment.filename in self._uploaded_segments:
+                        await self._skip_segment(segment)
+                        self.upload_queue.task_done()
+                    else:
+                        batch.append(segment)
+                if batch:
+                    await dispatch(batch, from_queue=True)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _skip_segment(self, segment: SegmentInfo) -> None:
+        """Skip a segment the server already has, deleting the local copy."""
+        logger.debug(f"Skipping already-uploaded segment: {segment.filename}")
+        self._skipped_segments.add(segment.filename)
+        # Delete local file since it's already on server
+        # EXCEPT: preserve init.mp4 and stream.m3u8 - needed for metadata
+        # extraction after upload completes (dimensions, playlist validation)
+        preserve_files = {"init.mp4", "stream.m3u8"}
+        if segment.filename not in preserve_files:
+            try:
+                await asyncio.to_thread(segment.filepath.unlink)
+                logger.debug(f"Deleted local segment (already on server): {segment.filename}")
+            except FileNotFoundError:
+                pass  # Already gone
+            except Exception as e:
+                logger.warning(f"Failed to delete local segment {segment.filename}: {e}")
+
+    async def _read_segment(self, segment: SegmentInfo, retry_count: int) -> Optional[bytes]:
+        """
+        Read a segment for upload, verifying its size hasn't changed since the stability check.
+
+        Returns:
+            The segment bytes, or None if it was re-queued or has disappeared
+        """
         # Read file content using thread pool to avoid blocking event loop
         try:
             # Verify file size hasn't changed (race condition fix from code review)
@@ -485,21 +600,125 @@ class SegmentUploadWorker:
                     filename=segment.filename,
                     size=current_size,
                 ))
-                return False
+                return None
 
-            data = await asyncio.to_thread(segment.filepath.read_bytes)
+            return await asyncio.to_thread(segment.filepath.read_bytes)
         except FileNotFoundError:
             logger.warning(f"Segment file disappeared before upload: {segment.filename}")
-            return True  # Don't retry - file is gone
+            return None  # Don't retry - file is gone
         except Exception as e:
             logger.error(f"Failed to read segment {segment.filename}: {e}")
             if retry_count < MAX_SEGMENT_RETRIES:
                 self._failed_segments.append(segment)
+            return None
+
+    async def _record_uploaded(self, segment: SegmentInfo, size: int) -> None:
+        """Delete the local copy of a server-verified segment and track it."""
+        # Safe to delete local file using thread pool (Ada's requirement)
+        try:
+            await asyncio.to_thread(segment.filepath.unlink)
+            logger.debug(f"Deleted local segment: {segment.filename}")
+        except Exception as e:
+            logger.warning(f"Failed to delete local segment {segment.filename}: {e}")
+
+        # Track upload
+        self._uploaded_segments.add(segment.filename)
+        self._total_bytes_uploaded += size
+
+        # Call progress callback if provided
+        if self.on_segment_uploaded:
+            try:
+                self.on_segment_uploaded(segment.filename, size)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+        logger.debug(f"Uploaded segment: {segment.quality}/{segment.filename} ({size} bytes)")
+
+    async def _persist_uploaded(self, segments: List[Tuple[str, int]]) -> None:
+        """Phase 6: Persist uploaded segments to disk for crash recovery (best-effort)."""
+        if self.state_manager and self.quality_name and segments:
+            try:
+                await self.state_manager.mark_uploaded_many(quality=self.quality_name, segments=segments)
+            except Exception as e:
+                # Log but don't fail - state persistence is best-effort
+                logger.warning(f"Failed to persist upload state: {e}")
+
+    async def _link_from_store(self, prepared: List[Tuple[SegmentInfo, bytes, str]]) -> Set[str]:
+        """
+        Ask the server to place segments it already has in its segment store.
+
+        Asking stops for the rest of the upload when the server has no segment
+        store (404) or after LINK_MAX_MISSES requests in a row found nothing.
+
+        Args:
+            prepared: (segment, data, sha256 hex digest) tuples of one quality
+
+        Returns:
+            Filenames the server placed, which need no upload
+
+        Raises:
+            ClaimExpiredError: If server returns 409 (claim expired)
+        """
+        if not self._link_enabled or not prepared:
+            return set()
+
+        try:
+            result = await self.client.link_segments(
+                video_id=self.video_id,
+                quality=prepared[0][0].quality,
+                segments=[(segment.filename, len(data), checksum) for segment, data, checksum in prepared],
+            )
+        except WorkerAPIError as e:
+            if e.status_code == 409:
+                logger.error(f"Claim expired during segment upload: {e.message}")
+                raise ClaimExpiredError(e.message)
+            if e.status_code == 404:
+                self._link_enabled = False
+            else:
+                # Not fatal: the segments are simply uploaded
+                logger.warning(f"Segment store lookup failed: {e.message}")
+            return set()
+
+        linked = set(result.get("linked", []))
+        if linked:
+            self._link_misses = 0
+        else:
+            self._link_misses += 1
+            if self._link_misses >= LINK_MAX_MISSES:
+                logger.info(f"Segment store has none of the segments of video {self.video_id}, uploading all")
+                self._link_enabled = False
+        return linked
+
+    async def _upload_segment(self, segment: SegmentInfo, retry_count: int = 0) -> bool:
+        """
+        Upload a single segment to the server.
+
+        Uses asyncio.to_thread for file I/O to avoid blocking the event loop.
+        Verifies file size hasn't changed since stability check (race condition fix).
+
+        Args:
+            segment: SegmentInfo object with filepath, quality, filename, size
+            retry_count: Current retry attempt (for re-queued segments)
+
+        Returns:
+            True if upload succeeded, False if should retry
+
+        Raises:
+            ClaimExpiredError: If server returns 409 (claim expired)
+        """
+        data = await self._read_segment(segment, retry_count)
+        if data is None:
             return False
 
         # Compute checksum (CPU-bound but fast for typical segment sizes)
         checksum = hashlib.sha256(data).hexdigest()
 
+        # Skip the upload if the server already stores this content
+        if segment.filename in await self._link_from_store([(segment, data, checksum)]):
+            await self._record_uploaded(segment, len(data))
+            await self._persist_uploaded([(segment.filename, len(data))])
+            return True
+
         # Upload to server
         try:
             result = await self.client.upload_segment(
@@ -512,40 +731,8 @@ class SegmentUploadWorker:
 
             # Verify server confirmed checksum
             if result.get("checksum_verified"):
-                # Safe to delete local file using thread pool (Ada's requirement)
-                try:
-                    await asyncio.to_thread(segment.filepath.unlink)
-                    logger.debug(f"Deleted local segment: {segment.filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete local segment {segment.filename}: {e}")
-
-                # Track upload
-                self._uploaded_segments.add(segment.filename)
-                self._total_bytes_uploaded += len(data)
-
-                # Phase 6: Persist state to disk for crash recovery
-                if self.state_manager and self.quality_name:
-                    try:
-                        await self.state_manager.mark_uploaded(
-                            quality=self.quality_name,
-                            filename=segment.filename,
-                            size=len(data),
-                        )
-                    except Exception as e:
-                        # Log but don't fail - state persistence is best-effort
-                        logger.warning(f"Failed to persist upload state: {e}")
-
-                # Call progress callback if provided
-                if self.on_segment_uploaded:
-                    try:
-                        self.on_segment_uploaded(segment.filename, len(data))
-                    except Exception as e:
-                        logger.warning(f"Progress callback failed: {e}")
-
-                logger.debug(
-                    f"Uploaded segment: {segment.quality}/{segment.filename} "
-                    f"({len(data)} bytes)"
-                )
+                await self._record_uploaded(segment, len(data))
+                await self._persist_uploaded([(segment.filename, len(data))])
                 return True
             else:
                 logger.warning(
@@ -569,6 +756,78 @@ class SegmentUploadWorker:
                     logger.error(f"Segment {segment.filename} failed after {MAX_SEGMENT_RETRIES} retries, giving up")
                 return False
 
+    async def _upload_batch(self, batch: List[SegmentInfo], retry_counts: Dict[str, int]) -> None:
+        """
+        Upload a batch of segments in one request, retrying failures individually.
+
+        Raises:
+            ClaimExpiredError: If server returns 409 (claim expired)
+        """
+        prepared = []
+        for segment in batch:
+            data = await self._read_segment(segment, retry_counts.get(segment.filename, 0))
+            if data is not None:
+                prepared.append((segment, data, hashlib.sha256(data).hexdigest()))
+
+        # Skip uploading segments the server already stores
+        linked = await self._link_from_store(prepared)
+        if linked:
+            placed = [(segment, data) for segment, data, _ in prepared if segment.filename in linked]
+            for segment, data in placed:
+                await self._record_uploaded(segment, len(data))
+            await self._persist_uploaded([(segment.filename, len(data)) for segment, data in placed])
+            prepared = [entry for entry in prepared if entry[0].filename not in linked]
+        if not prepared:
+            return
+
+        def queue_retry(segment: SegmentInfo) -> None:
+            if retry_counts.get(segment.filename, 0) < MAX_SEGMENT_RETRIES:
+                self._failed_segments.append(segment)
+            else:
+                logger.error(f"Segment {segment.filename} failed after {MAX_SEGMENT_RETRIES} retries, giving up")
+
+        # Keep each request under the server's batch body limit
+        groups: List[List[Tuple[SegmentInfo, bytes, str]]] = []
+        group_bytes = 0
+        for entry in prepared:
+            if groups and group_bytes + len(entry[1]) <= MAX_BATCH_BYTES:
+                groups[-1].append(entry)
+                group_bytes += len(entry[1])
+            else:
+                groups.append([entry])
+                group_bytes = len(entry[1])
+
+        for group in groups:
+            try:
+                # A SegmentWatcher feeds a single quality, so a batch never mixes qualities
+                result = await self.client.upload_segment_batch(
+                    video_id=self.video_id,
+                    quality=group[0][0].quality,
+                    segments=[(segment.filename, data, checksum) for segment, data, checksum in group],
+                )
+            except WorkerAPIError as e:
+                if e.status_code == 409:
+                    # Claim expired - abort immediately (Bruce's recommendation)
+                    logger.error(f"Claim expired during segment upload: {e.message}")
+                    raise ClaimExpiredError(e.message)
+                logger.error(f"Failed to upload batch of {len(group)} segments: {e.message}")
+                for segment, _, _ in group:
+                    queue_retry(segment)
+                continue
+
+            results = {r.get("filename"): r for r in result.get("results", [])}
+            uploaded = []
+            for segment, data, _ in group:
+                segment_result = results.get(segment.filename, {})
+                if segment_result.get("status") == "ok" and segment_result.get("checksum_verified"):
+                    await self._record_uploaded(segment, len(data))
+                    uploaded.append((segment.filename, len(data)))
+                else:
+                    error = segment_result.get("error", "missing from response")
+                    logger.warning(f"Server rejected segment {segment.filename} ({error}), will retry")
+                    queue_retry(segment)
+            await self._persist_uploaded(uploaded)
+
     async def stop(self) -> None:
         """
         Signal the worker to stop after draining the queue.
@@ -619,6 +878,8 @@ async def streaming_transcode_and_upload_quality(
     on_segment_progress: Optional[Callable[[int, int], None]] = None,
     job_id: Optional[int] = None,
     enable_resume: bool = True,
+    batch_size: int = 1,
+    upload_concurrency: int = 1,
 ) -> Tuple[bool, Optional[str], int]:
     """
     Transcode a quality with streaming segment upload (Issue #478).
@@ -644,12 +905,14 @@ async def streaming_transcode_and_upload_quality(
                             called after each segment upload for progress tracking
         job_id: Transcoding job ID (required for state persistence)
         enable_resume: If True, load existing state and resume from where we left off
+        batch_size: Segments per upload request (1 = one request per segment)
+        upload_concurrency: Maximum segment upload requests in flight at once
 
     Returns:
         Tuple of (success, error_message, segment_count)
     """
     # Create upload queue
-    upload_queue: asyncio.Queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+    upload_queue: asyncio.Queue = asyncio.Queue(maxsize=max(UPLOAD_QUEUE_SIZE, batch_size))
 
     # Phase 6: Set up state manager for resume support
     state_manager: Optional[UploadStateManager] = None
@@ -718,6 +981,8 @@ async def streaming_transcode_and_upload_quality(
         state_manager=state_manager,
         already_uploaded=already_uploaded,
         quality_name=quality_name,
+        batch_size=batch_size,
+        max_concurrency=upload_concurrency,
     )
 
     # Start watcher and upload worker tasks
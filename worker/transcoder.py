@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 import math
+import os
 import re
 import shutil
 import signal
@@ -35,6 +36,7 @@ from api.database import (
     quality_progress,
     sprite_queue,
     transcoding_jobs,
+    transcoding_tasks,
     transcriptions,
     video_qualities,
     videos,
@@ -42,13 +44,22 @@ from api.database import (
 from api.db_retry import DatabaseRetryableError, execute_with_retry, fetch_one_with_retry
 from api.enums import JobFailureMode, PlaylistValidation, QualityStatus, TranscodingStep, VideoStatus
 from api.errors import truncate_error
+from api.object_storage import STORAGE_SYNC_RESET, delete_video_objects, schedule_video_publish
+from api.response_cache import invalidate_response_cache
+from api.storage_ledger import record_video_storage
 
 # Import config for backwards compatibility and fallback values
 from config import (
     ARCHIVE_DIR,
     ARCHIVE_RETENTION_DAYS,
+    CHUNKED_ENCODING_CHUNK_SECONDS,
+    CHUNKED_ENCODING_ENABLED,
+    CHUNKED_ENCODING_MIN_DURATION,
+    CHUNKED_ENCODING_PARALLEL,
     CLEANUP_PARTIAL_ON_FAILURE,
     CLEANUP_SOURCE_ON_PERMANENT_FAILURE,
+    CMAF_AUDIO_PASSTHROUGH,
+    CMAF_SHARED_AUDIO_ENABLED,
     ERROR_DETAIL_MAX_LENGTH,
     ERROR_SUMMARY_MAX_LENGTH,
     FFMPEG_TIMEOUT_BASE_MULTIPLIER,
@@ -56,6 +67,7 @@ from config import (
     FFMPEG_TIMEOUT_MINIMUM,
     FFMPEG_TIMEOUT_RESOLUTION_MULTIPLIERS,
     HLS_SEGMENT_DURATION,
+    HWACCEL_MAX_CONCURRENT_SESSIONS,
     JOB_STALE_TIMEOUT,
     KEEP_COMPLETED_QUALITIES,
     PROGRESS_UPDATE_INTERVAL,
@@ -64,6 +76,7 @@ from config import (
     SPRITE_SHEET_AUTO_GENERATE,
     SPRITE_SHEET_ENABLED,
     SUPPORTED_VIDEO_EXTENSIONS,
+    TRANSCODE_LADDER_MODE,
     UPLOADS_DIR,
     VIDEOS_DIR,
     WORKER_CLAIM_DURATION_MINUTES,
@@ -83,12 +96,13 @@ from worker.alerts import (
     get_metrics as get_alert_metrics,
 )
 from worker.hwaccel import (
+    AUDIO_RENDITION_NAME,
     StreamingFormat,  # noqa: F401 - Used in future CMAF transcoding integration
     VideoCodec,
     extract_codec_string_from_file,
     get_codec_string,
-    get_recommended_parallel_sessions,
 )
+from worker.quality_scheduler import get_max_parallel_encodes, run_qualities_adaptive
 
 # Conditional import for filesystem watching
 if WORKER_USE_FILESYSTEM_WATCHER:
@@ -209,61 +223,6 @@ def reset_transcoder_settings_cache() -> None:
     _cached_transcoder_settings_time = 0
 
 
-def group_qualities_by_resolution(qualities: List[dict], parallel_count: int) -> List[List[dict]]:
-    """
-    Group qualities into batches for parallel encoding with interleaved resolution.
-
-    Interleaves high-res (>= 1080p) and low-res (< 1080p) qualities to balance
-    memory usage during parallel encoding. This prevents running all high-res
-    encodes simultaneously which could exhaust memory (Issue #429).
-
-    Example with parallel_count=2 and qualities [4K, 1440p, 1080p, 720p, 480p, 360p]:
-    - High-res: [4K, 1440p, 1080p]
-    - Low-res: [720p, 480p, 360p]
-    - Interleaved batches: [[4K, 720p], [1440p, 480p], [1080p, 360p]]
-
-    Args:
-        qualities: List of quality preset dicts with 'name' and 'height' keys
-        parallel_count: Maximum number of qualities per batch
-
-    Returns:
-        List of quality batches, each containing up to parallel_count qualities
-    """
-    if parallel_count <= 1:
-        # Sequential mode: each quality in its own batch
-        return [[q] for q in qualities]
-
-    # Split into high-res (1080p+) and low-res groups
-    high_res = [q for q in qualities if q["height"] >= 1080]
-    low_res = [q for q in qualities if q["height"] < 1080]
-
-    batches = []
-
-    # Interleave high-res and low-res to balance memory usage (Issue #429)
-    # This prevents all high-res encodes from running simultaneously
-    high_idx = 0
-    low_idx = 0
-
-    while high_idx < len(high_res) or low_idx < len(low_res):
-        batch = []
-
-        # Add qualities alternating between high and low res
-        for _ in range(parallel_count):
-            if high_idx < len(high_res) and (low_idx >= len(low_res) or len(batch) % 2 == 0):
-                batch.append(high_res[high_idx])
-                high_idx += 1
-            elif low_idx < len(low_res):
-                batch.append(low_res[low_idx])
-                low_idx += 1
-            else:
-                break
-
-        if batch:
-            batches.append(batch)
-
-    return batches
-
-
 class WorkerState:
     """
     Encapsulates mutable state for a transcoder worker instance.
@@ -711,7 +670,8 @@ async def get_video_info(input_path: Path, timeout: float = 30.0) -> dict:
         timeout: Maximum time to wait for ffprobe (default 30 seconds)
 
     Returns:
-        Dictionary with video metadata (width, height, duration, codec)
+        Dictionary with video metadata (width, height, duration, codec, audio_codec,
+        audio_profile, audio_channels, has_audio, format_name)
 
     Raises:
         RuntimeError: If ffprobe fails or times out
@@ -754,6 +714,10 @@ async def get_video_info(input_path: Path, timeout: float = 30.0) -> dict:
         "duration": duration,
         "codec": video_stream.get("codec_name", "unknown"),
         "audio_codec": audio_stream.get("codec_name", "aac") if audio_stream else "aac",
+        "audio_profile": audio_stream.get("profile") if audio_stream else None,
+        "audio_channels": audio_stream.get("channels") if audio_stream else None,
+        "has_audio": audio_stream is not None,
+        "format_name": data.get("format", {}).get("format_name", ""),
     }
 
 
@@ -1003,6 +967,225 @@ async def generate_thumbnail(input_path: Path, output_path: Path, timestamp: flo
         raise RuntimeError(f"Thumbnail generation failed: {error_msg}")
 
 
+# Chunk boundaries sit this far before a source keyframe, so rounding never makes a
+# chunk start just after its keyframe (the frames before it are decoded and dropped)
+CHUNK_BOUNDARY_LEAD = 0.001
+
+
+def chunked_encoding_applies(video_duration: float, streaming_format: str) -> bool:
+    """Whether renditions of this video are encoded in parallel chunks (see transcode_quality_chunked)."""
+    return CHUNKED_ENCODING_ENABLED and streaming_format == "cmaf" and video_duration >= CHUNKED_ENCODING_MIN_DURATION
+
+
+async def get_keyframe_times(input_path: Path, timeout: float = 300.0) -> List[float]:
+    """
+    List the video keyframe times of a file, in seconds from its start.
+
+    Only packet flags are read (no decoding), so this is quick even for long files.
+
+    Raises:
+        RuntimeError: If ffprobe fails or times out
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags:format=start_time",
+        "-of",
+        "csv=p=0",
+        str(input_path),
+    ]
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise RuntimeError(f"ffprobe timed out after {timeout}s listing keyframes")
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {stderr.decode('utf-8', errors='ignore')}")
+
+    # Packet lines are "pts_time,flags"; the format line is the start time
+    start_time = 0.0
+    keyframe_times = []
+    for line in stdout.decode("utf-8", errors="ignore").splitlines():
+        fields = line.strip().split(",")
+        try:
+            if len(fields) == 1:
+                start_time = float(fields[0])
+            elif "K" in fields[1]:
+                keyframe_times.append(float(fields[0]))
+        except ValueError:
+            # N/A timestamps
+            continue
+    return sorted(t - start_time for t in keyframe_times)
+
+
+def plan_keyframe_chunks(
+    keyframe_times: List[float], video_duration: float, chunk_seconds: float
+) -> List[Tuple[float, Optional[float]]]:
+    """
+    Cut a video into chunks of at least chunk_seconds that start at source keyframes.
+
+    A chunk is never cut off shorter than half a chunk at the end of the video.
+
+    Returns:
+        (start, length) per chunk in order; the last chunk's length is None (to the end).
+        A single chunk means the video can't be chunked.
+    """
+    starts = [0.0]
+    for keyframe in keyframe_times:
+        boundary = keyframe - CHUNK_BOUNDARY_LEAD
+        if boundary - starts[-1] >= chunk_seconds and video_duration - boundary >= chunk_seconds / 2:
+            starts.append(boundary)
+    chunks: List[Tuple[float, Optional[float]]] = [
+        (start, next_start - start) for start, next_start in zip(starts, starts[1:])
+    ]
+    chunks.append((starts[-1], None))
+    return chunks
+
+
+def get_chunk_parallelism(is_hardware: bool, gpu_caps: Optional["GPUCapabilities"] = None) -> int:
+    """
+    Number of chunks of one quality to encode at a time.
+
+    Chunked qualities are encoded one after another, so on a GPU the chunks get the
+    encode slots the quality scheduler would otherwise share out between qualities.
+    """
+    if is_hardware and gpu_caps is not None:
+        if CHUNKED_ENCODING_PARALLEL:
+            return min(CHUNKED_ENCODING_PARALLEL, HWACCEL_MAX_CONCURRENT_SESSIONS)
+        return get_max_parallel_encodes(gpu_caps)
+    if CHUNKED_ENCODING_PARALLEL:
+        return CHUNKED_ENCODING_PARALLEL
+    return max(2, (os.cpu_count() or 1) // 4)
+
+
+async def transcode_quality_chunked(
+    input_path: Path,
+    output_dir: Path,
+    quality: dict,
+    video_duration: float,
+    progress_callback: Optional[Callable[[int], Awaitable[None]]] = None,
+    gpu_caps: Optional["GPUCapabilities"] = None,
+    preferred_codec: Optional[str] = None,
+    audio: bool = True,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Transcode a CMAF quality variant as keyframe-aligned chunks encoded in parallel.
+
+    The source is cut at keyframes into chunks of about CHUNKED_ENCODING_CHUNK_SECONDS.
+    The chunks are encoded (video only) several at a time, then joined by a stream
+    copy that writes the CMAF segments and encodes the audio once. The output has the
+    same layout as transcode_quality_with_progress, but encoding takes roughly
+    duration / parallelism instead of the full duration.
+
+    Progress: the chunk encodes report 0-95% (weighted by chunk length), the join the rest.
+
+    Returns:
+        Same as transcode_quality_with_progress. Fails without encoding if the source
+        has too few keyframes to chunk.
+    """
+    from worker.hwaccel import build_chunk_encode_command, build_chunk_stitch_command, select_encoder
+
+    name = quality["name"]
+    height = quality["height"]
+
+    codec_enum = None
+    if gpu_caps is None:
+        # Mirror the default CPU path of transcode_quality_with_progress
+        codec_enum = VideoCodec.H264
+    elif preferred_codec:
+        codec_map = {"h264": VideoCodec.H264, "hevc": VideoCodec.HEVC, "av1": VideoCodec.AV1}
+        codec_enum = codec_map.get(preferred_codec.lower())
+    selection = select_encoder(gpu_caps, height, preferred_codec=codec_enum)
+
+    try:
+        keyframe_times = await get_keyframe_times(input_path)
+    except RuntimeError as e:
+        return False, f"Could not list keyframes: {e}"
+    chunks = plan_keyframe_chunks(keyframe_times, video_duration, CHUNKED_ENCODING_CHUNK_SECONDS)
+    if len(chunks) < 2:
+        return False, "Source has too few keyframes to chunk"
+
+    chunk_lengths = [length if length is not None else video_duration - start for start, length in chunks]
+    parallel = get_chunk_parallelism(selection.encoder.is_hardware, gpu_caps)
+    print(f"      {name}: Chunked encode of {len(chunks)} chunks, {parallel} at a time ({selection.encoder.name})")
+
+    chunk_dir = output_dir / f".{name}-chunks"
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+    chunk_dir.mkdir(parents=True)
+    (output_dir / name).mkdir(parents=True, exist_ok=True)
+    chunk_paths = [chunk_dir / f"chunk_{index:04d}.mkv" for index in range(len(chunks))]
+
+    chunk_progress = [0] * len(chunks)
+    reported = {"progress": 0}
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def report(progress: int) -> None:
+        if progress_callback and progress > reported["progress"]:
+            reported["progress"] = progress
+            await progress_callback(progress)
+
+    async def encode_chunk(index: int) -> None:
+        async def on_chunk_progress(progress: int) -> None:
+            chunk_progress[index] = progress
+            done = sum(p * length for p, length in zip(chunk_progress, chunk_lengths)) / sum(chunk_lengths)
+            await report(int(done * 0.95))
+
+        start, length = chunks[index]
+        async with semaphore:
+            success, error_msg = await run_ffmpeg_with_progress(
+                cmd=build_chunk_encode_command(input_path, chunk_paths[index], quality, selection, start, length),
+                video_duration=chunk_lengths[index],
+                timeout=calculate_ffmpeg_timeout(chunk_lengths[index], height),
+                progress_callback=on_chunk_progress,
+                logging_description=f"FFmpeg chunk {index + 1}/{len(chunks)} of {name}",
+            )
+        if not success:
+            raise RuntimeError(error_msg)
+
+    try:
+        tasks = [asyncio.create_task(encode_chunk(index)) for index in range(len(chunks))]
+        try:
+            await asyncio.gather(*tasks)
+        except RuntimeError as e:
+            return False, f"Chunk encode failed: {e}"
+        finally:
+            # Stop the remaining chunks once one has failed (or on cancellation)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        concat_list = chunk_dir / "chunks.txt"
+        lines = []
+        for chunk_path in chunk_paths:
+            escaped = str(chunk_path).replace("'", "'\\''")
+            lines.append(f"file '{escaped}'\n")
+        concat_list.write_text("".join(lines))
+
+        async def on_stitch_progress(progress: int) -> None:
+            await report(95 + progress * 5 // 100)
+
+        success, error_msg = await run_ffmpeg_with_progress(
+            cmd=build_chunk_stitch_command(
+                concat_list, input_path, output_dir, quality, selection, HLS_SEGMENT_DURATION, audio
+            ),
+            video_duration=video_duration,
+            timeout=calculate_ffmpeg_timeout(video_duration, height),
+            progress_callback=on_stitch_progress,
+            logging_description=f"FFmpeg chunk join {name}",
+        )
+        if not success:
+            return False, f"Chunk join failed: {error_msg}"
+        return True, None
+    finally:
+        shutil.rmtree(chunk_dir, ignore_errors=True)
+
+
 async def transcode_quality_with_progress(
     input_path: Path,
     output_dir: Path,
@@ -1012,6 +1195,7 @@ async def transcode_quality_with_progress(
     gpu_caps: Optional["GPUCapabilities"] = None,
     streaming_format: str = "hls_ts",
     preferred_codec: Optional[str] = None,
+    audio: bool = True,
 ) -> Tuple[bool, Optional[str]]:
     """
     Transcode a single quality variant with progress tracking and timeout.
@@ -1025,6 +1209,8 @@ async def transcode_quality_with_progress(
         gpu_caps: GPU capabilities from hwaccel module for hardware encoding
         streaming_format: Output format - "hls_ts" for MPEG-TS or "cmaf" for fMP4
         preferred_codec: Preferred video codec ("h264", "hevc", "av1") from settings
+        audio: Include the audio track; CMAF only, False for a video-only rendition
+            that plays with the shared audio rendition
 
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message) where error_message
@@ -1037,6 +1223,15 @@ async def transcode_quality_with_progress(
 
     use_cmaf = streaming_format == "cmaf"
 
+    if chunked_encoding_applies(video_duration, streaming_format):
+        success, error_msg = await transcode_quality_chunked(
+            input_path, output_dir, quality, video_duration, progress_callback, gpu_caps, preferred_codec, audio
+        )
+        if success:
+            return True, None
+        print(f"      {name}: {error_msg}, encoding in one pass")
+        _remove_quality_output(output_dir, name, streaming_format)
+
     # Calculate timeout based on video duration and resolution
     timeout = calculate_ffmpeg_timeout(video_duration, height)
     print(f"      Timeout set to {timeout:.0f}s ({timeout / 60:.1f} min) for {name}")
@@ -1069,6 +1264,7 @@ async def transcode_quality_with_progress(
                 quality,
                 selection,
                 HLS_SEGMENT_DURATION,
+                audio,
             )
         else:
             cmd = build_transcode_command(
@@ -1089,6 +1285,7 @@ async def transcode_quality_with_progress(
             playlist_name = "stream.m3u8"
             init_segment = "init.mp4"
             segment_pattern = str(quality_dir / "seg_%04d.m4s")
+            audio_args = ["-c:a", "aac", "-b:a", audio_bitrate, "-ac", "2"] if audio else ["-an"]
 
             cmd = [
                 "ffmpeg",
@@ -1109,12 +1306,7 @@ async def transcode_quality_with_progress(
                 f"{int(bitrate.replace('k', '')) * 2}k",
                 "-vf",
                 scale_filter,
-                "-c:a",
-                "aac",
-                "-b:a",
-                audio_bitrate,
-                "-ac",
-                "2",
+                *audio_args,
                 "-hls_time",
                 str(HLS_SEGMENT_DURATION),
                 "-hls_list_size",
@@ -1191,15 +1383,298 @@ async def transcode_quality_with_progress(
     return success, error_msg
 
 
+def _quality_playlist_path(output_dir: Path, quality_name: str, streaming_format: str) -> Path:
+    """Return the variant playlist path for a quality in the given streaming format."""
+    if streaming_format == "cmaf":
+        return output_dir / quality_name / "stream.m3u8"
+    return output_dir / f"{quality_name}.m3u8"
+
+
+def _remove_quality_output(output_dir: Path, quality_name: str, streaming_format: str) -> None:
+    """Remove any partial output for a quality before it is re-encoded."""
+    if streaming_format == "cmaf":
+        shutil.rmtree(output_dir / quality_name, ignore_errors=True)
+        return
+    (output_dir / f"{quality_name}.m3u8").unlink(missing_ok=True)
+    for segment in output_dir.glob(f"{quality_name}_*.ts"):
+        segment.unlink(missing_ok=True)
+
+
+async def transcode_ladder_with_progress(
+    input_path: Path,
+    output_dir: Path,
+    qualities: List[dict],
+    video_duration: float,
+    progress_callbacks: Optional[Dict[str, Callable[[int], Awaitable[None]]]] = None,
+    gpu_caps: Optional["GPUCapabilities"] = None,
+    streaming_format: str = "hls_ts",
+    preferred_codec: Optional[str] = None,
+    audio: bool = True,
+) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """
+    Transcode several quality variants from a single decode of the source.
+
+    Qualities are encoded by one FFmpeg process per ladder, using a split/scale
+    filter graph so the source is decoded once instead of once per quality.
+    Hardware ladders are chunked so that no single process opens more encoder
+    sessions than the GPU allows (reserving one session for headroom, like
+    get_recommended_parallel_sessions).
+
+    Every rendition of a ladder advances at the same rate, so FFmpeg's progress
+    is fanned out to each rendition's callback. Callbacks are looked up on every
+    update, so callers may register them after the ladder has started.
+
+    After each ladder finishes, every rendition's playlist is validated. Renditions
+    that did not come out complete (including all of them if the ladder process
+    failed) are cleaned up and retried individually with
+    transcode_quality_with_progress.
+
+    Args:
+        input_path: Source video file
+        output_dir: Output directory for HLS/CMAF files
+        qualities: Quality preset dicts with name, height, bitrate, audio_bitrate
+        video_duration: Video duration in seconds
+        progress_callbacks: Optional mapping of quality name to async progress callback (0-100)
+        gpu_caps: GPU capabilities from hwaccel module for hardware encoding
+        streaming_format: Output format - "hls_ts" for MPEG-TS or "cmaf" for fMP4
+        preferred_codec: Preferred video codec ("h264", "hevc", "av1") from settings
+        audio: Include the audio track (see transcode_quality_with_progress)
+
+    Returns:
+        Dict mapping quality name to (success, error_message), same semantics as
+        transcode_quality_with_progress.
+    """
+    from worker.hwaccel import build_ladder_transcode_command, select_encoder
+
+    if progress_callbacks is None:
+        progress_callbacks = {}
+
+    codec_enum = None
+    if gpu_caps is None:
+        # Mirror the default CPU path of transcode_quality_with_progress
+        codec_enum = VideoCodec.H264
+    elif preferred_codec:
+        codec_map = {"h264": VideoCodec.H264, "hevc": VideoCodec.HEVC, "av1": VideoCodec.AV1}
+        codec_enum = codec_map.get(preferred_codec.lower())
+
+    selections = [select_encoder(gpu_caps, q["height"], preferred_codec=codec_enum) for q in qualities]
+
+    # Group renditions by decoder input args so each ladder shares one decoder,
+    # then chunk hardware groups to respect encoder session limits
+    groups: Dict[Tuple[str, ...], List[Tuple[dict, Any]]] = {}
+    for quality, selection in zip(qualities, selections):
+        groups.setdefault(tuple(selection.input_args), []).append((quality, selection))
+
+    ladders: List[List[Tuple[dict, Any]]] = []
+    for members in groups.values():
+        if gpu_caps is not None and members[0][1].encoder.is_hardware:
+            chunk_size = max(1, gpu_caps.max_concurrent_sessions - 1)
+        else:
+            chunk_size = len(members)
+        for i in range(0, len(members), chunk_size):
+            ladders.append(members[i : i + chunk_size])
+
+    results: Dict[str, Tuple[bool, Optional[str]]] = {}
+
+    for ladder in ladders:
+        ladder_qualities = [quality for quality, _ in ladder]
+        ladder_selections = [selection for _, selection in ladder]
+        names = [quality["name"] for quality in ladder_qualities]
+
+        if streaming_format == "cmaf":
+            for name in names:
+                (output_dir / name).mkdir(parents=True, exist_ok=True)
+
+        cmd = build_ladder_transcode_command(
+            input_path,
+            output_dir,
+            ladder_qualities,
+            ladder_selections,
+            HLS_SEGMENT_DURATION,
+            streaming_format,
+            audio,
+        )
+
+        # The ladder runs as fast as its most expensive rendition
+        timeout = max(calculate_ffmpeg_timeout(video_duration, q["height"]) for q in ladder_qualities)
+        encoder_names = sorted({selection.encoder.name for selection in ladder_selections})
+        print(f"      Ladder encode {names} with {', '.join(encoder_names)} (timeout {timeout:.0f}s)")
+
+        async def fan_out_progress(progress: int, ladder_names: List[str] = names):
+            for ladder_name in ladder_names:
+                callback = progress_callbacks.get(ladder_name)
+                if callback:
+                    await callback(progress)
+
+        success, error_msg = await run_ffmpeg_with_progress(
+            cmd=cmd,
+            video_duration=video_duration,
+            timeout=timeout,
+            progress_callback=fan_out_progress,
+            logging_description=f"FFmpeg ladder transcode {'/'.join(names)}",
+        )
+        if not success:
+            print(f"  WARNING: Ladder encode failed ({error_msg}), checking renditions individually")
+
+        for quality in ladder_qualities:
+            name = quality["name"]
+            is_valid, validation_error = await validate_hls_playlist(
+                _quality_playlist_path(output_dir, name, streaming_format),
+                PlaylistValidation.CHECK_SEGMENTS,
+            )
+            if is_valid:
+                results[name] = (True, None)
+                continue
+
+            print(f"      {name}: Ladder output incomplete ({validation_error}), falling back to single encode")
+            _remove_quality_output(output_dir, name, streaming_format)
+            results[name] = await transcode_quality_with_progress(
+                input_path,
+                output_dir,
+                quality,
+                video_duration,
+                progress_callbacks.get(name),
+                gpu_caps=gpu_caps,
+                streaming_format=streaming_format,
+                preferred_codec=preferred_codec,
+                audio=audio,
+            )
+
+    return results
+
+
+# Codec string of the shared audio rendition (AAC-LC, encoded or passed through, see can_pass_through_audio)
+AUDIO_RENDITION_CODEC = "mp4a.40.2"
+
+
+def shared_audio_bitrate(qualities: List[dict]) -> str:
+    """Bitrate of the shared audio rendition: the highest audio bitrate of the qualities."""
+    bitrates = [q["audio_bitrate"] for q in qualities if q.get("audio_bitrate", "0k") != "0k"]
+    if not bitrates:
+        return "128k"
+    return max(bitrates, key=lambda bitrate: int(bitrate.replace("k", "")))
+
+
+def can_pass_through_audio(info: dict) -> bool:
+    """
+    Whether the source audio can be copied into the shared audio rendition.
+
+    Only AAC-LC with at most two channels matches AUDIO_RENDITION_CODEC; HE-AAC
+    (mp4a.40.5/29) and multichannel AAC would be advertised with the wrong codec
+    string, so they are encoded.
+
+    Args:
+        info: Source metadata from get_video_info
+    """
+    return (
+        (info.get("audio_codec") or "").lower() == "aac"
+        and info.get("audio_profile") == "LC"
+        and 0 < (info.get("audio_channels") or 0) <= 2
+    )
+
+
+async def transcode_audio_rendition(
+    input_path: Path,
+    output_dir: Path,
+    video_duration: float,
+    audio_bitrate: str,
+    source_passthrough: bool = False,
+    progress_callback: Optional[Callable[[int], Awaitable[None]]] = None,
+    follow_timeout: Optional[float] = None,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Encode the shared audio-only CMAF rendition into output_dir/audio/.
+
+    With source_passthrough (see can_pass_through_audio), the source audio is
+    copied without re-encoding when CMAF_AUDIO_PASSTHROUGH is enabled; if the copy
+    fails (or does not validate), the audio is encoded.
+    With follow_timeout, the source may still be downloading (see
+    build_input_args).
+
+    Returns:
+        Same as transcode_quality_with_progress. On failure no audio rendition is
+        left behind, so the video renditions should carry their own audio.
+    """
+    from worker.hwaccel import build_audio_rendition_command
+
+    audio_dir = output_dir / AUDIO_RENDITION_NAME
+    attempts = [False]
+    if CMAF_AUDIO_PASSTHROUGH and source_passthrough:
+        attempts.insert(0, True)
+
+    error_msg = None
+    for passthrough in attempts:
+        shutil.rmtree(audio_dir, ignore_errors=True)
+        audio_dir.mkdir(parents=True)
+        success, error_msg = await run_ffmpeg_with_progress(
+            cmd=build_audio_rendition_command(
+                input_path, output_dir, audio_bitrate, passthrough, HLS_SEGMENT_DURATION, follow_timeout
+            ),
+            video_duration=video_duration,
+            timeout=calculate_ffmpeg_timeout(video_duration),
+            progress_callback=progress_callback,
+            logging_description="FFmpeg audio rendition" + (" (passthrough)" if passthrough else ""),
+        )
+        if success:
+            success, error_msg = await validate_hls_playlist(
+                audio_dir / "stream.m3u8", PlaylistValidation.CHECK_SEGMENTS
+            )
+            if success:
+                return True, None
+        if passthrough:
+            print(f"      {AUDIO_RENDITION_NAME}: Passthrough failed ({error_msg}), encoding")
+
+    shutil.rmtree(audio_dir, ignore_errors=True)
+    return False, error_msg
+
+
+def get_audio_rendition_bandwidth(output_dir: Path) -> Optional[int]:
+    """
+    Bandwidth (bits/s) of the shared audio rendition in output_dir.
+
+    Measured from the segment sizes and durations in its playlist.
+
+    Returns:
+        None if the video has no (complete) shared audio rendition
+    """
+    audio_dir = output_dir / AUDIO_RENDITION_NAME
+    try:
+        lines = (audio_dir / "stream.m3u8").read_text().splitlines()
+    except OSError:
+        return None
+    if "#EXT-X-ENDLIST" not in lines:
+        return None
+
+    duration = 0.0
+    size = 0
+    for line in lines:
+        if line.startswith("#EXTINF:"):
+            try:
+                duration += float(line[len("#EXTINF:") :].split(",")[0])
+            except ValueError:
+                pass
+        elif line and not line.startswith("#"):
+            try:
+                size += (audio_dir / line).stat().st_size
+            except OSError:
+                pass
+    if duration <= 0 or size <= 0:
+        # Segments not available locally: assume a typical stereo AAC bitrate
+        return 128000
+    return int(size * 8 / duration)
+
+
 async def create_original_quality(
     input_path: Path,
     output_dir: Path,
     duration: float,
     progress_callback: Optional[Callable[[int], Awaitable[None]]] = None,
+    follow_timeout: Optional[float] = None,
 ) -> Tuple[bool, Optional[str], Optional[dict]]:
     """
     Create 'original' quality by remuxing source to HLS without re-encoding.
-    Preserves original video/audio quality with no generation loss.
+    Preserves original video/audio quality with no generation loss. With
+    follow_timeout, the source may still be downloading (see build_input_args).
 
     Returns:
         Tuple[bool, Optional[str], Optional[dict]]: (success, error_message, quality_info)
@@ -1214,11 +1689,12 @@ async def create_original_quality(
     print(f"      Timeout set to {timeout:.0f}s ({timeout / 60:.1f} min) for remux")
 
     # Use copy codec to remux without re-encoding
+    from worker.hwaccel import build_input_args
+
     cmd = [
         "ffmpeg",
         "-y",
-        "-i",
-        str(input_path),
+        *build_input_args(input_path, follow_timeout),
         "-c:v",
         "copy",  # Copy video stream as-is
         "-c:a",
@@ -1341,6 +1817,7 @@ async def generate_master_playlist_cmaf(
     completed_qualities: List[dict],
     codec: VideoCodec = VideoCodec.H264,
     original_audio_codec: str = "aac",
+    audio_bandwidth: Optional[int] = None,
 ):
     """
     Generate master HLS playlist for CMAF output structure.
@@ -1359,11 +1836,16 @@ async def generate_master_playlist_cmaf(
                 stream.m3u8
                 ...
 
+    With a shared audio rendition (audio/stream.m3u8), the transcoded variants are
+    video-only and reference it as an EXT-X-MEDIA audio group.
+
     Args:
         output_dir: Directory containing the CMAF quality subdirectories
         completed_qualities: List of quality dicts with name, width, height, bitrate fields
         codec: Video codec used for encoding (affects CODECS attribute)
         original_audio_codec: Audio codec of original quality (e.g., 'aac', 'ac3', 'eac3')
+        audio_bandwidth: Bandwidth (bits/s) of the shared audio rendition, None if the
+            variants carry their own audio
     """
     # Verify actual dimensions from init segment of each quality
     # If init.mp4 exists, extract actual dimensions; otherwise calculate from height
@@ -1385,6 +1867,11 @@ async def generate_master_playlist_cmaf(
 
     # HLS version 7 required for fMP4 segments
     master_content = "#EXTM3U\n#EXT-X-VERSION:7\n\n"
+    if audio_bandwidth is not None:
+        master_content += (
+            f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="{AUDIO_RENDITION_NAME}",NAME="default",'
+            f'DEFAULT=YES,AUTOSELECT=YES,URI="{AUDIO_RENDITION_NAME}/stream.m3u8"\n\n'
+        )
 
     # Calculate bandwidth for each quality and sort by bandwidth (highest first)
     qualities_with_bandwidth = []
@@ -1405,6 +1892,9 @@ async def generate_master_playlist_cmaf(
             bandwidth = quality["bitrate_bps"]
         else:
             bandwidth = int(quality["bitrate"].replace("k", "")) * 1000
+        if audio_bandwidth is not None and name != "original":
+            # Video-only variant: played together with the audio group
+            bandwidth += audio_bandwidth
 
         qualities_with_bandwidth.append(
             {
@@ -1454,10 +1944,15 @@ async def generate_master_playlist_cmaf(
             quality_codec = default_original_codec_string
         else:
             quality_codec = default_codec_string
+        audio_group = ""
+        if audio_bandwidth is not None and quality["name"] != "original":
+            # CODECS lists every format of the variant, including the audio group's
+            quality_codec = f"{quality_codec.split(',')[0]},{AUDIO_RENDITION_CODEC}"
+            audio_group = f',AUDIO="{AUDIO_RENDITION_NAME}"'
         master_content += (
             f"#EXT-X-STREAM-INF:BANDWIDTH={quality['bandwidth']},"
             f"RESOLUTION={quality['width']}x{quality['height']},"
-            f'CODECS="{quality_codec}"\n'
+            f'CODECS="{quality_codec}"{audio_group}\n'
         )
         # Original quality uses legacy TS format at root, transcoded use CMAF subdirs
         if quality["name"] == "original":
@@ -1474,6 +1969,7 @@ async def generate_dash_manifest(
     segment_duration: int = 6,
     codec: VideoCodec = VideoCodec.H264,
     total_duration: Optional[float] = None,
+    audio_bandwidth: Optional[int] = None,
 ):
     """
     Generate DASH MPD manifest for CMAF segments.
@@ -1490,6 +1986,8 @@ async def generate_dash_manifest(
         segment_duration: Segment duration in seconds
         codec: Video codec used for encoding
         total_duration: Video duration in seconds (if None, calculated from playlists)
+        audio_bandwidth: Bandwidth (bits/s) of the shared audio rendition, which gets its
+            own audio AdaptationSet (None if the renditions carry their own audio)
     """
     # Filter out "original" quality - it uses TS segments, not CMAF/fMP4
     # DASH manifest only supports fMP4 segments (init.mp4 + seg_*.m4s)
@@ -1539,7 +2037,7 @@ async def generate_dash_manifest(
 
     # Build adaptation sets for each quality
     # Note: CMAF segments have muxed audio+video, so we use a single AdaptationSet
-    # with combined codecs string
+    # with combined codecs string (unless the audio is a shared rendition)
     adaptation_sets = []
     seg_duration_ms = segment_duration * 1000
 
@@ -1574,6 +2072,9 @@ async def generate_dash_manifest(
 
         # Use extracted codec string if available, otherwise use default
         video_codecs = quality_codec_strings.get(name, default_video_codecs)
+        if audio_bandwidth is not None:
+            # Video-only representation: the audio has its own AdaptationSet
+            video_codecs = video_codecs.split(",")[0]
 
         # startNumber=0 since segments are named seg_0000.m4s, seg_0001.m4s, etc.
         adaptation_sets.append(
@@ -1588,6 +2089,18 @@ async def generate_dash_manifest(
             f"    </AdaptationSet>"
         )
 
+    if audio_bandwidth is not None:
+        adaptation_sets.append(
+            f'    <AdaptationSet id="{len(adaptation_sets)}" mimeType="audio/mp4" '
+            f'codecs="{AUDIO_RENDITION_CODEC}" lang="und" segmentAlignment="true">\n'
+            f'      <Representation id="{AUDIO_RENDITION_NAME}" bandwidth="{audio_bandwidth}">\n'
+            f'        <SegmentTemplate media="{AUDIO_RENDITION_NAME}/seg_$Number%04d$.m4s" '
+            f'initialization="{AUDIO_RENDITION_NAME}/init.mp4" startNumber="0" '
+            f'duration="{seg_duration_ms}" timescale="1000"/>\n'
+            f"      </Representation>\n"
+            f"    </AdaptationSet>"
+        )
+
     mpd_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="static" \
 mediaPresentationDuration="{duration_str}" minBufferTime="PT2S" \
@@ -2178,8 +2691,11 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
         return False
     job_id = job["id"]
 
-    # Always mark video as processing when we start/resume
-    await database.execute(videos.update().where(videos.c.id == video_id).values(status=VideoStatus.PROCESSING))
+    # Always mark video as processing when we start/resume (its files are served from
+    # VIDEOS_DIR until republished to object storage)
+    await database.execute(
+        videos.update().where(videos.c.id == video_id).values(status=VideoStatus.PROCESSING, **STORAGE_SYNC_RESET)
+    )
 
     try:
         # ----------------------------------------------------------------
@@ -2367,22 +2883,91 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
 
             await checkpoint(job_id)
 
+        # ----------------------------------------------------------------
+        # Shared audio rendition (CMAF): audio encoded once, video-only renditions
+        # ----------------------------------------------------------------
+        audio_bandwidth = None
+        if streaming_format == "cmaf":
+            # A video keeps the audio layout its renditions were encoded with
+            renditions_on_disk = any(
+                _quality_playlist_path(output_dir, q["name"], streaming_format).exists() for q in qualities
+            )
+            audio_bandwidth = get_audio_rendition_bandwidth(output_dir)
+            if audio_bandwidth is not None:
+                print(f"    {AUDIO_RENDITION_NAME}: Shared audio rendition already exists")
+            elif CMAF_SHARED_AUDIO_ENABLED and info.get("has_audio", True) and not renditions_on_disk:
+                print(f"    {AUDIO_RENDITION_NAME}: Encoding shared audio rendition...")
+                success, error_detail = await transcode_audio_rendition(
+                    source_file,
+                    output_dir,
+                    info["duration"],
+                    shared_audio_bitrate(qualities),
+                    can_pass_through_audio(info),
+                )
+                if success:
+                    audio_bandwidth = get_audio_rendition_bandwidth(output_dir)
+                    print(f"    {AUDIO_RENDITION_NAME}: Done ({audio_bandwidth // 1000} kbps)")
+                else:
+                    error_msg = truncate_error(error_detail or "Audio encode failed", ERROR_SUMMARY_MAX_LENGTH)
+                    print(f"    {AUDIO_RENDITION_NAME}: Failed - {error_msg}, renditions keep their own audio")
+                await checkpoint(job_id)
+        # Video renditions carry audio unless there is a shared audio rendition
+        rendition_audio = audio_bandwidth is None
+
         # ----------------------------------------------------------------
         # Step 3b: Transcode to lower qualities (with parallel batching)
         # ----------------------------------------------------------------
 
-        # Get parallel encoding count based on GPU capabilities
-        parallel_count = get_recommended_parallel_sessions(state.gpu_caps)
+        # Get parallel encoding count based on GPU capabilities. Chunked qualities run one
+        # at a time, their chunks using the encode slots (see get_chunk_parallelism)
+        chunked = chunked_encoding_applies(info["duration"], streaming_format)
+        parallel_count = 1 if chunked else get_max_parallel_encodes(state.gpu_caps)
         if parallel_count > 1:
-            print(f"  Using parallel encoding: {parallel_count} qualities at a time")
+            print(f"  Using parallel encoding: up to {parallel_count} qualities at a time")
 
-        # Group qualities into batches for parallel processing
-        quality_batches = group_qualities_by_resolution(qualities, parallel_count)
+        # Ladder mode encodes every pending quality from one decode; otherwise qualities
+        # are scheduled individually, most expensive first
+        use_ladder = TRANSCODE_LADDER_MODE and len(qualities) > 1 and not chunked
+        if use_ladder:
+            print("  Using ladder encoding: single decode for all pending qualities")
 
         # Shared progress tracking for parallel qualities (with lock for coroutine safety)
         quality_progresses: Dict[str, int] = {}
         progress_lock = asyncio.Lock()
 
+        # Ladder transcode results, keyed by quality name (all names share one task)
+        ladder_tasks: Dict[str, asyncio.Task] = {}
+        ladder_callbacks: Dict[str, Callable[[int], Awaitable[None]]] = {}
+
+        async def start_ladder(batch: List[dict]) -> None:
+            """Start one ladder encode for the qualities in batch that still need work."""
+            pending = []
+            for quality in batch:
+                status = await get_quality_status(job_id, quality["name"])
+                if status and status["status"] == QualityStatus.COMPLETED:
+                    continue
+                playlist_path = _quality_playlist_path(output_dir, quality["name"], streaming_format)
+                if await is_hls_playlist_complete(playlist_path):
+                    continue
+                pending.append(quality)
+            if len(pending) < 2:
+                return
+            task = asyncio.create_task(
+                transcode_ladder_with_progress(
+                    source_file,
+                    output_dir,
+                    pending,
+                    info["duration"],
+                    ladder_callbacks,
+                    gpu_caps=state.gpu_caps,
+                    streaming_format=streaming_format,
+                    preferred_codec=streaming_codec,
+                    audio=rendition_audio,
+                )
+            )
+            for quality in pending:
+                ladder_tasks[quality["name"]] = task
+
         async def transcode_single_quality(
             quality: dict,
         ) -> Tuple[Optional[dict], Optional[dict]]:
@@ -2478,16 +3063,22 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
                 await progress_tracker.update_job(job_id, min(overall, 99))  # Cap at 99 until finalized
 
             try:
-                success, error_detail = await transcode_quality_with_progress(
-                    source_file,
-                    output_dir,
-                    quality,
-                    info["duration"],
-                    progress_cb,
-                    gpu_caps=state.gpu_caps,
-                    streaming_format=streaming_format,
-                    preferred_codec=streaming_codec,
-                )
+                ladder_task = ladder_tasks.get(quality_name)
+                if ladder_task is not None:
+                    ladder_callbacks[quality_name] = progress_cb
+                    success, error_detail = (await ladder_task)[quality_name]
+                else:
+                    success, error_detail = await transcode_quality_with_progress(
+                        source_file,
+                        output_dir,
+                        quality,
+                        info["duration"],
+                        progress_cb,
+                        gpu_caps=state.gpu_caps,
+                        streaming_format=streaming_format,
+                        preferred_codec=streaming_codec,
+                        audio=rendition_audio,
+                    )
 
                 if success:
                     await update_quality_status(job_id, quality_name, QualityStatus.COMPLETED)
@@ -2525,39 +3116,61 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
                 print(f"    {quality_name}: Error - {e}")
                 return (None, {"name": quality_name, "error": error_msg})
 
-        # Process each batch of qualities
-        for batch_idx, batch in enumerate(quality_batches):
-            # Check for shutdown before processing each batch
-            if state.shutdown_requested:
-                print("  Shutdown requested, resetting video to pending...")
-                await reset_video_to_pending(video_id)
-                return False
+        # Check for shutdown before starting any quality encodes
+        if state.shutdown_requested:
+            print("  Shutdown requested, resetting video to pending...")
+            await reset_video_to_pending(video_id)
+            return False
 
-            if len(batch) > 1:
-                print(f"  Processing batch {batch_idx + 1}/{len(quality_batches)}: {[q['name'] for q in batch]}")
-
-            # Run batch in parallel
-            tasks = [transcode_single_quality(q) for q in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results - collect successes and failures from returned tuples
-            for quality, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    # Unexpected exception during task execution
-                    error_msg = str(result)
-                    await update_quality_status(job_id, quality["name"], QualityStatus.FAILED, error_msg)
-                    failed_qualities.append({"name": quality["name"], "error": error_msg})
-                    print(f"    {quality['name']}: Unexpected error - {result}")
-                elif isinstance(result, tuple):
-                    success_info, failure_info = result
-                    if success_info is not None:
-                        successful_qualities.append(success_info)
-                    if failure_info is not None:
-                        failed_qualities.append(failure_info)
-
-            # Checkpoint after each batch
+        async def checkpoint_quality(quality: dict, result: Any) -> None:
+            """Extend the claim as each quality finishes."""
             await checkpoint(job_id)
 
+        try:
+            if use_ladder:
+                await start_ladder(qualities)
+                tasks = [transcode_single_quality(q) for q in qualities]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                results = await run_qualities_adaptive(
+                    qualities,
+                    transcode_single_quality,
+                    parallel_count,
+                    info["duration"],
+                    codec=streaming_codec,
+                    on_complete=checkpoint_quality,
+                    stop_check=lambda: state.shutdown_requested,
+                )
+        finally:
+            # Every ladder member awaits the ladder, so it only outlives the encodes on early exit
+            for ladder_task in set(ladder_tasks.values()):
+                if not ladder_task.done():
+                    ladder_task.cancel()
+            ladder_tasks.clear()
+
+        # Qualities left unstarted by a shutdown are picked up when the job is resumed
+        if state.shutdown_requested:
+            print("  Shutdown requested, resetting video to pending...")
+            await reset_video_to_pending(video_id)
+            return False
+
+        # Process results - collect successes and failures from returned tuples
+        for quality, result in zip(qualities, results):
+            if isinstance(result, Exception):
+                # Unexpected exception during task execution
+                error_msg = str(result)
+                await update_quality_status(job_id, quality["name"], QualityStatus.FAILED, error_msg)
+                failed_qualities.append({"name": quality["name"], "error": error_msg})
+                print(f"    {quality['name']}: Unexpected error - {result}")
+            elif isinstance(result, tuple):
+                success_info, failure_info = result
+                if success_info is not None:
+                    successful_qualities.append(success_info)
+                if failure_info is not None:
+                    failed_qualities.append(failure_info)
+
+        await checkpoint(job_id)
+
         # ----------------------------------------------------------------
         # Step 3c: Re-verify all qualities are complete before finalizing
         # This catches any qualities that were reset mid-flight or missed
@@ -2679,6 +3292,7 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
                             gpu_caps=state.gpu_caps,
                             streaming_format=streaming_format,
                             preferred_codec=streaming_codec,
+                            audio=rendition_audio,
                         )
                         if success:
                             await update_quality_status(job_id, quality_name, QualityStatus.COMPLETED)
@@ -2749,13 +3363,17 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
             )
             # Pass original audio codec for correct manifest codec string
             original_audio = info.get("audio_codec", "aac")
-            await generate_master_playlist_cmaf(output_dir, successful_qualities, codec_enum, original_audio)
+            await generate_master_playlist_cmaf(
+                output_dir, successful_qualities, codec_enum, original_audio, audio_bandwidth=audio_bandwidth
+            )
 
             # Generate DASH manifest for CMAF streaming
             enable_dash = transcoder_settings.get("streaming_enable_dash", True)
             if enable_dash:
                 print("  Generating DASH manifest...")
-                await generate_dash_manifest(output_dir, successful_qualities, codec=codec_enum)
+                await generate_dash_manifest(
+                    output_dir, successful_qualities, codec=codec_enum, audio_bandwidth=audio_bandwidth
+                )
 
                 # Validate DASH manifest was created (prevent missing manifest bug)
                 mpd_path = output_dir / "manifest.mpd"
@@ -2808,10 +3426,15 @@ async def process_video_resumable(video_id: int, video_slug: str, state: Optiona
             video_updates["published_at"] = datetime.now(timezone.utc)
 
         await database.execute(videos.update().where(videos.c.id == video_id).values(**video_updates))
+        await record_video_storage(video_id, output_dir)
 
         # Mark job completed
         await mark_job_completed(job_id)
 
+        # The video is now ready, so public video lists must include it
+        await invalidate_response_cache()
+        schedule_video_publish(video_slug)
+
         # Queue sprite sheet generation if enabled (Issue #413 Phase 7B)
         if SPRITE_SHEET_ENABLED and SPRITE_SHEET_AUTO_GENERATE:
             try:
@@ -3045,6 +3668,7 @@ async def cleanup_expired_archives():
                 job = await database.fetch_one(transcoding_jobs.select().where(transcoding_jobs.c.video_id == video_id))
                 if job:
                     await database.execute(quality_progress.delete().where(quality_progress.c.job_id == job["id"]))
+                    await database.execute(transcoding_tasks.delete().where(transcoding_tasks.c.job_id == job["id"]))
                 await database.execute(transcoding_jobs.delete().where(transcoding_jobs.c.video_id == video_id))
                 await database.execute(playback_sessions.delete().where(playback_sessions.c.video_id == video_id))
                 await database.execute(transcriptions.delete().where(transcriptions.c.video_id == video_id))
@@ -3060,6 +3684,7 @@ async def cleanup_expired_archives():
             archive_dir = ARCHIVE_DIR / slug
             if archive_dir.exists():
                 shutil.rmtree(archive_dir)
+            await delete_video_objects(slug)
 
             # Delete source file from uploads if still there
             for ext in SUPPORTED_VIDEO_EXTENSIONS: